@@ -33,18 +33,18 @@ Highlights
 - Supports offline plots and DAT-to-WAV conversion with timestamp recovery.
 """
 import shutil
-import struct
 import time
 import warnings
 import os
 import json
 import copy
-from threading import Thread, Event
+from threading import Thread, Event, current_thread, main_thread
 from functools import partial
 import sys
 from enum import Enum
 
-from PySide6.QtCore import Qt, Signal, QThread, QObject
+import numpy as np
+from PySide6.QtCore import Qt, Signal, QThread, QTimer
 from PySide6.QtWidgets import QFileDialog
 
 from stdatalog_pnpl.DTDL.device_template_manager import DeviceCatalogManager
@@ -57,7 +57,28 @@ from stdatalog_core.HSD_utils.DataClass import DataClass
 from stdatalog_core.HSD_utils.DataReader import DataReader
 
 from stdatalog_gui.STDTDL_Controller import ComponentType, STDTDL_Controller
+from stdatalog_gui.Utils.AsyncDatWriter import AsyncDatWriter
+from stdatalog_gui.Utils.BandwidthPlanner import (
+    BandwidthPlanner,
+    StreamDemand,
+    SERIAL_LINK,
+    USB_LINK,
+)
+from stdatalog_gui.Utils.SerialDemux import SerialDemux
+from stdatalog_gui.Utils.SerializedLink import SerializedLink
+from stdatalog_gui.Utils.SessionFinalizer import SessionFinalizer
+from stdatalog_gui.Utils.StreamTelemetry import StreamTelemetry
+from stdatalog_gui.Utils.StreamWatchdog import StreamWatchdog
+from stdatalog_gui.Utils.TagQueue import TagQueue
+from stdatalog_gui.Utils.DatWavConverter import DatWavConverter, DatWavFormatError
+from stdatalog_gui.Utils.UiFormCache import ui_form_cache
+from stdatalog_gui.HSD_GUI.OfflinePlotEngine import (
+    OfflinePlotEngine,
+    OfflinePlotJob,
+    OfflinePlotJobType,
+)
 from stdatalog_gui.HSD_GUI.Widgets.HSDPlotLinesWidget import HSDPlotLinesWidget
+from stdatalog_gui.HSD_GUI.Widgets.HSDOfflinePlotWindow import HSDOfflinePlotWindow
 from stdatalog_gui.Utils.PlotParams import (
     AnomalyDetectorModelPlotParams,
     ClassificationModelPlotParams,
@@ -86,6 +107,10 @@ from stdatalog_core.HSD.utils.type_conversion import TypeConversion
 import stdatalog_core.HSD_utils.logger as logger
 log = logger.get_logger(__name__)
 
+STATUS_SNAPSHOT_DELAY_MS = 300
+PLOTS_STOP_TIMEOUT_S = 10
+SESSION_FINALIZER_TIMEOUT_S = 30
+
 log_file_name = None
 for handler in log.parent.handlers:
     if hasattr(handler, "baseFilename"):
@@ -136,22 +161,25 @@ class WavConversionThread(QThread):
     comp_name : str
         Component name to convert (typically an audio sensor).
     start_time : int
-        Start timestamp in microseconds for the conversion range.
+        Start time in seconds for the conversion range.
     end_time : int
-        End timestamp in microseconds for the conversion range.
+        End time in seconds for the conversion range (-1 for the end of the file).
 
     Signals
     -------
+    sig_progress : Signal(int)
+        Conversion progress percentage.
     sig_finished : Signal(str, str)
         Emitted when conversion completes, carrying the component name and the
-        generated WAV file path.
+        generated WAV file path (None if the conversion failed or was cancelled).
 
     Notes
     -----
-    The thread delegates conversion to `HSDatalog.convert_dat_to_wav` and emits
+    The thread delegates conversion to `HSD_Controller.convert_dat2wav` and emits
     the `sig_finished` signal upon completion. No device-side behavior changes.
     """
 
+    sig_progress = Signal(int)
     sig_finished = Signal(str, str)  # Signal emitted when the segmentation thread finishes
 
     def __init__(self, controller, comp_name, start_time, end_time):
@@ -169,6 +197,7 @@ class WavConversionThread(QThread):
         self.comp_name = comp_name
         self.start_time = start_time
         self.end_time = end_time
+        self.cancel_event = Event()
 
     def run(self):
         """
@@ -176,13 +205,23 @@ class WavConversionThread(QThread):
         """
         print("Wav Conversion Thread started")
         wav_file_path = self.controller.convert_dat2wav(
-            self.comp_name, self.start_time, self.end_time
+            self.comp_name,
+            self.start_time,
+            self.end_time,
+            progress_callback=self.sig_progress.emit,
+            cancel_event=self.cancel_event,
         )
         print("Wav Conversion Thread finished")
         # Emit the finished signal with the controller object reference
         # as argument to be used in the finish callback
         self.sig_finished.emit(self.comp_name, wav_file_path)
 
+    def cancel(self):
+        """
+        Request the conversion to stop. The partial WAV file is removed.
+        """
+        self.cancel_event.set()
+
 class HSD_Controller(STDTDL_Controller):
     """
     Main GUI controller coordinating link, logging, plots, and PNPL commands.
@@ -231,11 +270,15 @@ class HSD_Controller(STDTDL_Controller):
     sig_tag_done : Signal(bool, str)
         Emitted after tag operations with status and label.
     sig_hsd_bandwidth_exceeded : Signal(bool)
-        Emitted when computed bandwidth exceeds the configured maximum.
+        Emitted when the estimated bandwidth exceeds the link capacity (see
+        `get_bandwidth_plan` for the estimate and the suggested ODR reductions).
     sig_lock_start_button : Signal(bool, str)
         Requests UI to enable/disable Start based on configuration validity.
     sig_streaming_error : Signal(bool, str)
         Reports streaming errors with a human-readable description.
+    sig_status_snapshot_invalidated : Signal()
+        Emitted (from any thread) when the device configuration may have changed; it
+        schedules a background refresh of the component status snapshot.
 
     Notes
     -----
@@ -253,6 +296,7 @@ class HSD_Controller(STDTDL_Controller):
     sig_hsd_bandwidth_exceeded = Signal(bool)
     sig_lock_start_button = Signal(bool, str)
     sig_streaming_error = Signal(bool, str)
+    sig_status_snapshot_invalidated = Signal()
 
     # dataToolKit
     sig_new_spt_data_ready = Signal(DataClass)
@@ -333,14 +377,16 @@ class HSD_Controller(STDTDL_Controller):
                 self.controller.sig_new_spt_data_ready.emit(a_data)
             super().feed_data(data)
 
-    class SensorAcquisitionThread(Thread):
+    class SensorStream:
         """
-        Thread that pulls sensor data from the device link and forwards it.
+        Acquisition state of one component stream of a non-serial link.
+
+        A stream polls the device link for its component, checks the USB packet
+        counters, strips the USB framing and forwards the payload. Streams are
+        polled by an `AcquisitionEngine` (or by a dedicated `SensorAcquisitionThread`).
 
         Parameters
         ----------
-        event : threading.Event
-            Stop flag used to terminate the acquisition loop.
         hsd_link : HSDLink
             Active device link used to request sensor data.
         data_reader : HSD_Controller.DataReader
@@ -355,16 +401,20 @@ class HSD_Controller(STDTDL_Controller):
             USB data payload size per packet (used for integrity checks).
         sig_streaming_error : Signal(bool, str), optional
             Signal to report streaming errors to the UI.
+        stream_counters : StreamCounters | None, optional
+            Telemetry counters updated with the received packets and counter gaps.
+        stream_watchdog : StreamWatchdog | None, optional
+            Shared watchdog fed with the data arrivals; it raises the "No data" error
+            when the stream stalls.
 
         Notes
         -----
-        Starts an internal Qt timer object to detect prolonged lack of data and
-        raises a streaming error if necessary.
+        The stream must be created on the thread owning `stream_watchdog` (the GUI
+        thread), which registers it.
         """
 
         def __init__(
             self,
-            event,
             hsd_link,
             data_reader,
             d_id,
@@ -372,62 +422,9 @@ class HSD_Controller(STDTDL_Controller):
             sensor_data_file,
             usb_dps,
             sig_streaming_error=None,
+            stream_counters=None,
+            stream_watchdog=None,
         ):
-
-            class EmptyDataTimer(QObject):
-                """
-                Lightweight timer object used to detect prolonged lack of data.
-
-                This helper runs in its own `QThread` and emits a `timeout_signal` when
-                no samples arrive for a configurable period. The owning acquisition
-                thread can reset the interruption event to cancel/skip the timeout when
-                data resumes.
-
-                Signals
-                -------
-                timeout_signal : Signal()
-                    Emitted after the timeout elapses without interruption.
-
-                Notes
-                -----
-                - Designed to be moved to a dedicated `QThread`.
-                - The wait uses `time.sleep(timeout)` and checks an interrupt flag.
-                """
-
-                timeout_signal = Signal()
-
-                def __init__(self, comp_name):
-                    """
-                    Initialize the timer with a component-specific name.
-
-                    Parameters
-                    ----------
-                    comp_name : str
-                        Component name used to build a readable timer identifier.
-                    """
-                    super().__init__()
-                    self.interrupt_event = Event()
-                    self.timeout = 5  # if "_tof" in comp_name else 3
-                    self.name = f"edt_{comp_name}"
-
-                def run_wait(self):
-                    """
-                    Sleep for the configured timeout and emit on no interruption.
-
-                    Notes
-                    -----
-                    Recreates the `interrupt_event` each run. If the event is not set by
-                    the acquisition loop before the sleep completes, `timeout_signal` is
-                    emitted to notify about missing incoming data.
-                    """
-                    self.interrupt_event = Event()
-                    time.sleep(self.timeout)
-                    if not self.interrupt_event.is_set():
-                        self.timeout_signal.emit()
-
-            Thread.__init__(self)
-            self.name = comp_name
-            self.stopped = event
             self.hsd_link = hsd_link
             self.data_reader = data_reader
             self.d_id = d_id
@@ -435,15 +432,14 @@ class HSD_Controller(STDTDL_Controller):
             self.sensor_data_file = sensor_data_file
             self.sig_streaming_error = sig_streaming_error
             self.usb_dps = usb_dps
+            self.stream_counters = stream_counters
             self.over_proto = 0
             self.t0 = 0
             self.prev_cnt = 0
 
-            self.objThread = QThread()
-            self.obj = EmptyDataTimer(comp_name)
-            self.obj.moveToThread(self.objThread)
-            self.obj.timeout_signal.connect(self.raise_empty_data_error)
-            self.objThread.started.connect(self.obj.run_wait)
+            self.stream_watchdog = stream_watchdog
+            if self.stream_watchdog is not None:
+                self.stream_watchdog.watch(comp_name, self.raise_empty_data_error)
 
         def raise_empty_data_error(self):
             """
@@ -470,60 +466,226 @@ class HSD_Controller(STDTDL_Controller):
                 if self.sig_streaming_error is not None:
                     self.sig_streaming_error.emit(True, error_msg)
 
-        def run(self):
+        def __report_lost_packets(self, diff):
+            """
+            Emit a streaming error for a USB packet counter discontinuity.
+
+            Parameters
+            ----------
+            diff : int
+                Byte distance between two consecutive packet counters.
+            """
+            app_log = log_file_name if log_file_name is not None else "application"
+            error_msg = (
+                f"Streaming errors in {self.comp_name} component!\n"
+                f"{int(diff//self.usb_dps)} USB packets ({diff} bytes) lost.\n"
+                "Have a look in "
+                f"{app_log} "
+                "log file for more detailed info."
+            )
+            if self.stream_counters is not None:
+                self.stream_counters.add_gap(int(diff // self.usb_dps))
+            if self.sig_streaming_error is not None:
+                self.sig_streaming_error.emit(True, error_msg)
+            log.error(error_msg)
+
+        def frame_usb_packets(self, raw_data, nof_usb_packet):
+            """
+            Check packet counters and strip USB framing from a received buffer.
+
+            Parameters
+            ----------
+            raw_data : bytes | bytearray
+                Buffer returned by the link, made of `usb_dps + 4` byte packets.
+            nof_usb_packet : int
+                Number of complete packets contained in `raw_data`.
+
+            Returns
+            -------
+            memoryview
+                Contiguous payload of all packets, without the 4-byte counters.
+
+            Notes
+            -----
+            Counters are read through a strided view on `raw_data` and compared in
+            a single vectorized pass. A counter equal to 0 marks a stream restart
+            and is never reported as a loss.
+            """
+            packet_size = self.usb_dps + 4
+            counters = np.ndarray(
+                shape=(nof_usb_packet,), dtype="=i4", buffer=raw_data, strides=(packet_size,)
+            ).astype(np.int64)
+            prev_counters = np.empty_like(counters)
+            prev_counters[0] = self.prev_cnt
+            prev_counters[1:] = counters[:-1]
+            diffs = counters - prev_counters
+            for diff in diffs[(counters != 0) & (diffs != self.usb_dps)]:
+                self.__report_lost_packets(int(diff))
+            self.prev_cnt = int(counters[-1])
+
+            packets = np.frombuffer(
+                raw_data, dtype=np.uint8, count=nof_usb_packet * packet_size
+            ).reshape(nof_usb_packet, packet_size)
+            # Single gather of all payloads, handed to the reader in one call
+            return memoryview(np.ascontiguousarray(packets[:, 4:]).reshape(-1))
+
+        def poll(self):
             """
-            Main acquisition loop reading device packets and forwarding payloads.
+            Read the data available for the component and forward its payload.
+
+            Returns
+            -------
+            int
+                Number of bytes received (0 if the device had no data).
 
             Notes
             -----
             - Checks USB packet counters to detect losses and emits errors.
+            - Forwards all the payloads received in a poll as a single chunk.
             - Writes raw bytes to `sensor_data_file` when configured.
-            - Starts an empty-data timer when the device returns no data.
+            - Feeds the stream watchdog each time data is received.
+            """
+            sensor_data = self.hsd_link.get_sensor_data(self.d_id, self.comp_name)
+            if sensor_data is None:
+                return 0
+            if self.stream_watchdog is not None:
+                self.stream_watchdog.feed(self.comp_name)
+            nof_usb_packet = len(sensor_data[1]) // (self.usb_dps + 4)
+            if self.stream_counters is not None:
+                self.stream_counters.add(len(sensor_data[1]), nof_usb_packet)
+            if nof_usb_packet > 0:
+                payload = self.frame_usb_packets(sensor_data[1], nof_usb_packet)
+                self.data_reader.feed_data(DataClass(self.comp_name, payload))
+            if self.sensor_data_file is not None:
+                self.sensor_data_file.write(sensor_data[1])
+            return len(sensor_data[1])
+
+        def close(self):
+            """
+            Stop watching the stream.
+            """
+            if self.stream_watchdog is not None:
+                self.stream_watchdog.unwatch(self.comp_name)
+
+    class SensorAcquisitionThread(SensorStream, Thread):
+        """
+        Thread polling a single `SensorStream` every 20 ms.
+
+        Parameters
+        ----------
+        event : threading.Event
+            Stop flag used to terminate the acquisition loop.
+        *args
+            `SensorStream` parameters.
+
+        Notes
+        -----
+        Kept for single-stream use; the controller polls all the streams of an
+        acquisition from one `AcquisitionEngine`.
+        """
+
+        def __init__(self, event, *args, **kwargs):
+            Thread.__init__(self)
+            HSD_Controller.SensorStream.__init__(self, *args, **kwargs)
+            self.name = self.comp_name
+            self.stopped = event
+
+        def run(self):
+            """
+            Poll the stream until the stop flag is set.
             """
             while not self.stopped.wait(0.02):
-                # while not self.stopped.wait(1):
-                sensor_data = self.hsd_link.get_sensor_data(self.d_id, self.comp_name)
-                if sensor_data is not None:
-                    if self.objThread.isRunning():
-                        self.obj.interrupt_event.set()
-                    nof_usb_packet = len(sensor_data[1]) / (self.usb_dps + 4)
-                    for p in range(int(nof_usb_packet)):
-                        curr_cnt = struct.unpack(
-                            "=i",
-                            sensor_data[1][p * (self.usb_dps + 4) : p * (self.usb_dps + 4) + 4],
-                        )[0]
-                        diff = curr_cnt - self.prev_cnt
-                        if curr_cnt != 0 and diff != self.usb_dps:
-                            app_log = (
-                                log_file_name if log_file_name is not None else "application"
-                            )
-                            error_msg = (
-                                f"Streaming errors in {self.comp_name} component!\n"
-                                f"{int(diff//self.usb_dps)} USB packets ({diff} bytes) lost.\n"
-                                "Have a look in "
-                                f"{app_log} "
-                                "log file for more detailed info."
-                            )
-                            if self.sig_streaming_error is not None:
-                                self.sig_streaming_error.emit(True, error_msg)
-                            log.error(error_msg)
-                        self.prev_cnt = curr_cnt
-
-                        self.data_reader.feed_data(
-                            DataClass(
-                                self.comp_name,
-                                sensor_data[1][
-                                    p * (self.usb_dps + 4) + 4 : (p + 1) * (self.usb_dps + 4)
-                                ],
-                            )
-                        )
-                    if self.sensor_data_file is not None:
-                        self.sensor_data_file.write(sensor_data[1])
+                self.poll()
+            self.close()
+
+    class AcquisitionEngine(Thread):
+        """
+        Single thread draining all the component streams of a non-serial link.
+
+        Parameters
+        ----------
+        event : threading.Event
+            Stop flag used to terminate the acquisition loop.
+        target_poll_bytes : int, optional
+            Bytes expected per poll cycle, used to adapt the poll interval to the
+            observed data rate. Default is 4096.
+        min_poll_interval : float, optional
+            Shortest poll interval in seconds. Default is 0.002.
+        max_poll_interval : float, optional
+            Longest poll interval in seconds (idle link). Default is 0.02.
+
+        Notes
+        -----
+        - Streams are polled in order, one at a time, so the data of each component
+          keeps its ordering and its counter checks.
+        - The device link has no blocking read: the interval between poll cycles
+          follows the data rate (smoothed), so that a cycle collects about
+          `target_poll_bytes`, within `[min_poll_interval, max_poll_interval]`.
+        - Streams can be added while the engine is running: an engine without streams
+          is parked on a wake-up event instead of polling (pre-armed acquisition).
+        """
+
+        def __init__(
+            self,
+            event,
+            target_poll_bytes=4096,
+            min_poll_interval=0.002,
+            max_poll_interval=0.02,
+        ):
+            Thread.__init__(self)
+            self.name = "acquisition_engine_thread"
+            self.stopped = event
+            self.target_poll_bytes = target_poll_bytes
+            self.min_poll_interval = min_poll_interval
+            self.max_poll_interval = max_poll_interval
+            self.poll_interval = max_poll_interval
+            self.data_rate = 0.0  # bytes/s, smoothed
+            self.streams = []
+            self.__wakeup = Event()
+
+        def add_stream(self, stream):
+            """
+            Add a `SensorStream` to the poll cycle.
+            """
+            self.streams.append(stream)
+            self.__wakeup.set()
+
+        def stop(self):
+            """
+            Set the stop flag and wake up a parked engine.
+            """
+            self.stopped.set()
+            self.__wakeup.set()
+
+        def run(self):
+            """
+            Poll all the streams until the stop flag is set.
+            """
+            # Parked until the first stream is added
+            while len(self.streams) == 0 and not self.stopped.is_set():
+                self.__wakeup.wait(0.5)
+            last_cycle = time.monotonic()
+            while not self.stopped.wait(self.poll_interval):
+                received = 0
+                for stream in list(self.streams):
+                    try:
+                        received += stream.poll()
+                    except Exception as e:
+                        log.exception(f"Acquisition error [{stream.comp_name}]: {e}")
+                now = time.monotonic()
+                elapsed = now - last_cycle
+                last_cycle = now
+                if elapsed > 0:
+                    self.data_rate += 0.2 * (received / elapsed - self.data_rate)
+                if self.data_rate > 0:
+                    interval = self.target_poll_bytes / self.data_rate
+                    self.poll_interval = min(
+                        self.max_poll_interval, max(self.min_poll_interval, interval)
+                    )
                 else:
-                    self.objThread.start()
-            if self.objThread.isRunning():
-                self.obj.interrupt_event.set()
-                self.objThread.quit()
+                    self.poll_interval = self.max_poll_interval
+            for stream in list(self.streams):
+                stream.close()
 
     class SensorAcquisitionThread_test_v1(SensorAcquisitionThread):
         """
@@ -575,22 +737,26 @@ class HSD_Controller(STDTDL_Controller):
         ----------
         hsd_link : HSDLink_v2_Serial
             Serial link instance providing `get_serial_data()` and channels.
+        flush_interval : float, optional
+            Maximum time in seconds received payloads wait before being dispatched to
+            the data readers. Default is 0.02.
 
         Notes
         -----
-        Validates channel counters to detect streaming errors and writes raw data
-        to files when configured in `data_reader_params`.
+        Packets are demultiplexed by a `SerialDemux`: per-channel counter checks,
+        raw data files and payloads gathered in chunks for the data readers.
         """
 
-        def __init__(self, hsd_link, controller, sig_streaming_error=None):
+        def __init__(self, hsd_link, controller, sig_streaming_error=None, flush_interval=0.02):
             Thread.__init__(self)
             self.hsd_link = hsd_link
             self.name = "data_reader_thread"
             self.stop_event = Event()
             self.data_reader_params = None
             self.sig_streaming_error = sig_streaming_error
-            self.controller = controller    
-            self.prev_cnts = []
+            self.controller = controller
+            self.flush_interval = flush_interval
+            self.demux = SerialDemux(on_gap=self.__report_lost_packets)
 
         def set_data_reader_params(self, data_reader_params):
             """
@@ -600,10 +766,10 @@ class HSD_Controller(STDTDL_Controller):
             ----------
             data_reader_params : dict
                 Dictionary keyed by channel number containing entries:
-                `{"comp_name", "data_reader", "file"}`.
+                `{"comp_name", "data_reader", "file", "counters"}`.
             """
             self.data_reader_params = data_reader_params
-            self.prev_cnts = [0] * len(data_reader_params)
+            self.demux.configure(data_reader_params)
 
         def set_sig_streaming_error(self, sig_streaming_error):
             """
@@ -611,6 +777,19 @@ class HSD_Controller(STDTDL_Controller):
             """
             self.sig_streaming_error = sig_streaming_error
 
+        def __report_lost_packets(self, comp_name, lost_bytes, lost_packets):
+            app_log = log_file_name if log_file_name is not None else "application"
+            error_msg = (
+                f"Streaming errors in {comp_name} component!\n"
+                f"{lost_packets} serial packets ({lost_bytes} bytes) lost.\n"
+                "Have a look in "
+                f"{app_log} "
+                "log file for more detailed info."
+            )
+            if self.sig_streaming_error is not None:
+                self.sig_streaming_error.emit(True, error_msg)
+            log.error(error_msg)
+
         def run(self):
             """
             Read and dispatch serial data packets until the stop flag is set.
@@ -618,25 +797,26 @@ class HSD_Controller(STDTDL_Controller):
             Notes
             -----
             - Checks per-channel counters for integrity.
-            - Forwards payload to `data_reader.feed_data` and writes to file.
+            - Dispatches the gathered payloads when a channel buffer is full, when the
+              link is idle and at least every `flush_interval` seconds.
             - Flushes the link and closes files on exit.
             """
+            demux = self.demux
+            last_flush = time.monotonic()
             while not self.stop_event.is_set():
                 try:
                     pkt = self.hsd_link.get_serial_data()
                     if pkt is None:
+                        demux.flush()
+                        last_flush = time.monotonic()
                         continue
-                    data = pkt.data
-                    if pkt.header.cr == 0 and len(data) > 0:
-                        curr_cnt = struct.unpack("=i", data[0:4])[0]
-                        data_ch = pkt.header.ch_num                        
-                        comp_name = self.data_reader_params[data_ch].get("comp_name")
-                        self.data_reader_params[data_ch].get("data_reader").feed_data(DataClass(comp_name, data[4:]))
-                        file = self.data_reader_params[data_ch].get("file")
-                        if file is not None:
-                            if not file.closed:
-                                file.write(data)
-                        self.prev_cnts[data_ch] = curr_cnt
+                    if pkt.header.cr == 0 and len(pkt.data) > 0:
+                        demux.push(pkt.header.ch_num, pkt.data)
+                        if demux.pending > 0:
+                            now = time.monotonic()
+                            if now - last_flush >= self.flush_interval:
+                                demux.flush()
+                                last_flush = now
                 except HSDLinkV2SerialError as e:
                     if self.stop_event.is_set():
                         break
@@ -660,14 +840,16 @@ class HSD_Controller(STDTDL_Controller):
                     log.exception(e)
                     break
 
+            try:
+                demux.flush()
+            except Exception as e:
+                log.error(f"Serial reader flush error: {e}")
             try:
                 self.hsd_link.flush()
             except Exception:
                 pass
             time.sleep(1)
-            file = self.data_reader_params[0].get("file")
-            if file is not None:
-                file.close()
+            demux.close_files()
 
         def stop(self):
             """
@@ -702,10 +884,48 @@ class HSD_Controller(STDTDL_Controller):
         self.mc_speed_req_name = "speed"
         # DataToolkit
         self.dt_plugins_folder_path = None
+        # Offline plots
+        self.offline_plot_engine = None
+        self.offline_plot_windows = []
+        self.__offline_sub_plots_flag = False
+        # DAT to WAV conversion
+        self.worker_thread = None
+        # Startup benchmark (connect_to -> populated device configuration page)
+        self.__connect_start_time = None
+        self.startup_stats = None
+        # Acquisition telemetry (throughput, losses, queue depths, latencies)
+        self.stream_telemetry = StreamTelemetry(self, parent=self)
+        # SW tag commands are sent by a worker thread, tags are timestamped on request
+        self.tag_queue = TagQueue(self, parent=self)
+        # Automode: files of a stopped session are finalized while the next one runs
+        self.session_finalizer = SessionFinalizer()
+        self.__background_finalization = False
+        # Session stopped and not finalized by stop_plots yet (see __snapshot_session)
+        self.__stopped_session = None
+        self.__plots_stopped = Event()
+        self.__plots_stopped.set()
+        # Single "No data" watchdog shared by all the acquisition threads
+        self.stream_watchdog = StreamWatchdog(parent=self)
+        # Pre-armed acquisition: component status snapshot refreshed in background
+        # while configuring, so that start_log does not query each component
+        self.__status_generation = 0
+        self.__status_snapshot_valid = False
+        self.__status_snapshot_timer = None
+        # Refresh requested during an acquisition, performed once it is stopped
+        self.__status_snapshot_dirty = False
+        self.__start_log_time = None
+        self.time_to_first_sample = None
+        self.__serial_staging_folder = "."
+        self.sig_status_snapshot_invalidated.connect(self.__schedule_status_snapshot)
         # Serial communication
         self.data_reader_params = {}
         self.MAX_HSD_SRL_BANDWIDTH = 6000000
         self.MAX_HSD_BANDWIDTH = self.MAX_HSD_SRL_BANDWIDTH
+        # Link capacity models, calibrated with the telemetry of each acquisition
+        self.bandwidth_planner = BandwidthPlanner(
+            HSD_Controller.MAX_HSD_BANDWIDTH, self.MAX_HSD_SRL_BANDWIDTH
+        )
+        self.bandwidth_plan = None
 
 
         self.refresh()
@@ -809,10 +1029,12 @@ class HSD_Controller(STDTDL_Controller):
         """
         try:
             if self.hsd_link is not None:
+                self.__release_prearmed_acquisition()
                 self.hsd_link.close()
             hsd_link_factory = HSDLink()
-            self.hsd_link = hsd_link_factory.create_hsd_link()
-
+            hsd_link = hsd_link_factory.create_hsd_link()
+            # GUI thread and background workers share the link: PnPL calls are serialized
+            self.hsd_link = SerializedLink(hsd_link) if hsd_link is not None else None
 
             if self.hsd_link is not None:
                 self.is_hsd_link_up = True
@@ -824,7 +1046,12 @@ class HSD_Controller(STDTDL_Controller):
             self.sig_com_init_error.emit()
         self.sensors_threads = []
         self.threads_stop_flags = []
+        self.acquisition_engine = None
         self.sensor_data_files = []
+        # Raw .dat files are written by a dedicated thread (one per acquisition)
+        self.dat_writer = None
+        self.dat_writer_flush_interval = 0.5
+        self.dat_writer_preallocate = False
         self.data_readers = []
         # self.ispu_output_format = None
         # self.ispu_output_format_path = None
@@ -922,6 +1149,33 @@ class HSD_Controller(STDTDL_Controller):
         super().load_local_device_template(dev_template_json)
         self.hsd_link.set_device_template(dev_template_json)
         self.sig_dtm_loading_completed.emit()
+        self.invalidate_status_snapshot()
+        self.prearm_acquisition()
+        if self.__connect_start_time is not None:
+            self.startup_stats = {
+                "connect_to_config_page_s": time.perf_counter() - self.__connect_start_time,
+                "components": len(self.components_dtdl),
+                "ui_forms": ui_form_cache.get_stats(),
+            }
+            self.__connect_start_time = None
+            log.info(
+                "Device configuration page populated in {:.3f} s ({} components)".format(
+                    self.startup_stats["connect_to_config_page_s"], self.startup_stats["components"]
+                )
+            )
+
+    def get_startup_stats(self):
+        """
+        Return the startup benchmark of the last connection.
+
+        Returns
+        -------
+        dict | None
+            `connect_to_config_page_s` (time from `connect_to` to the device configuration
+            page populated with all the component widgets), `components` and `ui_forms`
+            (`UiFormCache` statistics), or None before the device template is loaded.
+        """
+        return self.startup_stats
 
     def load_local_device_template(self, dev_template_json):
         """
@@ -1568,7 +1822,7 @@ class HSD_Controller(STDTDL_Controller):
             self.remove_component_config_widget(comp_name)
             return
 
-    def update_component_status(self, comp_name, comp_type=ComponentType.OTHER):
+    def update_component_status(self, comp_name, comp_type=ComponentType.OTHER, comp_status=None):
         """
         Update internal status for a component and emit UI update signals.
 
@@ -1578,8 +1832,12 @@ class HSD_Controller(STDTDL_Controller):
             Component name.
         comp_type : ComponentType | str, optional
             Component type enum or name, by default `ComponentType.OTHER`.
+        comp_status : dict | None, optional
+            Already fetched status, as `{comp_name: status}`. If None (default), the
+            status is requested to the device.
         """
-        comp_status = self.get_component_status(comp_name)
+        if comp_status is None:
+            comp_status = self.get_component_status(comp_name)
         if comp_status is not None and comp_name in comp_status:
             self.components_status[comp_name] = comp_status[comp_name]
             if isinstance(comp_type, str):
@@ -1712,24 +1970,51 @@ class HSD_Controller(STDTDL_Controller):
 
             self.data_pipeline.update_components_status(components_status_exp)
 
+    @staticmethod
+    def __get_component_type(c_dict):
+        """
+        Map the `c_type` of a component status to a `ComponentType`.
+        """
+        c_type = c_dict.get("c_type", ComponentType.NONE)
+        if c_type == DTDLUtils.ComponentTypeEnum.SENSOR.value:
+            c_type = ComponentType.SENSOR
+        elif c_type == DTDLUtils.ComponentTypeEnum.ALGORITHM.value:
+            c_type = ComponentType.ALGORITHM
+        elif c_type == DTDLUtils.ComponentTypeEnum.ACTUATOR.value:
+            c_type = ComponentType.ACTUATOR
+        elif c_type == DTDLUtils.ComponentTypeEnum.OTHER.value:
+            c_type = ComponentType.OTHER
+        return c_type
+
     def update_device_status(self):
         """
         Refresh and broadcast status for all components on the device.
+
+        Notes
+        -----
+        The whole device status is requested once and every component is updated
+        from that snapshot. Only components of the device template missing from the
+        snapshot are requested one by one.
         """
         dev_status = self.hsd_link.get_device_status(self.device_id)
-        for c in dev_status["devices"][self.device_id]["components"]:
+        components = []
+        if dev_status is not None:
+            components = dev_status["devices"][self.device_id]["components"]
+        updated = set()
+        for c in components:
             c_dict = list(c.values())[0]
             c_name = list(c.keys())[0]
-            c_type = c_dict.get("c_type", ComponentType.NONE)
-            if c_type == DTDLUtils.ComponentTypeEnum.SENSOR.value:
-                c_type = ComponentType.SENSOR
-            elif c_type == DTDLUtils.ComponentTypeEnum.ALGORITHM.value:
-                c_type = ComponentType.ALGORITHM
-            elif c_type == DTDLUtils.ComponentTypeEnum.ACTUATOR.value:
-                c_type = ComponentType.ACTUATOR
-            elif c_type == DTDLUtils.ComponentTypeEnum.OTHER.value:
+            self.update_component_status(
+                c_name, HSD_Controller.__get_component_type(c_dict), {c_name: c_dict}
+            )
+            updated.add(c_name)
+        for c_name in list(self.components_dtdl):
+            if c_name not in updated:
+                comp_status = self.get_component_status(c_name)
                 c_type = ComponentType.OTHER
-            self.update_component_status(c_name, c_type)
+                if comp_status is not None and c_name in comp_status:
+                    c_type = HSD_Controller.__get_component_type(comp_status[c_name])
+                self.update_component_status(c_name, c_type, comp_status)
 
     def start_log(self, interface=1, acq_folder=None, sub_folder=True):
         """
@@ -1746,21 +2031,37 @@ class HSD_Controller(STDTDL_Controller):
 
         Notes
         -----
-        - For serial links, starts plot threads before the device logging.
+        - For serial links, starts plot threads before the device logging; `.dat` files
+          are moved into the acquisition folder by the writer thread once it exists.
         - Emits `sig_logging(True, interface)` on success and starts pipeline.
-        """
+        - Component statuses are queried only if the pre-armed snapshot is outdated.
+        - The time to the first received sample is measured from here (see
+          `time_to_first_sample`).
+        """
+        self.property_set_pipeline.sync()
+        self.__start_log_time = time.monotonic()
+        self.time_to_first_sample = None
+        self.tag_queue.reset(self.__start_log_time)
         if isinstance(self.hsd_link, HSDLink_v1):
             res = self.hsd_link.start_log(self.device_id, save_files=self.save_files_flag)
         else:
-            for s in self.plot_widgets:
-                s_plot = self.plot_widgets[s]
-                c_name = s_plot.comp_name
-                if c_name is not None:
-                    c_status = self.get_component_status(c_name)
-                    if c_status is not None:
-                        self.components_status[c_name] = c_status[c_name]
+            if not self.is_status_snapshot_valid():
+                for s in self.plot_widgets:
+                    s_plot = self.plot_widgets[s]
+                    c_name = s_plot.comp_name
+                    if c_name is not None:
+                        c_status = self.get_component_status(c_name)
+                        if c_status is not None:
+                            self.components_status[c_name] = c_status[c_name]
+            self.prearm_acquisition()
             if self.is_hsd_link_serial():
-                # In case of serial communication, plots are started before the log
+                # In case of serial communication, plots are started before the log.
+                # The acquisition folder does not exist yet: .dat files are opened in
+                # its parent folder (same filesystem) and renamed once it is created
+                if acq_folder is not None and os.path.isdir(acq_folder):
+                    self.__serial_staging_folder = acq_folder
+                else:
+                    self.__serial_staging_folder = "."
                 self.start_plots()
             res = self.hsd_link.start_log(
                 self.device_id,
@@ -1769,6 +2070,8 @@ class HSD_Controller(STDTDL_Controller):
                 sub_folder=sub_folder,
                 save_files=self.save_files_flag,
             )
+            if res and self.is_hsd_link_serial() and self.save_files_flag:
+                self.__move_serial_data_files()
         if res:
             self.sig_logging.emit(True, interface)
             if self.data_pipeline is not None:
@@ -1776,6 +2079,106 @@ class HSD_Controller(STDTDL_Controller):
             self.sig_streaming_error.emit(False, "")
             self.is_logging = True
 
+    def __move_serial_data_files(self):
+        # Renames are performed by the writer thread, in order with the data
+        acquisition_folder = self.hsd_link.get_acquisition_folder()
+        for f in self.sensor_data_files:
+            f.move_to(os.path.join(acquisition_folder, os.path.basename(f.name)))
+
+    def invalidate_status_snapshot(self):
+        """
+        Mark the cached component statuses as outdated (any thread).
+
+        A background refresh of the statuses of the plotted components is scheduled
+        on the property-set worker thread.
+        """
+        self.__status_generation += 1
+        self.__status_snapshot_valid = False
+        self.sig_status_snapshot_invalidated.emit()
+
+    def is_status_snapshot_valid(self):
+        """
+        Return True if `components_status` matches the device configuration.
+        """
+        return self.__status_snapshot_valid and self.property_set_pipeline.in_flight == 0
+
+    def __schedule_status_snapshot(self):
+        # Debounced: a burst of commands triggers a single refresh
+        if self.__status_snapshot_timer is None:
+            self.__status_snapshot_timer = QTimer(self)
+            self.__status_snapshot_timer.setSingleShot(True)
+            self.__status_snapshot_timer.timeout.connect(self.__refresh_status_snapshot)
+        self.__status_snapshot_timer.start(STATUS_SNAPSHOT_DELAY_MS)
+
+    def __refresh_status_snapshot(self):
+        if self.hsd_link is None or isinstance(self.hsd_link, HSDLink_v1):
+            return
+        if self.is_logging or self.is_detecting:
+            # Statuses are not polled during an acquisition: refreshed by stop_plots
+            self.__status_snapshot_dirty = True
+            return
+        self.__status_snapshot_dirty = False
+        comp_names = [w.comp_name for w in self.plot_widgets.values() if w.comp_name is not None]
+        self.property_set_pipeline.request_statuses(
+            comp_names, partial(self.__status_snapshot_received, self.__status_generation)
+        )
+
+    def __status_snapshot_received(self, generation, statuses):
+        for comp_name, _, comp_status in statuses:
+            if comp_status is not None and comp_name in comp_status:
+                self.components_status[comp_name] = comp_status[comp_name]
+        # Valid only if nothing changed on the device while the statuses were read
+        if generation == self.__status_generation:
+            self.__status_snapshot_valid = True
+
+    def prearm_acquisition(self):
+        """
+        Prepare the threads of the next acquisition while the user is configuring.
+
+        The raw data writer thread (when files are saved) and the acquisition engine
+        thread (non-serial links) are started and parked, so that `start_plots` only
+        opens the file sinks and adds the component streams.
+        """
+        if self.hsd_link is None or isinstance(self.hsd_link, HSDLink_v1):
+            return
+        if self.save_files_flag and self.dat_writer is None:
+            self.dat_writer = AsyncDatWriter(
+                flush_interval=self.dat_writer_flush_interval,
+                preallocate=self.dat_writer_preallocate,
+            )
+            self.dat_writer.start()
+        if not self.is_hsd_link_serial() and self.acquisition_engine is None:
+            stop_flag = Event()
+            self.threads_stop_flags.append(stop_flag)
+            self.acquisition_engine = self.AcquisitionEngine(stop_flag)
+            # A parked engine must not keep the application alive on exit
+            self.acquisition_engine.daemon = True
+            self.acquisition_engine.start()
+            self.sensors_threads.append(self.acquisition_engine)
+
+    def __release_prearmed_acquisition(self):
+        # Stop the threads parked by prearm_acquisition (no acquisition running)
+        if self.is_logging or self.is_detecting:
+            return
+        if self.acquisition_engine is not None:
+            self.acquisition_engine.stop()
+            self.acquisition_engine.join()
+            self.acquisition_engine = None
+        if self.dat_writer is not None:
+            self.dat_writer.stop()
+            self.dat_writer = None
+
+    def get_time_to_first_sample(self):
+        """
+        Return the time from the last `start_log` to the first received sample.
+
+        Returns
+        -------
+        float | None
+            Seconds, or None if no sample has been received yet.
+        """
+        return self.time_to_first_sample
+
     def start_waiting_auto_log(self):
         """
         Emit the waiting-to-start auto-mode state.
@@ -1798,12 +2201,26 @@ class HSD_Controller(STDTDL_Controller):
         self.sig_is_waiting_idle.emit(False)
 
     def start_auto_log(self):
+        """
+        Emit the auto-mode started state and finalize the sessions in background.
+        """
+        self.__background_finalization = True
         self.sig_is_auto_started.emit(True)
 
     def start_auto_log_inner(self, interface=1, acq_folder=None, sub_folder=True):
         """
         Start logging triggered by auto-mode logic and emit inner signal.
+
+        Called by the automode scheduler thread: the threads and files of the previous
+        session are stopped by `stop_plots` on the GUI thread, so the new session is
+        started only after `stop_plots` completed.
         """
+        if current_thread() is not main_thread():
+            if not self.__plots_stopped.wait(PLOTS_STOP_TIMEOUT_S):
+                log.warning(
+                    f"Previous acquisition not stopped after {PLOTS_STOP_TIMEOUT_S} s, "
+                    "starting the next one anyway"
+                )
         self.start_log(interface, acq_folder, sub_folder)
         self.sig_is_auto_started_inner.emit(True)
 
@@ -1811,6 +2228,7 @@ class HSD_Controller(STDTDL_Controller):
         """
         Start detection mode via device logging, using interface 1 on v2.
         """
+        self.property_set_pipeline.sync()
         if isinstance(self.hsd_link, HSDLink_v1):
             res = self.hsd_link.start_log(self.device_id)
         else:
@@ -1836,6 +2254,46 @@ class HSD_Controller(STDTDL_Controller):
         """
         self.save_files_flag = status
 
+    def open_sensor_data_file(self, file_path):
+        """
+        Open a raw `.dat` file sink served by the acquisition writer thread.
+
+        The writer thread is created with the first file of an acquisition and
+        stopped by `stop_plots`.
+
+        Parameters
+        ----------
+        file_path : str
+            Destination file path.
+
+        Returns
+        -------
+        AsyncFileSink
+            File-like object whose `write` never blocks on disk I/O.
+        """
+        if self.dat_writer is None:
+            self.dat_writer = AsyncDatWriter(
+                flush_interval=self.dat_writer_flush_interval,
+                preallocate=self.dat_writer_preallocate,
+            )
+            self.dat_writer.start()
+        sensor_data_file = self.dat_writer.open_sink(file_path, self.__report_dropped_data)
+        self.sensor_data_files.append(sensor_data_file)
+        return sensor_data_file
+
+    def __report_dropped_data(self, sensor_data_file, dropped_bytes):
+        # Acquisition thread: the disk cannot keep up, raw data is missing from the file
+        app_log = log_file_name if log_file_name is not None else "application"
+        error_msg = (
+            f"{dropped_bytes} bytes not saved to {os.path.basename(sensor_data_file.name)}!\n"
+            "The disk cannot keep up with the acquisition.\n"
+            "Have a look in "
+            f"{app_log} "
+            "log file for more detailed info."
+        )
+        log.error(error_msg)
+        self.sig_streaming_error.emit(True, error_msg)
+
     def __start_component_plot_serial(self, comp_status, comp_name):
         """
         Prepare data readers for serial link and optionally open `.dat` files.
@@ -1857,9 +2315,10 @@ class HSD_Controller(STDTDL_Controller):
             c_stream_id = comp_status.get("stream_id")
             if c_stream_id is not None:
                 if self.save_files_flag:
-                    sensor_data_file_path = os.path.join(".", str(comp_name) + ".dat")
-                    sensor_data_file = open(sensor_data_file_path, "wb+")
-                    self.sensor_data_files.append(sensor_data_file)
+                    sensor_data_file_path = os.path.join(
+                        self.__serial_staging_folder, str(comp_name) + ".dat"
+                    )
+                    sensor_data_file = self.open_sensor_data_file(sensor_data_file_path)
                 else:
                     sensor_data_file = None
 
@@ -1935,11 +2394,13 @@ class HSD_Controller(STDTDL_Controller):
                     "comp_name": comp_name,
                     "data_reader": dr,
                     "file": sensor_data_file,
+                    "counters": self.stream_telemetry.counters(comp_name),
                 }
 
     def __start_component_plots_hsddll(self, comp_status, comp_name, create_thread=False):
         """
-        Prepare data readers and start sensor threads for non-serial links.
+        Prepare data readers and add the component streams to the acquisition engine
+        for non-serial links.
 
         Parameters
         ----------
@@ -1955,11 +2416,8 @@ class HSD_Controller(STDTDL_Controller):
         if c_enable == True:
             if self.save_files_flag:
                 sensor_data_file_path = os.path.join(self.hsd_link.get_acquisition_folder(),(str(comp_name) + ".dat"))
-                sensor_data_file = open(sensor_data_file_path, "wb+")
-                self.sensor_data_files.append(sensor_data_file)
-            stopFlag = Event()
-            self.threads_stop_flags.append(stopFlag)
-            
+                sensor_data_file = self.open_sensor_data_file(sensor_data_file_path)
+
             c_type = comp_status.get("c_type")
             usb_dps = comp_status.get("usb_dps")
             dimensions = comp_status.get("dim", 1)
@@ -2030,30 +2488,35 @@ class HSD_Controller(STDTDL_Controller):
                 )
                 self.data_readers.append(dr)
 
-                if self.save_files_flag:
-                    thread = self.SensorAcquisitionThread(
-                        stopFlag,
-                        self.hsd_link,
-                        dr,
-                        self.device_id,
-                        comp_name,
-                        sensor_data_file,
-                        usb_dps,
-                        self.sig_streaming_error,
-                    )
-                else:
-                    thread = self.SensorAcquisitionThread(
-                        stopFlag,
+                self.add_acquisition_stream(
+                    self.SensorStream(
                         self.hsd_link,
                         dr,
                         self.device_id,
                         comp_name,
-                        None,
+                        sensor_data_file if self.save_files_flag else None,
                         usb_dps,
                         self.sig_streaming_error,
+                        self.stream_telemetry.counters(comp_name),
+                        self.stream_watchdog,
                     )
-                thread.start()
-                self.sensors_threads.append(thread)
+                )
+
+    def add_acquisition_stream(self, stream):
+        """
+        Add a component stream to the acquisition engine, starting it if needed.
+
+        All the streams of an acquisition on a non-serial link are polled by a
+        single `AcquisitionEngine` thread, stopped by `stop_plots`.
+
+        Parameters
+        ----------
+        stream : HSD_Controller.SensorStream
+            Component stream to poll.
+        """
+        if self.acquisition_engine is None:
+            self.prearm_acquisition()
+        self.acquisition_engine.add_stream(stream)
 
     def start_plots(self):
         """
@@ -2063,8 +2526,11 @@ class HSD_Controller(STDTDL_Controller):
         -----
         - For v1 links, uses legacy acquisition thread per plot.
         - For serial v2, defers to the serial reader thread.
-        - For non-serial v2, creates per-component threads.
+        - For non-serial v2, polls all the component streams from one
+          `AcquisitionEngine` thread.
         """
+        self.data_stage.clear()
+        self.stream_telemetry.start()
         if self.dt_plugins_folder_path is not None:
             # Initialize DataToolkit
             self.dataToolKit = HSD_DataToolkit(
@@ -2082,8 +2548,7 @@ class HSD_Controller(STDTDL_Controller):
                     sensor_data_file_path = os.path.join(
                         self.hsd_link.get_acquisition_folder(), (str(s_plot.comp_name) + ".dat")
                     )
-                    sensor_data_file = open(sensor_data_file_path, "wb+")
-                    self.sensor_data_files.append(sensor_data_file)
+                    sensor_data_file = self.open_sensor_data_file(sensor_data_file_path)
                 stopFlag = Event()
                 self.threads_stop_flags.append(stopFlag)
 
@@ -2118,7 +2583,11 @@ class HSD_Controller(STDTDL_Controller):
                 c_name = s_plot.comp_name
                 if c_name is not None:
                     c_status_value = self.components_status.get(c_name)
-                    if c_status_value.get("sensor_category") == DTDLUtils.SensorCategoryEnum.ISENSOR_CLASS_RANGING.value:
+                    if (
+                        c_status_value.get("sensor_category")
+                        == DTDLUtils.SensorCategoryEnum.ISENSOR_CLASS_RANGING.value
+                        and not self.is_status_snapshot_valid()
+                    ):
                         # Ranging sensor: need to get updated status from device
                         c_status = self.get_component_status(c_name)
                         c_status_value = c_status[c_name]
@@ -2142,6 +2611,9 @@ class HSD_Controller(STDTDL_Controller):
         """
         _ = interface  # Unused parameter
         if self.is_logging == True:
+            # Tags requested before Stop must reach the device before the log stops
+            if not self.tag_queue.sync():
+                log.warning(f"{self.tag_queue.pending} SW tag commands not sent before stop")
             self.hsd_link.stop_log(self.device_id)
             if isinstance(self.hsd_link, HSDLink_v1):
                 if self.save_files_flag:
@@ -2174,23 +2646,79 @@ class HSD_Controller(STDTDL_Controller):
                     #     log.info(f"{ucf_filename} File correctly saved")
 
                 self.update_component_status("acquisition_info", ComponentType.OTHER)
+                self.__snapshot_session()
                 self.sig_logging.emit(False, 1)
                 if self.data_pipeline is not None:
                     self.data_pipeline.stop()
                 self.is_logging = False
 
+    def __snapshot_session(self):
+        """
+        Record the state of the session being stopped, before `sig_logging(False)`.
+
+        `stop_plots` runs later on the GUI thread: the acquisition folder, the SW tags
+        and the telemetry info of the session are taken here, so that they cannot be
+        replaced by the ones of the next session. The next automode session waits for
+        `stop_plots` (see `start_auto_log_inner`).
+        """
+        self.__stopped_session = {
+            "acquisition_folder": self.hsd_link.get_acquisition_folder(),
+            "telemetry_info": dict(
+                self.stream_telemetry.info,
+                sw_tags=list(self.tag_queue.events),
+                sw_tag_stats=self.tag_queue.get_stats(),
+            ),
+        }
+        self.__plots_stopped.clear()
+
     def stop_auto_log(self):
         """
-        Clear the auto-mode started state.
+        Clear the auto-mode started state and wait for the background finalization.
         """
+        if current_thread() is not main_thread():
+            # Called by the automode scheduler: the last stop_plots may still be queued
+            self.__plots_stopped.wait(PLOTS_STOP_TIMEOUT_S)
+        self.__background_finalization = False
+        self.wait_session_finalization()
         self.sig_is_auto_started.emit(False)
 
+    def wait_session_finalization(self, timeout=SESSION_FINALIZER_TIMEOUT_S):
+        """
+        Wait until the files of the stopped sessions are closed and their raw data
+        writers stopped (see `SessionFinalizer`).
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum wait in seconds.
+
+        Returns
+        -------
+        bool
+            True if all the sessions have been finalized.
+        """
+        pending = self.session_finalizer.pending
+        if pending == 0:
+            return True
+        log.info(f"Waiting for the finalization of {pending} acquisition job(s)...")
+        if not self.session_finalizer.sync(timeout):
+            log.warning(
+                f"{self.session_finalizer.pending} acquisition finalization job(s) not "
+                f"completed after {timeout} s"
+            )
+            return False
+        return True
+
     def stop_auto_log_inner(self, interface=1):
         """
         Stop logging triggered by auto-mode and emit inner signal.
         """
         if self.is_logging == True:
             self.sig_autologging_is_stopping.emit(True)
+            # Tags requested before the session boundary must reach the device before
+            # the log stops, not land in the next session
+            if not self.tag_queue.sync():
+                log.warning(f"{self.tag_queue.pending} SW tag commands not sent before stop")
             self.hsd_link.stop_log(self.device_id)
             if isinstance(self.hsd_link, HSDLink_v1):
                 if self.save_files_flag:
@@ -2202,8 +2730,12 @@ class HSD_Controller(STDTDL_Controller):
                 if self.save_files_flag:
                     self.hsd_link.save_json_acq_info_file(self.device_id)
                     self.hsd_link.save_json_device_file(self.device_id)
-                    
-                    self.__copy_mlc_ispu_config_files()
+
+                    acquisition_folder = self.hsd_link.get_acquisition_folder()
+                    self.session_finalizer.submit(
+                        f"Configuration files {acquisition_folder}",
+                        partial(self.__copy_mlc_ispu_config_files, acquisition_folder),
+                    )
 
                     # if self.ispu_output_format_path is not None:
                     #     shutil.copyfile(
@@ -2221,6 +2753,7 @@ class HSD_Controller(STDTDL_Controller):
                     #     )
                     #     log.info(f"{ucf_filename} File correctly saved")
                 self.update_component_status("acquisition_info", ComponentType.OTHER)
+                self.__snapshot_session()
                 self.sig_logging.emit(False, interface)
                 if self.data_pipeline is not None:
                     self.data_pipeline.stop()
@@ -2267,7 +2800,7 @@ class HSD_Controller(STDTDL_Controller):
 
     def stop_plots(self):
         """
-        Stop all plot acquisition threads and move `.dat` files if needed.
+        Stop all plot acquisition threads and close the `.dat` files.
         """
         if self.dt_plugins_folder_path is not None:
             # stop dataToolKit thread
@@ -2275,24 +2808,78 @@ class HSD_Controller(STDTDL_Controller):
 
         for sf in self.threads_stop_flags:
             sf.set()
+        if self.acquisition_engine is not None:
+            self.acquisition_engine.stop()
 
         if not self.is_hsd_link_serial():
             for t in self.sensors_threads:
                 t.join()
+        self.acquisition_engine = None
+        self.stream_telemetry.stop()
+        self.bandwidth_planner.calibrate(
+            self.stream_telemetry.samples, self.__get_bandwidth_link()
+        )
 
+        session = self.__stopped_session
+        self.__stopped_session = None
+        acquisition_folder = None
+        telemetry_info = dict(self.stream_telemetry.info)
+        if session is not None:
+            telemetry_info = session["telemetry_info"]
+            # The snapshot precedes the last sample, taken by stop
+            telemetry_info["discarded_samples"] = self.stream_telemetry.discarded_samples
         if self.save_files_flag:
-            acquisition_folder = self.hsd_link.get_acquisition_folder()
-            for f in self.sensor_data_files:
+            if session is not None:
+                acquisition_folder = session["acquisition_folder"]
+            else:
+                acquisition_folder = self.hsd_link.get_acquisition_folder()
+        # Everything the finalization needs is detached from the controller state, that
+        # may be reused by the next acquisition while the files are still being closed
+        finalize = partial(
+            self.__finalize_acquisition_files,
+            acquisition_folder,
+            list(self.sensor_data_files),
+            self.dat_writer,
+            list(self.stream_telemetry.samples),
+            telemetry_info,
+        )
+        self.sensor_data_files.clear()
+        self.dat_writer = None
+        if self.__background_finalization:
+            self.session_finalizer.submit(f"Acquisition {acquisition_folder}", finalize)
+        else:
+            finalize()
+        self.__start_log_time = None
+        self.prearm_acquisition()
+        if self.__status_snapshot_dirty:
+            self.__schedule_status_snapshot()
+        self.__plots_stopped.set()
+
+    def __finalize_acquisition_files(
+        self, acquisition_folder, sensor_data_files, dat_writer, telemetry_samples, telemetry_info
+    ):
+        if acquisition_folder is not None:
+            for f in sensor_data_files:
                 try:
-                    fpath = f.name
+                    # Serial files are already in the acquisition folder (see start_log)
+                    f.move_to(os.path.join(acquisition_folder, os.path.basename(f.name)))
                     f.close()
-                    # Move the file to the acquisition folder if not already there
-                    dest_path = os.path.join(acquisition_folder, os.path.basename(fpath))
-                    if os.path.abspath(fpath) != os.path.abspath(dest_path):
-                        shutil.move(fpath, dest_path)
                 except Exception as e:
-                    log.error(f"Error moving file {f.name}: {e}")
-            self.sensor_data_files.clear()
+                    log.error(f"Error closing file {f.name}: {e}")
+            telemetry_files = self.stream_telemetry.export(
+                acquisition_folder, samples=telemetry_samples, info=telemetry_info
+            )
+            if len(telemetry_files) > 0:
+                log.info(f"Stream telemetry saved in {', '.join(telemetry_files)}")
+        if dat_writer is not None:
+            dat_writer.stop()
+            writer_stats = dat_writer.get_stats()
+            log.info(f"Raw data writer stats: {writer_stats}")
+            if writer_stats["dropped_bytes"] > 0:
+                log.warning(
+                    f"{writer_stats['dropped_bytes']} bytes not saved: the disk could not "
+                    "keep up with the acquisition"
+                )
 
     def plot_window_changed(self, plot_window_time):
         """
@@ -2334,51 +2921,145 @@ class HSD_Controller(STDTDL_Controller):
                 self.cconfig_widgets[plot_widget.comp_name].disable_plot_control()
                 self.cconfig_widgets[plot_widget.comp_name].hide_plot_widget()
 
-    def __calculate_hsd_bandwidth(self):
+    def add_plot_widget_factory(self, comp_name, factory):
         """
-        Compute current bandwidth across enabled sensors in bits per second.
+        Register a plot widget whose construction is deferred.
 
-        Notes
-        -----
-        Bandwidth formula: `ODR * (type_size * dim) * 8` summed across sensors.
+        The widget is built by `factory` the first time the component is enabled or
+        its plot is shown; until then the plot controls are disabled.
+
+        Parameters
+        ----------
+        comp_name : str
+            Component name.
+        factory : callable
+            Called without arguments, returns the plot widget (already in layout).
         """
-        self.curr_bandwidth = 0
-        sensors_status = {
-            s: self.components_status[s]
-            for s in self.components_status
-            if self.components_status[s].get("c_type") == DTDLUtils.ComponentTypeEnum.SENSOR.value
-            and self.components_status[s].get("enable")
-        }
-        for ss in sensors_status:
-            # bnd = ODR*(data_type*dim)*8
-            ss_status = sensors_status[ss]
-            ss_dtdl_comp = self.components_dtdl[ss]
-            ss_category = ss_status.get("sensor_category")
-            if ss_category is not None:
+        self.plot_widget_factories[comp_name] = factory
+        self.cconfig_widgets[comp_name].disable_plot_control()
+        self.cconfig_widgets[comp_name].hide_plot_widget()
+
+    def __get_bandwidth_link(self):
+        return SERIAL_LINK if self.is_hsd_link_serial() else USB_LINK
+
+    def __get_stream_demands(self):
+        """
+        Build the bandwidth requirements of the enabled streaming components.
+
+        Returns
+        -------
+        list[StreamDemand]
+            One entry per enabled sensor, algorithm or actuator. ODR is None for
+            components whose rate is not described by their status.
+        """
+        demands = []
+        packet_payload_key = "serial_dps" if self.is_hsd_link_serial() else "usb_dps"
+        for c_name, c_status in self.components_status.items():
+            c_type = c_status.get("c_type")
+            if c_type not in (
+                DTDLUtils.ComponentTypeEnum.SENSOR.value,
+                DTDLUtils.ComponentTypeEnum.ALGORITHM.value,
+                DTDLUtils.ComponentTypeEnum.ACTUATOR.value,
+            ) or not c_status.get("enable"):
+                continue
+            odr = None
+            odr_options = None
+            ss_category = c_status.get("sensor_category")
+            if c_type == DTDLUtils.ComponentTypeEnum.SENSOR.value and ss_category is not None:
+                c_dtdl_comp = self.components_dtdl[c_name]
                 odr = 0  # Safe default (No odr, no bandwidth contribution)
                 if (
                     ss_category == DTDLUtils.SensorCategoryEnum.ISENSOR_CLASS_MEMS.value
                     or ss_category == DTDLUtils.SensorCategoryEnum.ISENSOR_CLASS_AUDIO.value
                     or ss_category == DTDLUtils.SensorCategoryEnum.ISENSOR_CLASS_PRESENCE.value
                 ):
-                    odr = self.__get_mems_sensor_odr(ss_status, ss_dtdl_comp)
+                    odr = self.__get_mems_sensor_odr(c_status, c_dtdl_comp)
+                    odr_options = self.__get_hsd_comp_property_enum_number_options(
+                        "odr", c_dtdl_comp
+                    )
                 elif ss_category == DTDLUtils.SensorCategoryEnum.ISENSOR_CLASS_RANGING.value:
-                    odr = self.__get_ranging_sensor_odr(ss_status)
+                    odr = self.__get_ranging_sensor_odr(c_status)
                 elif ss_category == DTDLUtils.SensorCategoryEnum.ISENSOR_CLASS_LIGHT.value:
-                    odr = self.__get_light_sensor_odr(ss_status)
+                    odr = self.__get_light_sensor_odr(c_status)
                 elif ss_category == DTDLUtils.SensorCategoryEnum.ISENSOR_CLASS_POWERMETER.value:
-                    odr = self.__get_powermeter_sensor_odr(ss_status, ss_dtdl_comp)
-                data_byte_len = TypeConversion.check_type_length(ss_status.get("data_type"))
-                dim = ss_status.get("dim")
-                self.curr_bandwidth += odr * data_byte_len * dim * 8
+                    odr = self.__get_powermeter_sensor_odr(c_status, c_dtdl_comp)
+                if not isinstance(odr, (int, float)):
+                    odr = 0
+            data_type = c_status.get("data_type")
+            sample_size = TypeConversion.check_type_length(data_type) if data_type else 0
+            demands.append(
+                StreamDemand(
+                    c_name,
+                    odr,
+                    sample_size * c_status.get("dim", 1),
+                    c_status.get(packet_payload_key),
+                    odr_options,
+                )
+            )
+        return demands
+
+    def __get_hsd_comp_property_enum_number_options(self, prop_name, comp_interface):
+        """
+        Return the numeric values of an enum property with their enum indexes.
+
+        Parameters
+        ----------
+        prop_name : str
+            Enum property name (e.g., "odr").
+        comp_interface : object
+            DTDL interface providing the enum schema.
+
+        Returns
+        -------
+        list[tuple[float, int]]
+            `(value, enum_index)` pairs of the enum values that are numbers.
+        """
+        prop_contents = [c for c in comp_interface.contents if c.name == prop_name]
+        if len(prop_contents) == 0 or not isinstance(prop_contents[0].schema, ContentSchema):
+            return []
+        options = []
+        for i, enum_value in enumerate(prop_contents[0].schema.enum_values):
+            dname = enum_value.display_name
+            dname = dname if isinstance(dname, str) else dname.en
+            try:
+                options.append((float(dname.replace(",", ".")), i))
+            except ValueError:
+                continue
+        return options
+
+    def __calculate_hsd_bandwidth(self):
+        """
+        Estimate the current configuration bandwidth in bits per second.
+
+        Notes
+        -----
+        Per-stream bandwidth is `ODR * (type_size * dim) * 8`, increased by the packet
+        framing overhead; streams without an ODR (algorithms, actuators) use their
+        measured rate. The result is planned against the capacity of the link in use.
+        """
+        self.bandwidth_plan = self.bandwidth_planner.plan(
+            self.__get_stream_demands(), self.__get_bandwidth_link()
+        )
+        self.curr_bandwidth = self.bandwidth_plan.total_bps
 
     def check_hsd_bandwidth(self):
         """
-        Emit whether the current bandwidth exceeds the configured maximum.
+        Emit whether the current configuration is expected to exceed the link capacity.
         """
         self.__calculate_hsd_bandwidth()
-        # print("self.curr_bandwidth", self.curr_bandwidth)
-        self.sig_hsd_bandwidth_exceeded.emit(self.curr_bandwidth > HSD_Controller.MAX_HSD_BANDWIDTH)
+        self.sig_hsd_bandwidth_exceeded.emit(self.bandwidth_plan.exceeded)
+
+    def get_bandwidth_plan(self):
+        """
+        Return the bandwidth plan of the current configuration.
+
+        Returns
+        -------
+        BandwidthPlan | None
+            Estimated bandwidth, link capacity and suggested ODR reductions, or None
+            before the first check.
+        """
+        return self.bandwidth_plan
 
     def get_sd_mounted_status(self):
         """
@@ -2399,6 +3080,8 @@ class HSD_Controller(STDTDL_Controller):
         visible : bool
             True to enable controls and show the widget; False to hide.
         """
+        if visible:
+            self.materialize_plot_widget(comp_name)
         if comp_name in self.plot_widgets:
             self.plot_widgets[comp_name].update_plot_characteristics(plot_params)
             if visible:
@@ -2407,7 +3090,7 @@ class HSD_Controller(STDTDL_Controller):
             else:
                 self.cconfig_widgets[comp_name].disable_plot_control()
                 self.cconfig_widgets[comp_name].hide_plot_widget()
-        else:
+        elif comp_name not in self.plot_widget_factories:
             log.warning(f"{comp_name} is not in plot widget list yet")
 
     def remove_plot_widget(self, comp_name) -> HSDPlotLinesWidget:
@@ -2424,6 +3107,7 @@ class HSD_Controller(STDTDL_Controller):
         HSDPlotLinesWidget | None
             Removed widget or `None` if not present.
         """
+        self.plot_widget_factories.pop(comp_name, None)
         if comp_name in self.plot_widgets:
             return self.plot_widgets.pop(comp_name)
         else:
@@ -2431,14 +3115,22 @@ class HSD_Controller(STDTDL_Controller):
 
     def add_data_to_a_plot(self, data: DataClass):
         """
-        Append incoming `DataClass` payload to the corresponding plot widget.
+        Stage incoming `DataClass` payload for the corresponding plot widget.
+
+        Called from acquisition threads: the decoded block is queued into
+        `data_stage` and forwarded to the plot widget by the render clock, on the
+        GUI thread.
 
         Parameters
         ----------
         data : DataClass
-            Data wrapper containing `comp_name` and raw bytes.
+            Data wrapper containing `comp_name` and decoded samples.
         """
-        self.plot_widgets[data.comp_name].add_data(data.data)
+        if self.__start_log_time is not None and self.time_to_first_sample is None:
+            self.time_to_first_sample = time.monotonic() - self.__start_log_time
+            self.stream_telemetry.info["time_to_first_sample_s"] = self.time_to_first_sample
+            log.info(f"Time to first sample: {self.time_to_first_sample * 1000:.1f} ms")
+        self.data_stage.push(data.comp_name, data.data)
 
     def connect_to(self, d_id: int, d_text: str = None, com_speed: int = None):
         """
@@ -2457,7 +3149,9 @@ class HSD_Controller(STDTDL_Controller):
         -----
         - Emits `sig_device_connected(True)` on success.
         - Starts a serial reader thread for serial links.
+        - Starts the startup benchmark reported by `get_startup_stats`.
         """
+        self.__connect_start_time = time.perf_counter()
         if self.is_hsd_link_serial():
             com_id = d_text.split("]")[0][1:]
             is_open = self.hsd_link.open(com_id, com_speed)
@@ -2491,10 +3185,14 @@ class HSD_Controller(STDTDL_Controller):
         - Emits `sig_device_connected(False)`.
         - Deletes plot and config widgets and clears component maps.
         """
+        self.wait_session_finalization()
         self.sig_device_connected.emit(False)
+        self.__release_prearmed_acquisition()
+        self.__status_snapshot_valid = False
         for pw in self.plot_widgets:
             self.plot_widgets[pw].deleteLater()
         self.plot_widgets.clear()
+        self.plot_widget_factories.clear()
 
         for cw in self.cconfig_widgets:
             self.cconfig_widgets[cw].deleteLater()
@@ -2542,7 +3240,7 @@ class HSD_Controller(STDTDL_Controller):
         # Drop stopped serial threads from the list
         self.sensors_threads = [t for t in self.sensors_threads if t not in serial_threads]
 
-    def send_command(self, json_command):
+    def send_command(self, json_command, flush_pending=True):
         """
         Send a PNPL JSON command to the device and emit the response.
 
@@ -2550,14 +3248,21 @@ class HSD_Controller(STDTDL_Controller):
         ----------
         json_command : dict
             PNPL command payload.
+        flush_pending : bool, optional
+            Send the property edits still pending in `property_set_pipeline` first, so
+            that the device receives the messages in the order they were issued.
+            False only for the pipeline itself. Default is True.
 
         Returns
         -------
         dict | None
             Response dictionary if available.
         """
+        if flush_pending:
+            self.property_set_pipeline.sync()
         log.info(f"PnPL Message: {json_command}")
         response = self.hsd_link.send_command(self.device_id, json_command)
+        self.invalidate_status_snapshot()
         if response is not None:
             self.sig_pnpl_response_received.emit(json_command, response)
         return response
@@ -2573,6 +3278,7 @@ class HSD_Controller(STDTDL_Controller):
         on_sd : bool
             True to request firmware to save configuration to SD.
         """
+        self.property_set_pipeline.sync()
         if on_pc:
             fname = QFileDialog.getSaveFileName(
                 None, "Save Current Device Configuration", "device_config", "JSON (*.json)"
@@ -2592,6 +3298,7 @@ class HSD_Controller(STDTDL_Controller):
         Load a configuration JSON from disk and apply it to the device.
         """
         self.hsd_link.update_device(self.device_id, fpath)
+        self.invalidate_status_snapshot()
         self.update_device_status()
 
     def update_mlc_ispu_config_file(self, comp_name, fpath):
@@ -2615,7 +3322,9 @@ class HSD_Controller(STDTDL_Controller):
             self.mlc_ispu_configs[comp_name] = {}
         self.mlc_ispu_configs[comp_name]["output_path"] = fpath
 
-    def __copy_mlc_ispu_config_files(self):
+    def __copy_mlc_ispu_config_files(self, acquisition_folder=None):
+        if acquisition_folder is None:
+            acquisition_folder = self.hsd_link.get_acquisition_folder()
         copied_paths = set()
         for config_entry in self.mlc_ispu_configs.values():
             for path_key in ("path", "output_path"):
@@ -2627,7 +3336,7 @@ class HSD_Controller(STDTDL_Controller):
                 config_name = os.path.basename(config_path)
                 shutil.copyfile(
                     config_path,
-                    os.path.join(self.hsd_link.get_acquisition_folder(), config_name),
+                    os.path.join(acquisition_folder, config_name),
                 )
                 log.info(f"{config_name} File correctly saved")
 
@@ -2722,6 +3431,7 @@ class HSD_Controller(STDTDL_Controller):
         elif ucf_fpath_lower.endswith(".json"):
             upload_result = self.hsd_link.upload_mlc_json_file(self.device_id, comp_name, ucf_fpath)
 
+        self.invalidate_status_snapshot()
         if upload_result is not None:
             self.update_mlc_ispu_config_file(comp_name, ucf_fpath)
             self.sig_mlc_config_loaded.emit(comp_name, ucf_fpath)
@@ -2759,6 +3469,7 @@ class HSD_Controller(STDTDL_Controller):
                 self.device_id, comp_name, ucf_fpath, output_json_fpath
             )
 
+        self.invalidate_status_snapshot()
         if upload_result is not None:
             self.update_mlc_ispu_config_file(comp_name, ucf_fpath)
             if output_json_fpath:
@@ -2777,6 +3488,7 @@ class HSD_Controller(STDTDL_Controller):
             File path to the MLC JSON configuration.
         """
         upload_result = self.hsd_link.upload_mlc_json_file(self.device_id, comp_name, json_fpath)
+        self.invalidate_status_snapshot()
         if upload_result is not None:
             self.update_mlc_ispu_config_file(comp_name, json_fpath)
             self.sig_mlc_config_loaded.emit(comp_name, json_fpath)
@@ -2795,6 +3507,7 @@ class HSD_Controller(STDTDL_Controller):
         upload_result = self.hsd_link.upload_ispu_json_file(
             self.device_id, comp_name, json_fpath, output_json_fpath
         )
+        self.invalidate_status_snapshot()
         if upload_result is not None:
             self.update_mlc_ispu_config_file(comp_name, json_fpath)
             if output_json_fpath:
@@ -2802,12 +3515,23 @@ class HSD_Controller(STDTDL_Controller):
             self.sig_ispu_config_loaded.emit(comp_name, json_fpath, output_json_fpath or "")
 
     def doTag(self, sw_tag_name, status):
-        if status is True:
-            self.hsd_link.set_sw_tag_on(self.device_id, sw_tag_name)
-        else:
-            self.hsd_link.set_sw_tag_off(self.device_id, sw_tag_name)
-        self.update_component_status("tags_info")
-        tag_label = self.components_status["tags_info"][sw_tag_name]["label"]
+        """
+        Set a software tag ON or OFF without waiting for the device.
+
+        Parameters
+        ----------
+        sw_tag_name : str
+            Software tag class name.
+        status : bool
+            True for tag ON, False for tag OFF.
+
+        Notes
+        -----
+        The tag is timestamped and its label resolved from `components_status` at
+        once; the command is sent by `tag_queue` (see `TagQueue.get_stats` for the
+        command-to-ack latencies).
+        """
+        tag_label = self.tag_queue.tag(sw_tag_name, status)
         if self.data_pipeline is not None:
             self.data_pipeline.do_tag(status, tag_label)
         self.sig_tag_done.emit(status, tag_label)
@@ -2859,6 +3583,10 @@ class HSD_Controller(STDTDL_Controller):
         Change the display label of a software tag class.
         """
         self.hsd_link.set_sw_tag_class_label(self.device_id, sw_tag_name, new_label)
+        # Keep the cached label used by doTag up to date
+        tag_info = self.components_status.get("tags_info", {}).get(sw_tag_name)
+        if tag_info is not None:
+            tag_info["label"] = new_label
 
     def changeHWTagClassLabel(self, hw_tag_name, new_label):
         """
@@ -2993,63 +3721,35 @@ class HSD_Controller(STDTDL_Controller):
 
         Notes
         -----
-        Emits `sig_offline_plots_completed` when plotting finishes.
+        Components are loaded in parallel by an `OfflinePlotEngine` running in the
+        background, then plotted in the GUI process. Progress is reported through `sig_offline_plots_progress` and
+        `sig_offline_plots_completed` is emitted when all the workers finished.
         """
+        if self.offline_plot_engine is not None and self.offline_plot_engine.isRunning():
+            log.warning("Offline plots already in progress")
+            return
 
-        if self.hsd is not None:
-            self.hsd.close_plot_threads()
+        self.close_offline_plots()
 
         acquisition_folder = self.hsd_link.get_acquisition_folder()
         hsd_factory = HSDatalog()
         self.hsd = hsd_factory.create_hsd(acquisition_folder)
 
-        self.hsd.enable_timestamp_recovery(debug_flag)
         if tag_label == "None" or tag_label == "":
             tag_label = None
+        jobs = []
         if cb_sensor_value == "all":
             for s in active_sensor_list:
                 s_key = list(s.keys())[0]
-                s[s_key]["is_first_chunk"] = True
-                ioffset = s[s_key].get("ioffset", 0)
-                try:
-                    self.hsd.get_sensor_plot(
-                        s_key,
-                        s[s_key],
-                        start_time,
-                        end_time,
-                        tag_label if tag_label != "None" else None,
-                        [],
-                        sub_plots_flag,
-                        raw_data_flag,
-                        fft_flag,
-                    )
-                except Exception as e:
-                    log.error(f"Error in {s_key} get_sensor_plot: {e}")
-                HSDatalog.reset_status_conversion_side_info(s[s_key], ioffset)
+                jobs.append(OfflinePlotJob(OfflinePlotJobType.SENSOR, s_key, s[s_key]))
             for a in active_algorithm_list:
                 a_key = list(a.keys())[0]
-                self.hsd.get_algorithm_plot(
-                    a_key,
-                    a[a_key],
-                    start_time,
-                    end_time,
-                    tag_label if tag_label != "None" else None,
-                    [],
-                    sub_plots_flag,
-                    raw_data_flag,
-                )
+                jobs.append(OfflinePlotJob(OfflinePlotJobType.ALGORITHM, a_key, a[a_key]))
             if active_actuator_list is not None:
                 for act in active_actuator_list:
                     act_key = list(act.keys())[0]
-                    self.hsd.get_actuator_plot(
-                        act_key,
-                        act[act_key],
-                        start_time,
-                        end_time,
-                        tag_label if tag_label != "None" else None,
-                        [],
-                        True,
-                        raw_data_flag,
+                    jobs.append(
+                        OfflinePlotJob(OfflinePlotJobType.ACTUATOR, act_key, act[act_key])
                     )
         else:
             s_list = self.hsd.get_sensor_list(only_active=True)
@@ -3059,52 +3759,95 @@ class HSD_Controller(STDTDL_Controller):
             algo_comp = [a for a in a_list if cb_sensor_value in a]
             act_comp = [act for act in act_list if cb_sensor_value in act]
             if len(sensor_comp) > 0:  # == 1
-                sensor_comp = sensor_comp[0][cb_sensor_value]
-                sensor_comp["is_first_chunk"] = True
-                ioffset = sensor_comp.get("ioffset", 0)
-                try:
-                    self.hsd.get_sensor_plot(
+                jobs.append(
+                    OfflinePlotJob(
+                        OfflinePlotJobType.SENSOR,
                         cb_sensor_value,
-                        sensor_comp,
-                        start_time,
-                        end_time,
-                        tag_label if tag_label != "None" else None,
-                        [],
-                        sub_plots_flag,
-                        raw_data_flag,
-                        fft_flag,
+                        sensor_comp[0][cb_sensor_value],
                     )
-                except Exception as e:
-                    log.error(f"Error in {sensor_comp} get_sensor_plot: {e}")
-                HSDatalog.reset_status_conversion_side_info(sensor_comp, ioffset)
+                )
             elif len(algo_comp) > 0:  # == 1
-                a_key = list(algo_comp[0].keys())[0]
-
-                self.hsd.get_algorithm_plot(
-                    a_key,
-                    algo_comp,
-                    start_time,
-                    end_time,
-                    tag_label if tag_label != "None" else None,
-                    sub_plots_flag,
-                    raw_data_flag,
+                jobs.append(
+                    OfflinePlotJob(
+                        OfflinePlotJobType.ALGORITHM,
+                        cb_sensor_value,
+                        algo_comp[0][cb_sensor_value],
+                    )
                 )
             elif len(act_comp) > 0:  # == 1
-                act_comp = act_comp[0][cb_sensor_value]
-                self.hsd.get_actuator_plot(
-                    cb_sensor_value,
-                    act_comp,
-                    start_time,
-                    end_time,
-                    tag_label if tag_label != "None" else None,
-                    [],
-                    True,
-                    raw_data_flag,
+                jobs.append(
+                    OfflinePlotJob(
+                        OfflinePlotJobType.ACTUATOR,
+                        cb_sensor_value,
+                        act_comp[0][cb_sensor_value],
+                    )
                 )
 
+        if len(jobs) == 0:
+            self.sig_offline_plots_completed.emit()
+            return
+
+        self.offline_plot_engine = OfflinePlotEngine(
+            acquisition_folder,
+            jobs,
+            start_time,
+            end_time,
+            tag_label,
+            debug_flag,
+            raw_data_flag,
+            fft_flag,
+        )
+        self.__offline_sub_plots_flag = sub_plots_flag
+        self.offline_plot_engine.sig_data_ready.connect(self.__show_offline_plot)
+        self.offline_plot_engine.sig_progress.connect(self.sig_offline_plots_progress)
+        self.offline_plot_engine.sig_finished.connect(self.__offline_plots_finished)
+        self.offline_plot_engine.start()
+
+    def cancel_offline_plots(self):
+        """
+        Cancel the ongoing offline plots. Components already being plotted complete,
+        then `sig_offline_plots_completed` is emitted.
+        """
+        if self.offline_plot_engine is not None:
+            self.offline_plot_engine.cancel()
+
+    def close_offline_plots(self):
+        """
+        Close all the offline plot windows.
+        """
+        for window in self.offline_plot_windows:
+            window.close()
+            window.deleteLater()
+        self.offline_plot_windows = []
+
+    def __show_offline_plot(self, plot_data):
+        """
+        Offline plot engine data callback: plot a loaded component (GUI thread).
+        """
+        if len(plot_data.series) == 0:
+            log.warning(f"No data to plot for {plot_data.comp_name}")
+            return
+        window = HSDOfflinePlotWindow(plot_data, self.__offline_sub_plots_flag)
+        self.offline_plot_windows.append(window)
+        window.show()
+
+    def __offline_plots_finished(self, cancelled):
+        """
+        Offline plot engine completion callback.
+        """
+        engine = self.offline_plot_engine
+        if engine is not None:
+            if cancelled:
+                log.info("Offline plots cancelled")
+            if len(engine.failed_jobs) > 0:
+                log.warning(f"Offline plots failed for: {', '.join(engine.failed_jobs)}")
+            engine.wait()
+            self.offline_plot_engine = None
         self.sig_offline_plots_completed.emit()
 
-    def start_wav_conversion_thread(self, comp_name, start_time, end_time, finish_callback):
+    def start_wav_conversion_thread(
+        self, comp_name, start_time, end_time, finish_callback, progress_callback=None
+    ):
         """
         Start the wav conversion process.
         """
@@ -3113,15 +3856,78 @@ class HSD_Controller(STDTDL_Controller):
         self.worker_thread.sig_finished.connect(
             partial(self.__inner_finish_callback, finish_callback)
         )  # Connect the finish callback
+        if progress_callback is not None:
+            self.worker_thread.sig_progress.connect(progress_callback)
         self.worker_thread.start()  # Start the segmentation thread
 
+    def cancel_wav_conversion(self):
+        """
+        Cancel the ongoing wav conversion, if any.
+        """
+        if self.worker_thread is not None and self.worker_thread.isRunning():
+            self.worker_thread.cancel()
+
     def __inner_finish_callback(self, finish_callback, comp_name, wav_file_name):
         """
         Inner finish callback function.
         """
         finish_callback(comp_name, wav_file_name)
 
-    def convert_dat2wav(self, comp_name, start_time, end_time):
+    @staticmethod
+    def __load_saved_component_status(acquisition_folder, comp_name):
+        """
+        Return the status of a component saved in the acquisition `device_config.json`.
+        """
+        config_path = os.path.join(acquisition_folder, "device_config.json")
+        if not os.path.exists(config_path):
+            return None
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                device_config = json.load(f)
+            components = device_config["devices"][0]["components"]
+        except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+            log.warning(f"Invalid {config_path}: {e}")
+            return None
+        if isinstance(components, dict):
+            return components.get(comp_name)
+        for component in components:
+            if comp_name in component:
+                return component[comp_name]
+        return None
+
+    def __get_wav_converter(self, comp_name, acquisition_folder, dat_file_path, wav_file_path):
+        """
+        Build a streaming converter for a `.dat` file saved by this GUI, if possible.
+
+        The stream layout and the ODR are read from the `device_config.json` saved with
+        the acquisition (not from the current device configuration); the measured ODR,
+        when available, is used to locate the requested time range.
+        """
+        comp_status = self.__load_saved_component_status(acquisition_folder, comp_name)
+        comp_interface = self.components_dtdl.get(comp_name)
+        if comp_status is None or comp_interface is None or not os.path.exists(dat_file_path):
+            return None
+        spts = comp_status.get("samples_per_ts", 1)
+        if not isinstance(spts, int):
+            spts = spts["val"] if spts and "val" in spts else spts
+        try:
+            return DatWavConverter(
+                dat_file_path,
+                wav_file_path,
+                comp_status.get("usb_dps"),
+                spts,
+                comp_status.get("dim", 1),
+                TypeConversion.check_type_length(comp_status["data_type"]),
+                self.__get_audio_sensor_odr(comp_status, comp_interface),
+                comp_status.get("measodr"),
+            )
+        except (DatWavFormatError, KeyError, TypeError, ValueError) as e:
+            log.info(f"Streaming WAV conversion not available for {comp_name}: {e}")
+            return None
+
+    def convert_dat2wav(
+        self, comp_name, start_time, end_time, progress_callback=None, cancel_event=None
+    ):
         """
         Convert recorded DAT stream to WAV for the specified time range.
 
@@ -3130,30 +3936,55 @@ class HSD_Controller(STDTDL_Controller):
         comp_name : str
             Component name to convert.
         start_time : int
-            Start timestamp in microseconds.
+            Start time in seconds.
         end_time : int
-            End timestamp in microseconds.
+            End time in seconds (-1 for the end of the recording).
+        progress_callback : callable | None, optional
+            Called with the completion percentage (int, 0-100).
+        cancel_event : threading.Event | None, optional
+            Set it to stop the conversion.
 
         Returns
         -------
         str | None
-            Path to the generated WAV file or `None` on error.
+            Path to the generated WAV file or `None` on error or cancellation.
+
+        Notes
+        -----
+        Files recorded by this GUI over USB are streamed chunk by chunk from a
+        memory-mapped `.dat` file, with constant memory usage; packets lost during the
+        acquisition are replaced by silence and logged. Other files are
+        converted in one call by `HSDatalog.convert_dat_to_wav`.
         """
         acquisition_folder = self.hsd_link.get_acquisition_folder()
+        output_folder = acquisition_folder + "_Exported"
+        if not os.path.exists(output_folder):
+            os.makedirs(output_folder)
+
+        converter = self.__get_wav_converter(
+            comp_name,
+            acquisition_folder,
+            os.path.join(acquisition_folder, f"{comp_name}.dat"),
+            os.path.join(output_folder, f"{comp_name}.wav"),
+        )
+        if converter is not None:
+            try:
+                return converter.convert(start_time, end_time, progress_callback, cancel_event)
+            except DatWavFormatError as e:
+                log.info(f"Streaming WAV conversion not available for {comp_name}: {e}")
+
         hsd_factory = HSDatalog()
         hsd = hsd_factory.create_hsd(acquisition_folder)
         if hsd is None:
             log.error("Error creating HSDatalog object")
             return None
 
-        output_folder = acquisition_folder + "_Exported"
-        if not os.path.exists(output_folder):
-            os.makedirs(output_folder)
-
         hsd.enable_timestamp_recovery(True)
         component = HSDatalog.get_component(hsd, comp_name)
         if component is not None:
             HSDatalog.convert_dat_to_wav(hsd, component, start_time, end_time, output_folder)
+        if progress_callback is not None:
+            progress_callback(100)
 
         return HSDatalog.get_wav_file_path(hsd, comp_name, output_folder)
 
@@ -34,6 +34,7 @@ Highlights
 """
 import os
 import json
+from functools import partial
 
 from PySide6.QtCore import Slot
 from PySide6.QtWidgets import QMessageBox
@@ -81,6 +82,13 @@ import stdatalog_pnpl.DTDL.dtdl_utils as DTDLUtils
 import stdatalog_core.HSD_utils.logger as logger
 log = logger.get_logger(__name__)
 
+# Algorithm types with a plot widget
+ALGORITHM_PLOT_TYPES = (
+    DTDLUtils.AlgorithmTypeEnum.IALGORITHM_TYPE_FFT.value,
+    DTDLUtils.AlgorithmTypeEnum.IALGORITHM_TYPE_ANOMALY_DETECTOR.value,
+    DTDLUtils.AlgorithmTypeEnum.IALGORITHM_TYPE_CLASSIFIER.value,
+)
+
 class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
     """Concrete device configuration page for HSDatalog2.
 
@@ -106,6 +114,9 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
         Components ignored when discovered (e.g., ``applications_stblesensor``).
     graph_id : int
         Incremental identifier used when creating plot widgets.
+    plot_order : list[str]
+        Components with a plot widget, in discovery order. Plot widgets of disabled
+        sensors are built when the sensor is enabled and inserted at their position.
     log_file_name : str | None
         Basename of the current application log file, if available.
     """
@@ -128,6 +139,7 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
         self.ignored_components = ["applications_stblesensor", "wifi_config"]
 
         self.graph_id = 0
+        self.plot_order = []
 
         self.log_file_name = None
         for handler in log.parent.handlers:
@@ -242,6 +254,7 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
                 comp_interface.contents,
                 self.comp_id,
                 self.device_config_widget,
+                lazy_contents=True,
             )
             self.controller.add_component_config_widget(comp_config_widget)
             self.device_config_widget.layout().addWidget(comp_config_widget)
@@ -264,7 +277,9 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
         -----
         - Chooses specialized configuration widgets when ``_mlc`` or ``_als`` appear in
           the sensor name; otherwise uses a generic component widget.
-        - Builds an appropriate plot widget based on ``SensorPlotParams`` subtype.
+        - Builds an appropriate plot widget based on ``SensorPlotParams`` subtype; for
+          disabled sensors the plot widget is built when the sensor is enabled.
+        - The generic component widget builds its property widgets on first expansion.
         - Sets initial visibility from the sensor enabled state and updates controller
           bandwidth checks.
         """
@@ -303,6 +318,7 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
                 comp_interface.contents,
                 self.comp_id,
                 self.device_config_widget,
+                lazy_contents=True,
             )
 
         self.controller.add_component_config_widget(sensor_config_widget)
@@ -317,100 +333,24 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
                 comp_name, ComponentType.SENSOR, comp_interface, comp_status
             )
             if sensor_plot_params is not None:
-                if isinstance(sensor_plot_params, SensorRangingPlotParams):
-                    sensor_plot_widget = HSDPlotToFWidget(
-                        self.controller,
-                        comp_name,
-                        comp_display_name,
-                        sensor_plot_params,
-                        self.graph_id,
-                        self.plots_widget,
-                    )
-                elif isinstance(sensor_plot_params, SensorPresenscePlotParams):
-                    plots_params_dict = {}
-                    s_enabled = comp_status[comp_name].get("enable")
-                    embedded_compensation = comp_status[comp_name].get(
-                        "embedded_compensation"
-                    )
-                    software_compensation = comp_status[comp_name].get(
-                        "software_compensation"
-                    )
-                    plots_params_dict["Ambient"] = PlotPAmbientParams(
-                        comp_name, s_enabled, 1
-                    )
-                    plots_params_dict["Object"] = PlotPObjectParams(
-                        comp_name,
-                        s_enabled,
-                        4,
-                        embedded_compensation,
-                        software_compensation,
-                    )
-                    plots_params_dict["Presence"] = PlotPPresenceParams(
-                        comp_name,
-                        s_enabled,
-                        1,
-                        embedded_compensation,
-                        software_compensation,
-                    )
-                    plots_params_dict["Motion"] = PlotPMotionParams(
-                        comp_name,
-                        s_enabled,
-                        1,
-                        embedded_compensation,
-                        software_compensation,
-                    )
-                    sensor_plot_params.plots_params_dict = plots_params_dict
-                    sensor_plot_widget = HSDPlotTMOSWidget(
-                        self.controller,
-                        comp_name,
-                        comp_display_name,
-                        sensor_plot_params,
-                        self.graph_id,
-                        self.plots_widget,
-                    )
-                elif isinstance(sensor_plot_params, SensorLightPlotParams):
-                    sensor_plot_widget = HSDPlotALSWidget(
-                        self.controller,
-                        comp_name,
-                        comp_display_name,
-                        sensor_plot_params,
-                        self.graph_id,
-                        self.plots_widget,
-                    )
-                elif isinstance(sensor_plot_params, SensorPowerPlotParams):
-                    sensor_plot_widget = HSDPlotPOWWidget(
-                        self.controller,
-                        comp_name,
-                        comp_display_name,
-                        sensor_plot_params,
-                        self.graph_id,
-                        self.plots_widget,
-                    )
-
-                elif isinstance(sensor_plot_params,SensorCameraPlotParams):
-                    sensor_plot_widget = HSDPlotImageWidget(
-                        self.controller, 
-                        comp_name, 
-                        comp_display_name, 
-                        sensor_plot_params, 
-                        self.graph_id, 
-                        self.plots_widget
-                    ) 
-                
-                else:
-                    sensor_plot_widget = HSDPlotLinesWidget(
-                        self.controller,
-                        comp_name,
-                        comp_display_name,
-                        sensor_plot_params,
-                        self.graph_id,
-                        self.plots_widget,
-                    )
+                build_plot_widget = partial(
+                    self.__create_sensor_plot_widget,
+                    comp_name,
+                    comp_display_name,
+                    sensor_plot_params,
+                    comp_status,
+                    self.graph_id,
+                )
                 self.graph_id +=1
-                self.controller.add_plot_widget(sensor_plot_widget, enabled)
-                self.plots_widget.layout().addWidget(sensor_plot_widget)
+                self.plot_order.append(comp_name)
                 log.debug(f"comp_name: {comp_name} - status: {enabled}")
-                sensor_plot_widget.setVisible(enabled)
+                if enabled:
+                    sensor_plot_widget = build_plot_widget()
+                    self.controller.add_plot_widget(sensor_plot_widget, enabled)
+                    sensor_plot_widget.setVisible(enabled)
+                else:
+                    # Disabled sensor: the plot widget is built when it is enabled
+                    self.controller.add_plot_widget_factory(comp_name, build_plot_widget)
         except Exception as e:
             print(e)
             log.warning(
@@ -421,6 +361,132 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
         self.controller.fill_component_status(comp_name)
         self.controller.check_hsd_bandwidth()
 
+    def __create_sensor_plot_widget(
+        self, comp_name, comp_display_name, sensor_plot_params, comp_status, graph_id
+    ):
+        """Build the plot widget of a sensor and insert it in the plots layout.
+
+        Parameters
+        ----------
+        comp_name : str
+            Sensor component name.
+        comp_display_name : str
+            Sensor display name.
+        sensor_plot_params : SensorPlotParams
+            Plot parameters computed when the sensor was discovered.
+        comp_status : dict
+            Sensor status when the sensor was discovered.
+        graph_id : int
+            Plot identifier assigned when the sensor was discovered.
+
+        Returns
+        -------
+        QWidget
+            The new plot widget.
+        """
+        if isinstance(sensor_plot_params, SensorRangingPlotParams):
+            sensor_plot_widget = HSDPlotToFWidget(
+                self.controller,
+                comp_name,
+                comp_display_name,
+                sensor_plot_params,
+                graph_id,
+                self.plots_widget,
+            )
+        elif isinstance(sensor_plot_params, SensorPresenscePlotParams):
+            plots_params_dict = {}
+            s_enabled = comp_status[comp_name].get("enable")
+            embedded_compensation = comp_status[comp_name].get(
+                "embedded_compensation"
+            )
+            software_compensation = comp_status[comp_name].get(
+                "software_compensation"
+            )
+            plots_params_dict["Ambient"] = PlotPAmbientParams(
+                comp_name, s_enabled, 1
+            )
+            plots_params_dict["Object"] = PlotPObjectParams(
+                comp_name,
+                s_enabled,
+                4,
+                embedded_compensation,
+                software_compensation,
+            )
+            plots_params_dict["Presence"] = PlotPPresenceParams(
+                comp_name,
+                s_enabled,
+                1,
+                embedded_compensation,
+                software_compensation,
+            )
+            plots_params_dict["Motion"] = PlotPMotionParams(
+                comp_name,
+                s_enabled,
+                1,
+                embedded_compensation,
+                software_compensation,
+            )
+            sensor_plot_params.plots_params_dict = plots_params_dict
+            sensor_plot_widget = HSDPlotTMOSWidget(
+                self.controller,
+                comp_name,
+                comp_display_name,
+                sensor_plot_params,
+                graph_id,
+                self.plots_widget,
+            )
+        elif isinstance(sensor_plot_params, SensorLightPlotParams):
+            sensor_plot_widget = HSDPlotALSWidget(
+                self.controller,
+                comp_name,
+                comp_display_name,
+                sensor_plot_params,
+                graph_id,
+                self.plots_widget,
+            )
+        elif isinstance(sensor_plot_params, SensorPowerPlotParams):
+            sensor_plot_widget = HSDPlotPOWWidget(
+                self.controller,
+                comp_name,
+                comp_display_name,
+                sensor_plot_params,
+                graph_id,
+                self.plots_widget,
+            )
+
+        elif isinstance(sensor_plot_params,SensorCameraPlotParams):
+            sensor_plot_widget = HSDPlotImageWidget(
+                self.controller, 
+                comp_name, 
+                comp_display_name, 
+                sensor_plot_params, 
+                graph_id, 
+                self.plots_widget
+            ) 
+        
+        else:
+            sensor_plot_widget = HSDPlotLinesWidget(
+                self.controller,
+                comp_name,
+                comp_display_name,
+                sensor_plot_params,
+                graph_id,
+                self.plots_widget,
+            )
+        self.__insert_plot_widget(comp_name, sensor_plot_widget)
+        return sensor_plot_widget
+
+    def __insert_plot_widget(self, comp_name, plot_widget):
+        # Keep the plots in discovery order, also when built later
+        layout = self.plots_widget.layout()
+        following = self.plot_order[self.plot_order.index(comp_name) + 1:]
+        for cn in following:
+            w = self.controller.plot_widgets.get(cn)
+            if w is not None and layout.indexOf(w) >= 0:
+                layout.insertWidget(layout.indexOf(w), plot_widget)
+                return
+        layout.addWidget(plot_widget)
+
     @Slot(str, dict)
     def s_algorithm_component_found(self, comp_name, comp_interface):
         """Handle algorithm discovery and attach configuration and plot widgets.
@@ -445,6 +511,7 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
             comp_interface.contents,
             self.comp_id,
             self.device_config_widget,
+            lazy_contents=True,
         )
         self.comp_id += 1
         self.controller.add_component_config_widget(alg_config_widget)
@@ -455,57 +522,84 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
         algorithm_plot_params = self.controller.get_plot_params(
             comp_name, ComponentType.ALGORITHM, comp_interface, comp_status
         )
-        if algorithm_plot_params is not None:
-            alg_type = algorithm_plot_params.alg_type
-            if alg_type == DTDLUtils.AlgorithmTypeEnum.IALGORITHM_TYPE_FFT.value:
-                alg_plot_widget = PlotBarFFTWidget(
-                    self.controller,
-                    comp_name,
-                    comp_display_name=comp_display_name,
-                    fft_len=algorithm_plot_params.fft_len,
-                    fft_input_freq_hz=algorithm_plot_params.fft_sample_freq,
-                    p_id=self.graph_id,
-                    parent=self.plots_widget,
-                )
-                self.graph_id +=1
-                self.controller.add_plot_widget(alg_plot_widget)
-                self.plots_widget.layout().addWidget(alg_plot_widget)
-                alg_plot_widget.setVisible(True)
-            elif alg_type == DTDLUtils.AlgorithmTypeEnum.IALGORITHM_TYPE_ANOMALY_DETECTOR.value:
-                anomaly_classes = self.controller.get_anomaly_classes()
-                ai_tool = self.controller.get_ai_anomaly_tool()
-                alg_plot_widget = AnomalyDetectorWidget(
-                    self.controller,
-                    comp_name,
-                    comp_display_name,
-                    anomaly_classes=anomaly_classes,
-                    ai_tool=ai_tool,
-                    p_id=self.graph_id,
-                    parent=self.plots_widget,
-                )
-                self.graph_id +=1
-                self.controller.add_plot_widget(alg_plot_widget)
-                self.plots_widget.layout().addWidget(alg_plot_widget)
-                alg_plot_widget.setVisible(True)
-            elif alg_type == DTDLUtils.AlgorithmTypeEnum.IALGORITHM_TYPE_CLASSIFIER.value:
-                out_classes = self.controller.get_output_classes()
-                ai_tool = self.controller.get_ai_classifier_tool()
-                alg_plot_widget = ClassifierOutputWidget(
-                    self.controller,
-                    comp_name,
-                    comp_display_name,
-                    out_classes=out_classes,
-                    ai_tool=ai_tool,
-                    p_id=self.graph_id,
-                    parent=self.plots_widget,
-                )
-                self.graph_id +=1
+        if (
+            algorithm_plot_params is not None
+            and algorithm_plot_params.alg_type in ALGORITHM_PLOT_TYPES
+        ):
+            build_plot_widget = partial(
+                self.__create_algorithm_plot_widget,
+                comp_name,
+                comp_display_name,
+                algorithm_plot_params,
+                self.graph_id,
+            )
+            self.graph_id +=1
+            self.plot_order.append(comp_name)
+            if algorithm_plot_params.enabled:
+                alg_plot_widget = build_plot_widget()
                 self.controller.add_plot_widget(alg_plot_widget)
-                self.plots_widget.layout().addWidget(alg_plot_widget)
                 alg_plot_widget.setVisible(True)
+            else:
+                # Disabled algorithm: the plot widget is built when it is enabled
+                self.controller.add_plot_widget_factory(comp_name, build_plot_widget)
 
         self.controller.fill_component_status(comp_name)
 
+    def __create_algorithm_plot_widget(
+        self, comp_name, comp_display_name, algorithm_plot_params, graph_id
+    ):
+        """Build the plot widget of an algorithm and insert it in the plots layout.
+
+        Parameters
+        ----------
+        comp_name : str
+            Algorithm component name.
+        comp_display_name : str
+            Algorithm display name.
+        algorithm_plot_params : AlgorithmPlotParams
+            Plot parameters computed when the algorithm was discovered.
+        graph_id : int
+            Plot identifier assigned when the algorithm was discovered.
+
+        Returns
+        -------
+        QWidget
+            The new plot widget.
+        """
+        alg_type = algorithm_plot_params.alg_type
+        if alg_type == DTDLUtils.AlgorithmTypeEnum.IALGORITHM_TYPE_FFT.value:
+            alg_plot_widget = PlotBarFFTWidget(
+                self.controller,
+                comp_name,
+                comp_display_name=comp_display_name,
+                fft_len=algorithm_plot_params.fft_len,
+                fft_input_freq_hz=algorithm_plot_params.fft_sample_freq,
+                p_id=graph_id,
+                parent=self.plots_widget,
+            )
+        elif alg_type == DTDLUtils.AlgorithmTypeEnum.IALGORITHM_TYPE_ANOMALY_DETECTOR.value:
+            alg_plot_widget = AnomalyDetectorWidget(
+                self.controller,
+                comp_name,
+                comp_display_name,
+                anomaly_classes=self.controller.get_anomaly_classes(),
+                ai_tool=self.controller.get_ai_anomaly_tool(),
+                p_id=graph_id,
+                parent=self.plots_widget,
+            )
+        else:
+            alg_plot_widget = ClassifierOutputWidget(
+                self.controller,
+                comp_name,
+                comp_display_name,
+                out_classes=self.controller.get_output_classes(),
+                ai_tool=self.controller.get_ai_classifier_tool(),
+                p_id=graph_id,
+                parent=self.plots_widget,
+            )
+        self.__insert_plot_widget(comp_name, alg_plot_widget)
+        return alg_plot_widget
+
     @Slot(str, dict)
     def s_actuator_component_found(self, comp_name, comp_interface):
         """Handle actuator discovery and attach configuration widget.
@@ -531,6 +625,7 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
             comp_interface.contents,
             self.comp_id,
             self.device_config_widget,
+            lazy_contents=True,
         )
         self.comp_id += 1
         self.controller.add_component_config_widget(act_config_widget)
@@ -680,13 +775,24 @@ class HSD_DeviceConfigPage(STDTDL_DeviceConfigPage):
         Parameters
         ----------
         status : bool
-            ``True`` to show the warning; ``False`` to clear it.
+            ``True`` to show the warning, with the estimate and the suggested ODR
+            reductions of the controller bandwidth plan; ``False`` to clear it.
         """
         if status:
             error_msg = (
                 "Safe bandwidth limit exceeded.\n"
                 "Consider disabling sensors or lowering ODRs to avoid possible data "
                 "corruption.\n"
+            )
+            plan = self.controller.get_bandwidth_plan()
+            if plan is not None:
+                error_msg += (
+                    f"Estimated {plan.total_bps / 1e6:.2f} Mbit/s, "
+                    f"{plan.link} link capacity {plan.capacity_bps / 1e6:.2f} Mbit/s.\n"
+                )
+                if len(plan.suggestions) > 0 or not plan.fits_with_suggestions:
+                    error_msg += f"Suggested changes:\n{plan.describe_suggestions()}\n"
+            error_msg += (
                 f"Have a look in {self.log_file_name if self.log_file_name is not None else 'application'} log file for more detailed info."
             )
             log.warning(error_msg)
@@ -30,11 +30,15 @@ Highlights
 - Maintains mappings from output class names to representative images.
 - Exposes helpers to set AI tool badges (ISPU, Nanoedge variants).
 - Forwards key press/release events to the controller via signals.
+- Opens the acquisition diagnostics panel with Ctrl+Shift+D.
 - Gracefully closes threads and links when the window is closed.
 """
 
+from PySide6.QtGui import QKeySequence, QShortcut
+
 import stdatalog_gui.UI.images #NOTE don't delete this! it is used from resource_filename
 from stdatalog_gui.STDTDL_MainWindow import STDTDL_MainWindow
+from stdatalog_gui.Widgets.StreamDiagnosticsDialog import StreamDiagnosticsDialog
 
 from stdatalog_gui.HSD_GUI.HSD_DeviceConfigPage import HSD_DeviceConfigPage
 from stdatalog_gui.HSD_GUI.HSD_Controller import HSD_Controller
@@ -81,6 +85,8 @@ class HSD_MainWindow(STDTDL_MainWindow):
         Mapping from selected anomaly tool display name to image path.
     ai_classifier_tool : dict[str, str]
         Mapping from selected classifier tool display name to image path.
+    diagnostics_dialog : StreamDiagnosticsDialog | None
+        Acquisition diagnostics panel, created when first opened.
     """
 
     def __init__(self, app, controller = HSD_Controller(None), parent=None):
@@ -110,8 +116,19 @@ class HSD_MainWindow(STDTDL_MainWindow):
         self.ai_anomaly_tool = {}
         self.ai_classifier_tool = {}
 
+        self.diagnostics_dialog = None
+        self.diagnostics_shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        self.diagnostics_shortcut.activated.connect(self.show_stream_diagnostics)
+
         self.setWindowTitle("HSDatalog2")
 
+    def show_stream_diagnostics(self):
+        """Show the acquisition diagnostics panel (throughput, losses, latencies)."""
+        if self.diagnostics_dialog is None:
+            self.diagnostics_dialog = StreamDiagnosticsDialog(self.controller, self)
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
+
     def setAIAnomalyImages(self, anomaly_images:list):
         """Register images for anomaly output classes.
 
@@ -211,8 +228,8 @@ class HSD_MainWindow(STDTDL_MainWindow):
     def closeEvent(self, event):
         """Shutdown logging, plot threads, and links before closing.
 
-        This handler stops the controller logging, closes plot threads if the HSD
-        instance exists, and safely shuts down the serial link when used. Finally, it
+        This handler stops the controller logging, waits for the acquisition files to
+        be finalized, closes the offline plots, and safely shuts down the serial link when used. Finally, it
         accepts the close event.
 
         Parameters
@@ -225,8 +242,10 @@ class HSD_MainWindow(STDTDL_MainWindow):
         None
         """
         self.controller.stop_log()
-        if self.controller.hsd is not None:
-            self.controller.hsd.close_plot_threads()
+        # Automode sessions may still be closing their files in background
+        self.controller.wait_session_finalization()
+        self.controller.cancel_offline_plots()
+        self.controller.close_offline_plots()
         if self.controller.is_hsd_link_serial():
             self.controller.stop_serial_reader_thread()
             if self.controller.hsd_link is not None:
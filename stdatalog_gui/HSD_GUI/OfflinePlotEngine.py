@@ -0,0 +1,340 @@
+# *****************************************************************************
+#  * @file    OfflinePlotEngine.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+#
+"""
+Background engine loading the data of offline plots of a saved acquisition.
+
+Offline plots of multi-GB acquisitions take minutes per component, most of it spent
+reading and decoding the `.dat` files. This module fans the per-component loading out
+over a `ProcessPoolExecutor`, so the GUI thread stays responsive and components are
+decoded in parallel. The figures are created in the GUI process from the returned
+arrays (see `OfflinePlotWindow`).
+
+- `OfflinePlotJob`: one component to load (sensor, algorithm or actuator).
+- `OfflinePlotData`: decoded arrays of a component, returned by the workers.
+- `OfflinePlotEngine`: `QThread` submitting the jobs, delivering the decoded data,
+    reporting per-component progress and supporting cancellation.
+
+Design Notes
+------------
+- Workers are started with the `spawn` method: forking a process that runs Qt threads
+    is unsafe. Each worker opens its own `HSDatalog` instance on the acquisition folder.
+- Workers never create figures: they are headless processes without an event loop.
+- Workers return at most `MAX_PLOT_POINTS` points per series: longer series are reduced
+    to their min/max envelope (see `Utils.Decimation`), so the GUI process never
+    receives the full arrays of a multi-GB acquisition.
+- A selected tag does not filter the samples: its intervals are returned as
+    `tag_regions` and highlighted on the time plots.
+- Cancellation drops the jobs not started yet; running jobs are allowed to complete.
+- `sig_finished` is emitted once, after all the workers returned.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from enum import Enum
+from threading import Event
+
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+
+from stdatalog_core.HSD.HSDatalog import HSDatalog
+from stdatalog_gui.Utils.Decimation import decimate_minmax
+
+import stdatalog_core.HSD_utils.logger as logger
+log = logger.get_logger(__name__)
+
+MAX_PLOT_POINTS = 200000  # per series, after min/max decimation
+
+class OfflinePlotJobType(Enum):
+    SENSOR = 0
+    ALGORITHM = 1
+    ACTUATOR = 2
+
+class OfflinePlotJob:
+    """
+    Offline plot request for a single component.
+
+    Parameters
+    ----------
+    job_type : OfflinePlotJobType
+        Kind of component.
+    comp_name : str
+        Component name.
+    comp_status : dict
+        Component status, as returned by `HSDatalog.get_sensor_list` and similar.
+    """
+
+    def __init__(self, job_type: OfflinePlotJobType, comp_name, comp_status):
+        self.job_type = job_type
+        self.comp_name = comp_name
+        self.comp_status = comp_status
+
+class OfflinePlotData:
+    """
+    Decoded data of one component, ready to be plotted.
+
+    Parameters
+    ----------
+    comp_name : str
+        Component name.
+    job_type : OfflinePlotJobType
+        Kind of component.
+
+    Attributes
+    ----------
+    series : list[tuple[str, numpy.ndarray, numpy.ndarray, list[str]]]
+        `(name, time, data, columns)` per data frame: `time` has shape `(n,)`, `data`
+        has shape `(n, len(columns))`.
+    fft : list[tuple[str, numpy.ndarray, numpy.ndarray, list[str]]]
+        `(name, frequencies, magnitudes, columns)` per data frame, when requested.
+    tag_label : str | None
+        Selected tag label.
+    tag_regions : list[tuple[float, float]]
+        `(start, end)` times of the intervals labelled with `tag_label`.
+    """
+
+    def __init__(self, comp_name, job_type, tag_label=None):
+        self.comp_name = comp_name
+        self.job_type = job_type
+        self.tag_label = tag_label
+        self.series = []
+        self.fft = []
+        self.tag_regions = []
+
+def _dataframe_arrays(df, label_classes):
+    # Numeric data columns of a data frame (label columns excluded)
+    columns = [
+        c
+        for c in df.select_dtypes(include="number").columns
+        if c != "Time" and c not in label_classes
+    ]
+    if "Time" in df.columns:
+        time = df["Time"].to_numpy(dtype=np.float64)
+    else:
+        time = np.arange(len(df), dtype=np.float64)
+    return time, df[columns].to_numpy(dtype=np.float64), columns
+
+def _tag_regions(df, time, tag_label):
+    # (start, end) times of the runs of rows labelled with the tag
+    if tag_label is None or tag_label not in df.columns or len(time) == 0:
+        return []
+    active = df[tag_label].to_numpy(dtype=bool).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], active, [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return [(float(time[s]), float(time[e])) for s, e in zip(starts, ends)]
+
+def _decimate_series(x, data, max_points=MAX_PLOT_POINTS):
+    # Min/max envelope of the columns of data; each point takes the x of the first or
+    # last sample of its bucket
+    n = len(x)
+    if n <= max_points:
+        return x, data
+    n_buckets = max_points // 2
+    bucket_len = -(-n // n_buckets)  # ceil, as in decimate_minmax
+    first = np.minimum(np.arange(n_buckets) * bucket_len, n - 1)
+    last = np.minimum(first + bucket_len - 1, n - 1)
+    out_x = np.empty(max_points, dtype=np.float64)
+    out_x[0:2 * n_buckets:2] = x[first]
+    out_x[1:2 * n_buckets:2] = x[last]
+    if max_points % 2:
+        out_x[-1] = x[-1]
+    return out_x, decimate_minmax(data.T, max_points).T
+
+def _fft_arrays(time, data):
+    # One-sided magnitude spectrum of each column (mean removed)
+    if len(time) < 2:
+        return None
+    dt = float(np.median(np.diff(time)))
+    if dt <= 0:
+        return None
+    magnitudes = np.abs(np.fft.rfft(data - data.mean(axis=0), axis=0)) / len(time)
+    return np.fft.rfftfreq(len(time), dt), magnitudes
+
+def load_offline_plot_data(
+    acquisition_folder,
+    job,
+    start_time,
+    end_time,
+    tag_label,
+    debug_flag,
+    raw_data_flag,
+    fft_flag,
+):
+    """
+    Load and decode one component of an acquisition (executed in a worker process).
+
+    Returns
+    -------
+    OfflinePlotData
+        The decoded arrays of the component.
+    """
+    hsd_factory = HSDatalog()
+    hsd = hsd_factory.create_hsd(acquisition_folder)
+    hsd.enable_timestamp_recovery(debug_flag)
+    label_classes = set()
+    if tag_label is not None:
+        label_classes = set(hsd.get_acquisition_label_classes() or [])
+    comp_status = job.comp_status
+    ioffset = comp_status.get("ioffset", 0)
+    if job.job_type == OfflinePlotJobType.SENSOR:
+        comp_status["is_first_chunk"] = True
+    try:
+        dataframes = HSDatalog.get_dataframe(
+            hsd,
+            {job.comp_name: comp_status},
+            start_time,
+            end_time,
+            labeled=tag_label is not None,
+            raw_data=raw_data_flag,
+        )
+    finally:
+        if job.job_type == OfflinePlotJobType.SENSOR:
+            HSDatalog.reset_status_conversion_side_info(comp_status, ioffset)
+    if dataframes is None:
+        dataframes = []
+    elif not isinstance(dataframes, list):
+        dataframes = [dataframes]
+
+    result = OfflinePlotData(job.comp_name, job.job_type, tag_label)
+    for i, df in enumerate(dataframes):
+        name = job.comp_name if len(dataframes) == 1 else f"{job.comp_name} [{i}]"
+        time, data, columns = _dataframe_arrays(df, label_classes)
+        if len(columns) == 0:
+            continue
+        result.tag_regions.extend(_tag_regions(df, time, tag_label))
+        if fft_flag and job.job_type == OfflinePlotJobType.SENSOR:
+            spectrum = _fft_arrays(time, data)
+            if spectrum is not None:
+                result.fft.append((name, *_decimate_series(*spectrum), columns))
+        result.series.append((name, *_decimate_series(time, data), columns))
+    return result
+
+class OfflinePlotEngine(QThread):
+    """
+    Thread loading the data of a set of offline plot jobs over a process pool.
+
+    Parameters
+    ----------
+    acquisition_folder : str
+        Folder of the acquisition to plot.
+    jobs : list[OfflinePlotJob]
+        Components to plot.
+    start_time : int
+        Start timestamp in microseconds.
+    end_time : int
+        End timestamp in microseconds.
+    tag_label : str | None
+        Tag filter label, or None.
+    debug_flag : bool
+        Enable timestamp recovery debugging.
+    raw_data_flag : bool
+        True to load raw data.
+    fft_flag : bool | None
+        Enable FFT plots when available.
+    max_workers : int | None, optional
+        Number of worker processes. Defaults to one per job, up to the number of CPUs.
+
+    Signals
+    -------
+    sig_data_ready : Signal(object)
+        Emitted with the `OfflinePlotData` of each component loaded successfully.
+    sig_progress : Signal(str, int, int)
+        Emitted each time a component is done (or cancelled): component name, number
+        of completed jobs and total number of jobs.
+    sig_finished : Signal(bool)
+        Emitted once all the workers returned. The argument is True if the run was
+        cancelled.
+    """
+
+    sig_data_ready = Signal(object)
+    sig_progress = Signal(str, int, int)
+    sig_finished = Signal(bool)
+
+    def __init__(
+        self,
+        acquisition_folder,
+        jobs,
+        start_time,
+        end_time,
+        tag_label,
+        debug_flag,
+        raw_data_flag,
+        fft_flag,
+        max_workers=None,
+    ):
+        super().__init__()
+        self.acquisition_folder = acquisition_folder
+        self.jobs = jobs
+        self.plot_args = (
+            start_time,
+            end_time,
+            tag_label,
+            debug_flag,
+            raw_data_flag,
+            fft_flag,
+        )
+        if max_workers is None:
+            max_workers = min(len(jobs), os.cpu_count() or 1)
+        self.max_workers = max(1, max_workers)
+        self.failed_jobs = []
+        self.__futures = []
+        self.__cancel_event = Event()
+
+    def run(self):
+        """
+        Submit all the jobs and wait for their completion.
+        """
+        total = len(self.jobs)
+        completed = 0
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(self.max_workers, mp_context=mp_context) as executor:
+            futures = {}
+            for job in self.jobs:
+                future = executor.submit(
+                    load_offline_plot_data, self.acquisition_folder, job, *self.plot_args
+                )
+                futures[future] = job.comp_name
+            self.__futures = list(futures)
+            if self.__cancel_event.is_set():
+                self.cancel()
+            for future in as_completed(futures):
+                comp_name = futures[future]
+                if not future.cancelled():
+                    error = future.exception()
+                    if error is not None:
+                        log.error(f"Error in {comp_name} offline plot: {error}")
+                        self.failed_jobs.append(comp_name)
+                    else:
+                        self.sig_data_ready.emit(future.result())
+                completed += 1
+                self.sig_progress.emit(comp_name, completed, total)
+        self.sig_finished.emit(self.__cancel_event.is_set())
+
+    def cancel(self):
+        """
+        Drop the jobs that have not started yet. Running jobs complete normally.
+        """
+        self.__cancel_event.set()
+        for future in self.__futures:
+            future.cancel()
+
+    def is_cancelled(self):
+        """
+        Return True if the run has been cancelled.
+        """
+        return self.__cancel_event.is_set()
@@ -94,6 +94,8 @@ class HSDComponentWidget(ComponentWidget):
         Component identifier used by the base class, by default 0.
     parent : QWidget | None, optional
         Parent widget.
+    lazy_contents : bool, optional
+        Build the property widgets on first expansion or enabling, by default False.
     """
     def __init__(
         self,
@@ -104,6 +106,7 @@ class HSDComponentWidget(ComponentWidget):
         comp_contents,
         c_id=0,
         parent=None,
+        lazy_contents=False,
     ):
         """Initialize the generic component widget."""
         super().__init__(
@@ -114,6 +117,7 @@ class HSDComponentWidget(ComponentWidget):
             comp_contents,
             c_id,
             parent,
+            lazy_contents,
         )
 
 
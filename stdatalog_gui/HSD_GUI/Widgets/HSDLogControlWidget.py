@@ -34,11 +34,10 @@ Highlights
 from datetime import datetime
 import os
 import math
-import threading
-import time
 
 from stdatalog_gui.UI.styles import STDTDL_Label, STDTDL_PushButton
-from stdatalog_gui.Widgets.LoadingWindow import StaticLoadingWindow
+from stdatalog_gui.Widgets.LoadingWindow import LoadingWindow
+from stdatalog_gui.Utils.AutomodeScheduler import AutomodeScheduler
 
 from PySide6.QtCore import Slot, Qt
 from PySide6.QtWidgets import (
@@ -107,6 +106,7 @@ class HSDLogControlWidget(ComponentWidget):
         )
 
         self.controller.sig_autologging_is_stopping.connect(self.s_is_autologging_stopping)
+        self.controller.sig_offline_plots_progress.connect(self.s_offline_plots_progress)
         self.controller.sig_offline_plots_completed.connect(self.s_offline_plots_completed)
         self.controller.sig_lock_start_button.connect(self.s_lock_start_button)
 
@@ -429,12 +429,12 @@ class HSDLogControlWidget(ComponentWidget):
         """
         Launch offline plotting for the selected components and time range.
         """
-        self.loading_window = StaticLoadingWindow(
+        self.loading_window = LoadingWindow(
             "Plot ongoing...",
             "Acquired data extraction. Please wait...",
             self.parent_widget,
+            cancel_callback=self.controller.cancel_offline_plots,
         )
-        self.app.processEvents()
 
         cb_sensor_value = self.ds_component_names_combo.currentText()
         tag_label = self.tags_label_combo.currentText()
@@ -476,6 +476,26 @@ class HSDLogControlWidget(ComponentWidget):
             self.log_start_button.setEnabled(not status)
             self.curr_start_log_button_statue = status
 
+    @Slot(str, int, int)
+    def s_offline_plots_progress(self, comp_name, completed, total):
+        """
+        Show the offline plotting progress.
+
+        Parameters
+        ----------
+        comp_name : str
+            Last component completed.
+        completed : int
+            Number of components completed.
+        total : int
+            Total number of components to plot.
+        """
+        self.loading_window.set_progress(
+            completed,
+            total,
+            f"Acquired data extraction: {comp_name} done ({completed}/{total})",
+        )
+
     @Slot()
     def s_offline_plots_completed(self):
         """
@@ -734,10 +754,9 @@ class HSDLogControlWidget(ComponentWidget):
         except Exception:
             pass
 
-    # import threading
     def run_timer(self, n, m, x, y):
         """
-        Start an automode timer thread to schedule repeated logging sessions.
+        Start an automode scheduler thread to run repeated logging sessions.
 
         Parameters
         ----------
@@ -752,62 +771,54 @@ class HSDLogControlWidget(ComponentWidget):
 
         Returns
         -------
-        tuple[threading.Thread, Callable[[], None]]
-            The running thread and a `stop_timer` function to signal a stop.
-        """
-        def timer_thread():
-            nonlocal stop_flag
-            self.is_waiting_to_start = True
-            self.controller.start_auto_log()
-            self.controller.start_waiting_auto_log()
-            time.sleep(m)  # Wait M seconds before the first start
-            self.is_waiting_to_start = False
-            self.controller.stop_waiting_auto_log()
-            if n != 0:
-                for i in range(n):
-                    if stop_flag:
-                        break
-                    self.controller.set_automode_status(AutomodeStatus.AUTOMODE_LOGGING)
-                    self.controller.start_auto_log_inner(1, self.acq_folder, True)
-                    time.sleep(x)  # Wait X seconds
-                    if stop_flag:
-                        break
-                    if i < n-1:
-                        self.controller.set_automode_status(AutomodeStatus.AUTOMODE_IDLE)
-                        self.controller.stop_auto_log_inner(1)
-                        self.log_start_button.setText("Stop Log")
-                        self.log_start_button.setStyleSheet(STDTDL_PushButton.red)
-                        self.controller.start_idle_auto_log()
-                        time.sleep(y)  # Wait Y seconds before the next execution
-                        self.controller.stop_idle_auto_log()
-                    else:
-                        self.controller.set_automode_status(AutomodeStatus.AUTOMODE_UNSTARTED)
-                        self.controller.stop_log(1)
-            else:
-                while True:
-                    if stop_flag:
-                        break
-                    self.controller.set_automode_status(AutomodeStatus.AUTOMODE_LOGGING)
-                    self.controller.start_auto_log_inner(1, self.acq_folder, True)
-                    time.sleep(x)  # Wait X seconds
-                    if stop_flag:
-                        break
-                    self.controller.set_automode_status(AutomodeStatus.AUTOMODE_IDLE)
-                    self.controller.stop_auto_log_inner(1)
-                    self.log_start_button.setText("Stop Log")
-                    self.log_start_button.setStyleSheet(STDTDL_PushButton.red)
-                    self.controller.start_idle_auto_log()
-                    time.sleep(y)  # Wait Y seconds before the next execution
-                    self.controller.stop_idle_auto_log()
+        tuple[AutomodeScheduler, Callable[[], None]]
+            The running scheduler thread and a `stop_timer` function to signal a stop.
 
-            self.controller.stop_auto_log()
+        Notes
+        -----
+        Sessions start and stop on absolute deadlines (no drift); the measured
+        inter-session gaps are logged by the scheduler.
+        """
+        def on_waiting(status):
+            self.is_waiting_to_start = status
+            if status:
+                self.controller.start_auto_log()
+                self.controller.start_waiting_auto_log()
+            else:
+                self.controller.stop_waiting_auto_log()
 
-        stop_flag = False
+        def on_idle(status):
+            if status:
+                self.controller.start_idle_auto_log()
+            else:
+                self.controller.stop_idle_auto_log()
 
-        def stop_timer():
-            nonlocal stop_flag
-            stop_flag = True
+        def start_session(i):
+            _ = i  # Unused parameter
+            self.controller.set_automode_status(AutomodeStatus.AUTOMODE_LOGGING)
+            self.controller.start_auto_log_inner(1, self.acq_folder, True)
 
-        timer_thread = threading.Thread(target=timer_thread)
-        timer_thread.start()
-        return timer_thread, stop_timer
+        def stop_session(i, last):
+            _ = i  # Unused parameter
+            if last:
+                self.controller.set_automode_status(AutomodeStatus.AUTOMODE_UNSTARTED)
+                self.controller.stop_log(1)
+            else:
+                self.controller.set_automode_status(AutomodeStatus.AUTOMODE_IDLE)
+                self.controller.stop_auto_log_inner(1)
+                self.log_start_button.setText("Stop Log")
+                self.log_start_button.setStyleSheet(STDTDL_PushButton.red)
+
+        scheduler = AutomodeScheduler(
+            n,
+            m,
+            x,
+            y,
+            start_session,
+            stop_session,
+            on_waiting=on_waiting,
+            on_idle=on_idle,
+            on_finished=self.controller.stop_auto_log,
+        )
+        scheduler.start()
+        return scheduler, scheduler.stop
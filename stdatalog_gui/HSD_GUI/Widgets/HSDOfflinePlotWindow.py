@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    HSDOfflinePlotWindow.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""
+Window showing the offline plots of one component.
+
+The data is loaded and decoded by the `OfflinePlotEngine` workers; this window only
+draws the returned arrays with pyqtgraph, in the GUI process, so its lifetime is
+managed by the controller like any other widget. The intervals of the selected tag are
+highlighted on the time plots.
+"""
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+
+import pyqtgraph as pg
+
+TAG_REGION_BRUSH = (164, 194, 56, 50)
+LINES_COLORS = ['#e6007e','#a4c238','#3cb4e6','#ef4f4f','#46b28e','#e8ce0e','#60b562','#f99e20','#41b3ba']
+
+class HSDOfflinePlotWindow(QWidget):
+    """Top-level window plotting an `OfflinePlotData`.
+
+    Parameters
+    ----------
+    plot_data : OfflinePlotData
+        Decoded component data.
+    sub_plots_flag : bool
+        True to draw each column in its own subplot.
+    parent : QWidget | None, optional
+        Parent widget.
+    """
+
+    def __init__(self, plot_data, sub_plots_flag, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"{plot_data.comp_name} - Offline plot")
+        self.resize(1000, 600)
+        self.graph_layout = pg.GraphicsLayoutWidget()
+        self.graph_layout.setBackground('#1b1d23')
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.graph_layout)
+
+        self.tag_regions = plot_data.tag_regions
+        for name, time, data, columns in plot_data.series:
+            if plot_data.tag_label is not None:
+                name = f"{name} - {plot_data.tag_label}"
+            self.__add_plots(name, time, data, columns, sub_plots_flag, "Time [s]", True)
+        for name, freqs, magnitudes, columns in plot_data.fft:
+            self.__add_plots(
+                f"{name} FFT", freqs, magnitudes, columns, False, "Frequency [Hz]", False
+            )
+
+    def __add_plots(self, title, x, data, columns, sub_plots_flag, x_label, with_tags):
+        if sub_plots_flag:
+            for i, column in enumerate(columns):
+                plot = self.__new_plot(f"{title} - {column}", x_label, with_tags)
+                plot.plot(x, data[:, i], pen=pg.mkPen(LINES_COLORS[i % len(LINES_COLORS)]))
+        else:
+            plot = self.__new_plot(title, x_label, with_tags)
+            plot.addLegend()
+            for i, column in enumerate(columns):
+                plot.plot(
+                    x,
+                    data[:, i],
+                    pen=pg.mkPen(LINES_COLORS[i % len(LINES_COLORS)]),
+                    name=column,
+                )
+
+    def __new_plot(self, title, x_label, with_tags):
+        plot = self.graph_layout.addPlot(title=title)
+        self.graph_layout.nextRow()
+        plot.setLabel('bottom', x_label)
+        plot.showGrid(x=True, y=True, alpha=0.2)
+        if with_tags:
+            for start, end in self.tag_regions:
+                region = pg.LinearRegionItem((start, end), movable=False, brush=TAG_REGION_BRUSH)
+                region.setZValue(-10)
+                plot.addItem(region)
+        # Large acquisitions: draw a peak-preserving decimation of the visible range
+        plot.setDownsampling(auto=True, mode="peak")
+        plot.setClipToView(True)
+        return plot
@@ -32,8 +32,7 @@ Highlights
 """
 import json
 import struct
-from collections import deque
-from PySide6.QtCore import Slot
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QPushButton, QFileDialog, QFrame
 
@@ -42,6 +41,7 @@ import pyqtgraph as pg
 
 import stdatalog_gui.UI.icons #do not remove this import. It is used by pkg_resources
 from stdatalog_gui.UI.styles import STDTDL_PushButton
+from stdatalog_gui.Utils.Decimation import DecimationMode, decimate
 from stdatalog_gui.Utils.PlotParams import PlotParams, SensorISPUPlotParams
 from stdatalog_gui.Widgets.Plots.PlotWidget import PlotLabel
 from stdatalog_gui.Widgets.Plots.PlotLinesWavWidget import PlotLinesWavWidget
@@ -108,9 +108,9 @@ class HSDPlotLinesWidget(PlotLinesWavWidget):
             self.fft_window = np.hanning(self.FFT_N)
             self.current_x = 0
             self.x_data_fft = np.fft.rfftfreq(self.FFT_N, 1/plot_params.odr)
-            self.y_queue_fft = dict() # dict of queues for fft
+            self.y_queue_fft = None # (dimension, FFT_N/2 + 1) spectra
             self.fft_graph_curves = dict()
-            self.fft_input_buff = []
+            self.fft_input_buff = np.zeros(0)
             self.fft_window_flag = True
 
         super().__init__(controller, comp_name, comp_display_name, plot_params, p_id, parent)
@@ -137,6 +137,19 @@ class HSDPlotLinesWidget(PlotLinesWavWidget):
                 QPushButton, "pushButton_tf_fft"
             )
             self.tf_fft_pushButton.clicked.connect(self.clicked_tf_fft_button)
+            self.tf_peak_pushButton = QPushButton("peak")
+            self.tf_peak_pushButton.setFixedSize(50, 30)
+            self.tf_peak_pushButton.setToolTip(
+                "live plot over time with min/max (peak-preserving) decimation"
+            )
+            self.tf_peak_pushButton.setStyleSheet(STDTDL_PushButton.valid)
+            self.tf_peak_pushButton.clicked.connect(self.clicked_tf_peak_button)
+            tf_layout = self.time_freq_setting_frame.layout()
+            tf_layout.insertWidget(
+                tf_layout.indexOf(self.tf_fft_pushButton) + 1,
+                self.tf_peak_pushButton,
+                alignment=Qt.AlignHCenter,
+            )
             self.frame_tf_fft_settings = self.time_freq_setting_frame.findChild(
                 QFrame, "frame_tf_fft_settings"
             )
@@ -466,6 +479,17 @@ class HSDPlotLinesWidget(PlotLinesWavWidget):
 
             self.__show_fft_curves_in_legend()
 
+    def clicked_tf_peak_button(self):
+        """
+        Toggle min/max (peak-preserving) decimation of the time-domain curves.
+        """
+        if self.decimation_mode == DecimationMode.MINMAX:
+            self.set_decimation_mode(DecimationMode.LINEAR)
+            self.tf_peak_pushButton.setStyleSheet(STDTDL_PushButton.valid)
+        else:
+            self.set_decimation_mode(DecimationMode.MINMAX)
+            self.tf_peak_pushButton.setStyleSheet(STDTDL_PushButton.green)
+
     def clicked_hanning_window_button(self):
         """
         Toggle the application of a Hanning window to the FFT input signal.
@@ -682,10 +706,9 @@ class HSDPlotLinesWidget(PlotLinesWavWidget):
             Parameters providing ODR and time window for FFT computations.
         """
         self.x_data_fft = np.fft.rfftfreq(self.FFT_N, 1/plot_params.odr)
+        self._data.clear()
+        self.y_queue_fft = np.zeros((self.plot_params.dimension, int(self.FFT_N / 2) + 1))
         for i in range(self.plot_params.dimension):
-            self._data[i] = deque(maxlen=200000)
-            self.y_queue_fft[i] = deque(maxlen=int(self.FFT_N / 2) + 1)
-            self.y_queue_fft[i].extend(np.zeros(int(self.FFT_N / 2) + 1))
             if len(self.fft_graph_curves) < self.plot_params.dimension:
                 self.fft_graph_curves[i] = self.graph_widget.plot()
                 self.fft_graph_curves[i] = pg.PlotDataItem(
@@ -740,20 +763,22 @@ class HSDPlotLinesWidget(PlotLinesWavWidget):
         """
         # if self.tf_time_flag:
         self.x_data = self.x_data + self.timer_interval
-        # for i in range(self.n_curves):
+        # Extract all data received since the last tick (dimension, n)
+        one_reduced_t_interval = self._data.read()
+        has_data = one_reduced_t_interval.shape[1] > 0
+        if has_data:
+            # Decimate extracted raw data to have the same plot_timer_interval size
+            # (plot len / (time window / times interval(sec)))
+            resampled = decimate(
+                one_reduced_t_interval, self.plot_t_interval_size, self.decimation_mode
+            )
         for i in range(self.plot_params.dimension):
-            if len(self._data[i]) > 0: # If data queue is not empty
-                # Extract all data from the queue (pop)
-                one_reduced_t_interval = [self._data[i].popleft() for _i in range(len(self._data[i]))]
-                # Resample extracted raw data to have the same plot_timer_interval size
-                # (plot len / (time window / times interval(sec)))
-                self.one_t_interval_resampled[i] = self.resample_linear1D(
-                    one_reduced_t_interval, self.plot_t_interval_size
-                )
-                # Put resampled data into the y data queue
-                self.y_queue[i].extend(self.one_t_interval_resampled[i])
+            if has_data:
+                self.one_t_interval_resampled[i] = resampled[i]
                 if self.tf_fft_flag:
-                    self.fft_input_buff.extend(one_reduced_t_interval)
+                    self.fft_input_buff = np.concatenate(
+                        (self.fft_input_buff, one_reduced_t_interval[i])
+                    )
                     if len(self.fft_input_buff) >= self.FFT_N:
                         signal = self.fft_input_buff[:self.FFT_N]
                         if self.fft_window_flag == True:
@@ -768,28 +793,23 @@ class HSDPlotLinesWidget(PlotLinesWavWidget):
                         else:
                             fft = np.abs(np.fft.rfft(signal)) / self.FFT_N
                             fft[1:] *= 2  # Double only the non-DC components
-                        self.one_t_interval_resampled[i] = np.concatenate(
-                            ([fft[0]], 2 * fft[1:])
-                        )
-                        # Put resampled data into the y data queue
-                        self.y_queue_fft[i].extend(self.one_t_interval_resampled[i])
-                        self.fft_input_buff = []
-            else: #data queue is empty
-                if self.tf_fft_flag:
-                    self.y_queue_fft[i].extend(self.one_t_interval_resampled[i])
-                self.y_queue[i].extend(self.one_t_interval_resampled[i])
-            # set extracted resampled data into the plot curve (for each axis)
-            # [x and y will have the same len = (plot len / (time window / times interval(sec)))
-            # self.graph_curves[i].setData(x=self.x_data,y=np.array(self.y_queue[i]))
+                        # Put the new spectrum into the fft data buffer
+                        self.y_queue_fft[i] = np.concatenate(([fft[0]], 2 * fft[1:]))
+                        self.fft_input_buff = np.zeros(0)
+        # Put resampled data (or the last interval, if no new data) into the y window
+        self.y_queue.extend(
+            [self.one_t_interval_resampled[i] for i in range(self.plot_params.dimension)]
+        )
+        for i in range(self.plot_params.dimension):
+            # set the rolling window (or the last spectrum) into the plot curve
             if self.tf_fft_flag:
                 self.fft_graph_curves[i].setData(
-                    x=self.x_data_fft, y=np.array(self.y_queue_fft[i])
+                    x=self.x_data_fft, y=self.y_queue_fft[i]
                 )
             else:
                 self.graph_curves[i].setData(
-                    x=self.x_data, y=np.array(self.y_queue[i])
+                    x=self.x_data, y=self.y_queue.row(i)
                 )
-        self.app_qt.processEvents()
 
     def add_data(self, data):
         """
@@ -804,13 +824,14 @@ class HSDPlotLinesWidget(PlotLinesWavWidget):
         if "_ispu" in self.comp_name:
             if self.plot_params.out_fmt is not None:
                 data_idx = 0
-                for i, of in enumerate(self.plot_params.out_fmt):
+                ax_values = []
+                for of in self.plot_params.out_fmt:
                     ax_len = of["data_byte_len"]
                     ax_value_bytes = np.array(
                         data[0][data_idx : data_idx + ax_len], dtype='int8'
                     ).tobytes() # Convert to bytes
-                    ax_value = struct.unpack("=" + of["data_format"], ax_value_bytes)
-                    self._data[i].extend(ax_value)
+                    ax_values.append(struct.unpack("=" + of["data_format"], ax_value_bytes))
                     data_idx += ax_len
+                self._data.write(ax_values)
         else:
             super().add_data(data)
@@ -26,7 +26,6 @@ set speed).
 """
 import os
 import time
-from threading import Event
 
 from PySide6.QtCore import Signal
 from stdatalog_core.HSD.utils.type_conversion import TypeConversion
@@ -98,7 +97,7 @@ class HSD_MC_Controller(HSD_Controller):
         - Retrieves the component status and determines if streaming is enabled.
         - Creates and registers a `DataReader` for incoming data frames.
         - Optionally opens a file for raw data saving if acquisition saving is enabled.
-        - Spawns and starts a `SensorAcquisitionThread` to read from the device link.
+        - Adds a `SensorStream` to the controller acquisition engine.
 
         Notes
         -----
@@ -121,10 +120,7 @@ class HSD_MC_Controller(HSD_Controller):
                             self.hsd_link.get_acquisition_folder(),
                             (str(s_plot.comp_name) + ".dat"),
                         )
-                        sensor_data_file = open(sensor_data_file_path, "wb+")
-                        self.sensor_data_files.append(sensor_data_file)
-                    stopFlag = Event()
-                    self.threads_stop_flags.append(stopFlag)
+                        sensor_data_file = self.open_sensor_data_file(sensor_data_file_path)
 
                     usb_dps = c_status_value.get("usb_dps")
                     spts = c_status_value.get("samples_per_ts", 1)
@@ -153,30 +149,19 @@ class HSD_MC_Controller(HSD_Controller):
                     )
                     self.data_readers.append(dr)
 
-                    if self.save_files_flag:
-                        thread = self.SensorAcquisitionThread(
-                            stopFlag,
+                    self.add_acquisition_stream(
+                        self.SensorStream(
                             self.hsd_link,
                             dr,
                             self.device_id,
                             s_plot.comp_name,
-                            sensor_data_file,
+                            sensor_data_file if self.save_files_flag else None,
                             usb_dps,
                             self.sig_streaming_error,
+                            self.stream_telemetry.counters(s_plot.comp_name),
+                            self.stream_watchdog,
                         )
-                    else:
-                        thread = self.SensorAcquisitionThread(
-                            stopFlag,
-                            self.hsd_link,
-                            dr,
-                            self.device_id,
-                            s_plot.comp_name,
-                            None,
-                            usb_dps,
-                            self.sig_streaming_error,
-                        )
-                    thread.start()
-                    self.sensors_threads.append(thread)
+                    )
 
     def get_plot_params(self, comp_name, comp_type, comp_interface, comp_status):
         """Return plot parameters for a component.
@@ -326,7 +311,7 @@ class HSD_MC_Controller(HSD_Controller):
                     )
         return None
 
-    def update_component_status(self, comp_name, comp_type = ComponentType.OTHER):
+    def update_component_status(self, comp_name, comp_type = ComponentType.OTHER, comp_status = None):
         """Update and emit status for a component.
 
         Calls the base implementation to refresh status, then, for actuators, computes plot
@@ -338,17 +323,21 @@ class HSD_MC_Controller(HSD_Controller):
             Component name.
         comp_type : ComponentType, optional
             Component type, defaults to `ComponentType.OTHER`.
+        comp_status : dict | None, optional
+            Already fetched status, as `{comp_name: status}`. If None (default), the
+            status is requested to the device once and shared by both updates.
         """
-        super().update_component_status(comp_name, comp_type)
-        self.__update_actuator_component_status(comp_name, comp_type)
+        if comp_status is None:
+            comp_status = self.get_component_status(comp_name)
+        super().update_component_status(comp_name, comp_type, comp_status)
+        self.__update_actuator_component_status(comp_name, comp_type, comp_status)
 
-    def __update_actuator_component_status(self, comp_name, comp_type):
+    def __update_actuator_component_status(self, comp_name, comp_type, comp_status):
         """Internal helper to handle actuator component status updates.
 
         If the component type is actuator, computes plot params and emits
         `sig_actuator_component_updated`. Always emits `sig_component_updated` with latest status.
         """
-        comp_status = self.get_component_status(comp_name)
         if comp_status is not None and comp_name in comp_status:
             self.components_status[comp_name] = comp_status[comp_name]
             if isinstance(comp_type,str):
@@ -359,7 +348,6 @@ class HSD_MC_Controller(HSD_Controller):
                 plot_params = self.get_plot_params(
                     comp_name, comp_type, self.components_dtdl[comp_name], comp_status
                 )
-                comp_status = self.get_component_status(comp_name)
                 self.sig_actuator_component_updated.emit(comp_name, plot_params)
             self.sig_component_updated.emit(comp_name, comp_status[comp_name])
 
@@ -39,6 +39,7 @@ from PySide6.QtUiTools import QUiLoader
 from PySide6.QtDesigner import QPyDesignerCustomWidgetCollection
 
 import stdatalog_gui
+from stdatalog_gui.Widgets.Plots.ClassHighlight import ClassHighlightMixin
 from stdatalog_gui.Widgets.Plots.PlotWidget import PlotWidget
 from stdatalog_gui.Widgets.Plots.PlotWidget import PlotLabel
 
@@ -99,7 +100,7 @@ class ApplicationState(Enum):
     VibrationState = 3
     RecoveryState = 4
 
-class HSD_MC_ClassifierOutputWidget(PlotWidget):
+class HSD_MC_ClassifierOutputWidget(ClassHighlightMixin, PlotWidget):
     """Widget rendering AI classification results with optional confidence display.
 
     Parameters
@@ -175,6 +176,7 @@ class HSD_MC_ClassifierOutputWidget(PlotWidget):
         self.ai_tool = ai_tool
         self.output_class_widget = {}
         self.output_class_pixmaps = {}
+        self.init_class_highlight(out_classes)
         self.demo_class_widget = {}
         self.demo_class_pixmaps = {}
 
@@ -307,6 +309,7 @@ class HSD_MC_ClassifierOutputWidget(PlotWidget):
             class_image:QLabel = self.output_class_widget[output_class].findChild(
                 QLabel, "out_class_image"
             )
+            self.output_class_labels[output_class] = (class_image, class_name)
             enabled_pixmap = class_pixmap
             disabled_pixmap = self.setOpacity(class_pixmap, 0.1)
             self.output_class_pixmaps[output_class] = (enabled_pixmap, disabled_pixmap)
@@ -405,9 +408,9 @@ class HSD_MC_ClassifierOutputWidget(PlotWidget):
         if len(self._data[0]) > 0:
             if not self.is_plotting_out:
                 self.is_plotting_out = True
-            # Extract all data from the queue (pop)
-            one_reduced_t_interval = [self._data[0].popleft() for _i in range(len(self._data[0]))]
-            one_reduced_t_interval_int = one_reduced_t_interval[0].astype(np.int32)
+            # Only the latest output of the interval is processed
+            one_reduced_t_interval_int = self._data[0][-1].astype(np.int32)
+            self._data[0].clear()
             predicted_class = one_reduced_t_interval_int[0]
 
             probability_byte = one_reduced_t_interval_int[1:]
@@ -425,17 +428,10 @@ class HSD_MC_ClassifierOutputWidget(PlotWidget):
             self.classifier_sm(predicted_class)
         else:
             if self.is_plotting_out:
-                for cn in list(self.output_class_widget.keys()):
-                    self.output_class_widget[cn].out_class_image.setPixmap(
-                        self.output_class_pixmaps[cn][1]
-                    )
-                    self.output_class_widget[cn].setEnabled(False)
-                    self.output_class_widget[cn].findChild(
-                        QLabel,"out_class_name").setStyleSheet("color: #383D48; font-size: 20px;")
+                self.disableAllClassificationWidget()
                 self.is_plotting_out = False
                 if self.with_confidence:
                     self.class_confidence_value.setText("--- %")
-        self.app_qt.processEvents()
 
     def add_data(self, data):
         """Append a new output frame to the processing queue."""
@@ -449,25 +445,7 @@ class HSD_MC_ClassifierOutputWidget(PlotWidget):
         class_id : int
             Index of the class to highlight, based on `out_classes` ordering.
         """
-        class_names = list(self.output_class_widget.keys())
-        class_name = class_names[class_id]
-        for cn in class_names:
-            if cn == class_name:
-                self.output_class_widget[cn].out_class_image.setPixmap(
-                    self.output_class_pixmaps[cn][0]
-                )
-                self.output_class_widget[cn].setEnabled(True)
-                self.output_class_widget[cn].findChild(QLabel, "out_class_name").setStyleSheet(
-                    "color: #a4c238; font-size: 30px;"
-                )
-            else:
-                self.output_class_widget[cn].out_class_image.setPixmap(
-                    self.output_class_pixmaps[cn][1]
-                )
-                self.output_class_widget[cn].setEnabled(False)
-                self.output_class_widget[cn].findChild(QLabel, "out_class_name").setStyleSheet(
-                    "color: #383D48; font-size: 20px;"
-                )
+        self.show_class(class_id)
 
     def classifier_sm(self, class_id):
         """Minimal state machine to stabilize class display transitions.
@@ -504,13 +482,7 @@ class HSD_MC_ClassifierOutputWidget(PlotWidget):
 
     def disableAllClassificationWidget(self):
         """Disable and dim all classification cards."""
-        class_names = list(self.output_class_widget.keys())
-        for cn in class_names:
-            self.output_class_widget[cn].out_class_image.setPixmap(self.output_class_pixmaps[cn][1])
-            self.output_class_widget[cn].setEnabled(False)
-            self.output_class_widget[cn].findChild(QLabel, "out_class_name").setStyleSheet(
-                "color: #383D48; font-size: 20px;"
-            )
+        self.show_class(None)
 
     def disableAllWidget(self):
         """Disable all UI elements managed by this widget."""
@@ -20,17 +20,18 @@ Fast telemetries lines plot widget for Motor Control.
 
 This module defines `HSD_MC_FastTelemetriesPlotLinesWidget`, a specialized plot widget
 that renders high-rate MC telemetries as scrolling line graphs. It handles dynamic
-reconfiguration on time-window changes, resamples incoming data to a fixed interval size,
+reconfiguration on time-window changes, decimates incoming data to a fixed interval size,
 and draws tag markers when labeling events occur.
 """
 
 import numpy as np
-from collections import deque
 
 from PySide6.QtCore import Slot
 
 import pyqtgraph as pg
+from stdatalog_gui.Utils.Decimation import DecimationMode, decimate, resample_linear
 from stdatalog_gui.Utils.PlotParams import LinesPlotParams
+from stdatalog_gui.Utils.RingBuffer import RingBuffer, RollingBuffer
 
 from stdatalog_gui.Widgets.Plots.PlotWidget import PlotWidget
 
@@ -58,12 +59,14 @@ class HSD_MC_FastTelemetriesPlotLinesWidget(PlotWidget):
         Predefined color palette used cyclically for multiple curves.
     graph_curves : dict
         Map from curve index to `PlotDataItem`.
-    _data : dict
-        Map from curve index to a queue of incoming samples.
-    y_queue : dict
-        Map from curve index to the scrolling y values buffer.
+    _data : RingBuffer
+        `(dimension, capacity)` buffer of incoming samples.
+    y_queue : RollingBuffer
+        `(dimension, plot_len)` scrolling y values window.
     one_t_interval_resampled : dict
         Temporary resampled arrays for each curve per update interval.
+    decimation_mode : DecimationMode
+        Linear resampling or min/max envelope of each update interval.
     active_tags : dict
         Track tag label active state for rendering ON/OFF markers.
     tag_lines : list
@@ -97,8 +100,9 @@ class HSD_MC_FastTelemetriesPlotLinesWidget(PlotWidget):
         self.graph_curves = dict()
 
         self.one_t_interval_resampled = dict()
-        self._data = dict() # dict of queues
-        self.y_queue = dict() # dict of queues
+        self._data = None # RingBuffer (dimension, capacity)
+        self.y_queue = None # RollingBuffer (dimension, plot_len)
+        self.decimation_mode = DecimationMode.LINEAR
 
         self.active_tags = dict()
         self.tag_lines = []
@@ -119,10 +123,9 @@ class HSD_MC_FastTelemetriesPlotLinesWidget(PlotWidget):
             self.one_t_interval_resampled[i] = np.zeros(self.plot_t_interval_size)
 
         self.x_data = np.linspace(-(plot_params.time_window), 0, self.plot_len)
+        self._data = RingBuffer(self.plot_params.dimension, 200000)
+        self.y_queue = RollingBuffer(self.plot_params.dimension, self.plot_len)
         for i in range(self.plot_params.dimension):
-            self._data[i] = deque(maxlen=200000)
-            self.y_queue[i] = deque(maxlen=self.plot_len)
-            self.y_queue[i].extend(np.zeros(self.plot_len))
             if len(self.graph_curves) < self.plot_params.dimension:
                 self.graph_curves[i] = self.graph_widget.plot()
                 pen_color = self.lines_colors[
@@ -197,48 +200,43 @@ class HSD_MC_FastTelemetriesPlotLinesWidget(PlotWidget):
         numpy.ndarray
             Resampled values with length `targetLen`.
         """
-        original = np.array(original, dtype=float)
-        index_arr = np.linspace(0, len(original) - 1, num=targetLen, dtype=float)
-        index_floor = np.array(index_arr, dtype=int) # Round down
-        index_ceil = index_floor + 1
-        index_rem = index_arr - index_floor # Remain
-
-        val1 = original[index_floor]
-        val2 = original[index_ceil % len(original)]
-        interp = val1 * (1.0 - index_rem) + val2 * index_rem
-        assert(len(interp) == targetLen)
-        return interp
+        original = np.asarray(original, dtype=float)
+        return resample_linear(original[np.newaxis, :], targetLen)[0]
+
+    def set_decimation_mode(self, mode: DecimationMode):
+        """Select linear resampling or min/max (peak-preserving) decimation."""
+        self.decimation_mode = mode
 
     def update_plot(self):
         """Scroll x-axis and set resampled data on each curve."""
         self.x_data = self.x_data + self.timer_interval
-        # for i in range(self.n_curves):
+        # Extract all data received since the last tick (dimension, n)
+        one_reduced_t_interval = self._data.read()
+        if one_reduced_t_interval.shape[1] > 0: # If data buffer is not empty
+            # Decimate extracted raw data to have the same plot_timer_interval size
+            # (plot len / (time window / times interval(sec)))
+            resampled = decimate(
+                one_reduced_t_interval, self.plot_t_interval_size, self.decimation_mode
+            )
+            for i in range(self.plot_params.dimension):
+                self.one_t_interval_resampled[i] = resampled[i]
+            # Put resampled data into the y data window
+            self.y_queue.extend(
+                [self.one_t_interval_resampled[i] for i in range(self.plot_params.dimension)]
+            )
+        else: #data buffer is empty
+            self.y_queue.extend(
+                np.zeros((self.plot_params.dimension, self.plot_t_interval_size))
+            )
         for i in range(self.plot_params.dimension):
-            if len(self._data[i]) > 0: # If data queue is not empty
-                # Extract all data from the queue (pop)
-                one_reduced_t_interval = [
-                    self._data[i].popleft() for _i in range(len(self._data[i]))
-                ]
-                # Resample extracted raw data to have the same plot_timer_interval size
-                # (plot len / (time window / times interval(sec)))
-                self.one_t_interval_resampled[i] = self.resample_linear1D(
-                    one_reduced_t_interval, self.plot_t_interval_size
-                )
-                # Put resampled data into the y data queue
-                self.y_queue[i].extend(self.one_t_interval_resampled[i])
-            else: #data queue is empty
-                self.y_queue[i].extend(np.zeros(len(self.one_t_interval_resampled[i])))
-            # set extracted resampled data into the plot curve (for each axis)
-            # [x and y will have the same len = (plot len / (time window / times interval(sec))
+            # set the rolling window into the plot curve (for each axis)
             self.graph_curves[i].setData(
-                x=self.x_data, y=np.array(self.y_queue[i])
+                x=self.x_data, y=self.y_queue.row(i)
             )
-        self.app_qt.processEvents()
 
     def add_data(self, data):
-        """Append new samples for each curve into the input queues."""
-        for i in range(self.plot_params.dimension):
-            self._data[i].extend(data[i])
+        """Append a block of new samples for all curves into the ring buffer."""
+        self._data.write(data)
 
     @Slot()
     def s_tag_done(self, status, tag_label:str):
@@ -26,6 +26,8 @@ Responsibilities:
 - Own and expose signals for GUI pages/widgets to react to hardware state changes.
 - Load DTDL device templates and emit discovery signals for sensors/algorithms/actuators.
 - Track component configuration widgets and plugin plot widgets.
+- Own the shared render clock that refreshes all the live plot widgets, and the data
+    stage through which acquisition threads hand decoded blocks to them.
 - Bridge to the Data Toolkit pipeline to reflect component status.
 
 Design Notes:
@@ -52,6 +54,9 @@ from stdatalog_gui.Utils.PlotParams import (
     AlgorithmPlotParams,
     ActuatorPlotParams,
 )
+from stdatalog_gui.Utils.DataStage import DataStage
+from stdatalog_gui.Utils.PropertySetPipeline import PropertySetPipeline
+from stdatalog_gui.Utils.RenderScheduler import RenderScheduler
 
 class ComponentType(Enum):
     """Component categories handled by the controller.
@@ -95,9 +100,16 @@ class STDTDL_Controller(QObject):
     - components_status (dict): Component status data from firmware.
     - cconfig_widgets (dict): Component name -> configuration widget instance.
     - plot_widgets (dict): Component name -> plot widget instance.
+    - plot_widget_factories (dict): Component name -> callable building a plot widget
+        whose construction is deferred until the component is enabled.
     - plugin_plot_widgets (list): Extra plot widgets added by plugins.
     - data_pipeline: Optional Data Toolkit pipeline instance.
     - qt_app: Reference to QApplication for UI processing as needed.
+    - render_scheduler (RenderScheduler): Single render clock driving plot updates.
+    - data_stage (DataStage): Per-component queues of decoded blocks waiting to be
+        forwarded to `plot_widgets` by its dispatch timer or the render clock.
+    - property_set_pipeline (PropertySetPipeline): Debounced, off-GUI-thread sender of
+        the set-property commands issued by the component configuration widgets.
     """
 
     # Signals
@@ -129,6 +141,7 @@ class STDTDL_Controller(QObject):
     sig_ispu_config_loaded = Signal(str, str, str)
 
     sig_wav_conversion_completed = Signal(str, str)
+    sig_offline_plots_progress = Signal(str, int, int)  # comp_name, completed, total
     sig_offline_plots_completed = Signal()
 
     sig_tmos_presence_detected = Signal(bool,str,str)
@@ -151,6 +164,7 @@ class STDTDL_Controller(QObject):
         self.components_status = dict()  # From FW
         self.cconfig_widgets = dict()  # {comp_name:CConfigWidget}
         self.plot_widgets = dict()
+        self.plot_widget_factories = dict()  # {comp_name: callable building a deferred plot widget}
         # self.plugin_plot_widgets = dict()
         self.plugin_plot_widgets = []
         self.__dt_manager = None
@@ -158,6 +172,10 @@ class STDTDL_Controller(QObject):
         self.detect_msg = ""
         self.data_pipeline = None
         self.qt_app = None
+        self.render_scheduler = RenderScheduler(parent=self)
+        self.data_stage = DataStage(plot_widgets=self.plot_widgets, parent=self)
+        self.render_scheduler.add_frame_hook(self.dispatch_staged_data)
+        self.property_set_pipeline = PropertySetPipeline(self, parent=self)
 
     def set_Qt_app(self, qt_app):
         """Set the Qt application instance.
@@ -269,7 +287,8 @@ class STDTDL_Controller(QObject):
         Returns:
         - None
         """
-        self.plot_widgets[comp_name].setVisible(False)
+        if comp_name in self.plot_widgets:
+            self.plot_widgets[comp_name].setVisible(False)
 
     def show_plot_widget(self, comp_name):
         """Show a plot widget for the given component.
@@ -280,7 +299,35 @@ class STDTDL_Controller(QObject):
         Returns:
         - None
         """
-        self.plot_widgets[comp_name].setVisible(True)
+        if self.materialize_plot_widget(comp_name) is not None:
+            self.plot_widgets[comp_name].setVisible(True)
+
+    def materialize_plot_widget(self, comp_name):
+        """Return the plot widget of a component, building it if it was deferred.
+
+        Parameters:
+        - comp_name (str): Component name.
+
+        Returns:
+        - QWidget | None: The plot widget, or None if the component has no plot.
+        """
+        factory = self.plot_widget_factories.pop(comp_name, None)
+        if factory is not None:
+            self.plot_widgets[comp_name] = factory()
+        return self.plot_widgets.get(comp_name)
+
+    def dispatch_staged_data(self):
+        """Forward the decoded blocks staged by acquisition threads to the plot widgets.
+
+        Called on the GUI thread at each render clock tick.
+
+        Parameters:
+        - None
+
+        Returns:
+        - None
+        """
+        self.data_stage.dispatch(self.plot_widgets)
 
     def add_plugin_plot_widget(self, plot_widget):
         """Add a plugin-provided plot widget to the layout and internal list.
@@ -489,12 +536,14 @@ class STDTDL_Controller(QObject):
         """
 
     @abstractmethod
-    def update_component_status(self, comp_name, comp_type = "other"):
+    def update_component_status(self, comp_name, comp_type = "other", comp_status = None):
         """Update firmware-side status for a component and propagate to listeners.
 
         Parameters:
         - comp_name (str): Component name.
         - comp_type (str | ComponentType): Component type (default "other").
+        - comp_status (dict | None): Already fetched `{comp_name: status}` snapshot; if
+            None, the status is requested to the device.
 
         Returns:
         - None
@@ -522,11 +571,12 @@ class STDTDL_Controller(QObject):
         """Disconnect from the current device and release resources."""
 
     @abstractmethod
-    def send_command(self, json_command):
+    def send_command(self, json_command, flush_pending=True):
         """Send a JSON command to the device.
 
         Parameters:
         - json_command (str): JSON payload.
+        - flush_pending (bool): Send the pending property edits first.
 
         Returns:
         - None
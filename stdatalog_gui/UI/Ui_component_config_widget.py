@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'component_config_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QLabel,
+    QPushButton, QRadioButton, QSizePolicy, QVBoxLayout,
+    QWidget)
+import stdatalog_gui.UI.resources_rc
+
+class Ui_widget_component_config(object):
+    def setupUi(self, widget_component_config):
+        if not widget_component_config.objectName():
+            widget_component_config.setObjectName(u"widget_component_config")
+        widget_component_config.resize(1225, 165)
+        widget_component_config.setStyleSheet(u"")
+        self.verticalLayout = QVBoxLayout(widget_component_config)
+        self.verticalLayout.setSpacing(3)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(3, 0, 3, 0)
+        self.frame_component_config = QFrame(widget_component_config)
+        self.frame_component_config.setObjectName(u"frame_component_config")
+        self.frame_component_config.setMinimumSize(QSize(0, 0))
+        self.frame_component_config.setMaximumSize(QSize(16777215, 16777215))
+        self.frame_component_config.setStyleSheet(u"background-color: rgb(41, 45, 56);\n"
+"border-radius: 5px;\n"
+"color: rgb(210, 210, 210);\n"
+"")
+        self.frame_component_config.setFrameShape(QFrame.NoFrame)
+        self.frame_component_config.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_13 = QVBoxLayout(self.frame_component_config)
+        self.verticalLayout_13.setSpacing(0)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.frame_title = QFrame(self.frame_component_config)
+        self.frame_title.setObjectName(u"frame_title")
+        self.frame_title.setMaximumSize(QSize(16777215, 35))
+        self.frame_title.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_title.setStyleSheet(u"QFrame {\n"
+"	border: transparent;\n"
+"	background-color: rgb(39, 44, 54);\n"
+"}")
+        self.frame_title.setFrameShape(QFrame.StyledPanel)
+        self.frame_title.setFrameShadow(QFrame.Raised)
+        self.horizontalLayout = QHBoxLayout(self.frame_title)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(9, 9, 9, 9)
+        self.radioButton_enable = QRadioButton(self.frame_title)
+        self.radioButton_enable.setObjectName(u"radioButton_enable")
+        self.radioButton_enable.setEnabled(True)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.radioButton_enable.sizePolicy().hasHeightForWidth())
+        self.radioButton_enable.setSizePolicy(sizePolicy)
+        self.radioButton_enable.setStyleSheet(u"/* RADIO BUTTON */\n"
+"QRadioButton::indicator {\n"
+"    border: 3px solid rgb(52, 59, 72);\n"
+"	width: 10px;\n"
+"	height: 10px;\n"
+"	border-radius: 8px;\n"
+"    background: rgb(44, 49, 60);\n"
+"}\n"
+"QRadioButton::indicator:hover {\n"
+"    border: 3px solid rgb(61, 70, 86);\n"
+"}\n"
+"QRadioButton:hover {\n"
+"    border: rgb(61, 70, 86);\n"
+"}\n"
+"QRadioButton::indicator:checked {\n"
+"    background: 3px solid rgb(32, 133, 25);/*rgb(94, 106, 130);*/\n"
+"	border: 3px solid rgb(52, 59, 72);	\n"
+"}\n"
+"QRadioButton::indicator:checked:hover {\n"
+"    background: 3px solid rgb(43, 176, 33);\n"
+"	border: 3px solid rgb(61, 70, 86);	\n"
+"}\n"
+"\n"
+"")
+
+        self.horizontalLayout.addWidget(self.radioButton_enable)
+
+        self.label_title = QPushButton(self.frame_title)
+        self.label_title.setObjectName(u"label_title")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.label_title.sizePolicy().hasHeightForWidth())
+        self.label_title.setSizePolicy(sizePolicy1)
+        self.label_title.setMaximumSize(QSize(16777215, 16777215))
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.label_title.setFont(font)
+        self.label_title.setStyleSheet(u"QPushButton{\n"
+"	text-align: left\n"
+"}\n"
+"QPushButton:hover {\n"
+"	font-size: 11pt;\n"
+"	font-weight: bold;\n"
+"}")
+
+        self.horizontalLayout.addWidget(self.label_title)
+
+        self.label_annotation = QLabel(self.frame_title)
+        self.label_annotation.setObjectName(u"label_annotation")
+        self.label_annotation.setFont(font)
+        self.label_annotation.setStyleSheet(u"color: rgb(32, 178, 170);")
+        self.label_annotation.setTextInteractionFlags(Qt.LinksAccessibleByMouse|Qt.TextSelectableByKeyboard|Qt.TextSelectableByMouse)
+
+        self.horizontalLayout.addWidget(self.label_annotation, 0, Qt.AlignRight)
+
+        self.pushButton_show = QPushButton(self.frame_title)
+        self.pushButton_show.setObjectName(u"pushButton_show")
+        self.pushButton_show.setMinimumSize(QSize(18, 18))
+        self.pushButton_show.setMaximumSize(QSize(18, 18))
+        self.pushButton_show.setStyleSheet(u"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}")
+        icon = QIcon()
+        icon.addFile(u":/icons/icons/outline_arrow_bottom_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_show.setIcon(icon)
+        self.pushButton_show.setIconSize(QSize(20, 20))
+
+        self.horizontalLayout.addWidget(self.pushButton_show)
+
+        self.pushButton_pop_out = QPushButton(self.frame_title)
+        self.pushButton_pop_out.setObjectName(u"pushButton_pop_out")
+        self.pushButton_pop_out.setMinimumSize(QSize(18, 18))
+        self.pushButton_pop_out.setMaximumSize(QSize(18, 18))
+        self.pushButton_pop_out.setStyleSheet(u"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}")
+        icon1 = QIcon()
+        icon1.addFile(u":/icons/icons/pop-out_18dp_E8EAED.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_pop_out.setIcon(icon1)
+        self.pushButton_pop_out.setIconSize(QSize(16, 16))
+
+        self.horizontalLayout.addWidget(self.pushButton_pop_out)
+
+        self.pushButton_show_plot = QPushButton(self.frame_title)
+        self.pushButton_show_plot.setObjectName(u"pushButton_show_plot")
+        self.pushButton_show_plot.setMinimumSize(QSize(18, 18))
+        self.pushButton_show_plot.setMaximumSize(QSize(18, 18))
+        self.pushButton_show_plot.setStyleSheet(u"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}")
+        icon2 = QIcon()
+        icon2.addFile(u":/icons/icons/monitoring_18dp_E8EAED.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_show_plot.setIcon(icon2)
+        self.pushButton_show_plot.setIconSize(QSize(16, 16))
+
+        self.horizontalLayout.addWidget(self.pushButton_show_plot)
+
+
+        self.verticalLayout_13.addWidget(self.frame_title)
+
+        self.frame_contents = QFrame(self.frame_component_config)
+        self.frame_contents.setObjectName(u"frame_contents")
+        self.frame_contents.setMinimumSize(QSize(0, 0))
+        self.frame_contents.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_contents.setStyleSheet(u"QFrame {\n"
+"	 border: transparent\n"
+"}\n"
+"QLineEdit {\n"
+"	background-color: rgb(27, 29, 35);\n"
+"	border-radius: 5px;\n"
+"	border: 2px solid rgb(27, 29, 35);\n"
+"	padding-left: 10px;\n"
+"}\n"
+"QLineEdit:hover {\n"
+"	border: 2px solid rgb(64, 71, 88);\n"
+"}\n"
+"QLineEdit:focus {\n"
+"	border: 2px solid rgb(91, 101, 124);\n"
+"}\n"
+"QLineEdit:disabled {\n"
+"	background-color: rgb(36, 40, 48);\n"
+"	border: 2px solid rgb(32, 32, 32);\n"
+"}\n"
+"QComboBox{\n"
+"	background-color: rgb(27, 29, 35);\n"
+"	border-radius: 5px;\n"
+"	border: 2px solid rgb(27, 29, 35);\n"
+"	padding: 5px;\n"
+"	padding-left: 10px;\n"
+"}\n"
+"QComboBox:hover{\n"
+"	border: 2px solid rgb(64, 71, 88);\n"
+"}\n"
+"QComboBox:focus {\n"
+"	border: 2px solid rgb(91, 101, 124);\n"
+"}\n"
+"QComboBox QAbstractItemView {\n"
+"	color: rgb(85, 170, 255);	\n"
+"	background-color: rgb(27, 29, 35);\n"
+"	padding: 10px;\n"
+"	selection-background-color: rgb(39, 44, 54);\n"
+"}\n"
+"QComboBox:disabled {\n"
+"	background-color: rgb(36, 40, 48);\n"
+"	border: 2px solid rgb(32"
+                        ", 32, 32);\n"
+"}\n"
+"\n"
+"/* RADIO BUTTON */\n"
+"QRadioButton::indicator {\n"
+"    border: 3px solid rgb(52, 59, 72);\n"
+"	width: 15px;\n"
+"	height: 15px;\n"
+"	border-radius: 10px;\n"
+"    background: rgb(44, 49, 60);\n"
+"}\n"
+"QRadioButton::indicator:hover {\n"
+"    border: 3px solid rgb(58, 66, 81);\n"
+"}\n"
+"QRadioButton::indicator:checked {\n"
+"    background: 3px solid rgb(94, 106, 130);\n"
+"	border: 3px solid rgb(52, 59, 72);	\n"
+"}\n"
+"")
+        self.frame_contents.setFrameShadow(QFrame.Raised)
+        self.horizontalLayout_4 = QHBoxLayout(self.frame_contents)
+        self.horizontalLayout_4.setSpacing(24)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(9, 9, 9, 9)
+
+        self.verticalLayout_13.addWidget(self.frame_contents)
+
+
+        self.verticalLayout.addWidget(self.frame_component_config)
+
+
+        self.retranslateUi(widget_component_config)
+
+        QMetaObject.connectSlotsByName(widget_component_config)
+    # setupUi
+
+    def retranslateUi(self, widget_component_config):
+        widget_component_config.setWindowTitle(QCoreApplication.translate("widget_component_config", u"Form", None))
+        self.radioButton_enable.setText("")
+        self.label_title.setText(QCoreApplication.translate("widget_component_config", u"Dummy_Component", None))
+        self.label_annotation.setText(QCoreApplication.translate("widget_component_config", u"DUMMY_ANNOTATION", None))
+        self.pushButton_show.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_pop_out.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_pop_out.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_show_plot.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_show_plot.setText("")
+    # retranslateUi
+
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'output_class_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QLabel, QSizePolicy,
+    QVBoxLayout, QWidget)
+import stdatalog_gui.UI.resources_rc
+
+class Ui_widget_out_class(object):
+    def setupUi(self, widget_out_class):
+        if not widget_out_class.objectName():
+            widget_out_class.setObjectName(u"widget_out_class")
+        widget_out_class.resize(251, 231)
+        widget_out_class.setStyleSheet(u"")
+        self.verticalLayout = QVBoxLayout(widget_out_class)
+        self.verticalLayout.setSpacing(3)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(3, 3, 3, 3)
+        self.frame_out_class = QFrame(widget_out_class)
+        self.frame_out_class.setObjectName(u"frame_out_class")
+        self.frame_out_class.setMinimumSize(QSize(0, 0))
+        self.frame_out_class.setMaximumSize(QSize(16777215, 16777215))
+        self.frame_out_class.setStyleSheet(u"background-color: rgb(41, 45, 56);\n"
+"color: rgb(210, 210, 210);")
+        self.frame_out_class.setFrameShape(QFrame.NoFrame)
+        self.frame_out_class.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_13 = QVBoxLayout(self.frame_out_class)
+        self.verticalLayout_13.setSpacing(0)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.frame_contents = QFrame(self.frame_out_class)
+        self.frame_contents.setObjectName(u"frame_contents")
+        self.frame_contents.setEnabled(True)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.frame_contents.sizePolicy().hasHeightForWidth())
+        self.frame_contents.setSizePolicy(sizePolicy)
+        self.frame_contents.setMinimumSize(QSize(0, 0))
+        self.frame_contents.setMaximumSize(QSize(16777215, 16777215))
+        self.frame_contents.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_contents.setStyleSheet(u"")
+        self.frame_contents.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_2 = QVBoxLayout(self.frame_contents)
+        self.verticalLayout_2.setSpacing(9)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.out_class_image = QLabel(self.frame_contents)
+        self.out_class_image.setObjectName(u"out_class_image")
+        font = QFont()
+        font.setPointSize(20)
+        font.setBold(True)
+        self.out_class_image.setFont(font)
+        self.out_class_image.setStyleSheet(u"")
+        self.out_class_image.setTextFormat(Qt.AutoText)
+        self.out_class_image.setPixmap(QPixmap(u":/icons/icons/baseline_engineering_white_48dp.png"))
+
+        self.verticalLayout_2.addWidget(self.out_class_image, 0, Qt.AlignHCenter)
+
+        self.out_class_name = QLabel(self.frame_contents)
+        self.out_class_name.setObjectName(u"out_class_name")
+        self.out_class_name.setFont(font)
+        self.out_class_name.setStyleSheet(u"")
+        self.out_class_name.setTextFormat(Qt.AutoText)
+
+        self.verticalLayout_2.addWidget(self.out_class_name, 0, Qt.AlignHCenter)
+
+
+        self.verticalLayout_13.addWidget(self.frame_contents, 0, Qt.AlignVCenter)
+
+
+        self.verticalLayout.addWidget(self.frame_out_class)
+
+
+        self.retranslateUi(widget_out_class)
+
+        QMetaObject.connectSlotsByName(widget_out_class)
+    # setupUi
+
+    def retranslateUi(self, widget_out_class):
+        widget_out_class.setWindowTitle(QCoreApplication.translate("widget_out_class", u"Form", None))
+        self.out_class_image.setText("")
+        self.out_class_name.setText(QCoreApplication.translate("widget_out_class", u"Output Class Name", None))
+    # retranslateUi
+
@@ -0,0 +1,775 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'plot_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QLabel,
+    QProgressBar, QPushButton, QSizePolicy, QSpacerItem,
+    QSpinBox, QVBoxLayout, QWidget)
+import stdatalog_gui.UI.resources_rc
+
+class Ui_widget_plot(object):
+    def setupUi(self, widget_plot):
+        if not widget_plot.objectName():
+            widget_plot.setObjectName(u"widget_plot")
+        widget_plot.resize(1278, 334)
+        widget_plot.setStyleSheet(u"color: rgb(210, 210, 210);")
+        self.verticalLayout = QVBoxLayout(widget_plot)
+        self.verticalLayout.setSpacing(3)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(3, 0, 3, 0)
+        self.frame_plot = QFrame(widget_plot)
+        self.frame_plot.setObjectName(u"frame_plot")
+        self.frame_plot.setMinimumSize(QSize(0, 0))
+        self.frame_plot.setMaximumSize(QSize(16777215, 16777215))
+        self.frame_plot.setStyleSheet(u"background-color: rgb(41, 45, 56);\n"
+"border-radius: 5px;\n"
+"")
+        self.frame_plot.setFrameShape(QFrame.NoFrame)
+        self.frame_plot.setFrameShadow(QFrame.Raised)
+        self.horizontalLayout = QHBoxLayout(self.frame_plot)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(3, 3, 3, 3)
+        self.frame_title = QFrame(self.frame_plot)
+        self.frame_title.setObjectName(u"frame_title")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.frame_title.sizePolicy().hasHeightForWidth())
+        self.frame_title.setSizePolicy(sizePolicy)
+        self.frame_title.setMinimumSize(QSize(35, 0))
+        self.frame_title.setMaximumSize(QSize(35, 16777215))
+        self.frame_title.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_title.setStyleSheet(u"QFrame {\n"
+"    background-color: rgb(39, 44, 54);\n"
+"}\n"
+"\n"
+"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"QPushButton:disabled {\n"
+"     background-color: rgb(29,33,41);\n"
+"     border: 2px solid rgb(29,33,41);\n"
+"}\n"
+"\n"
+"	border-color: rgb(0, 255, 0);")
+        self.frame_title.setFrameShape(QFrame.StyledPanel)
+        self.frame_title.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_3 = QVBoxLayout(self.frame_title)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(9, 9, 9, 9)
+        self.pushButton_pop_out = QPushButton(self.frame_title)
+        self.pushButton_pop_out.setObjectName(u"pushButton_pop_out")
+        self.pushButton_pop_out.setMinimumSize(QSize(18, 18))
+        self.pushButton_pop_out.setMaximumSize(QSize(18, 18))
+        self.pushButton_pop_out.setStyleSheet(u"")
+        icon = QIcon()
+        icon.addFile(u":/icons/icons/pop-out_18dp_E8EAED.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_pop_out.setIcon(icon)
+
+        self.verticalLayout_3.addWidget(self.pushButton_pop_out)
+
+        self.pushButton_plot_settings = QPushButton(self.frame_title)
+        self.pushButton_plot_settings.setObjectName(u"pushButton_plot_settings")
+        self.pushButton_plot_settings.setMinimumSize(QSize(18, 18))
+        self.pushButton_plot_settings.setMaximumSize(QSize(18, 18))
+        self.pushButton_plot_settings.setStyleSheet(u"")
+        icon1 = QIcon()
+        icon1.addFile(u":/icons/icons/outline_settings_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_plot_settings.setIcon(icon1)
+
+        self.verticalLayout_3.addWidget(self.pushButton_plot_settings)
+
+        self.title_label_frame = QFrame(self.frame_title)
+        self.title_label_frame.setObjectName(u"title_label_frame")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.title_label_frame.sizePolicy().hasHeightForWidth())
+        self.title_label_frame.setSizePolicy(sizePolicy1)
+        self.title_label_frame.setFrameShape(QFrame.StyledPanel)
+        self.title_label_frame.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_2 = QVBoxLayout(self.title_label_frame)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+
+        self.verticalLayout_3.addWidget(self.title_label_frame)
+
+
+        self.horizontalLayout.addWidget(self.frame_title)
+
+        self.frame_time_freq_settings = QFrame(self.frame_plot)
+        self.frame_time_freq_settings.setObjectName(u"frame_time_freq_settings")
+        sizePolicy.setHeightForWidth(self.frame_time_freq_settings.sizePolicy().hasHeightForWidth())
+        self.frame_time_freq_settings.setSizePolicy(sizePolicy)
+        self.frame_time_freq_settings.setMinimumSize(QSize(70, 0))
+        self.frame_time_freq_settings.setMaximumSize(QSize(35, 16777215))
+        self.frame_time_freq_settings.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_time_freq_settings.setStyleSheet(u"QFrame {\n"
+"    background-color: rgb(39, 44, 54);\n"
+"}\n"
+"\n"
+"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"QPushButton:disabled {\n"
+"     background-color: rgb(29,33,41);\n"
+"     border: 2px solid rgb(29,33,41);\n"
+"}\n"
+"QSpinBox {\n"
+"    color: rgb(255,255,255);\n"
+"    background-color: rgb(27, 29, 35);\n"
+"    border-radius: 5px;\n"
+"    border: 2px solid rgb(27, 29, 35);\n"
+"    padding-left: 10px;\n"
+"}\n"
+"QSpinBox:hover {\n"
+"    border: 2px solid rgb(58, 66, 81);\n"
+"}\n"
+"QSpinBox:focus {\n"
+"    border: 2px solid rgb(91, 101, 124);\n"
+"}\n"
+"QSpinBox:disabled {\n"
+"    color: rgb(60,60,60);\n"
+"	border: 2px solid rgb(64, 64, 64);\n"
+"}\n"
+"\n"
+"QSpinBox::up-button {\n"
+"    border-image: u"
+                        "rl(:/icons/icons/outline_keyboard_arrow_up_white_18dp.png);\n"
+"    /*border-width: 1px;*/\n"
+"}\n"
+"\n"
+"QSpinBox::down-button {\n"
+"    border-image: url(:/icons/icons/outline_keyboard_arrow_down_white_18dp.png);\n"
+"    /*border-width: 1px;*/\n"
+"}")
+        self.frame_time_freq_settings.setFrameShape(QFrame.StyledPanel)
+        self.frame_time_freq_settings.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_11 = QVBoxLayout(self.frame_time_freq_settings)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.verticalLayout_11.setContentsMargins(9, 9, 9, 9)
+        self.pushButton_tf_time = QPushButton(self.frame_time_freq_settings)
+        self.pushButton_tf_time.setObjectName(u"pushButton_tf_time")
+        self.pushButton_tf_time.setMinimumSize(QSize(50, 30))
+        self.pushButton_tf_time.setMaximumSize(QSize(50, 30))
+        self.pushButton_tf_time.setStyleSheet(u"")
+
+        self.verticalLayout_11.addWidget(self.pushButton_tf_time, 0, Qt.AlignHCenter)
+
+        self.pushButton_tf_fft = QPushButton(self.frame_time_freq_settings)
+        self.pushButton_tf_fft.setObjectName(u"pushButton_tf_fft")
+        self.pushButton_tf_fft.setMinimumSize(QSize(50, 30))
+        self.pushButton_tf_fft.setMaximumSize(QSize(50, 30))
+        self.pushButton_tf_fft.setStyleSheet(u"")
+
+        self.verticalLayout_11.addWidget(self.pushButton_tf_fft, 0, Qt.AlignHCenter)
+
+        self.frame_tf_fft_settings = QFrame(self.frame_time_freq_settings)
+        self.frame_tf_fft_settings.setObjectName(u"frame_tf_fft_settings")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.frame_tf_fft_settings.sizePolicy().hasHeightForWidth())
+        self.frame_tf_fft_settings.setSizePolicy(sizePolicy2)
+        self.frame_tf_fft_settings.setFrameShape(QFrame.StyledPanel)
+        self.frame_tf_fft_settings.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_7 = QVBoxLayout(self.frame_tf_fft_settings)
+        self.verticalLayout_7.setSpacing(3)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.hanning_window_label = QLabel(self.frame_tf_fft_settings)
+        self.hanning_window_label.setObjectName(u"hanning_window_label")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.hanning_window_label.sizePolicy().hasHeightForWidth())
+        self.hanning_window_label.setSizePolicy(sizePolicy3)
+        self.hanning_window_label.setMinimumSize(QSize(0, 0))
+        self.hanning_window_label.setMaximumSize(QSize(16777215, 16777215))
+        self.hanning_window_label.setTextFormat(Qt.MarkdownText)
+
+        self.verticalLayout_7.addWidget(self.hanning_window_label)
+
+        self.pushButton_hanning_window = QPushButton(self.frame_tf_fft_settings)
+        self.pushButton_hanning_window.setObjectName(u"pushButton_hanning_window")
+        self.pushButton_hanning_window.setMinimumSize(QSize(18, 18))
+        self.pushButton_hanning_window.setMaximumSize(QSize(18, 18))
+        self.pushButton_hanning_window.setStyleSheet(u"")
+        icon2 = QIcon()
+        icon2.addFile(u":/icons/icons/outline_window_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_hanning_window.setIcon(icon2)
+
+        self.verticalLayout_7.addWidget(self.pushButton_hanning_window, 0, Qt.AlignHCenter)
+
+
+        self.verticalLayout_11.addWidget(self.frame_tf_fft_settings)
+
+        self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_11.addItem(self.verticalSpacer_3)
+
+        self.pushButton_time_freq_close_settings = QPushButton(self.frame_time_freq_settings)
+        self.pushButton_time_freq_close_settings.setObjectName(u"pushButton_time_freq_close_settings")
+        self.pushButton_time_freq_close_settings.setMinimumSize(QSize(18, 18))
+        self.pushButton_time_freq_close_settings.setMaximumSize(QSize(18, 18))
+        self.pushButton_time_freq_close_settings.setStyleSheet(u"")
+        icon3 = QIcon()
+        icon3.addFile(u":/icons/icons/outline_arrow_back_ios_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_time_freq_close_settings.setIcon(icon3)
+
+        self.verticalLayout_11.addWidget(self.pushButton_time_freq_close_settings)
+
+
+        self.horizontalLayout.addWidget(self.frame_time_freq_settings)
+
+        self.frame_load_out_fmt = QFrame(self.frame_plot)
+        self.frame_load_out_fmt.setObjectName(u"frame_load_out_fmt")
+        sizePolicy.setHeightForWidth(self.frame_load_out_fmt.sizePolicy().hasHeightForWidth())
+        self.frame_load_out_fmt.setSizePolicy(sizePolicy)
+        self.frame_load_out_fmt.setMinimumSize(QSize(35, 0))
+        self.frame_load_out_fmt.setMaximumSize(QSize(35, 16777215))
+        self.frame_load_out_fmt.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_load_out_fmt.setStyleSheet(u"QFrame {\n"
+"    background-color: rgb(39, 44, 54);\n"
+"}\n"
+"\n"
+"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"QPushButton:disabled {\n"
+"     background-color: rgb(29,33,41);\n"
+"     border: 2px solid rgb(29,33,41);\n"
+"}")
+        self.frame_load_out_fmt.setFrameShape(QFrame.StyledPanel)
+        self.frame_load_out_fmt.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_8 = QVBoxLayout(self.frame_load_out_fmt)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.verticalLayout_8.setContentsMargins(9, 9, 9, 9)
+        self.pushButton_load_out_fmt = QPushButton(self.frame_load_out_fmt)
+        self.pushButton_load_out_fmt.setObjectName(u"pushButton_load_out_fmt")
+        self.pushButton_load_out_fmt.setMinimumSize(QSize(18, 18))
+        self.pushButton_load_out_fmt.setMaximumSize(QSize(18, 18))
+        self.pushButton_load_out_fmt.setStyleSheet(u"")
+        icon4 = QIcon()
+        icon4.addFile(u":/icons/icons/outline_file_upload_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_load_out_fmt.setIcon(icon4)
+
+        self.verticalLayout_8.addWidget(self.pushButton_load_out_fmt)
+
+        self.out_fmt_status = QPushButton(self.frame_load_out_fmt)
+        self.out_fmt_status.setObjectName(u"out_fmt_status")
+        self.out_fmt_status.setEnabled(True)
+        self.out_fmt_status.setMinimumSize(QSize(18, 18))
+        self.out_fmt_status.setMaximumSize(QSize(18, 18))
+        self.out_fmt_status.setStyleSheet(u"background-color: transparent;\n"
+"border-color: transparent;")
+        icon5 = QIcon()
+        icon5.addFile(u":/icons/icons/outline_close_white_36dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.out_fmt_status.setIcon(icon5)
+
+        self.verticalLayout_8.addWidget(self.out_fmt_status)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_8.addItem(self.verticalSpacer_2)
+
+        self.pushButton_close_settings = QPushButton(self.frame_load_out_fmt)
+        self.pushButton_close_settings.setObjectName(u"pushButton_close_settings")
+        self.pushButton_close_settings.setMinimumSize(QSize(18, 18))
+        self.pushButton_close_settings.setMaximumSize(QSize(18, 18))
+        self.pushButton_close_settings.setStyleSheet(u"")
+        self.pushButton_close_settings.setIcon(icon3)
+
+        self.verticalLayout_8.addWidget(self.pushButton_close_settings)
+
+
+        self.horizontalLayout.addWidget(self.frame_load_out_fmt)
+
+        self.frame_fft_settings = QFrame(self.frame_plot)
+        self.frame_fft_settings.setObjectName(u"frame_fft_settings")
+        sizePolicy.setHeightForWidth(self.frame_fft_settings.sizePolicy().hasHeightForWidth())
+        self.frame_fft_settings.setSizePolicy(sizePolicy)
+        self.frame_fft_settings.setMinimumSize(QSize(35, 0))
+        self.frame_fft_settings.setMaximumSize(QSize(35, 16777215))
+        self.frame_fft_settings.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_fft_settings.setStyleSheet(u"QFrame {\n"
+"    background-color: rgb(39, 44, 54);\n"
+"}\n"
+"\n"
+"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"QPushButton:disabled {\n"
+"     background-color: rgb(29,33,41);\n"
+"     border: 2px solid rgb(29,33,41);\n"
+"}")
+        self.frame_fft_settings.setFrameShape(QFrame.StyledPanel)
+        self.frame_fft_settings.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_9 = QVBoxLayout(self.frame_fft_settings)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.verticalLayout_9.setContentsMargins(9, 9, 9, 9)
+        self.pushButton_fft_peak = QPushButton(self.frame_fft_settings)
+        self.pushButton_fft_peak.setObjectName(u"pushButton_fft_peak")
+        self.pushButton_fft_peak.setMinimumSize(QSize(18, 18))
+        self.pushButton_fft_peak.setMaximumSize(QSize(18, 18))
+        self.pushButton_fft_peak.setStyleSheet(u"")
+        icon6 = QIcon()
+        icon6.addFile(u":/icons/icons/outline_peak_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_fft_peak.setIcon(icon6)
+
+        self.verticalLayout_9.addWidget(self.pushButton_fft_peak)
+
+        self.pushButton_fft_filter = QPushButton(self.frame_fft_settings)
+        self.pushButton_fft_filter.setObjectName(u"pushButton_fft_filter")
+        self.pushButton_fft_filter.setMinimumSize(QSize(18, 18))
+        self.pushButton_fft_filter.setMaximumSize(QSize(18, 18))
+        self.pushButton_fft_filter.setStyleSheet(u"")
+        icon7 = QIcon()
+        icon7.addFile(u":/icons/icons/outline_filter_alt_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_fft_filter.setIcon(icon7)
+
+        self.verticalLayout_9.addWidget(self.pushButton_fft_filter)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_9.addItem(self.verticalSpacer)
+
+        self.pushButton_fft_close_settings = QPushButton(self.frame_fft_settings)
+        self.pushButton_fft_close_settings.setObjectName(u"pushButton_fft_close_settings")
+        self.pushButton_fft_close_settings.setMinimumSize(QSize(18, 18))
+        self.pushButton_fft_close_settings.setMaximumSize(QSize(18, 18))
+        self.pushButton_fft_close_settings.setStyleSheet(u"")
+        self.pushButton_fft_close_settings.setIcon(icon3)
+
+        self.verticalLayout_9.addWidget(self.pushButton_fft_close_settings)
+
+
+        self.horizontalLayout.addWidget(self.frame_fft_settings)
+
+        self.frame_wav_control = QFrame(self.frame_plot)
+        self.frame_wav_control.setObjectName(u"frame_wav_control")
+        self.frame_wav_control.setEnabled(True)
+        sizePolicy.setHeightForWidth(self.frame_wav_control.sizePolicy().hasHeightForWidth())
+        self.frame_wav_control.setSizePolicy(sizePolicy)
+        self.frame_wav_control.setMinimumSize(QSize(70, 0))
+        self.frame_wav_control.setMaximumSize(QSize(70, 16777215))
+        self.frame_wav_control.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_wav_control.setStyleSheet(u"QFrame {\n"
+"    background-color: rgb(39, 44, 54);\n"
+"}\n"
+"\n"
+"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"QPushButton:disabled {\n"
+"     background-color: rgb(29,33,41);\n"
+"     border: 2px solid rgb(29,33,41);\n"
+"}")
+        self.frame_wav_control.setFrameShape(QFrame.StyledPanel)
+        self.frame_wav_control.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_10 = QVBoxLayout(self.frame_wav_control)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.verticalLayout_10.setContentsMargins(9, 9, 9, 9)
+        self.convert_wav_frame = QFrame(self.frame_wav_control)
+        self.convert_wav_frame.setObjectName(u"convert_wav_frame")
+        self.convert_wav_frame.setEnabled(True)
+        self.convert_wav_frame.setMinimumSize(QSize(0, 0))
+        self.convert_wav_frame.setStyleSheet(u"QFrame {\n"
+"	border-radius: 5px;\n"
+"	border: 2px solid rgb(27, 29, 35);\n"
+"}\n"
+"\n"
+"QSpinBox {\n"
+"    color: rgb(255,255,255);\n"
+"    background-color: rgb(27, 29, 35);\n"
+"    border-radius: 5px;\n"
+"    border: 2px solid rgb(27, 29, 35);\n"
+"    padding-left: 10px;\n"
+"}\n"
+"QSpinBox:hover {\n"
+"    border: 2px solid rgb(58, 66, 81);\n"
+"}\n"
+"QSpinBox:focus {\n"
+"    border: 2px solid rgb(91, 101, 124);\n"
+"}\n"
+"QSpinBox:disabled {\n"
+"    color: rgb(60,60,60);\n"
+"	border: 2px solid rgb(64, 64, 64);\n"
+"}\n"
+"\n"
+"QSpinBox::up-button {\n"
+"    border-image: url(:/icons/icons/outline_keyboard_arrow_up_white_18dp.png);\n"
+"    /*border-width: 1px;*/\n"
+"}\n"
+"\n"
+"QSpinBox::down-button {\n"
+"    border-image: url(:/icons/icons/outline_keyboard_arrow_down_white_18dp.png);\n"
+"    /*border-width: 1px;*/\n"
+"}")
+        self.convert_wav_frame.setFrameShape(QFrame.StyledPanel)
+        self.convert_wav_frame.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_4 = QVBoxLayout(self.convert_wav_frame)
+        self.verticalLayout_4.setSpacing(6)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(3, 6, 3, 6)
+        self.start_time_spinbox = QSpinBox(self.convert_wav_frame)
+        self.start_time_spinbox.setObjectName(u"start_time_spinbox")
+        self.start_time_spinbox.setEnabled(True)
+        self.start_time_spinbox.setMinimumSize(QSize(0, 30))
+        self.start_time_spinbox.setWrapping(False)
+        self.start_time_spinbox.setFrame(True)
+
+        self.verticalLayout_4.addWidget(self.start_time_spinbox)
+
+        self.end_time_spinbox = QSpinBox(self.convert_wav_frame)
+        self.end_time_spinbox.setObjectName(u"end_time_spinbox")
+        self.end_time_spinbox.setEnabled(True)
+        self.end_time_spinbox.setMinimumSize(QSize(0, 30))
+        self.end_time_spinbox.setWrapping(False)
+        self.end_time_spinbox.setFrame(True)
+        self.end_time_spinbox.setMinimum(-1)
+        self.end_time_spinbox.setValue(-1)
+
+        self.verticalLayout_4.addWidget(self.end_time_spinbox)
+
+        self.pushButton_convert_wav = QPushButton(self.convert_wav_frame)
+        self.pushButton_convert_wav.setObjectName(u"pushButton_convert_wav")
+        self.pushButton_convert_wav.setEnabled(True)
+        self.pushButton_convert_wav.setMinimumSize(QSize(42, 30))
+        self.pushButton_convert_wav.setMaximumSize(QSize(42, 30))
+        self.pushButton_convert_wav.setLayoutDirection(Qt.RightToLeft)
+        self.pushButton_convert_wav.setStyleSheet(u"")
+        icon8 = QIcon()
+        icon8.addFile(u":/icons/icons/outline_audiotrack_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_convert_wav.setIcon(icon8)
+        self.pushButton_convert_wav.setCheckable(False)
+
+        self.verticalLayout_4.addWidget(self.pushButton_convert_wav, 0, Qt.AlignHCenter)
+
+
+        self.verticalLayout_10.addWidget(self.convert_wav_frame)
+
+        self.playing_wav_frame = QFrame(self.frame_wav_control)
+        self.playing_wav_frame.setObjectName(u"playing_wav_frame")
+        self.playing_wav_frame.setEnabled(True)
+        self.playing_wav_frame.setMinimumSize(QSize(0, 0))
+        self.playing_wav_frame.setStyleSheet(u"QFrame {\n"
+"	border-radius: 5px;\n"
+"	border: 2px solid rgb(27, 29, 35);\n"
+"}")
+        self.playing_wav_frame.setFrameShape(QFrame.StyledPanel)
+        self.playing_wav_frame.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_5 = QVBoxLayout(self.playing_wav_frame)
+        self.verticalLayout_5.setSpacing(6)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(3, 6, 3, 6)
+        self.wav_progressBar = QProgressBar(self.playing_wav_frame)
+        self.wav_progressBar.setObjectName(u"wav_progressBar")
+        self.wav_progressBar.setEnabled(True)
+        self.wav_progressBar.setStyleSheet(u"/* PROGRESS BAR */\n"
+"QProgressBar {\n"
+"    border: 2px solid rgb(27, 29, 35);\n"
+"    border-radius: 10px;\n"
+"    text-align: center;\n"
+"}\n"
+"\n"
+"QProgressBar::chunk {\n"
+"    background-color: rgb(32, 178, 170);\n"
+"    margin: 4px;\n"
+"    border-bottom-right-radius: 6px;\n"
+"    border-bottom-left-radius: 6px;\n"
+"    border-top-right-radius: 6px;\n"
+"    border-top-left-radius: 6px;\n"
+"}\n"
+"\n"
+"QProgressBar:disabled {\n"
+"    border: 2px solid rgb(64, 64, 64);\n"
+"    border-radius: 10px;\n"
+"    text-align: center;\n"
+"}\n"
+"\n"
+"QProgressBar::chunk:disabled {\n"
+"    background-color: rgb(64, 64, 64);\n"
+"    margin: 4px;\n"
+"    border-bottom-right-radius: 6px;\n"
+"    border-bottom-left-radius: 6px;\n"
+"    border-top-right-radius: 6px;\n"
+"    border-top-left-radius: 6px;\n"
+"}\n"
+"")
+        self.wav_progressBar.setValue(24)
+        self.wav_progressBar.setTextVisible(False)
+        self.wav_progressBar.setOrientation(Qt.Vertical)
+        self.wav_progressBar.setInvertedAppearance(True)
+        self.wav_progressBar.setTextDirection(QProgressBar.TopToBottom)
+
+        self.verticalLayout_5.addWidget(self.wav_progressBar, 0, Qt.AlignHCenter)
+
+        self.frame = QFrame(self.playing_wav_frame)
+        self.frame.setObjectName(u"frame")
+        self.frame.setStyleSheet(u"border-color: transparent;")
+        self.frame.setFrameShape(QFrame.StyledPanel)
+        self.frame.setFrameShadow(QFrame.Raised)
+        self.horizontalLayout_2 = QHBoxLayout(self.frame)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.pushButton_play_wav = QPushButton(self.frame)
+        self.pushButton_play_wav.setObjectName(u"pushButton_play_wav")
+        self.pushButton_play_wav.setMinimumSize(QSize(18, 18))
+        self.pushButton_play_wav.setMaximumSize(QSize(18, 18))
+        self.pushButton_play_wav.setStyleSheet(u"")
+        icon9 = QIcon()
+        icon9.addFile(u":/icons/icons/outline_play_arrow_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_play_wav.setIcon(icon9)
+
+        self.horizontalLayout_2.addWidget(self.pushButton_play_wav)
+
+        self.pushButton_stop_wav = QPushButton(self.frame)
+        self.pushButton_stop_wav.setObjectName(u"pushButton_stop_wav")
+        self.pushButton_stop_wav.setMinimumSize(QSize(18, 18))
+        self.pushButton_stop_wav.setMaximumSize(QSize(18, 18))
+        self.pushButton_stop_wav.setStyleSheet(u"")
+        icon10 = QIcon()
+        icon10.addFile(u":/icons/icons/outline_stop_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton_stop_wav.setIcon(icon10)
+
+        self.horizontalLayout_2.addWidget(self.pushButton_stop_wav)
+
+
+        self.verticalLayout_5.addWidget(self.frame)
+
+
+        self.verticalLayout_10.addWidget(self.playing_wav_frame)
+
+        self.pushButton_wav_close_settings = QPushButton(self.frame_wav_control)
+        self.pushButton_wav_close_settings.setObjectName(u"pushButton_wav_close_settings")
+        self.pushButton_wav_close_settings.setMinimumSize(QSize(18, 18))
+        self.pushButton_wav_close_settings.setMaximumSize(QSize(18, 18))
+        self.pushButton_wav_close_settings.setStyleSheet(u"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}")
+        self.pushButton_wav_close_settings.setIcon(icon3)
+
+        self.verticalLayout_10.addWidget(self.pushButton_wav_close_settings, 0, Qt.AlignHCenter)
+
+
+        self.horizontalLayout.addWidget(self.frame_wav_control)
+
+        self.frame_contents = QFrame(self.frame_plot)
+        self.frame_contents.setObjectName(u"frame_contents")
+        self.frame_contents.setEnabled(True)
+        sizePolicy1.setHeightForWidth(self.frame_contents.sizePolicy().hasHeightForWidth())
+        self.frame_contents.setSizePolicy(sizePolicy1)
+        self.frame_contents.setMaximumSize(QSize(16777215, 16777215))
+        self.frame_contents.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_contents.setStyleSheet(u"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"QPushButton:disabled {\n"
+"     background-color: rgb(29,33,41);\n"
+"     border: 2px solid rgb(29,33,41);\n"
+"}\n"
+"\n"
+"/* RADIO BUTTON */\n"
+"QRadioButton::indicator {\n"
+"    border: 3px rgb(27, 29, 35);\n"
+"	width: 15px;\n"
+"	height: 15px;\n"
+"	border-radius: 10px;\n"
+"	margin-top: 5px;\n"
+"    margin-bottom: 5px;\n"
+"    background: rgb(44, 49, 60);\n"
+"}\n"
+"QRadioButton::indicator:hover {\n"
+"    border: 3px solid rgb(58, 66, 81);\n"
+"}\n"
+"QRadioButton::indicator:checked {\n"
+"    background: 3px solid rgb(94, 106, 130);\n"
+"	border: 3px solid rgb(52, 59, 72);	\n"
+"}\n"
+"QRadioButton::indicator:checked:hover {\n"
+"    border: 3px solid rgb(68, 76, 91);\n"
+""
+                        "}\n"
+"QRadioButton::indicator:unchecked {\n"
+"    border: 3px solid rgb(27, 29, 35);\n"
+"    background: rgb(44, 49, 60);\n"
+"}\n"
+"QRadioButton::indicator:unchecked:hover {\n"
+"    border: 3px solid rgb(58, 66, 81);\n"
+"}")
+        self.frame_contents.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_6 = QVBoxLayout(self.frame_contents)
+        self.verticalLayout_6.setSpacing(0)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+
+        self.horizontalLayout.addWidget(self.frame_contents)
+
+
+        self.verticalLayout.addWidget(self.frame_plot)
+
+
+        self.retranslateUi(widget_plot)
+
+        QMetaObject.connectSlotsByName(widget_plot)
+    # setupUi
+
+    def retranslateUi(self, widget_plot):
+        widget_plot.setWindowTitle(QCoreApplication.translate("widget_plot", u"Form", None))
+#if QT_CONFIG(tooltip)
+        self.pushButton_pop_out.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_pop_out.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_plot_settings.setToolTip(QCoreApplication.translate("widget_plot", u"Plot settings", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_plot_settings.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_tf_time.setToolTip(QCoreApplication.translate("widget_plot", u"live plot over time", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_tf_time.setText(QCoreApplication.translate("widget_plot", u"time", None))
+#if QT_CONFIG(tooltip)
+        self.pushButton_tf_fft.setToolTip(QCoreApplication.translate("widget_plot", u"live FFT plot", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_tf_fft.setText(QCoreApplication.translate("widget_plot", u"fft", None))
+        self.hanning_window_label.setText(QCoreApplication.translate("widget_plot", u"<html><head/><body><p align=\"center\"><span style=\" font-size:8pt;\">Hanning<br/>Window</span></p></body></html>", None))
+#if QT_CONFIG(tooltip)
+        self.pushButton_hanning_window.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_hanning_window.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_time_freq_close_settings.setToolTip(QCoreApplication.translate("widget_plot", u"Close plot settings", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_time_freq_close_settings.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_load_out_fmt.setToolTip(QCoreApplication.translate("widget_plot", u"Output format description file loading", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_load_out_fmt.setText("")
+#if QT_CONFIG(tooltip)
+        self.out_fmt_status.setToolTip(QCoreApplication.translate("widget_plot", u"Output format description file loading status", None))
+#endif // QT_CONFIG(tooltip)
+        self.out_fmt_status.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_close_settings.setToolTip(QCoreApplication.translate("widget_plot", u"Close plot settings", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_close_settings.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_fft_peak.setToolTip(QCoreApplication.translate("widget_plot", u"Frequency peak detector", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_fft_peak.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_fft_filter.setToolTip(QCoreApplication.translate("widget_plot", u"Enable frequency filter regions", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_fft_filter.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_fft_close_settings.setToolTip(QCoreApplication.translate("widget_plot", u"Close plot settings", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_fft_close_settings.setText("")
+#if QT_CONFIG(tooltip)
+        self.start_time_spinbox.setToolTip(QCoreApplication.translate("widget_plot", u"Start time [seconds]", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.end_time_spinbox.setToolTip(QCoreApplication.translate("widget_plot", u"End time [seconds]", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.pushButton_convert_wav.setToolTip(QCoreApplication.translate("widget_plot", u"Start .dat to .wav conversion", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_convert_wav.setText(QCoreApplication.translate("widget_plot", u"get", None))
+#if QT_CONFIG(tooltip)
+        self.pushButton_play_wav.setToolTip(QCoreApplication.translate("widget_plot", u"Play converted Wav", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_play_wav.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_stop_wav.setToolTip(QCoreApplication.translate("widget_plot", u"Play converted Wav", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_stop_wav.setText("")
+#if QT_CONFIG(tooltip)
+        self.pushButton_wav_close_settings.setToolTip(QCoreApplication.translate("widget_plot", u"Close plot settings", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton_wav_close_settings.setText("")
+    # retranslateUi
+
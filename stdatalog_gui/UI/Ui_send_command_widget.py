@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'send_command_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QLabel,
+    QPushButton, QSizePolicy, QVBoxLayout, QWidget)
+import stdatalog_gui.UI.resources_rc
+
+class Ui_widget_component_config(object):
+    def setupUi(self, widget_component_config):
+        if not widget_component_config.objectName():
+            widget_component_config.setObjectName(u"widget_component_config")
+        widget_component_config.resize(1225, 165)
+        widget_component_config.setStyleSheet(u"color: rgb(210, 210, 210);")
+        self.verticalLayout = QVBoxLayout(widget_component_config)
+        self.verticalLayout.setSpacing(3)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(3, 0, 3, 0)
+        self.frame_component_config = QFrame(widget_component_config)
+        self.frame_component_config.setObjectName(u"frame_component_config")
+        self.frame_component_config.setMinimumSize(QSize(0, 0))
+        self.frame_component_config.setMaximumSize(QSize(16777215, 16777215))
+        self.frame_component_config.setStyleSheet(u"#frame_component_config { \n"
+"	background-color: rgb(41, 45, 56);\n"
+"	border-radius: 5px;\n"
+"	border: 2px solid rgb(27, 29, 35);\n"
+"}\n"
+"\n"
+"")
+        self.frame_component_config.setFrameShape(QFrame.NoFrame)
+        self.frame_component_config.setFrameShadow(QFrame.Plain)
+        self.frame_component_config.setLineWidth(1)
+        self.verticalLayout_13 = QVBoxLayout(self.frame_component_config)
+        self.verticalLayout_13.setSpacing(0)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.frame_title = QFrame(self.frame_component_config)
+        self.frame_title.setObjectName(u"frame_title")
+        self.frame_title.setMaximumSize(QSize(16777215, 35))
+        self.frame_title.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_title.setStyleSheet(u"background-color: rgb(39, 44, 54);")
+        self.frame_title.setFrameShape(QFrame.StyledPanel)
+        self.frame_title.setFrameShadow(QFrame.Raised)
+        self.horizontalLayout = QHBoxLayout(self.frame_title)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(9, 9, 9, 9)
+        self.label_title = QLabel(self.frame_title)
+        self.label_title.setObjectName(u"label_title")
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.label_title.setFont(font)
+        self.label_title.setTextInteractionFlags(Qt.LinksAccessibleByMouse|Qt.TextSelectableByKeyboard|Qt.TextSelectableByMouse)
+
+        self.horizontalLayout.addWidget(self.label_title)
+
+        self.pushButton = QPushButton(self.frame_title)
+        self.pushButton.setObjectName(u"pushButton")
+        self.pushButton.setMinimumSize(QSize(40, 20))
+        self.pushButton.setMaximumSize(QSize(40, 20))
+        self.pushButton.setStyleSheet(u"QPushButton {\n"
+"	border: 2px solid rgb(52, 59, 72);\n"
+"	border-radius: 5px;	\n"
+"	background-color: rgb(52, 59, 72);\n"
+"}\n"
+"QPushButton:hover {\n"
+"	background-color: rgb(57, 65, 80);\n"
+"	border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"QPushButton:pressed {	\n"
+"	background-color: rgb(35, 40, 49);\n"
+"	border: 2px solid rgb(43, 50, 61);\n"
+"}")
+        icon = QIcon()
+        icon.addFile(u":/icons/icons/outline_play_arrow_white_18dp.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.pushButton.setIcon(icon)
+
+        self.horizontalLayout.addWidget(self.pushButton)
+
+
+        self.verticalLayout_13.addWidget(self.frame_title)
+
+        self.frame_contents = QFrame(self.frame_component_config)
+        self.frame_contents.setObjectName(u"frame_contents")
+        self.frame_contents.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        self.frame_contents.setFrameShadow(QFrame.Raised)
+        self.horizontalLayout_4 = QHBoxLayout(self.frame_contents)
+        self.horizontalLayout_4.setSpacing(24)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+
+        self.verticalLayout_13.addWidget(self.frame_contents)
+
+
+        self.verticalLayout.addWidget(self.frame_component_config)
+
+
+        self.retranslateUi(widget_component_config)
+
+        QMetaObject.connectSlotsByName(widget_component_config)
+    # setupUi
+
+    def retranslateUi(self, widget_component_config):
+        widget_component_config.setWindowTitle(QCoreApplication.translate("widget_component_config", u"Form", None))
+        self.label_title.setText(QCoreApplication.translate("widget_component_config", u"Dummy_Component", None))
+        self.pushButton.setText("")
+    # retranslateUi
+
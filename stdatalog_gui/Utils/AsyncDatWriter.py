@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    AsyncDatWriter.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Asynchronous, buffered writer for raw `.dat` acquisition files.
+
+Acquisition threads must drain the device link as fast as possible: a slow disk or an
+antivirus scan must not stall them. This module moves file I/O to a dedicated thread:
+
+- `AsyncDatWriter`: one writer thread per acquisition. It owns a FIFO of filled
+    buffers, writes them to disk in order, and periodically flushes partially filled
+    buffers so data reach the disk at least every `flush_interval` seconds.
+- `AsyncFileSink`: file-like object (`write`, `close`, `closed`, `name`) returned by
+    `AsyncDatWriter.open_sink`. `write` only copies bytes into a large preallocated
+    buffer; full buffers are handed over to the writer thread and recycled after use.
+    Each sink owns at most `max_buffers` buffers: when all of them wait to be written
+    (disk slower than the stream), `write` blocks for up to `block_timeout` seconds,
+    then drops the data. Dropped bytes are counted and reported by `get_stats`, and
+    the optional `on_drop` callback of the sink reports them while acquiring.
+
+Design Notes:
+- Buffer sizes are rounded up to a multiple of `mmap.PAGESIZE`.
+- On Linux, files can be preallocated in large chunks (`os.posix_fallocate`) to limit
+    fragmentation. The file is truncated to the written size when closed.
+- `AsyncFileSink.move_to` renames the file on the writer thread, in order with the
+    writes, so a file opened before its final folder exists can be moved there while
+    the acquisition is running.
+- `AsyncDatWriter.get_stats` reports bytes written, number of writes, write latency,
+    the number of buffers waiting to be written and the data dropped.
+"""
+
+import mmap
+import os
+import queue
+import shutil
+import sys
+import time
+from collections import deque
+from threading import Condition, Event, Lock, Thread
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+DEFAULT_BUFFER_SIZE = 4 * 1024 * 1024
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_PREALLOCATION_CHUNK = 64 * 1024 * 1024
+DEFAULT_MAX_BUFFERS = 16  # per sink
+DEFAULT_BLOCK_TIMEOUT = 0.5
+DROP_REPORT_INTERVAL = 1.0  # seconds between two on_drop calls of a sink
+_MOVE = object()  # Queue marker: move the sink file (size holds the destination path)
+
+def _page_aligned(size):
+    return -(-size // mmap.PAGESIZE) * mmap.PAGESIZE
+
+class AsyncFileSink:
+    """File-like sink whose writes are performed by an `AsyncDatWriter` thread.
+
+    Parameters
+    ----------
+    writer : AsyncDatWriter
+        Writer thread that performs the actual file I/O.
+    path : str
+        Destination file path. The file is created (or truncated).
+    buffer_size : int
+        Size of each staging buffer in bytes.
+    preallocation_chunk : int
+        Preallocation step in bytes, 0 to disable preallocation.
+    max_buffers : int, optional
+        Maximum number of buffers owned by the sink. Default is 16.
+    block_timeout : float, optional
+        Maximum time in seconds `write` waits for a free buffer before dropping the
+        data. Default is 0.5.
+    on_drop : callable | None, optional
+        Called as `on_drop(sink, dropped_bytes)` by `write` (acquisition thread) when
+        data is dropped, at most once per second; `dropped_bytes` is the amount dropped
+        since the previous call. Default is None.
+
+    Attributes
+    ----------
+    name : str
+        Destination file path.
+    closed : bool
+        True once `close` has been called. Later writes are ignored, so that a
+        receive loop racing with the end of the acquisition cannot fail.
+    bytes_written : int
+        Bytes written to disk so far.
+    dropped_bytes : int
+        Bytes discarded because no buffer was available within `block_timeout`.
+    dropped_writes : int
+        Number of `write` calls whose data was discarded.
+    """
+
+    def __init__(
+        self,
+        writer,
+        path,
+        buffer_size,
+        preallocation_chunk=0,
+        max_buffers=DEFAULT_MAX_BUFFERS,
+        block_timeout=DEFAULT_BLOCK_TIMEOUT,
+        on_drop=None,
+    ):
+        self.writer = writer
+        self.name = path
+        self.on_drop = on_drop
+        self.closed = False
+        self.bytes_written = 0
+        self.dropped_bytes = 0
+        self.dropped_writes = 0
+        self._file = open(path, "wb", buffering=0)
+        self._buffer_size = buffer_size
+        self._buffer = bytearray(buffer_size)
+        self._fill = 0
+        self._free_buffers = deque()
+        self._max_buffers = max(2, max_buffers)
+        self._block_timeout = block_timeout
+        self._buffers = 1  # allocated, including the staging buffer
+        self._lock = Lock()
+        self._buffer_freed = Condition(self._lock)
+        self._closed_event = Event()
+        self._preallocation_chunk = preallocation_chunk
+        self._allocated = 0
+        self._reported_dropped_bytes = 0
+        self._last_drop_report = None
+
+    def write(self, data):
+        """Copy bytes into the staging buffer (acquisition thread side).
+
+        Parameters
+        ----------
+        data : bytes | bytearray | memoryview
+            Raw bytes to append to the file.
+
+        Returns
+        -------
+        int
+            Number of bytes accepted (0 if the sink is closed or the data was dropped).
+        """
+        mv = memoryview(data).cast("B")
+        size = len(mv)
+        with self._lock:
+            if self.closed:
+                return 0
+            if size > self.__capacity():
+                # All the buffers wait for the disk: wait a bit, then drop the data
+                self._buffer_freed.wait_for(
+                    lambda: self.closed or size <= self.__capacity(), self._block_timeout
+                )
+                if self.closed:
+                    return 0
+            dropped = size > self.__capacity()
+            if dropped:
+                self.dropped_bytes += size
+                self.dropped_writes += 1
+                report = self.__drop_report()
+            else:
+                pos = 0
+                while pos < size:
+                    n = min(size - pos, self._buffer_size - self._fill)
+                    self._buffer[self._fill:self._fill + n] = mv[pos:pos + n]
+                    self._fill += n
+                    pos += n
+                    if self._fill == self._buffer_size:
+                        self.__hand_over()
+        if dropped:
+            # Reported outside the lock: the callback may emit Qt signals
+            if report is not None:
+                self.on_drop(self, report)
+            return 0
+        return size
+
+    def flush(self):
+        """Hand the partially filled buffer over to the writer thread.
+
+        Nothing is done if no buffer is available to replace it (never blocks).
+        """
+        with self._lock:
+            if self._fill > 0 and self.__capacity() > self._buffer_size - self._fill:
+                self.__hand_over()
+
+    def close(self):
+        """Flush pending data and wait until the writer thread closed the file."""
+        with self._lock:
+            if self.closed:
+                return
+            if self._fill > 0:
+                self.__hand_over(replace=False)
+            self.closed = True
+            self._buffer_freed.notify_all()
+            self.writer.enqueue(self, None, 0)
+        self._closed_event.wait()
+
+    def move_to(self, path):
+        """Move the file to `path` on the writer thread (any thread).
+
+        Writes are not interrupted: the data queued before and after the request keep
+        their order. The file is renamed (atomic on the same filesystem) or, if that is
+        not possible, moved with a copy. `name` is updated once the file is moved.
+
+        Parameters
+        ----------
+        path : str
+            New file path.
+        """
+        with self._lock:
+            if self.closed:
+                return
+            self.writer.enqueue(self, _MOVE, path)
+
+    def __drop_report(self):
+        # Bytes to report through on_drop, None if not due yet (self._lock held)
+        if self.on_drop is None:
+            return None
+        now = time.monotonic()
+        if (
+            self._last_drop_report is not None
+            and now - self._last_drop_report < DROP_REPORT_INTERVAL
+        ):
+            return None
+        self._last_drop_report = now
+        report = self.dropped_bytes - self._reported_dropped_bytes
+        self._reported_dropped_bytes = self.dropped_bytes
+        return report
+
+    def __capacity(self):
+        # Bytes that can be staged without waiting for the writer (self._lock held)
+        available = len(self._free_buffers) + self._max_buffers - self._buffers
+        return self._buffer_size - self._fill + available * self._buffer_size
+
+    def __hand_over(self, replace=True):
+        # Called with self._lock held, with a free buffer available if replace is True
+        self.writer.enqueue(self, self._buffer, self._fill)
+        self._fill = 0
+        if not replace:
+            self._buffer = None
+        elif self._free_buffers:
+            self._buffer = self._free_buffers.popleft()
+        else:
+            self._buffer = bytearray(self._buffer_size)
+            self._buffers += 1
+
+    def _write_out(self, buffer, size):
+        # Writer thread side
+        if self._preallocation_chunk > 0 and self.bytes_written + size > self._allocated:
+            try:
+                os.posix_fallocate(self._file.fileno(), self._allocated, self._preallocation_chunk)
+                self._allocated += self._preallocation_chunk
+            except OSError as e:
+                log.warning(f"Preallocation disabled for {self.name}: {e}")
+                self._preallocation_chunk = 0
+        mv = memoryview(buffer)[:size]
+        while len(mv) > 0:
+            mv = mv[self._file.write(mv):]
+        self.bytes_written += size
+        with self._lock:
+            self._free_buffers.append(buffer)
+            self._buffer_freed.notify_all()
+
+    def _move_out(self, path):
+        # Writer thread side
+        if os.path.abspath(self.name) == os.path.abspath(path):
+            return
+        # Closed first: open files cannot be renamed on Windows
+        self._file.close()
+        try:
+            try:
+                os.replace(self.name, path)
+            except OSError as e:
+                log.warning(f"Cannot rename {self.name} to {path} ({e}), moving it")
+                shutil.move(self.name, path)
+            self.name = path
+        finally:
+            self._file = open(self.name, "r+b", buffering=0)
+            self._file.seek(self.bytes_written)
+
+    def _close_out(self):
+        # Writer thread side
+        try:
+            if self._allocated > self.bytes_written:
+                self._file.truncate(self.bytes_written)
+            self._file.close()
+        finally:
+            self._closed_event.set()
+
+class AsyncDatWriter(Thread):
+    """Writer thread serving all the `.dat` sinks of one acquisition.
+
+    Parameters
+    ----------
+    buffer_size : int, optional
+        Size of the staging buffers in bytes, rounded up to the page size.
+        Default is 4 MiB.
+    flush_interval : float, optional
+        Maximum time in seconds partially filled buffers wait before being written.
+        Default is 0.5.
+    preallocate : bool, optional
+        Preallocate file space with `posix_fallocate` (Linux only). Default is False.
+    preallocation_chunk : int, optional
+        Preallocation step in bytes. Default is 64 MiB.
+    max_buffers : int, optional
+        Maximum number of buffers of each sink. Default is 16.
+    block_timeout : float, optional
+        Maximum wait in seconds of a `write` for a free buffer before its data is
+        dropped. Default is 0.5.
+
+    Attributes
+    ----------
+    bytes_written : int
+        Total bytes written by this thread.
+    writes : int
+        Number of buffer writes performed.
+    max_latency : float
+        Longest single buffer write in seconds.
+    """
+
+    def __init__(
+        self,
+        buffer_size=DEFAULT_BUFFER_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+        preallocate=False,
+        preallocation_chunk=DEFAULT_PREALLOCATION_CHUNK,
+        max_buffers=DEFAULT_MAX_BUFFERS,
+        block_timeout=DEFAULT_BLOCK_TIMEOUT,
+    ):
+        super().__init__(name="dat_writer_thread", daemon=True)
+        self.buffer_size = _page_aligned(buffer_size)
+        self.max_buffers = max_buffers
+        self.block_timeout = block_timeout
+        self.flush_interval = flush_interval
+        self.preallocation_chunk = 0
+        if preallocate:
+            if sys.platform.startswith("linux") and hasattr(os, "posix_fallocate"):
+                self.preallocation_chunk = preallocation_chunk
+            else:
+                log.info("File preallocation is supported on Linux only")
+        self.sinks = []
+        self.bytes_written = 0
+        self.writes = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._queue = queue.Queue()
+        self._stop_event = Event()
+
+    def open_sink(self, path, on_drop=None):
+        """Create a file sink served by this writer.
+
+        Parameters
+        ----------
+        path : str
+            Destination file path.
+        on_drop : callable | None, optional
+            Dropped data callback of the sink (see `AsyncFileSink`). Default is None.
+
+        Returns
+        -------
+        AsyncFileSink
+            File-like object to be used by the acquisition thread.
+        """
+        sink = AsyncFileSink(
+            self,
+            path,
+            self.buffer_size,
+            self.preallocation_chunk,
+            self.max_buffers,
+            self.block_timeout,
+            on_drop,
+        )
+        self.sinks.append(sink)
+        return sink
+
+    def enqueue(self, sink, buffer, size):
+        """Queue a filled buffer (or a close request if `buffer` is None)."""
+        self._queue.put((sink, buffer, size))
+
+    def run(self):
+        """Write queued buffers in order and flush idle sinks periodically."""
+        last_flush = time.monotonic()
+        while True:
+            try:
+                sink, buffer, size = self._queue.get(timeout=self.flush_interval)
+                self.__process(sink, buffer, size)
+            except queue.Empty:
+                if self._stop_event.is_set():
+                    break
+            now = time.monotonic()
+            if now - last_flush >= self.flush_interval:
+                last_flush = now
+                for s in list(self.sinks):
+                    if not s.closed:
+                        s.flush()
+
+    def __process(self, sink, buffer, size):
+        try:
+            if buffer is None:
+                sink._close_out()
+                return
+            if buffer is _MOVE:
+                sink._move_out(size)
+                return
+            start = time.monotonic()
+            sink._write_out(buffer, size)
+            latency = time.monotonic() - start
+            self.bytes_written += size
+            self.writes += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+        except Exception as e:
+            log.error(f"Error writing {sink.name}: {e}")
+
+    def stop(self):
+        """Close all the sinks, write the remaining data and stop the thread."""
+        for sink in list(self.sinks):
+            sink.close()
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+    def get_stats(self):
+        """Return the writer metrics.
+
+        Returns
+        -------
+        dict
+            `bytes_written`, `writes`, `avg_latency_s`, `max_latency_s`,
+            `pending_buffers`, `dropped_bytes` and `dropped_writes` (all sinks).
+        """
+        sinks = list(self.sinks)
+        return {
+            "bytes_written": self.bytes_written,
+            "writes": self.writes,
+            "avg_latency_s": self.total_latency / self.writes if self.writes else 0.0,
+            "max_latency_s": self.max_latency,
+            "pending_buffers": self._queue.qsize(),
+            "dropped_bytes": sum(s.dropped_bytes for s in sinks),
+            "dropped_writes": sum(s.dropped_writes for s in sinks),
+        }
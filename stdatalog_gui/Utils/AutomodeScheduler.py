@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    AutomodeScheduler.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Drift-free scheduler of the automode acquisition sessions.
+
+Automode waits `m` seconds, then runs `n` sessions (0 = until stopped) of `x` seconds
+separated by `y` seconds of idle time. `AutomodeScheduler` computes every start and
+stop time as an absolute `time.monotonic()` deadline from the scheduler start:
+
+    start(i) = t0 + m + i * (x + y)
+    stop(i) = start(i) + x
+
+so the time spent starting and stopping the acquisitions does not accumulate over the
+sessions.
+
+Design Notes:
+- Waits use `Event.wait`, so `stop` interrupts the schedule at once.
+- Each session records its deadlines, the actual start/stop times and the gap from the
+    stop request of the previous session to the start of this one. The gaps are logged
+    and reported by `get_stats`.
+"""
+
+import time
+from threading import Event, Thread
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+class AutomodeScheduler(Thread):
+    """Thread running the automode sessions on absolute deadlines.
+
+    Parameters
+    ----------
+    n : int
+        Number of sessions (0 means until stopped).
+    m : float
+        Delay in seconds before the first session.
+    x : float
+        Duration in seconds of each session.
+    y : float
+        Idle time in seconds between sessions.
+    start_session : callable
+        Called as `start_session(index)` to start an acquisition.
+    stop_session : callable
+        Called as `stop_session(index, last)` to stop an acquisition; `last` is True
+        for the final session of a finite schedule.
+    on_waiting : callable | None, optional
+        Called with True/False when the initial delay begins/ends.
+    on_idle : callable | None, optional
+        Called with True/False when an idle time between sessions begins/ends.
+    on_finished : callable | None, optional
+        Called without arguments when the schedule ends or is stopped.
+
+    Attributes
+    ----------
+    sessions : list[dict]
+        Per-session timing: `index`, `start_deadline_s`, `start_s`, `stop_deadline_s`,
+        `stop_s`, `gap_s` (seconds; times are relative to the scheduler start).
+    """
+
+    def __init__(
+        self,
+        n,
+        m,
+        x,
+        y,
+        start_session,
+        stop_session,
+        on_waiting=None,
+        on_idle=None,
+        on_finished=None,
+    ):
+        super().__init__(name="automode_thread", daemon=True)
+        self.n = n
+        self.m = m
+        self.x = x
+        self.y = y
+        self.start_session = start_session
+        self.stop_session = stop_session
+        self.on_waiting = on_waiting
+        self.on_idle = on_idle
+        self.on_finished = on_finished
+        self.sessions = []
+        self.__t0 = None
+        self.__stop_event = Event()
+
+    def stop(self):
+        """Interrupt the schedule (any thread). The running session is not stopped."""
+        self.__stop_event.set()
+
+    def is_stopped(self):
+        """Return True if `stop` has been called."""
+        return self.__stop_event.is_set()
+
+    def get_stats(self):
+        """Return the session timing summary.
+
+        Returns
+        -------
+        dict
+            `sessions`, `avg_gap_s`, `max_gap_s` and `max_start_delay_s` (lateness of
+            the starts with respect to their deadlines).
+        """
+        gaps = [s["gap_s"] for s in self.sessions if s["gap_s"] is not None]
+        delays = [s["start_s"] - s["start_deadline_s"] for s in self.sessions]
+        return {
+            "sessions": len(self.sessions),
+            "avg_gap_s": sum(gaps) / len(gaps) if gaps else None,
+            "max_gap_s": max(gaps) if gaps else None,
+            "max_start_delay_s": max(delays) if delays else None,
+        }
+
+    def run(self):
+        """Run the sessions until the schedule ends or `stop` is called."""
+        self.__t0 = time.monotonic()
+        try:
+            self.__run_schedule()
+        except Exception as e:
+            log.exception(f"Automode error: {e}")
+        finally:
+            self.__log_stats()
+            if self.on_finished is not None:
+                self.on_finished()
+
+    def __run_schedule(self):
+        if self.on_waiting is not None:
+            self.on_waiting(True)
+        self.__wait_until(self.m)
+        if self.on_waiting is not None:
+            self.on_waiting(False)
+
+        prev_stop = None
+        i = 0
+        while self.n == 0 or i < self.n:
+            if self.is_stopped():
+                break
+            start_deadline = self.m + i * (self.x + self.y)
+            self.start_session(i)
+            session = {
+                "index": i,
+                "start_deadline_s": start_deadline,
+                "start_s": self.__now(),
+                "stop_deadline_s": start_deadline + self.x,
+                "stop_s": None,
+                "gap_s": None,
+            }
+            if prev_stop is not None:
+                session["gap_s"] = session["start_s"] - prev_stop
+                log.info(
+                    f"Automode session {i}: started {session['gap_s'] * 1000:.0f} ms after "
+                    f"the previous one stopped ({(session['gap_s'] - self.y) * 1000:.0f} ms "
+                    "beyond the idle time)"
+                )
+            self.sessions.append(session)
+
+            if self.__wait_until(session["stop_deadline_s"]):
+                break
+            last = self.n != 0 and i == self.n - 1
+            prev_stop = self.__now()
+            session["stop_s"] = prev_stop
+            self.stop_session(i, last)
+            if last:
+                break
+
+            if self.on_idle is not None:
+                self.on_idle(True)
+            self.__wait_until(start_deadline + self.x + self.y)
+            if self.on_idle is not None:
+                self.on_idle(False)
+            i += 1
+
+    def __now(self):
+        return time.monotonic() - self.__t0
+
+    def __wait_until(self, deadline):
+        # True if the schedule has been stopped
+        return self.__stop_event.wait(max(0.0, deadline - self.__now()))
+
+    def __log_stats(self):
+        stats = self.get_stats()
+        if stats["max_gap_s"] is not None:
+            log.info(
+                f"Automode: {stats['sessions']} sessions, inter-session gap "
+                f"avg {stats['avg_gap_s'] * 1000:.0f} ms, max {stats['max_gap_s'] * 1000:.0f} ms "
+                f"(idle time {self.y * 1000:.0f} ms)"
+            )
@@ -0,0 +1,357 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    BandwidthPlanner.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Bandwidth planning of a device configuration.
+
+Before an acquisition starts, `BandwidthPlanner` estimates the link bandwidth needed by
+the enabled streams and compares it with the capacity of the link in use:
+
+- Each stream contributes `ODR * sample_size * 8` bits/s of payload, increased by the
+    framing overhead of its packets (e.g., the 4-byte counter of each `usb_dps` payload).
+- Streams without a known ODR (algorithms, actuators) contribute the rate measured in
+    the previous acquisitions, if any.
+- Link capacities start from nominal values and are calibrated with the telemetry of
+    each acquisition: a throughput sustained without losses raises the capacity,
+    packet losses confirmed over consecutive acquisitions lower it, and a lowered
+    capacity recovers gradually while acquisitions run without losses.
+
+When the configuration does not fit, the planner suggests the smallest ODR reductions
+that bring it under capacity: the single ODR change saving the least bandwidth among
+those that fit is preferred. Only when no single change fits, the one-step reduction
+saving the most is applied and the search is repeated.
+"""
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+USB_LINK = "usb"
+SERIAL_LINK = "serial"
+DEFAULT_LINK_CAPACITY = 6000000  # bits/s
+PACKET_COUNTER_SIZE = 4  # bytes
+EDGE_SAMPLES = 1  # telemetry samples ignored at each end of an acquisition
+
+class LinkModel:
+    """Capacity model of a device link.
+
+    Parameters
+    ----------
+    name : str
+        Link name.
+    capacity_bps : float
+        Nominal capacity in bits per second.
+    packet_overhead : int, optional
+        Framing bytes added to each stream packet. Default is 4 (packet counter).
+
+    Attributes
+    ----------
+    calibrated_bps : float | None
+        Capacity estimated from the acquisitions, None until calibrated.
+    loss_strikes : int
+        Consecutive acquisitions with packet losses.
+    """
+
+    def __init__(self, name, capacity_bps, packet_overhead=PACKET_COUNTER_SIZE):
+        self.name = name
+        self.capacity_bps = capacity_bps
+        self.packet_overhead = packet_overhead
+        self.calibrated_bps = None
+        self.loss_strikes = 0
+
+    @property
+    def effective_bps(self):
+        """Capacity used for planning: the calibrated one, when available."""
+        return self.calibrated_bps if self.calibrated_bps is not None else self.capacity_bps
+
+class StreamDemand:
+    """Bandwidth requirement of one stream.
+
+    Parameters
+    ----------
+    comp_name : str
+        Component name.
+    odr : float | None
+        Current output data rate (samples/s), None if unknown.
+    sample_size : int
+        Bytes per sample (data type size * dimensions).
+    packet_payload : int | None, optional
+        Payload bytes per link packet (`usb_dps`), used to account framing overhead.
+    odr_options : list[tuple[float, int]] | None, optional
+        Selectable ODRs as `(odr, enum_index)` pairs, used for suggestions.
+    """
+
+    def __init__(self, comp_name, odr, sample_size, packet_payload=None, odr_options=None):
+        self.comp_name = comp_name
+        self.odr = odr
+        self.sample_size = sample_size
+        self.packet_payload = packet_payload
+        self.odr_options = sorted(odr_options) if odr_options else []
+
+class BandwidthPlan:
+    """Result of `BandwidthPlanner.plan`.
+
+    Attributes
+    ----------
+    link : str
+        Link name.
+    capacity_bps : float
+        Link capacity used for the check.
+    total_bps : float
+        Estimated bandwidth of the configuration, framing included.
+    streams : dict
+        `{comp_name: bits/s}` per-stream estimate.
+    suggestions : list[tuple[str, float, float, int]]
+        `(comp_name, current_odr, suggested_odr, suggested_enum_index)` reductions that
+        make the configuration fit. Empty when it already fits.
+    fits_with_suggestions : bool
+        False if even the suggested reductions are not enough.
+    """
+
+    def __init__(self, link, capacity_bps, total_bps, streams, suggestions, fits_with_suggestions):
+        self.link = link
+        self.capacity_bps = capacity_bps
+        self.total_bps = total_bps
+        self.streams = streams
+        self.suggestions = suggestions
+        self.fits_with_suggestions = fits_with_suggestions
+
+    @property
+    def exceeded(self):
+        """True if the configuration is expected to drop packets."""
+        return self.total_bps > self.capacity_bps
+
+    def describe_suggestions(self):
+        """Return a human-readable list of the suggested ODR reductions."""
+        lines = [
+            f"- {comp_name}: ODR {_format_odr(odr)} -> {_format_odr(new_odr)}"
+            for comp_name, odr, new_odr, _ in self.suggestions
+        ]
+        if not self.fits_with_suggestions:
+            lines.append("- disable one or more components")
+        return "\n".join(lines)
+
+def _format_odr(odr):
+    return f"{odr:g} Hz"
+
+class BandwidthPlanner:
+    """Link capacity models and configuration bandwidth checks.
+
+    Parameters
+    ----------
+    usb_capacity_bps : float, optional
+        Nominal USB link capacity in bits/s. Default is 6 Mbit/s.
+    serial_capacity_bps : float, optional
+        Nominal serial link capacity in bits/s. Default is 6 Mbit/s.
+    calibration_margin : float, optional
+        Fraction of a throughput observed with losses taken as the new capacity.
+        Default is 0.9.
+    sustain_samples : int, optional
+        Telemetry samples over which a throughput must be sustained. Default is 5.
+    loss_evidence : int, optional
+        Consecutive acquisitions with losses required to lower a capacity. Default is 2.
+    recovery_rate : float, optional
+        Fraction of the gap to the nominal capacity recovered after each acquisition
+        without losses. Default is 0.25.
+    """
+
+    def __init__(
+        self,
+        usb_capacity_bps=DEFAULT_LINK_CAPACITY,
+        serial_capacity_bps=DEFAULT_LINK_CAPACITY,
+        calibration_margin=0.9,
+        sustain_samples=5,
+        loss_evidence=2,
+        recovery_rate=0.25,
+    ):
+        self.links = {
+            USB_LINK: LinkModel(USB_LINK, usb_capacity_bps),
+            SERIAL_LINK: LinkModel(SERIAL_LINK, serial_capacity_bps),
+        }
+        self.calibration_margin = calibration_margin
+        self.sustain_samples = max(1, sustain_samples)
+        self.loss_evidence = max(1, loss_evidence)
+        self.recovery_rate = recovery_rate
+        self.measured_bps = dict()  # {comp_name: bits/s measured in the last acquisition}
+
+    @staticmethod
+    def stream_bps(demand, link_model, odr=None):
+        """Estimate the link bandwidth of a stream.
+
+        Parameters
+        ----------
+        demand : StreamDemand
+            Stream requirement.
+        link_model : LinkModel
+            Link carrying the stream.
+        odr : float | None, optional
+            ODR to evaluate instead of `demand.odr`.
+
+        Returns
+        -------
+        float | None
+            Bits per second, framing included, or None if the ODR is unknown.
+        """
+        odr = demand.odr if odr is None else odr
+        if odr is None:
+            return None
+        bps = odr * demand.sample_size * 8
+        if demand.packet_payload:
+            bps *= (demand.packet_payload + link_model.packet_overhead) / demand.packet_payload
+        return bps
+
+    def plan(self, demands, link=USB_LINK):
+        """Check a configuration against the link capacity.
+
+        Parameters
+        ----------
+        demands : list[StreamDemand]
+            Enabled streams.
+        link : str, optional
+            Link name (`USB_LINK` or `SERIAL_LINK`). Default is `USB_LINK`.
+
+        Returns
+        -------
+        BandwidthPlan
+            Estimate, capacity and suggested ODR reductions.
+        """
+        link_model = self.links[link]
+        capacity = link_model.effective_bps
+        streams = dict()
+        for d in demands:
+            bps = self.stream_bps(d, link_model)
+            if bps is None:
+                bps = self.measured_bps.get(d.comp_name, 0.0)
+            streams[d.comp_name] = bps
+        total = sum(streams.values())
+
+        suggestions = dict()  # {comp_name: (odr, enum_index)}
+        planned = dict(streams)
+        planned_total = total
+        while planned_total > capacity:
+            # Smallest single ODR change that fits; else the largest one-step saving
+            best_fit = None
+            best_step = None
+            for d in demands:
+                current = suggestions.get(d.comp_name, (d.odr, None))[0]
+                if current is None:
+                    continue
+                lower = [o for o in d.odr_options if o[0] < current]
+                for steps, option in enumerate(reversed(lower), 1):
+                    saving = planned[d.comp_name] - self.stream_bps(d, link_model, option[0])
+                    if planned_total - saving <= capacity:
+                        if best_fit is None or (saving, steps) < best_fit[:2]:
+                            best_fit = (saving, steps, d, option)
+                        break  # lower options of this stream save more
+                    if steps == 1 and (best_step is None or saving > best_step[0]):
+                        best_step = (saving, steps, d, option)
+            best = best_fit if best_fit is not None else best_step
+            if best is None:
+                break
+            saving, _, d, option = best
+            suggestions[d.comp_name] = option
+            planned[d.comp_name] -= saving
+            planned_total -= saving
+
+        exceeded = total > capacity
+        return BandwidthPlan(
+            link,
+            capacity,
+            total,
+            streams,
+            [
+                (d.comp_name, d.odr, suggestions[d.comp_name][0], suggestions[d.comp_name][1])
+                for d in demands
+                if exceeded and d.comp_name in suggestions
+            ],
+            planned_total <= capacity,
+        )
+
+    def calibrate(self, samples, link=USB_LINK):
+        """Update the link capacity and stream rates with an acquisition telemetry.
+
+        The first and last samples (partial start/stop periods) are ignored. The link
+        throughput is the sustained peak: the highest mean over `sustain_samples`
+        consecutive samples. The capacity is lowered to a fraction of that throughput
+        only after `loss_evidence` consecutive acquisitions with packet losses; an
+        acquisition without losses raises it to the throughput sustained, and moves a
+        lowered capacity back towards the nominal one by `recovery_rate`.
+
+        Parameters
+        ----------
+        samples : Sequence[dict]
+            `StreamTelemetry` samples of the acquisition.
+        link : str, optional
+            Link used by the acquisition. Default is `USB_LINK`.
+        """
+        samples = list(samples)[EDGE_SAMPLES:-EDGE_SAMPLES]
+        if len(samples) == 0:
+            return
+        totals = []  # link throughput of each sample, bits/s
+        rates = dict()  # {comp_name: [bits/s]}
+        loss_samples = 0
+        lost_packets = 0
+        prev_lost = None
+        for sample in samples:
+            total = 0.0
+            for comp_name, stream in sample["streams"].items():
+                if stream["bytes_per_s"] > 0:
+                    rates.setdefault(comp_name, []).append(stream["bytes_per_s"] * 8)
+                    total += stream["bytes_per_s"] * 8
+            totals.append(total)
+            lost = sum(s["lost_packets"] for s in sample["streams"].values())
+            if prev_lost is not None and lost > prev_lost:
+                loss_samples += 1
+                lost_packets += lost - prev_lost
+            prev_lost = lost
+        if len(rates) == 0:
+            return
+        for comp_name, values in rates.items():
+            self.measured_bps[comp_name] = sum(values) / len(values)
+        window = min(self.sustain_samples, len(totals))
+        throughput = max(
+            sum(totals[i:i + window]) / window for i in range(len(totals) - window + 1)
+        )
+
+        link_model = self.links[link]
+        capacity = link_model.effective_bps
+        if loss_samples > 0:
+            link_model.loss_strikes += 1
+            if link_model.loss_strikes < self.loss_evidence:
+                log.info(
+                    f"{link} link: {lost_packets} packets lost at {throughput / 1e6:.2f} Mbit/s, "
+                    f"capacity kept until confirmed ({link_model.loss_strikes}/{self.loss_evidence})"
+                )
+                return
+            if throughput * self.calibration_margin >= capacity:
+                return
+            link_model.calibrated_bps = throughput * self.calibration_margin
+        else:
+            link_model.loss_strikes = 0
+            new_capacity = max(capacity, throughput)
+            if capacity < link_model.capacity_bps:
+                # Lowered by past losses: recover gradually towards the nominal capacity
+                new_capacity = max(
+                    new_capacity,
+                    capacity + self.recovery_rate * (link_model.capacity_bps - capacity),
+                )
+            if new_capacity <= capacity:
+                return
+            link_model.calibrated_bps = new_capacity
+        log.info(
+            f"{link} link capacity calibrated to {link_model.calibrated_bps / 1e6:.2f} Mbit/s "
+            f"(sustained {throughput / 1e6:.2f} Mbit/s, {lost_packets} packets lost)"
+        )
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    DatWavConverter.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Streaming conversion of raw audio `.dat` files into WAV files.
+
+The `.dat` files written by the GUI during a USB acquisition are the sequence of the
+packets received from the device: a 4-byte packet counter followed by `usb_dps`
+payload bytes. The counter is the position of the packet payload in the component
+data stream, where every `samples_per_ts` samples are followed by an 8-byte timestamp.
+
+`DatWavConverter` memory-maps the `.dat` file and processes it in chunks of whole
+packets: counters and timestamps are stripped with NumPy masks and the samples are
+appended to the WAV file. Peak memory depends on the chunk size only, not on the
+recording length.
+
+Design Notes:
+- The stream position of every packet is taken from its counter, so a packet lost by
+    the host does not shift the data that follows. Lost ranges are filled with silence
+    (zero samples), logged and reported by `gaps` and `lost_bytes`.
+- Positions are computed chunk by chunk, carrying the last counter over, so no
+    per-packet array of the whole file is built: a first pass over the counters
+    validates the file, counts the gaps and maps the time range to packets, the
+    second one converts.
+- Counters that go backwards or do not advance by whole packets mean a different file
+    layout and raise `DatWavFormatError`, so callers can fall back to the full
+    `HSDatalog` conversion.
+- The time range is converted to sample indexes with the measured ODR when known, the
+    WAV header uses the nominal sample rate.
+- Progress is reported as a percentage; cancellation is checked between chunks and
+    removes the partial WAV file.
+"""
+
+import mmap
+import os
+import wave
+
+import numpy as np
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+USB_PACKET_COUNTER_SIZE = 4
+TIMESTAMP_SIZE = 8
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+COUNTER_MODULO = 1 << 32
+
+class DatWavFormatError(Exception):
+    """Raised when a `.dat` file cannot be streamed into a WAV file."""
+
+class DatWavConverter:
+    """Convert a USB-framed audio `.dat` file into a PCM WAV file.
+
+    Parameters
+    ----------
+    dat_path : str
+        Source `.dat` file.
+    wav_path : str
+        Destination WAV file.
+    usb_dps : int
+        Payload size in bytes of each USB packet.
+    samples_per_ts : int
+        Number of samples between two timestamps, 0 if the stream has no timestamps.
+    dimension : int
+        Number of channels.
+    sample_size : int
+        Size in bytes of one sample (2 for int16, 4 for int32).
+    sample_rate : int
+        Nominal output data rate in Hz, written in the WAV header.
+    measured_odr : float | None, optional
+        Measured output data rate in Hz, used to convert times to samples. Defaults
+        to `sample_rate`.
+    chunk_size : int, optional
+        Approximate number of `.dat` bytes processed per chunk. Default is 1 MiB.
+
+    Attributes
+    ----------
+    gaps : int
+        Number of lost packet ranges found by the last `convert`.
+    lost_bytes : int
+        Payload bytes lost in those ranges (filled with silence in the WAV file).
+    """
+
+    def __init__(
+        self,
+        dat_path,
+        wav_path,
+        usb_dps,
+        samples_per_ts,
+        dimension,
+        sample_size,
+        sample_rate,
+        measured_odr=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        if not usb_dps or usb_dps <= 0:
+            raise DatWavFormatError("Missing USB packet size")
+        if sample_size not in (2, 3, 4):
+            raise DatWavFormatError(f"Unsupported WAV sample size: {sample_size}")
+        if not sample_rate or sample_rate <= 0:
+            raise DatWavFormatError("Missing output data rate")
+        self.dat_path = dat_path
+        self.wav_path = wav_path
+        self.usb_dps = usb_dps
+        self.packet_size = usb_dps + USB_PACKET_COUNTER_SIZE
+        self.frame_size = dimension * sample_size
+        self.block_size = samples_per_ts * self.frame_size + TIMESTAMP_SIZE if samples_per_ts > 0 else 0
+        self.dimension = dimension
+        self.sample_size = sample_size
+        self.sample_rate = int(round(sample_rate))
+        self.measured_odr = measured_odr if measured_odr and measured_odr > 0 else sample_rate
+        self.chunk_packets = max(1, chunk_size // self.packet_size)
+        self.gaps = 0
+        self.lost_bytes = 0
+
+    def __chunk_offsets(self, mm, packet, n, prev_counter, prev_offset):
+        # Payload offsets of packets [packet, packet + n) in the data stream, from their
+        # counters and those of the previous packet (None for the first one converted)
+        counters = np.ndarray(
+            shape=(n,), dtype="=u4", buffer=mm, offset=packet * self.packet_size,
+            strides=(self.packet_size,),
+        ).astype(np.int64)
+        steps = np.empty(n, dtype=np.int64)
+        steps[0] = 0 if prev_counter is None else counters[0] - prev_counter
+        steps[1:] = np.diff(counters)
+        # Counters are 32-bit and wrap around on long acquisitions
+        steps %= COUNTER_MODULO
+        if prev_counter is None:
+            checked = steps[1:]
+        else:
+            checked = steps
+        if np.any(checked < self.usb_dps) or np.any(checked % self.usb_dps != 0):
+            raise DatWavFormatError(f"{self.dat_path} is not made of {self.usb_dps} bytes USB packets")
+        offsets = np.cumsum(steps)
+        offsets += prev_offset
+        return offsets, int(counters[-1]), checked
+
+    def __scan(self, mm, n_packets, start_payload, end_payload):
+        # Running scan of the counters: gaps, packet of start_payload, first packet after
+        # end_payload (None: end of file) and end of the stream payload
+        self.gaps = 0
+        self.lost_bytes = 0
+        first_packet, first_offset = 0, 0
+        last_packet = n_packets
+        prev_counter, prev_offset = None, 0
+        for packet in range(0, n_packets, self.chunk_packets):
+            n = min(self.chunk_packets, n_packets - packet)
+            offsets, prev_counter, steps = self.__chunk_offsets(
+                mm, packet, n, prev_counter, prev_offset
+            )
+            gap_steps = steps[steps != self.usb_dps]
+            self.gaps += len(gap_steps)
+            self.lost_bytes += int(np.sum(gap_steps - self.usb_dps))
+            i = int(np.searchsorted(offsets, start_payload, side="right")) - 1
+            if i >= 0:
+                first_packet, first_offset = packet + i, int(offsets[i])
+            if end_payload is not None and last_packet == n_packets:
+                i = int(np.searchsorted(offsets, end_payload, side="right"))
+                if i < n:
+                    last_packet = packet + i
+            prev_offset = int(offsets[-1])
+        return first_packet, first_offset, last_packet, prev_offset + self.usb_dps
+
+    def __sample_mask(self, payload_offset, length):
+        # False on the timestamp bytes of the payload range [payload_offset, payload_offset + length)
+        mask = np.ones(length, dtype=bool)
+        ts_pos = self.block_size - TIMESTAMP_SIZE
+        first_ts = (ts_pos - payload_offset) % self.block_size - self.block_size
+        ts_starts = np.arange(first_ts, length, self.block_size)
+        ts_bytes = (ts_starts[:, np.newaxis] + np.arange(TIMESTAMP_SIZE)).reshape(-1)
+        mask[ts_bytes[(ts_bytes >= 0) & (ts_bytes < length)]] = False
+        return mask
+
+    def __sample_bytes_before(self, payload_offset):
+        # Number of sample bytes contained in the first payload_offset payload bytes
+        if self.block_size == 0:
+            return payload_offset
+        full_blocks, rem = divmod(payload_offset, self.block_size)
+        return full_blocks * (self.block_size - TIMESTAMP_SIZE) + min(rem, self.block_size - TIMESTAMP_SIZE)
+
+    def __payload_offset_of_sample_byte(self, sample_offset):
+        # Payload offset of the given sample byte offset
+        if self.block_size == 0:
+            return sample_offset
+        full_blocks, rem = divmod(sample_offset, self.block_size - TIMESTAMP_SIZE)
+        return full_blocks * self.block_size + rem
+
+    def __write_range(self, wav_file, data, sample_offset, start_byte, end_byte):
+        # Write the part of data (sample bytes starting at sample_offset) in [start_byte, end_byte)
+        lo = max(0, start_byte - sample_offset)
+        hi = min(len(data), end_byte - sample_offset)
+        if hi > lo:
+            wav_file.writeframesraw(memoryview(data[lo:hi]))
+
+    def __write_silence(self, wav_file, sample_start, sample_end, start_byte, end_byte):
+        lo = max(sample_start, start_byte)
+        hi = min(sample_end, end_byte)
+        step = self.chunk_packets * self.usb_dps
+        for pos in range(lo, hi, step):
+            wav_file.writeframesraw(bytes(min(step, hi - pos)))
+
+    def convert(self, start_time=0, end_time=-1, progress_callback=None, cancel_event=None):
+        """Convert the selected time range.
+
+        Parameters
+        ----------
+        start_time : float, optional
+            Start time in seconds from the first sample. Default is 0.
+        end_time : float, optional
+            End time in seconds, -1 (default) for the end of the recording.
+        progress_callback : callable | None, optional
+            Called with the completion percentage (int, 0-100) after each chunk.
+        cancel_event : threading.Event | None, optional
+            When set, the conversion stops and the partial WAV file is removed.
+
+        Returns
+        -------
+        str | None
+            Path of the WAV file, or None if the conversion was cancelled.
+        """
+        file_size = os.path.getsize(self.dat_path)
+        n_packets = file_size // self.packet_size
+        if n_packets == 0:
+            raise DatWavFormatError(f"{self.dat_path} contains no complete packet")
+
+        with open(self.dat_path, "rb") as dat_file, \
+                mmap.mmap(dat_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start_byte = max(0, int(start_time * self.measured_odr)) * self.frame_size
+            end_payload = None
+            if end_time is not None and end_time >= 0:
+                time_end_byte = int(end_time * self.measured_odr) * self.frame_size
+                end_payload = self.__payload_offset_of_sample_byte(max(0, time_end_byte - 1))
+            first_packet, first_offset, last_packet, stream_end = self.__scan(
+                mm, n_packets, self.__payload_offset_of_sample_byte(start_byte), end_payload
+            )
+            if self.gaps > 0:
+                log.warning(
+                    f"{self.dat_path}: {self.gaps} lost packet range(s), {self.lost_bytes} bytes "
+                    "replaced by silence in the WAV file"
+                )
+
+            end_byte = self.__sample_bytes_before(stream_end)
+            end_byte -= end_byte % self.frame_size
+            if end_payload is not None:
+                end_byte = min(end_byte, time_end_byte)
+            if start_byte >= end_byte:
+                first_packet = last_packet = n_packets
+
+            wav_file = wave.open(self.wav_path, "wb")
+            cancelled = False
+            try:
+                wav_file.setnchannels(self.dimension)
+                wav_file.setsampwidth(self.sample_size)
+                wav_file.setframerate(self.sample_rate)
+                total = max(1, last_packet - first_packet)
+                expected = first_offset
+                prev_counter, prev_offset = None, first_offset
+                for packet in range(first_packet, last_packet, self.chunk_packets):
+                    if cancel_event is not None and cancel_event.is_set():
+                        cancelled = True
+                        break
+                    n = min(self.chunk_packets, last_packet - packet)
+                    packets = np.frombuffer(
+                        mm, dtype=np.uint8, count=n * self.packet_size, offset=packet * self.packet_size
+                    ).reshape(n, self.packet_size)
+                    chunk_offsets, prev_counter, _ = self.__chunk_offsets(
+                        mm, packet, n, prev_counter, prev_offset
+                    )
+                    prev_offset = int(chunk_offsets[-1])
+                    # Runs of consecutive packets, split where packets have been lost
+                    breaks = np.flatnonzero(np.diff(chunk_offsets) != self.usb_dps) + 1
+                    bounds = [0] + breaks.tolist() + [n]
+                    for a, b in zip(bounds[:-1], bounds[1:]):
+                        payload_offset = int(chunk_offsets[a])
+                        if payload_offset > expected:
+                            self.__write_silence(
+                                wav_file,
+                                self.__sample_bytes_before(expected),
+                                self.__sample_bytes_before(payload_offset),
+                                start_byte,
+                                end_byte,
+                            )
+                        payload = packets[a:b, USB_PACKET_COUNTER_SIZE:].reshape(-1)
+                        if self.block_size > 0:
+                            payload = payload[self.__sample_mask(payload_offset, len(payload))]
+                        self.__write_range(
+                            wav_file,
+                            payload,
+                            self.__sample_bytes_before(payload_offset),
+                            start_byte,
+                            end_byte,
+                        )
+                        expected = payload_offset + (b - a) * self.usb_dps
+                    if progress_callback is not None:
+                        progress_callback(int(100 * (packet + n - first_packet) / total))
+                    del packets, payload
+            finally:
+                wav_file.close()
+        if cancelled:
+            os.remove(self.wav_path)
+            log.info(f"WAV conversion of {self.dat_path} cancelled")
+            return None
+        if progress_callback is not None:
+            progress_callback(100)
+        return self.wav_path
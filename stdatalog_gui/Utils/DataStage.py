@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    DataStage.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Hand-off stage between acquisition threads and plot widgets.
+
+Acquisition threads decode the incoming stream (`DataReader`) into blocks of NumPy
+arrays and push them into a bounded per-component `StageQueue`. They never touch Qt
+objects. A dispatch timer, on the GUI thread, pulls all the ready blocks in one pass
+and forwards them to the plot widgets `add_data`; the render clock also dispatches at
+the beginning of each frame, so widgets draw the freshest data.
+
+This module provides:
+
+- `OverflowPolicy`: behavior of a full queue (drop the oldest block or apply
+    back-pressure to the producer).
+- `StageQueue`: bounded single-producer/single-consumer queue with depth and drop
+    counters.
+- `DataStage`: the set of queues of a controller, keyed by component name, with its
+    own dispatch timer.
+
+Design Notes:
+- In `DROP_OLDEST` mode producer and consumer never wait for each other:
+    `deque.append` and `deque.popleft` are atomic and the bounded deque discards the
+    oldest block. The counters are updated under a short private lock.
+- The dispatch timer does not depend on the render clock, which only runs while plot
+    widgets are registered: it is started (through a queued signal) by the first block
+    pushed and stops after one second without data.
+- In `BACK_PRESSURE` mode the producer waits (up to `timeout` seconds) for the consumer
+    to make room, then falls back to dropping the oldest block.
+"""
+
+from collections import deque
+from enum import Enum
+from threading import Condition, Lock
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+DEFAULT_DISPATCH_INTERVAL_MS = 20
+IDLE_TICKS_BEFORE_STOP = 50
+
+class OverflowPolicy(Enum):
+    """Behavior of a `StageQueue` when it is full."""
+    DROP_OLDEST = 0
+    BACK_PRESSURE = 1
+
+class StageQueue:
+    """Bounded queue of decoded data blocks for one component.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Maximum number of queued blocks. Default is 256.
+    policy : OverflowPolicy, optional
+        Overflow behavior. Default is `OverflowPolicy.DROP_OLDEST`.
+    timeout : float, optional
+        Maximum producer wait in seconds with `OverflowPolicy.BACK_PRESSURE`.
+        Default is 0.05.
+
+    Attributes
+    ----------
+    pushed : int
+        Number of blocks pushed by the producer.
+    dropped : int
+        Number of blocks discarded before being consumed.
+    max_depth : int
+        Highest queue depth observed.
+    """
+
+    def __init__(self, capacity=256, policy=OverflowPolicy.DROP_OLDEST, timeout=0.05):
+        self.capacity = capacity
+        self.policy = policy
+        self.timeout = timeout
+        self._queue = deque(maxlen=capacity)
+        self._not_full = Condition()
+        self._stats_lock = Lock()
+        self.pushed = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    def __len__(self):
+        return len(self._queue)
+
+    def push(self, block):
+        """Append a decoded block (producer side).
+
+        Parameters
+        ----------
+        block : Any
+            Decoded data, as accepted by the destination widget `add_data`.
+        """
+        if self.policy == OverflowPolicy.BACK_PRESSURE and len(self._queue) >= self.capacity:
+            with self._not_full:
+                self._not_full.wait_for(
+                    lambda: len(self._queue) < self.capacity, timeout=self.timeout
+                )
+        with self._stats_lock:
+            if len(self._queue) >= self.capacity:
+                self.dropped += 1  # the bounded deque discards the oldest block
+            self._queue.append(block)
+            self.pushed += 1
+            self.max_depth = max(self.max_depth, len(self._queue))
+
+    def pop_all(self):
+        """Remove and return all the queued blocks, oldest first (consumer side).
+
+        Returns
+        -------
+        list
+            Queued blocks.
+        """
+        blocks = [self._queue.popleft() for _ in range(len(self._queue))]
+        if self.policy == OverflowPolicy.BACK_PRESSURE and len(blocks) > 0:
+            with self._not_full:
+                self._not_full.notify_all()
+        return blocks
+
+    def clear(self):
+        """Discard all the queued blocks and reset the counters."""
+        with self._stats_lock:
+            self._queue.clear()
+            self.pushed = 0
+            self.dropped = 0
+            self.max_depth = 0
+
+    def get_stats(self):
+        """Return the queue counters.
+
+        Returns
+        -------
+        dict
+            `depth`, `max_depth`, `pushed` and `dropped`.
+        """
+        with self._stats_lock:
+            return {
+                "depth": len(self._queue),
+                "max_depth": self.max_depth,
+                "pushed": self.pushed,
+                "dropped": self.dropped,
+            }
+
+class DataStage(QObject):
+    """Per-component `StageQueue` collection shared by producers and the GUI thread.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Capacity of each component queue. Default is 256 blocks.
+    policy : OverflowPolicy, optional
+        Overflow policy of the queues created from now on.
+        Default is `OverflowPolicy.DROP_OLDEST`.
+    plot_widgets : dict | None, optional
+        Map of component name -> plot widget served by the dispatch timer (the
+        controller `plot_widgets`). Default is None (no timer dispatch).
+    dispatch_interval_ms : int, optional
+        Dispatch timer period in milliseconds. Default is 20.
+    parent : QObject | None, optional
+        Parent object.
+    """
+
+    sig_data_staged = Signal()
+
+    def __init__(
+        self,
+        capacity=256,
+        policy=OverflowPolicy.DROP_OLDEST,
+        plot_widgets=None,
+        dispatch_interval_ms=DEFAULT_DISPATCH_INTERVAL_MS,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.capacity = capacity
+        self.policy = policy
+        self.plot_widgets = plot_widgets
+        self.dispatch_interval_ms = dispatch_interval_ms
+        self.queues = dict()  # {comp_name: StageQueue}
+        self.__timer = None  # created on the GUI thread by the first staged block
+        self.__armed = False
+        self.__idle_ticks = 0
+        self.sig_data_staged.connect(self.__start_timer)
+
+    def get_queue(self, comp_name):
+        """Return the queue of a component, creating it if needed."""
+        queue = self.queues.get(comp_name)
+        if queue is None:
+            queue = self.queues.setdefault(
+                comp_name, StageQueue(self.capacity, self.policy)
+            )
+        return queue
+
+    def push(self, comp_name, block):
+        """Stage a decoded block for a component (acquisition thread side).
+
+        Parameters
+        ----------
+        comp_name : str
+            Destination component name.
+        block : Any
+            Decoded data, as accepted by the destination widget `add_data`.
+        """
+        self.get_queue(comp_name).push(block)
+        if not self.__armed and self.plot_widgets is not None:
+            self.__armed = True
+            self.sig_data_staged.emit()  # queued to the GUI thread
+
+    def dispatch(self, plot_widgets):
+        """Forward all the staged blocks to their plot widgets (GUI thread side).
+
+        Parameters
+        ----------
+        plot_widgets : dict
+            Map of component name -> plot widget. Blocks of components without a
+            plot widget are discarded.
+
+        Returns
+        -------
+        int
+            Number of blocks forwarded.
+        """
+        forwarded = 0
+        for comp_name, queue in list(self.queues.items()):
+            blocks = queue.pop_all()
+            widget = plot_widgets.get(comp_name)
+            if widget is None or len(blocks) == 0:
+                continue
+            try:
+                for block in blocks:
+                    widget.add_data(block)
+            except Exception as e:
+                log.exception(f"Staged data error [{comp_name}]: {e}")
+            forwarded += len(blocks)
+        return forwarded
+
+    def clear(self):
+        """Discard all the staged blocks and reset the counters."""
+        for queue in self.queues.values():
+            queue.clear()
+
+    def get_stats(self):
+        """Return the queue counters of each component.
+
+        Returns
+        -------
+        dict
+            `{comp_name: {"depth", "max_depth", "pushed", "dropped"}}`.
+        """
+        return {comp_name: queue.get_stats() for comp_name, queue in list(self.queues.items())}
+
+    def __start_timer(self):
+        # GUI thread
+        if self.__timer is None:
+            self.__timer = QTimer(self)
+            self.__timer.timeout.connect(self.__tick)
+        self.__idle_ticks = 0
+        if not self.__timer.isActive():
+            self.__timer.start(self.dispatch_interval_ms)
+
+    def __tick(self):
+        if self.dispatch(self.plot_widgets) > 0:
+            self.__idle_ticks = 0
+            return
+        self.__idle_ticks += 1
+        if self.__idle_ticks < IDLE_TICKS_BEFORE_STOP:
+            return
+        self.__timer.stop()
+        self.__armed = False
+        # A block staged while disarming would otherwise wait for the next one
+        if any(len(queue) > 0 for queue in list(self.queues.values())):
+            self.__armed = True
+            self.__start_timer()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    Decimation.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Vectorized decimation of sample blocks to a fixed number of plot points.
+
+Live line plots receive, at each update, a `(dimension, n)` block whose length depends
+on the sensor ODR, and show it with a fixed point budget per update interval. This
+module provides the two available reduction strategies:
+
+- `DecimationMode.LINEAR`: linear interpolation at evenly spaced positions. Cheap and
+    smooth, but short spikes between two picked positions are lost.
+- `DecimationMode.MINMAX`: the block is split into `target_len / 2` buckets and each
+    bucket contributes its minimum and maximum, in time order. Peaks and transients
+    are always visible, as an envelope of the signal.
+
+Design Notes:
+- All the channels of a block are processed at once, without Python loops.
+- In `MINMAX` mode, blocks longer than `MAX_DECIMATION_INPUT` samples (e.g., accumulated
+    while a plot was hidden) are reduced to their most recent part, so the cost per
+    update is bounded. `LINEAR` resampling only reads `target_len` positions, so its
+    cost does not depend on the block length and the whole block is used.
+"""
+
+from enum import Enum
+
+import numpy as np
+
+MAX_DECIMATION_INPUT = 65536
+
+class DecimationMode(Enum):
+    """Available strategies to reduce a sample block to the plot point budget."""
+    LINEAR = 0
+    MINMAX = 1
+
+def resample_linear(block, target_len):
+    """Linearly resample every row of a block to a given length.
+
+    Parameters
+    ----------
+    block : numpy.ndarray
+        `(dimension, n)` input samples, with `n > 0`.
+    target_len : int
+        Number of output points per row.
+
+    Returns
+    -------
+    numpy.ndarray
+        `(dimension, target_len)` interpolated values.
+    """
+    n = block.shape[1]
+    index_arr = np.linspace(0, n - 1, num=target_len, dtype=float)
+    index_floor = index_arr.astype(int)  # Round down
+    index_ceil = (index_floor + 1) % n
+    index_rem = index_arr - index_floor  # Remainder
+    val1 = block[:, index_floor]
+    val2 = block[:, index_ceil]
+    return val1 * (1.0 - index_rem) + val2 * index_rem
+
+def decimate_minmax(block, target_len):
+    """Reduce every row of a block to its min/max envelope.
+
+    Parameters
+    ----------
+    block : numpy.ndarray
+        `(dimension, n)` input samples, with `n > 0`.
+    target_len : int
+        Number of output points per row. Each bucket of samples produces two points
+        (its minimum and maximum, in the order they occurred).
+
+    Returns
+    -------
+    numpy.ndarray
+        `(dimension, target_len)` envelope values. Blocks shorter than `target_len`
+        cannot be decimated and are linearly resampled instead.
+    """
+    dimension, n = block.shape
+    n_buckets = target_len // 2
+    if n_buckets == 0 or n < target_len:
+        return resample_linear(block, target_len)
+    bucket_len = -(-n // n_buckets)  # ceil
+    pad = n_buckets * bucket_len - n
+    if pad > 0:
+        # Repeat the last sample: it does not change the min/max of the last bucket
+        block = np.concatenate((block, np.repeat(block[:, -1:], pad, axis=1)), axis=1)
+    buckets = block.reshape(dimension, n_buckets, bucket_len)
+    i_min = np.argmin(buckets, axis=2)[..., np.newaxis]
+    i_max = np.argmax(buckets, axis=2)[..., np.newaxis]
+    v_min = np.take_along_axis(buckets, i_min, axis=2)[..., 0]
+    v_max = np.take_along_axis(buckets, i_max, axis=2)[..., 0]
+    min_first = (i_min <= i_max)[..., 0]
+    out = np.empty((dimension, target_len), dtype=float)
+    out[:, 0:2 * n_buckets:2] = np.where(min_first, v_min, v_max)
+    out[:, 1:2 * n_buckets:2] = np.where(min_first, v_max, v_min)
+    if target_len % 2:
+        out[:, -1] = block[:, n - 1]
+    return out
+
+def decimate(block, target_len, mode=DecimationMode.LINEAR):
+    """Reduce a sample block to `target_len` points per row.
+
+    Parameters
+    ----------
+    block : numpy.ndarray
+        `(dimension, n)` input samples, with `n > 0`.
+    target_len : int
+        Number of output points per row.
+    mode : DecimationMode, optional
+        Reduction strategy. Default is `DecimationMode.LINEAR`.
+
+    Returns
+    -------
+    numpy.ndarray
+        `(dimension, target_len)` array.
+    """
+    if mode == DecimationMode.MINMAX:
+        if block.shape[1] > MAX_DECIMATION_INPUT:
+            block = block[:, -MAX_DECIMATION_INPUT:]
+        return decimate_minmax(block, target_len)
+    return resample_linear(block, target_len)
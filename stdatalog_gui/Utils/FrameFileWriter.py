@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    FrameFileWriter.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Background writer of the camera frame files.
+
+In JPEG mode each frame received from a camera component is saved to its own file in
+the acquisition folder. The frames are cut from the stream on the GUI thread, at each
+plot update; opening, writing and closing a file per frame there would stall the
+rendering on a slow disk. `FrameFileWriter` queues the frame bytes and a worker thread
+writes the files in order.
+
+Design Notes:
+- The queue is bounded: when the disk is slower than the camera, new frames are
+    dropped and counted instead of growing the memory.
+- A failing write is logged and counted and does not stop the worker.
+- `sync` waits until the queued frames are written.
+"""
+
+import queue
+import time
+from threading import Condition, Thread
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+DEFAULT_MAX_PENDING_FRAMES = 64
+
+class FrameFileWriter:
+    """Worker thread writing frame files in order.
+
+    Parameters
+    ----------
+    max_pending_frames : int, optional
+        Maximum number of frames waiting to be written. Default is 64.
+
+    Attributes
+    ----------
+    written : int
+        Frames written.
+    dropped : int
+        Frames discarded because the queue was full.
+    errors : int
+        Frames whose write failed.
+    max_latency : float
+        Longest file write in seconds.
+    """
+
+    def __init__(self, max_pending_frames=DEFAULT_MAX_PENDING_FRAMES):
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_latency = 0.0
+        self.__submitted = 0
+        self.__done = 0
+        self.__done_cond = Condition()
+        self.__queue = queue.Queue(max_pending_frames)
+        self.__worker = None
+
+    @property
+    def pending(self):
+        """Frames queued and not written yet."""
+        return self.__submitted - self.__done
+
+    def save(self, path, data):
+        """Queue a frame file (GUI thread). Never blocks.
+
+        Parameters
+        ----------
+        path : str
+            Destination file path.
+        data : bytes
+            File contents.
+
+        Returns
+        -------
+        bool
+            False if the frame was dropped (queue full).
+        """
+        if self.__worker is None:
+            self.__worker = Thread(target=self.__run, name="frame_writer_thread", daemon=True)
+            self.__worker.start()
+        with self.__done_cond:
+            self.__submitted += 1
+        try:
+            self.__queue.put_nowait((path, data))
+        except queue.Full:
+            with self.__done_cond:
+                self.__submitted -= 1
+                self.dropped += 1
+            return False
+        return True
+
+    def sync(self, timeout=None):
+        """Wait until the queued frames are written.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Maximum wait in seconds. Default is None (no limit).
+
+        Returns
+        -------
+        bool
+            True if no frame is pending.
+        """
+        with self.__done_cond:
+            return self.__done_cond.wait_for(lambda: self.pending == 0, timeout)
+
+    def get_stats(self):
+        """Return the writer metrics.
+
+        Returns
+        -------
+        dict
+            `pending`, `written`, `dropped`, `errors` and `max_latency_s`.
+        """
+        with self.__done_cond:
+            return {
+                "pending": self.pending,
+                "written": self.written,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "max_latency_s": self.max_latency,
+            }
+
+    def __run(self):
+        while True:
+            path, data = self.__queue.get()
+            start = time.monotonic()
+            failed = False
+            try:
+                with open(path, "wb") as f:
+                    f.write(data)
+            except OSError as e:
+                failed = True
+                log.error(f"Error writing frame {path}: {e}")
+            latency = time.monotonic() - start
+            with self.__done_cond:
+                if failed:
+                    self.errors += 1
+                else:
+                    self.written += 1
+                self.max_latency = max(self.max_latency, latency)
+                self.__done += 1
+                self.__done_cond.notify_all()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    JpegFrameAssembler.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Incremental reassembly of JPEG frames from a camera (MJPEG) byte stream.
+
+Camera components in JPEG mode stream compressed frames back to back, split across
+USB packets of arbitrary size. `JpegFrameAssembler` accumulates the incoming bytes and
+cuts complete frames, from the SOI (`FF D8`) marker to the EOI (`FF D9`) marker.
+
+Design Notes:
+- Markers are searched with `bytearray.find`, starting from the last scanned position:
+    every byte is examined once, whatever the packet size.
+- `FF D8`/`FF D9` cannot occur inside entropy-coded data (`FF` is byte-stuffed), so a
+    new SOI before the expected EOI means the previous frame was truncated.
+- Complete frames wait in a bounded queue. When the consumer is slower than the device,
+    the oldest frames are dropped and counted, so the buffer never grows unbounded.
+"""
+
+from collections import deque
+
+import numpy as np
+
+JPEG_SOI = b"\xff\xd8"
+JPEG_EOI = b"\xff\xd9"
+
+DEFAULT_MAX_FRAME_SIZE = 4 * 1024 * 1024
+
+def to_bytes(data):
+    """Convert a block of byte values (e.g., a float `numpy.ndarray`) to `bytes`."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    return np.asarray(data).astype(np.uint8).tobytes()
+
+class JpegFrameAssembler:
+    """Cut complete JPEG frames out of a continuous byte stream.
+
+    Parameters
+    ----------
+    max_pending_frames : int, optional
+        Maximum number of complete frames waiting to be consumed. Default is 8.
+    max_frame_size : int, optional
+        Maximum size of a frame in bytes. A partial frame growing beyond this size is
+        discarded. Default is 4 MiB.
+
+    Attributes
+    ----------
+    frames : int
+        Number of complete frames assembled.
+    dropped_frames : int
+        Number of frames lost: truncated by the stream, oversized, or discarded
+        because the consumer did not keep up.
+    """
+
+    def __init__(self, max_pending_frames=8, max_frame_size=DEFAULT_MAX_FRAME_SIZE):
+        self.max_pending_frames = max_pending_frames
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+        self._scan_pos = 0  # buffer position where the next marker search starts
+        self._in_frame = False  # True when _buffer starts with an SOI marker
+        self._pending = deque()
+        self.frames = 0
+        self.dropped_frames = 0
+
+    def __len__(self):
+        return len(self._pending)
+
+    def feed(self, data):
+        """Append stream bytes and cut all the frames they complete.
+
+        Parameters
+        ----------
+        data : bytes | bytearray | numpy.ndarray
+            Next chunk of the stream.
+        """
+        self._buffer += to_bytes(data)
+        while self.__cut_next():
+            pass
+        if self._in_frame and len(self._buffer) > self.max_frame_size:
+            self.__discard_frame()
+
+    def pop_frames(self):
+        """Remove and return the complete frames, oldest first.
+
+        Returns
+        -------
+        list[bytes]
+            JPEG frames, each from its SOI to its EOI marker included.
+        """
+        frames = list(self._pending)
+        self._pending.clear()
+        return frames
+
+    def clear(self):
+        """Discard buffered bytes and pending frames, and reset the counters."""
+        self._buffer = bytearray()
+        self._scan_pos = 0
+        self._in_frame = False
+        self._pending.clear()
+        self.frames = 0
+        self.dropped_frames = 0
+
+    def __cut_next(self):
+        if not self._in_frame:
+            soi = self._buffer.find(JPEG_SOI, self._scan_pos)
+            if soi < 0:
+                # Keep a trailing FF: it may be the first half of a marker
+                keep = 1 if self._buffer.endswith(b"\xff") else 0
+                del self._buffer[:len(self._buffer) - keep]
+                self._scan_pos = 0
+                return False
+            del self._buffer[:soi]
+            self._in_frame = True
+            self._scan_pos = len(JPEG_SOI)
+        eoi = self._buffer.find(JPEG_EOI, self._scan_pos)
+        soi = self._buffer.find(JPEG_SOI, self._scan_pos, eoi if eoi >= 0 else len(self._buffer))
+        if soi >= 0:
+            # A new frame starts before the end of the current one: it was truncated
+            self.dropped_frames += 1
+            del self._buffer[:soi]
+            self._scan_pos = len(JPEG_SOI)
+            return True
+        if eoi < 0:
+            self._scan_pos = max(len(JPEG_SOI), len(self._buffer) - 1)
+            return False
+        end = eoi + len(JPEG_EOI)
+        self.__push(bytes(self._buffer[:end]))
+        del self._buffer[:end]
+        self._in_frame = False
+        self._scan_pos = 0
+        return True
+
+    def __push(self, frame):
+        if len(self._pending) >= self.max_pending_frames:
+            self._pending.popleft()
+            self.dropped_frames += 1
+        self._pending.append(frame)
+        self.frames += 1
+
+    def __discard_frame(self):
+        self.dropped_frames += 1
+        self._buffer = bytearray()
+        self._scan_pos = 0
+        self._in_frame = False
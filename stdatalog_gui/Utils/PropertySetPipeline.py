@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    PropertySetPipeline.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Asynchronous, coalescing pipeline for PnPL set-property commands.
+
+Property edits in the component configuration widgets used to send one PnPL message
+and refresh several component statuses synchronously, on the GUI thread. This module
+moves that traffic to a worker thread:
+
+- Edits are collected on the GUI thread and debounced: a burst of edits (e.g., a
+    spinbox being scrolled) becomes a single batch once the user pauses.
+- All the properties set on the same component within a batch are merged into one
+    PnPL message (later values win).
+- After the batch is sent, the status of each component to refresh is requested once,
+    and the snapshots are applied on the GUI thread through
+    `update_component_status(comp_name, comp_type, comp_status)`.
+
+Design Notes:
+- The debounce timer is created on first use, when the QApplication exists.
+- `sync` flushes pending edits and waits for the worker: it is used before operations
+    that read the device configuration (e.g., start of an acquisition).
+- `get_stats` reports batches in flight and link latencies.
+- `request_statuses` runs status-only batches on the same worker. The device link is
+    shared with the GUI thread and the other workers: the controller serializes the
+    PnPL calls (see `SerializedLink`), and `send_command` flushes the pending edits
+    first, so the device receives the messages in the order they were issued.
+"""
+
+import json
+import queue
+import time
+from threading import Condition, Thread
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from stdatalog_pnpl.PnPLCmd import PnPLCMDManager
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+DEFAULT_DEBOUNCE_MS = 150
+
+def _merge(dst, src):
+    for key, value in src.items():
+        if isinstance(value, dict) and isinstance(dst.get(key), dict):
+            _merge(dst[key], value)
+        else:
+            dst[key] = value
+
+class PropertySetPipeline(QObject):
+    """Debounced, per-component coalescing sender of set-property commands.
+
+    Parameters
+    ----------
+    controller : STDTDL_Controller
+        Controller providing `send_command(json_command, flush_pending)`,
+        `get_component_status` and `update_component_status`.
+    debounce_ms : int, optional
+        Quiet time in milliseconds before pending edits are sent. Default is 150.
+    parent : QObject | None, optional
+        Parent object.
+
+    Attributes
+    ----------
+    in_flight : int
+        Batches handed to the worker and not yet applied on the GUI thread.
+    batches : int
+        Batches sent.
+    messages : int
+        PnPL messages sent.
+    property_sets : int
+        Property sets requested by the widgets (>= `messages` when edits are merged).
+    """
+
+    sig_batch_completed = Signal(list, object)  # [(comp_name, comp_type, comp_status)], callback
+
+    def __init__(self, controller, debounce_ms=DEFAULT_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.debounce_ms = debounce_ms
+        self.in_flight = 0
+        self.batches = 0
+        self.messages = 0
+        self.property_sets = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.__total_latency = 0.0
+        self.__timer = None
+        self.__pending = dict()  # {comp_name: merged PnPL set-property message}
+        self.__refresh = dict()  # {comp_name: comp_type}
+        self.__queue = queue.Queue()
+        self.__submitted = 0  # batches queued, and sent by the worker: under __sent_cond
+        self.__sent = 0
+        self.__sent_cond = Condition()
+        self.__worker = None
+        self.sig_batch_completed.connect(self.__apply_batch)
+
+    def set_property(self, comp_name, prop_name, value, refresh_list):
+        """Queue a property set (GUI thread).
+
+        Parameters
+        ----------
+        comp_name : str
+            Component name.
+        prop_name : str
+            Property name.
+        value : Any
+            New value (a `{field_name: value}` dict for object properties).
+        refresh_list : list[tuple[str, ComponentType]]
+            Components whose status must be refreshed after the batch.
+        """
+        message = json.loads(PnPLCMDManager.create_set_property_cmd(comp_name, prop_name, value))
+        _merge(self.__pending.setdefault(comp_name, dict()), message)
+        for cn, ct in refresh_list:
+            self.__refresh[cn] = ct
+        self.property_sets += 1
+        if self.__timer is None:
+            self.__timer = QTimer(self)
+            self.__timer.setSingleShot(True)
+            self.__timer.timeout.connect(self.flush)
+        self.__timer.start(self.debounce_ms)
+
+    def flush(self):
+        """Hand the pending edits to the worker thread without waiting."""
+        if self.__timer is not None:
+            self.__timer.stop()
+        if len(self.__pending) == 0:
+            return
+        batch = (list(self.__pending.values()), list(self.__refresh.items()), None)
+        self.__pending = dict()
+        self.__refresh = dict()
+        self.__submit(batch)
+
+    def request_statuses(self, comp_names, callback):
+        """Fetch component statuses on the worker thread (GUI thread).
+
+        The statuses are not applied to the controller: they are passed to `callback`
+        on the GUI thread.
+
+        Parameters
+        ----------
+        comp_names : list[str]
+            Components whose status is requested.
+        callback : callable
+            Called with the list of `(comp_name, None, comp_status)` tuples.
+        """
+        self.__submit(([], [(c, None) for c in comp_names], callback))
+
+    def __submit(self, batch):
+        if self.__worker is None:
+            self.__worker = Thread(target=self.__run, name="property_set_thread", daemon=True)
+            self.__worker.start()
+        self.in_flight += 1
+        with self.__sent_cond:
+            self.__submitted += 1
+        self.__queue.put(batch)
+
+    def sync(self, timeout=5.0):
+        """Send the pending edits and wait until the worker has sent them.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum wait in seconds. Default is 5.
+
+        Returns
+        -------
+        bool
+            True if all the batches have been sent.
+        """
+        self.flush()
+        with self.__sent_cond:
+            return self.__sent_cond.wait_for(
+                lambda: self.__sent == self.__submitted, timeout
+            )
+
+    def get_stats(self):
+        """Return the pipeline metrics.
+
+        Returns
+        -------
+        dict
+            `in_flight`, `batches`, `messages`, `property_sets`, `last_latency_s`,
+            `avg_latency_s` and `max_latency_s` (send plus status refresh, per batch).
+        """
+        return {
+            "in_flight": self.in_flight,
+            "batches": self.batches,
+            "messages": self.messages,
+            "property_sets": self.property_sets,
+            "last_latency_s": self.last_latency,
+            "avg_latency_s": self.__total_latency / self.batches if self.batches else 0.0,
+            "max_latency_s": self.max_latency,
+        }
+
+    def __run(self):
+        while True:
+            messages, refresh, callback = self.__queue.get()
+            start = time.monotonic()
+            statuses = []
+            try:
+                for message in messages:
+                    self.controller.send_command(json.dumps(message), flush_pending=False)
+                    self.messages += 1
+                for comp_name, comp_type in refresh:
+                    statuses.append(
+                        (comp_name, comp_type, self.controller.get_component_status(comp_name))
+                    )
+            except Exception as e:
+                log.exception(f"Property set error: {e}")
+            if len(messages) > 0:
+                latency = time.monotonic() - start
+                self.batches += 1
+                self.last_latency = latency
+                self.__total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+            with self.__sent_cond:
+                self.__sent += 1
+                self.__sent_cond.notify_all()
+            self.sig_batch_completed.emit(statuses, callback)
+
+    def __apply_batch(self, statuses, callback):
+        # GUI thread: apply the refreshed statuses fetched by the worker
+        self.in_flight -= 1
+        if callback is not None:
+            try:
+                callback(statuses)
+            except Exception as e:
+                log.exception(f"Status request callback error: {e}")
+            return
+        for comp_name, comp_type, comp_status in statuses:
+            self.controller.update_component_status(comp_name, comp_type, comp_status)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    RenderScheduler.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Shared render clock driving every live plot widget.
+
+This module provides:
+
+- `RenderScheduler`: a single precise `QTimer` owned by the controller. At each frame
+    it refreshes, in one batch, the registered plot widgets whose update period has
+    elapsed, that have something to draw and that are actually on screen.
+- `RenderTimer`: a per-widget handle exposing the `start`/`stop`/`isActive` subset of
+    the `QTimer` API, so plot widgets keep driving their updates as before.
+
+Design Notes:
+- Each widget keeps its own update period (e.g., `timer_interval_ms`). Deadlines are
+    absolute, so the scrolling speed of time plots does not drift with the frame clock.
+- Widgets with `render_continuously = False` are redrawn only after `add_data` marked
+    them dirty; the others (e.g., scrolling line plots) are redrawn at every period.
+- Hidden widgets, widgets scrolled out of view and popped-out windows that are
+    minimized are skipped. Visibility is tested on the widget `graph_widget` (the
+    plot area), which composite widgets reparent into their own layout. Their data
+    stay buffered until they are shown again.
+- Widgets with `update_offscreen = True` are never skipped: their `update_plot` also
+    consumes the data (e.g., the camera widget saves and releases the frames, the ToF
+    heatmap drains its queue and emits the presence detection signals).
+- Frame hooks (e.g., the controller `DataStage` dispatch) run at the beginning of each
+    tick, so data produced by acquisition threads reach the widgets on the GUI thread.
+- The tick never calls `processEvents`: the event loop repaints once after the batch.
+"""
+
+import time
+
+from PySide6.QtCore import QObject, Qt, QTimer
+from shiboken6 import isValid
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+class RenderTimer:
+    """`QTimer`-like handle registering a plot widget into the `RenderScheduler`.
+
+    Parameters
+    ----------
+    scheduler : RenderScheduler
+        Shared scheduler owned by the controller.
+    widget : PlotWidget
+        Plot widget whose `update_plot` is driven by the scheduler.
+    """
+
+    def __init__(self, scheduler, widget):
+        self.scheduler = scheduler
+        self.widget = widget
+
+    def start(self, interval_ms=None):
+        """Start (or restart) periodic updates of the widget.
+
+        Parameters
+        ----------
+        interval_ms : int | float | None, optional
+            Update period in milliseconds. Defaults to the widget `timer_interval_ms`.
+        """
+        if interval_ms is None:
+            interval_ms = self.widget.timer_interval_ms
+        self.scheduler.register(self.widget, interval_ms)
+
+    def stop(self):
+        """Stop periodic updates of the widget."""
+        self.scheduler.unregister(self.widget)
+
+    def isActive(self):
+        """Return True if the widget is registered into the scheduler."""
+        return self.scheduler.is_registered(self.widget)
+
+class RenderScheduler(QObject):
+    """Single render clock for all the plot widgets of a controller.
+
+    Parameters
+    ----------
+    frame_interval_ms : int, optional
+        Frame clock period in milliseconds. Default is 20 (50 fps). Widget update
+        periods are honored with this granularity.
+    parent : QObject | None, optional
+        Parent object.
+
+    Attributes
+    ----------
+    last_frame_time : float
+        Duration in seconds of the last frame that rendered at least one widget.
+    max_frame_time : float
+        Longest frame duration in seconds since it was last reset to 0.
+    last_frame_widgets : int
+        Number of widgets refreshed in the last rendering frame.
+    """
+
+    def __init__(self, frame_interval_ms=20, parent=None):
+        super().__init__(parent)
+        self.frame_interval_ms = frame_interval_ms
+        self.__timer = None  # created on first use, when the QApplication exists
+        self.__entries = dict()  # {widget: [period_s, next_deadline_s]}
+        self.__frame_hooks = []
+        self.last_frame_time = 0.0
+        self.max_frame_time = 0.0
+        self.last_frame_widgets = 0
+
+    def register(self, widget, interval_ms):
+        """Schedule periodic updates for a widget.
+
+        Parameters
+        ----------
+        widget : PlotWidget
+            Plot widget to refresh.
+        interval_ms : int | float
+            Update period in milliseconds.
+        """
+        period = interval_ms / 1000
+        self.__entries[widget] = [period, time.monotonic() + period]
+        if self.__timer is None:
+            self.__timer = QTimer(self)
+            self.__timer.setTimerType(Qt.PreciseTimer)
+            self.__timer.timeout.connect(self.__tick)
+        if not self.__timer.isActive():
+            self.__timer.start(self.frame_interval_ms)
+
+    def unregister(self, widget):
+        """Stop updating a widget. The frame clock stops with the last widget.
+
+        Parameters
+        ----------
+        widget : PlotWidget
+            Plot widget to remove.
+        """
+        self.__entries.pop(widget, None)
+        if len(self.__entries) == 0 and self.__timer is not None:
+            self.__timer.stop()
+
+    def add_frame_hook(self, hook):
+        """Register a callable invoked, without arguments, at the beginning of each tick.
+
+        Parameters
+        ----------
+        hook : callable
+            Function run on the GUI thread before widgets are refreshed.
+        """
+        self.__frame_hooks.append(hook)
+
+    def is_registered(self, widget):
+        """Return True if the widget is currently scheduled."""
+        return widget in self.__entries
+
+    @staticmethod
+    def __is_on_screen(widget):
+        # The plot area may live outside the registered widget: composite widgets
+        # (e.g., TMOS, power) move the `graph_widget` of their sub-plots into their own
+        # layout, so the visibility of the plot area itself is tested
+        target = getattr(widget, "graph_widget", None)
+        if target is None or not isValid(target):
+            target = widget
+        if not target.isVisible() or target.window().isMinimized():
+            return False
+        return not target.visibleRegion().isEmpty()
+
+    def __tick(self):
+        start = time.monotonic()
+        for hook in self.__frame_hooks:
+            try:
+                hook()
+            except Exception as e:
+                log.exception(f"Render frame hook error: {e}")
+        rendered = 0
+        for widget, entry in list(self.__entries.items()):
+            if not isValid(widget):
+                # Widget deleted without stopping its updates
+                self.unregister(widget)
+                continue
+            period, deadline = entry
+            if start < deadline:
+                continue
+            deadline += period
+            if deadline <= start:
+                # Late by more than a period (e.g., GUI busy): do not burst, re-align
+                deadline = start + period
+            entry[1] = deadline
+            if not (widget.render_continuously or widget.dirty):
+                continue
+            if not widget.update_offscreen and not self.__is_on_screen(widget):
+                continue
+            widget.dirty = False
+            try:
+                widget.update_plot()
+            except Exception as e:
+                log.exception(f"Plot update error [{widget.comp_name}]: {e}")
+            rendered += 1
+        if rendered > 0:
+            self.last_frame_time = time.monotonic() - start
+            self.max_frame_time = max(self.max_frame_time, self.last_frame_time)
+            self.last_frame_widgets = rendered
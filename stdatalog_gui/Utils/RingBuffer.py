@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    RingBuffer.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Preallocated NumPy buffers used by the live plot widgets.
+
+This module provides two fixed-size containers shaped `(dimension, capacity)`:
+
+- `RingBuffer`: FIFO of incoming samples. Producers write whole blocks, the plot
+    timer drains everything that has been written since the previous read.
+- `RollingBuffer`: fixed-length display window. New blocks push the oldest values out
+    and the whole window is always readable as a contiguous view.
+
+Design Notes:
+- Work is proportional to the number of blocks, not to the number of samples: writes
+    and reads are a few NumPy slice assignments.
+- `RingBuffer` is guarded by a lock, since acquisition threads write while the GUI
+    thread reads.
+"""
+
+from threading import Lock
+
+import numpy as np
+
+
+def as_block(data, dimension, dtype=float):
+    """Convert incoming samples to a `(dimension, n)` array.
+
+    Parameters
+    ----------
+    data : Sequence | numpy.ndarray
+        One sequence of samples per dimension, or a flat sequence holding one sample
+        per dimension.
+    dimension : int
+        Number of channels expected in the block.
+    dtype : numpy.dtype, optional
+        Output data type. Default is float.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array with `dimension` rows.
+    """
+    block = np.asarray(data[:dimension], dtype=dtype)
+    if block.ndim != 2:
+        block = block.reshape(dimension, -1)
+    return block
+
+
+class RingBuffer:
+    """Thread-safe FIFO of samples stored in a `(dimension, capacity)` array.
+
+    Parameters
+    ----------
+    dimension : int
+        Number of channels (rows).
+    capacity : int
+        Maximum number of samples kept per channel. When the buffer is full the
+        oldest samples are overwritten, as a `deque(maxlen=capacity)` would do.
+    dtype : numpy.dtype, optional
+        Sample data type. Default is float.
+
+    Attributes
+    ----------
+    dropped : int
+        Number of samples overwritten before being read.
+    """
+
+    def __init__(self, dimension, capacity, dtype=float):
+        self.dimension = dimension
+        self.capacity = capacity
+        self.dtype = dtype
+        self._buffer = np.zeros((dimension, capacity), dtype=dtype)
+        self._head = 0  # next write position
+        self._count = 0  # unread samples
+        self._lock = Lock()
+        self.dropped = 0
+
+    def __len__(self):
+        return self._count
+
+    def write(self, data):
+        """Append a block of samples.
+
+        Parameters
+        ----------
+        data : Sequence | numpy.ndarray
+            Block accepted by `as_block`, one row per channel.
+        """
+        block = as_block(data, self.dimension, self.dtype)
+        n = block.shape[1]
+        if n == 0:
+            return
+        with self._lock:
+            if n > self.capacity:
+                self.dropped += n - self.capacity
+                block = block[:, -self.capacity:]
+                n = self.capacity
+            first = min(n, self.capacity - self._head)
+            self._buffer[:, self._head:self._head + first] = block[:, :first]
+            if first < n:
+                self._buffer[:, :n - first] = block[:, first:]
+            self._head = (self._head + n) % self.capacity
+            overflow = self._count + n - self.capacity
+            if overflow > 0:
+                self.dropped += overflow
+            self._count = min(self._count + n, self.capacity)
+
+    def read(self):
+        """Drain all unread samples.
+
+        Returns
+        -------
+        numpy.ndarray
+            `(dimension, n)` array with the unread samples in arrival order. It is a
+            view on the internal storage when the samples are not wrapped around, and
+            it stays valid until the next `write` overwrites that region.
+        """
+        with self._lock:
+            n = self._count
+            start = (self._head - n) % self.capacity
+            self._count = 0
+            if start + n <= self.capacity:
+                return self._buffer[:, start:start + n]
+            return np.concatenate(
+                (self._buffer[:, start:], self._buffer[:, :self._head]), axis=1
+            )
+
+    def clear(self):
+        """Discard all unread samples."""
+        with self._lock:
+            self._count = 0
+
+
+class RollingBuffer:
+    """Fixed-length window of the latest samples, readable as contiguous views.
+
+    Values are stored twice in a `(dimension, 2 * length)` array so that the current
+    window is always `[head, head + length)` without any copy.
+
+    Parameters
+    ----------
+    dimension : int
+        Number of channels (rows).
+    length : int
+        Window length per channel.
+    dtype : numpy.dtype, optional
+        Sample data type. Default is float.
+    """
+
+    def __init__(self, dimension, length, dtype=float):
+        self.dimension = dimension
+        self.length = length
+        self._buffer = np.zeros((dimension, 2 * length), dtype=dtype)
+        self._head = 0
+
+    def extend(self, data):
+        """Push a block of samples into the window, dropping the oldest ones.
+
+        Parameters
+        ----------
+        data : Sequence | numpy.ndarray
+            Block accepted by `as_block`, one row per channel.
+        """
+        block = as_block(data, self.dimension, self._buffer.dtype)
+        n = block.shape[1]
+        if n == 0:
+            return
+        if n > self.length:
+            block = block[:, -self.length:]
+            n = self.length
+        first = min(n, self.length - self._head)
+        for offset in (0, self.length):
+            pos = self._head + offset
+            self._buffer[:, pos:pos + first] = block[:, :first]
+            if first < n:
+                self._buffer[:, offset:offset + n - first] = block[:, first:]
+        self._head = (self._head + n) % self.length
+
+    def view(self):
+        """Return the `(dimension, length)` window, oldest sample first."""
+        return self._buffer[:, self._head:self._head + self.length]
+
+    def row(self, i):
+        """Return the window of channel `i` as a contiguous 1D view."""
+        return self._buffer[i, self._head:self._head + self.length]
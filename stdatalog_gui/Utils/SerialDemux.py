@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    SerialDemux.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Per-channel demultiplexer of the serial link data packets.
+
+The serial reader thread receives one packet at a time, each carrying a 4-byte counter
+followed by the payload of one channel (stream id). `SerialDemux` turns this packet
+flow into per-channel chunks:
+
+- Channels are looked up in a list indexed by channel number, built once per
+  acquisition by `configure`.
+- Payloads are kept as memoryviews on the received packets (no slice copy) and
+  gathered into one buffer per channel when the channel is flushed, so the data reader
+  receives a few large chunks instead of one `DataClass` per packet.
+- Packet counters are checked per channel: a counter must advance by the payload size
+  of the previous packet. A counter equal to 0 marks a stream restart and is never
+  reported as a loss.
+
+Design Notes:
+- A channel is flushed when its pending payload reaches `flush_bytes`; the reader
+    thread also calls `flush` when the link is idle or `flush_interval` elapsed, so
+    that plots keep a bounded latency at low data rates.
+- `configure` swaps the whole channel table: it can be called from another thread
+    while the reader thread is running.
+"""
+
+import struct
+
+from stdatalog_core.HSD_utils.DataClass import DataClass
+
+DEFAULT_FLUSH_BYTES = 16 * 1024
+COUNTER_SIZE = 4  # bytes
+
+_counter = struct.Struct("=i")
+
+class SerialChannel:
+    """Demultiplexing state of one serial channel.
+
+    Parameters
+    ----------
+    comp_name : str
+        Component name.
+    data_reader : DataReader
+        Reader receiving the gathered payloads.
+    file : AsyncFileSink | None, optional
+        Sink of the raw packets (counter included).
+    counters : StreamCounters | None, optional
+        Telemetry counters.
+    """
+
+    def __init__(self, comp_name, data_reader, file=None, counters=None):
+        self.comp_name = comp_name
+        self.data_reader = data_reader
+        self.file = file
+        self.counters = counters
+        self.prev_cnt = None
+        self.prev_size = 0
+        self.views = []
+        self.pending = 0
+
+class SerialDemux:
+    """Dispatch of the serial packets to the per-channel data readers.
+
+    Parameters
+    ----------
+    flush_bytes : int, optional
+        Pending payload bytes that trigger the dispatch of a channel. Default is 16 KiB.
+    on_gap : callable | None, optional
+        Called as `on_gap(comp_name, lost_bytes, lost_packets)` when a counter gap is
+        detected (reader thread).
+
+    Attributes
+    ----------
+    pending : int
+        Payload bytes received and not dispatched yet, all channels.
+    """
+
+    def __init__(self, flush_bytes=DEFAULT_FLUSH_BYTES, on_gap=None):
+        self.flush_bytes = flush_bytes
+        self.on_gap = on_gap
+        self.pending = 0
+        self.__channels = []
+
+    def configure(self, data_reader_params):
+        """Build the channel table of an acquisition (any thread).
+
+        Parameters
+        ----------
+        data_reader_params : dict
+            `{stream_id: {"comp_name", "data_reader", "file", "counters"}}`.
+        """
+        size = max(data_reader_params.keys(), default=-1) + 1
+        channels = [None] * size
+        for ch_num, params in data_reader_params.items():
+            channels[ch_num] = SerialChannel(
+                params.get("comp_name"),
+                params.get("data_reader"),
+                params.get("file"),
+                params.get("counters"),
+            )
+        self.pending = 0
+        self.__channels = channels
+
+    def push(self, ch_num, data):
+        """Account a received packet and queue its payload (reader thread).
+
+        Parameters
+        ----------
+        ch_num : int
+            Channel number from the packet header.
+        data : bytes | bytearray
+            Packet data: 4-byte counter followed by the payload.
+        """
+        channels = self.__channels
+        channel = channels[ch_num] if ch_num < len(channels) else None
+        if channel is None:
+            return
+        size = len(data)
+        if size < COUNTER_SIZE:
+            return
+        cnt = _counter.unpack_from(data)[0]
+        prev_cnt = channel.prev_cnt
+        if prev_cnt is not None and cnt != 0:
+            diff = cnt - prev_cnt
+            if diff != channel.prev_size:
+                self.__report_gap(channel, diff - channel.prev_size)
+        channel.prev_cnt = cnt
+        channel.prev_size = size - COUNTER_SIZE
+
+        if channel.counters is not None:
+            channel.counters.add(size)
+        if channel.file is not None and not channel.file.closed:
+            channel.file.write(data)
+        channel.views.append(memoryview(data)[COUNTER_SIZE:])
+        channel.pending += size - COUNTER_SIZE
+        self.pending += size - COUNTER_SIZE
+        if channel.pending >= self.flush_bytes:
+            self.__dispatch(channel)
+
+    def flush(self):
+        """Dispatch the pending payloads of all the channels (reader thread)."""
+        if self.pending == 0:
+            return
+        for channel in self.__channels:
+            if channel is not None and channel.pending > 0:
+                self.__dispatch(channel)
+
+    def close_files(self):
+        """Close the raw data sinks of all the channels."""
+        for channel in self.__channels:
+            if channel is not None and channel.file is not None:
+                channel.file.close()
+
+    def __dispatch(self, channel):
+        views = channel.views
+        # Single gather of the payloads, handed to the reader in one call
+        chunk = views[0].tobytes() if len(views) == 1 else b"".join(views)
+        channel.views = []
+        self.pending -= channel.pending
+        channel.pending = 0
+        channel.data_reader.feed_data(DataClass(channel.comp_name, chunk))
+
+    def __report_gap(self, channel, lost_bytes):
+        lost_packets = lost_bytes // channel.prev_size if channel.prev_size > 0 else 0
+        if channel.counters is not None:
+            channel.counters.add_gap(lost_packets)
+        if self.on_gap is not None:
+            self.on_gap(channel.comp_name, lost_bytes, lost_packets)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    SerializedLink.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Device link wrapper serializing the PnPL traffic.
+
+The device link is used by the GUI thread and by several workers (property set
+pipeline, status snapshot refresh, SW tag queue). A PnPL exchange is a request
+followed by its response: two threads using the link at the same time could interleave
+their messages. `SerializedLink` wraps the `HSDLink` instance created by the controller
+and runs every call under a single lock.
+
+Design Notes:
+- The data path (`get_sensor_data`, `get_serial_data`) and the local getters are not
+    locked: the acquisition threads must never wait for a command.
+- The lock is reentrant, so a locked call may use the link again.
+- `isinstance` checks on the wrapper match the wrapped link class (e.g.
+    `HSDLink_v1`), so the existing link type checks are unchanged.
+"""
+
+import functools
+from threading import RLock
+
+UNLOCKED_METHODS = frozenset(
+    ("get_sensor_data", "get_serial_data", "get_acquisition_folder", "get_com_manager")
+)
+
+class SerializedLink:
+    """Proxy of a device link running the PnPL calls under one lock.
+
+    Parameters
+    ----------
+    link : HSDLink_v1 | HSDLink_v2
+        Wrapped device link.
+
+    Attributes
+    ----------
+    link : HSDLink_v1 | HSDLink_v2
+        Wrapped device link.
+    lock : threading.RLock
+        Lock held during each PnPL call.
+    """
+
+    def __init__(self, link):
+        self.link = link
+        self.lock = RLock()
+
+    @property
+    def __class__(self):
+        # isinstance(proxy, HSDLink_v1) checks the wrapped link class
+        return type(self.link)
+
+    def __getattr__(self, name):
+        attr = getattr(self.link, name)
+        if name in UNLOCKED_METHODS or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def locked_call(*args, **kwargs):
+            with self.lock:
+                return attr(*args, **kwargs)
+
+        return locked_call
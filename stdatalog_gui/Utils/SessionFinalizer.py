@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    SessionFinalizer.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Background finalization of the acquisition sessions.
+
+In automode a new acquisition starts right after the previous one stops. The work that
+only concerns the stopped session (closing its raw data files, exporting its telemetry,
+copying its configuration files) does not need to delay the next one: it is handed to
+`SessionFinalizer`, a worker thread running the submitted jobs in order.
+
+Design Notes:
+- Jobs receive everything they need as arguments (e.g., the acquisition folder of
+    their session): the controller state may already belong to the next session.
+- A failing job is logged and does not stop the worker.
+- `sync` waits until all the submitted jobs are done.
+"""
+
+import queue
+import time
+from threading import Condition, Thread
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+class SessionFinalizer:
+    """Worker thread running session finalization jobs in order.
+
+    Attributes
+    ----------
+    max_duration : float
+        Longest job in seconds.
+    """
+
+    def __init__(self):
+        self.max_duration = 0.0
+        self.__submitted = 0
+        self.__done = 0
+        self.__done_cond = Condition()
+        self.__queue = queue.Queue()
+        self.__worker = None
+
+    @property
+    def pending(self):
+        """Jobs submitted and not completed yet."""
+        return self.__submitted - self.__done
+
+    def submit(self, name, job):
+        """Queue a job (any thread).
+
+        Parameters
+        ----------
+        name : str
+            Job description, used in the log.
+        job : callable
+            Called without arguments on the worker thread.
+        """
+        if self.__worker is None:
+            self.__worker = Thread(target=self.__run, name="session_finalizer_thread", daemon=True)
+            self.__worker.start()
+        with self.__done_cond:
+            self.__submitted += 1
+        self.__queue.put((name, job))
+
+    def sync(self, timeout=None):
+        """Wait until all the submitted jobs are done.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Maximum wait in seconds. Default is None (no limit).
+
+        Returns
+        -------
+        bool
+            True if no job is pending.
+        """
+        with self.__done_cond:
+            return self.__done_cond.wait_for(lambda: self.pending == 0, timeout)
+
+    def __run(self):
+        while True:
+            name, job = self.__queue.get()
+            start = time.monotonic()
+            try:
+                job()
+            except Exception as e:
+                log.exception(f"Error finalizing {name}: {e}")
+            duration = time.monotonic() - start
+            self.max_duration = max(self.max_duration, duration)
+            log.info(f"{name} finalized in background in {duration * 1000:.0f} ms")
+            with self.__done_cond:
+                self.__done += 1
+                self.__done_cond.notify_all()
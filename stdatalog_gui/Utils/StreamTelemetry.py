@@ -0,0 +1,381 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    StreamTelemetry.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Runtime telemetry of the acquisition streams.
+
+Acquisition threads update a `StreamCounters` object per component (received bytes and
+packets, packet counter gaps). Once per second, on the GUI thread, `StreamTelemetry`
+samples those counters together with the other pipeline metrics already kept by the
+controller:
+
+- `DataStage` queue depths and drops (decoded blocks waiting for the render clock).
+- Plot widget backlogs (`_data` queues and ring buffers).
+- `RenderScheduler` frame time.
+- `AsyncDatWriter` file write latency, pending buffers and bytes dropped.
+- `PropertySetPipeline` batches in flight.
+
+Samples are emitted through `sig_sample` (e.g., for a diagnostics panel), kept in
+memory and exported to CSV and JSON files by `export`. Only the last `history` samples
+are kept (one hour at the default rate): on longer acquisitions the oldest ones are
+discarded, and their number is recorded as `discarded_samples` in `info`, so an export
+tells when it does not cover the whole acquisition.
+
+Design Notes:
+- Each counter has a single writer (the acquisition thread of its stream), so plain
+    integer increments are consistent without locks; the GUI thread only reads them.
+- Rates are computed from the counter deltas between two samples.
+- `start` and `stop` may be called by the automode scheduler thread: the sampling timer
+    is created with the object, on the GUI thread, and started/stopped through queued
+    signals. `sample` runs under a lock, as the last sample is taken by the caller of
+    `stop`.
+"""
+
+import csv
+import json
+import os
+import time
+from collections import deque
+from threading import Lock
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL_MS = 1000
+DEFAULT_HISTORY = 3600
+TELEMETRY_FILE_NAME = "stream_telemetry"
+
+CSV_FIELDS = [
+    "t_s",
+    "comp_name",
+    "bytes",
+    "packets",
+    "bytes_per_s",
+    "packets_per_s",
+    "lost_packets",
+    "gap_events",
+    "stage_depth",
+    "stage_dropped",
+    "plot_backlog",
+    "plot_dropped",
+    "frame_time_s",
+    "max_frame_time_s",
+    "write_avg_latency_s",
+    "write_max_latency_s",
+    "write_pending_buffers",
+    "write_dropped_bytes",
+]
+
+class StreamCounters:
+    """Counters of one data stream, updated by its acquisition thread.
+
+    Parameters
+    ----------
+    comp_name : str
+        Component name.
+
+    Attributes
+    ----------
+    bytes : int
+        Bytes received from the device.
+    packets : int
+        Packets received from the device.
+    lost_packets : int
+        Packets missing according to the packet counters.
+    gap_events : int
+        Packet counter discontinuities.
+    """
+
+    __slots__ = ("comp_name", "bytes", "packets", "lost_packets", "gap_events")
+
+    def __init__(self, comp_name):
+        self.comp_name = comp_name
+        self.reset()
+
+    def reset(self):
+        """Clear all the counters."""
+        self.bytes = 0
+        self.packets = 0
+        self.lost_packets = 0
+        self.gap_events = 0
+
+    def add(self, nbytes, packets=1):
+        """Account received data (acquisition thread)."""
+        self.bytes += nbytes
+        self.packets += packets
+
+    def add_gap(self, lost_packets):
+        """Account a packet counter discontinuity (acquisition thread)."""
+        self.gap_events += 1
+        self.lost_packets += lost_packets
+
+def _plot_backlog(widget):
+    # Items waiting in a plot widget: ring buffer samples or queued blocks
+    data = getattr(widget, "_data", None)
+    if data is None:
+        return 0, 0
+    queues = data.values() if isinstance(data, dict) else [data]
+    backlog = 0
+    dropped = 0
+    for q in queues:
+        try:
+            backlog += len(q)
+        except TypeError:
+            pass
+        dropped += getattr(q, "dropped", 0)
+    return backlog, dropped
+
+class StreamTelemetry(QObject):
+    """Periodic sampler of the acquisition pipeline metrics.
+
+    Parameters
+    ----------
+    controller : STDTDL_Controller
+        Controller owning `data_stage`, `render_scheduler` and `plot_widgets` (and
+        optionally `dat_writer` and `property_set_pipeline`).
+    sample_interval_ms : int, optional
+        Sampling period in milliseconds. Default is 1000.
+    history : int, optional
+        Maximum number of samples kept; older samples are discarded. Default is 3600.
+    parent : QObject | None, optional
+        Parent object.
+
+    Attributes
+    ----------
+    samples : collections.deque
+        Last `history` samples of the current acquisition, oldest first.
+    discarded_samples : int
+        Samples of the current acquisition discarded because `history` was reached.
+    info : dict
+        Per-acquisition values set by the controller (e.g., `time_to_first_sample_s`)
+        and `discarded_samples`, exported with the samples.
+    """
+
+    sig_sample = Signal(dict)
+    sig_timer_start = Signal()
+    sig_timer_stop = Signal()
+
+    def __init__(
+        self,
+        controller,
+        sample_interval_ms=DEFAULT_SAMPLE_INTERVAL_MS,
+        history=DEFAULT_HISTORY,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.controller = controller
+        self.sample_interval_ms = sample_interval_ms
+        self.samples = deque(maxlen=history)
+        self.discarded_samples = 0
+        self.info = dict()
+        self.__counters = dict()  # {comp_name: StreamCounters}
+        self.__prev = dict()  # {comp_name: (bytes, packets)}
+        self.__start_time = None
+        self.__prev_time = None
+        self.__running = False
+        self.__sample_lock = Lock()
+        # Created here, on the GUI thread: start/stop only queue its start/stop
+        self.__timer = QTimer(self)
+        self.__timer.timeout.connect(self.__on_timeout)
+        self.sig_timer_start.connect(self.__start_timer)
+        self.sig_timer_stop.connect(self.__timer.stop)
+
+    def counters(self, comp_name):
+        """Return the counters of a stream, creating them if needed.
+
+        Parameters
+        ----------
+        comp_name : str
+            Component name.
+
+        Returns
+        -------
+        StreamCounters
+            Counters to be updated by the acquisition thread of the stream.
+        """
+        counters = self.__counters.get(comp_name)
+        if counters is None:
+            counters = self.__counters.setdefault(comp_name, StreamCounters(comp_name))
+        return counters
+
+    def is_running(self):
+        """Return True while samples are being taken."""
+        return self.__running
+
+    def start(self):
+        """Reset counters and samples and start sampling (any thread)."""
+        with self.__sample_lock:
+            self.__counters.clear()
+            self.__prev.clear()
+            self.samples.clear()
+            self.info.clear()
+            self.discarded_samples = 0
+            self.info["discarded_samples"] = 0
+            self.__start_time = time.monotonic()
+            self.__prev_time = self.__start_time
+            self.__running = True
+        self.sig_timer_start.emit()
+
+    def stop(self):
+        """Take a last sample and stop sampling (any thread)."""
+        if self.__running:
+            self.__running = False
+            self.sig_timer_stop.emit()
+            self.sample()
+
+    def sample(self):
+        """Take a sample of all the metrics and emit `sig_sample`.
+
+        Returns
+        -------
+        dict
+            `t_s` (seconds from `start`), `streams` (per-component metrics),
+            `frame_time_s`, `max_frame_time_s`, `writer` and `property_sets`.
+        """
+        with self.__sample_lock:
+            sample = self.__take_sample()
+        self.sig_sample.emit(sample)
+        return sample
+
+    def __start_timer(self):
+        # GUI thread
+        self.__timer.start(self.sample_interval_ms)
+
+    def __on_timeout(self):
+        # A tick may still be delivered before a queued stop
+        if self.__running:
+            self.sample()
+
+    def __take_sample(self):
+        now = time.monotonic()
+        if self.__start_time is None:
+            self.__start_time = now
+            self.__prev_time = now
+        elapsed = now - self.__prev_time
+        self.__prev_time = now
+
+        controller = self.controller
+        stage_stats = controller.data_stage.get_stats()
+        streams = dict()
+        comp_names = list(self.__counters) + [c for c in stage_stats if c not in self.__counters]
+        for comp_name in comp_names:
+            counters = self.__counters.get(comp_name)
+            n_bytes = counters.bytes if counters is not None else 0
+            n_packets = counters.packets if counters is not None else 0
+            prev_bytes, prev_packets = self.__prev.get(comp_name, (0, 0))
+            self.__prev[comp_name] = (n_bytes, n_packets)
+            stage = stage_stats.get(comp_name, {})
+            backlog, plot_dropped = _plot_backlog(controller.plot_widgets.get(comp_name))
+            streams[comp_name] = {
+                "bytes": n_bytes,
+                "packets": n_packets,
+                "bytes_per_s": (n_bytes - prev_bytes) / elapsed if elapsed > 0 else 0.0,
+                "packets_per_s": (n_packets - prev_packets) / elapsed if elapsed > 0 else 0.0,
+                "lost_packets": counters.lost_packets if counters is not None else 0,
+                "gap_events": counters.gap_events if counters is not None else 0,
+                "stage_depth": stage.get("depth", 0),
+                "stage_dropped": stage.get("dropped", 0),
+                "plot_backlog": backlog,
+                "plot_dropped": plot_dropped,
+            }
+
+        render_scheduler = controller.render_scheduler
+        dat_writer = getattr(controller, "dat_writer", None)
+        property_set_pipeline = getattr(controller, "property_set_pipeline", None)
+        sample = {
+            "t_s": now - self.__start_time,
+            "streams": streams,
+            "frame_time_s": render_scheduler.last_frame_time,
+            "max_frame_time_s": render_scheduler.max_frame_time,
+            "writer": dat_writer.get_stats() if dat_writer is not None else None,
+            "property_sets": (
+                property_set_pipeline.get_stats() if property_set_pipeline is not None else None
+            ),
+        }
+        # Frame time peak is reported per sampling period
+        render_scheduler.max_frame_time = 0.0
+        if len(self.samples) == self.samples.maxlen:
+            if self.discarded_samples == 0:
+                log.warning(
+                    f"Stream telemetry history full ({self.samples.maxlen} samples): "
+                    "the oldest samples are discarded"
+                )
+            self.discarded_samples += 1
+            self.info["discarded_samples"] = self.discarded_samples
+        self.samples.append(sample)
+        return sample
+
+    def export(self, folder, file_name=TELEMETRY_FILE_NAME, samples=None, info=None):
+        """Write the samples to `<file_name>.csv` and `<file_name>.json`.
+
+        The CSV file has a row per sample and stream; the JSON file contains the full
+        samples and `info`.
+
+        Parameters
+        ----------
+        folder : str
+            Destination folder (e.g., the acquisition folder).
+        file_name : str, optional
+            File name without extension. Default is "stream_telemetry".
+        samples : list[dict] | None, optional
+            Samples to write instead of `samples` (e.g., a copy taken at the end of an
+            acquisition, exported from another thread).
+        info : dict | None, optional
+            Values to write instead of `info`.
+
+        Returns
+        -------
+        list[str]
+            Paths of the written files (empty if there are no samples).
+        """
+        samples = list(self.samples) if samples is None else samples
+        info = self.info if info is None else info
+        if len(samples) == 0:
+            return []
+        csv_path = os.path.join(folder, file_name + ".csv")
+        json_path = os.path.join(folder, file_name + ".json")
+        try:
+            with open(csv_path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                for sample in samples:
+                    writer_stats = sample["writer"] or {}
+                    for comp_name, stream in sample["streams"].items():
+                        row = dict(stream)
+                        row.update(
+                            t_s=round(sample["t_s"], 3),
+                            comp_name=comp_name,
+                            frame_time_s=sample["frame_time_s"],
+                            max_frame_time_s=sample["max_frame_time_s"],
+                            write_avg_latency_s=writer_stats.get("avg_latency_s", ""),
+                            write_max_latency_s=writer_stats.get("max_latency_s", ""),
+                            write_pending_buffers=writer_stats.get("pending_buffers", ""),
+                            write_dropped_bytes=writer_stats.get("dropped_bytes", ""),
+                        )
+                        writer.writerow(row)
+            with open(json_path, "w") as f:
+                json.dump(
+                    {"sample_interval_ms": self.sample_interval_ms, "info": info, "samples": samples},
+                    f,
+                    indent=1,
+                )
+        except OSError as e:
+            log.error(f"Error exporting stream telemetry to {folder}: {e}")
+            return []
+        return [csv_path, json_path]
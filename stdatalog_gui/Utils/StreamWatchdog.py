@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    StreamWatchdog.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Shared watchdog detecting acquisition streams that stopped delivering data.
+
+Acquisition threads `feed` the watchdog with the component name each time data is
+received. A single timer, on the thread that created the watchdog (the GUI thread),
+checks the last-data timestamps of all the watched streams and calls the stall callback
+of a stream that received nothing for longer than its timeout.
+
+Design Notes:
+- `feed` is a single dictionary item assignment of a `time.monotonic()` value: it is
+    safe from any thread and costs no system call besides the clock read.
+- A stall is reported once; the stream is re-armed when data arrives again.
+- The timer runs only while at least one stream is watched.
+"""
+
+import time
+
+from PySide6.QtCore import QObject, QTimer
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+DEFAULT_STREAM_TIMEOUT = 5  # s
+DEFAULT_CHECK_INTERVAL_MS = 500
+
+class StreamWatchdog(QObject):
+    """Last-data timestamps of the acquisition streams, checked by a single timer.
+
+    Parameters
+    ----------
+    check_interval_ms : int, optional
+        Period of the stall check in milliseconds. Default is 500.
+    parent : QObject | None, optional
+        Parent object.
+    """
+
+    def __init__(self, check_interval_ms=DEFAULT_CHECK_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.check_interval_ms = check_interval_ms
+        self.__last_data = dict()  # {comp_name: monotonic time of the last data}
+        self.__watched = dict()  # {comp_name: [timeout_s, on_stall, reported]}
+        self.__timer = None
+
+    def watch(self, comp_name, on_stall, timeout=DEFAULT_STREAM_TIMEOUT):
+        """Start watching a stream (thread that created the watchdog).
+
+        Parameters
+        ----------
+        comp_name : str
+            Component name.
+        on_stall : callable
+            Called, without arguments, when no data arrives for `timeout` seconds.
+        timeout : float, optional
+            Stall timeout in seconds. Default is 5.
+        """
+        self.__last_data[comp_name] = time.monotonic()
+        self.__watched[comp_name] = [timeout, on_stall, False]
+        if self.__timer is None:
+            self.__timer = QTimer(self)
+            self.__timer.timeout.connect(self.check)
+        if not self.__timer.isActive():
+            self.__timer.start(self.check_interval_ms)
+
+    def unwatch(self, comp_name):
+        """Stop watching a stream (any thread)."""
+        self.__watched.pop(comp_name, None)
+        self.__last_data.pop(comp_name, None)
+
+    def feed(self, comp_name):
+        """Record that data has been received for a stream (acquisition thread)."""
+        self.__last_data[comp_name] = time.monotonic()
+
+    def check(self):
+        """Call the stall callback of the streams without data for too long."""
+        if len(self.__watched) == 0:
+            self.__timer.stop()
+            return
+        now = time.monotonic()
+        for comp_name, entry in list(self.__watched.items()):
+            last_data = self.__last_data.get(comp_name)
+            if last_data is None:
+                continue
+            timeout, on_stall, reported = entry
+            if now - last_data < timeout:
+                entry[2] = False
+            elif not reported:
+                entry[2] = True
+                try:
+                    on_stall()
+                except Exception as e:
+                    log.exception(f"Stream watchdog error [{comp_name}]: {e}")
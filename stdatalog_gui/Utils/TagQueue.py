@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    TagQueue.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Asynchronous sender of software tag commands.
+
+Software tags mark label boundaries in the acquired data: they must be recorded when
+the user presses the tag button, not when the device link is free. `TagQueue` splits a
+tag in two parts:
+
+- On the GUI thread, `tag` records the host time of the request (`time.monotonic()`),
+    resolves the tag label from the cached `components_status` and returns at once.
+- A worker thread sends the `set_sw_tag_on/off` commands in request order and records
+    the command-to-ack latency of each tag.
+
+Design Notes:
+- Each tag is a dict: `tag`, `label`, `status`, `host_time_s` (seconds from the start
+    of the acquisition), `queue_delay_s` (request to command sent), `ack_latency_s`
+    (command sent to command returned) and `error`.
+- `sig_tag_acked` delivers each completed tag to the GUI thread.
+- `sync` waits for the queued commands, e.g. before the acquisition is stopped.
+- `get_stats` reports tags pending and latencies. The counters are updated by the
+    worker and read by the GUI thread under the same condition lock.
+- Commands go through the controller `hsd_link`, which serializes the PnPL calls of
+    all the threads (see `SerializedLink`).
+"""
+
+import queue
+import time
+from threading import Condition, Thread
+
+from PySide6.QtCore import QObject, Signal
+
+from stdatalog_core.HSD_utils import logger
+
+log = logger.get_logger(__name__)
+
+class TagQueue(QObject):
+    """FIFO of software tag commands sent by a worker thread.
+
+    Parameters
+    ----------
+    controller : HSD_Controller
+        Controller providing `hsd_link`, `device_id` and `components_status`.
+    parent : QObject | None, optional
+        Parent object.
+
+    Attributes
+    ----------
+    events : list[dict]
+        Tags of the current acquisition, in request order.
+    """
+
+    sig_tag_acked = Signal(dict)
+
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.events = []
+        self.max_latency = 0.0
+        self.max_queue_delay = 0.0
+        self.__requested = 0
+        self.__acked = 0
+        self.__total_latency = 0.0
+        self.__t0 = time.monotonic()
+        self.__queue = queue.Queue()
+        self.__acked_cond = Condition()
+        self.__worker = None
+
+    @property
+    def pending(self):
+        """Tags requested and not acknowledged yet."""
+        return self.__requested - self.__acked
+
+    def reset(self, t0=None):
+        """Clear the tags and set the time origin of `host_time_s` (GUI thread).
+
+        Parameters
+        ----------
+        t0 : float | None, optional
+            `time.monotonic()` value of the acquisition start. Default is now.
+        """
+        self.events = []
+        self.__t0 = time.monotonic() if t0 is None else t0
+
+    def tag(self, sw_tag_name, status):
+        """Record a tag and queue its command (GUI thread).
+
+        Parameters
+        ----------
+        sw_tag_name : str
+            Software tag class name (e.g., "sw_tag0").
+        status : bool
+            True for tag ON, False for tag OFF.
+
+        Returns
+        -------
+        str
+            Tag label, from the cached `tags_info` status (the tag name if unknown).
+        """
+        now = time.monotonic()
+        tag_info = self.controller.components_status.get("tags_info", {}).get(sw_tag_name, {})
+        event = {
+            "tag": sw_tag_name,
+            "label": tag_info.get("label", sw_tag_name),
+            "status": status,
+            "host_time_s": now - self.__t0,
+            "queue_delay_s": None,
+            "ack_latency_s": None,
+            "error": None,
+        }
+        self.events.append(event)
+        if self.__worker is None:
+            self.__worker = Thread(target=self.__run, name="tag_thread", daemon=True)
+            self.__worker.start()
+        with self.__acked_cond:
+            self.__requested += 1
+        self.__queue.put((event, now))
+        return event["label"]
+
+    def sync(self, timeout=2.0):
+        """Wait until the queued tag commands have been sent.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum wait in seconds. Default is 2.
+
+        Returns
+        -------
+        bool
+            True if all the commands have been sent.
+        """
+        with self.__acked_cond:
+            return self.__acked_cond.wait_for(lambda: self.pending == 0, timeout)
+
+    def get_stats(self):
+        """Return the tag metrics.
+
+        Returns
+        -------
+        dict
+            `pending`, `tags`, `avg_latency_s`, `max_latency_s` and
+            `max_queue_delay_s`.
+        """
+        with self.__acked_cond:
+            return {
+                "pending": self.pending,
+                "tags": self.__acked,
+                "avg_latency_s": self.__total_latency / self.__acked if self.__acked else 0.0,
+                "max_latency_s": self.max_latency,
+                "max_queue_delay_s": self.max_queue_delay,
+            }
+
+    def __run(self):
+        while True:
+            event, requested = self.__queue.get()
+            hsd_link = self.controller.hsd_link
+            d_id = self.controller.device_id
+            start = time.monotonic()
+            try:
+                if event["status"]:
+                    hsd_link.set_sw_tag_on(d_id, event["tag"])
+                else:
+                    hsd_link.set_sw_tag_off(d_id, event["tag"])
+            except Exception as e:
+                event["error"] = str(e)
+                log.error(f"Tag {event['tag']} {'ON' if event['status'] else 'OFF'} error: {e}")
+            end = time.monotonic()
+            event["queue_delay_s"] = start - requested
+            event["ack_latency_s"] = end - start
+            with self.__acked_cond:
+                self.__total_latency += end - start
+                self.max_latency = max(self.max_latency, end - start)
+                self.max_queue_delay = max(self.max_queue_delay, start - requested)
+                self.__acked += 1
+                self.__acked_cond.notify_all()
+            self.sig_tag_acked.emit(event)
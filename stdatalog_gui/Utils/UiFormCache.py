@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    UiFormCache.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Cache of the Qt Designer forms instantiated by the GUI widgets.
+
+Property, command, telemetry, component and plot widgets are created by the hundreds
+when a device template is loaded, and each one used to read and parse its `.ui` XML
+file with a new `QUiLoader`. The forms instantiated in bulk are compiled ahead of time
+to `Ui_*.py` modules in the `UI` folder (like `Ui_MainWindow.py`), so `UiFormCache`
+builds them with `setupUi`, without any XML parsing. The other forms are read once
+and built from the in-memory copy with a single shared `QUiLoader`.
+
+Design Notes:
+- Forms are identified by their file name in the `UI` package folder.
+- A compiled form must be regenerated when its `.ui` file changes, e.g.
+    `pyside6-uic component_config_widget.ui -o Ui_component_config_widget.py`.
+- As with `QUiLoader`, the children of a compiled form are available both through
+    `findChild` and as attributes of the returned widget.
+- No code is generated at runtime.
+- `get_stats` reports per-form instance counts and the time spent building them.
+"""
+
+import os
+import time
+
+from PySide6.QtCore import QBuffer, QByteArray, QDir, QIODevice
+from PySide6.QtUiTools import QUiLoader
+from PySide6.QtWidgets import QWidget
+
+import stdatalog_gui
+from stdatalog_gui.UI.Ui_component_config_widget import Ui_widget_component_config
+from stdatalog_gui.UI.Ui_output_class_widget import Ui_widget_out_class
+from stdatalog_gui.UI.Ui_plot_widget import Ui_widget_plot
+from stdatalog_gui.UI.Ui_send_command_widget import (
+    Ui_widget_component_config as Ui_widget_send_command,
+)
+
+UI_FOLDER = os.path.join(os.path.dirname(stdatalog_gui.__file__), "UI")
+
+# Forms built from their compiled Ui_*.py module (all with a QWidget top-level)
+COMPILED_FORMS = {
+    "component_config_widget.ui": Ui_widget_component_config,
+    "output_class_widget.ui": Ui_widget_out_class,
+    "plot_widget.ui": Ui_widget_plot,
+    "send_command_widget.ui": Ui_widget_send_command,
+}
+
+class UiFormCache:
+    """Build widgets from Qt Designer forms, reading each form file once.
+
+    Parameters
+    ----------
+    ui_folder : str, optional
+        Folder containing the `.ui` files. Default is the `stdatalog_gui` UI folder.
+    compiled_forms : dict, optional
+        Map of form file name -> compiled `Ui_*` class. Default is `COMPILED_FORMS`.
+    """
+
+    def __init__(self, ui_folder=UI_FOLDER, compiled_forms=COMPILED_FORMS):
+        self.ui_folder = ui_folder
+        self.compiled_forms = compiled_forms
+        self.__forms = dict()  # {ui_file: QByteArray}
+        self.__loader = None
+        self.__stats = dict()  # {ui_file: [instances, total build time s]}
+
+    def load(self, ui_file, parent=None):
+        """Create a new instance of a form.
+
+        Parameters
+        ----------
+        ui_file : str
+            Form file name (e.g., "component_config_widget.ui").
+        parent : QWidget | None, optional
+            Parent of the new widget.
+
+        Returns
+        -------
+        QWidget
+            The form top-level widget, with its children named as in the `.ui` file.
+        """
+        start = time.perf_counter()
+        ui_class = self.compiled_forms.get(ui_file)
+        if ui_class is not None:
+            widget = self.__setup_compiled(ui_class, parent)
+        else:
+            widget = self.__load_xml(ui_file, parent)
+        stats = self.__stats.setdefault(ui_file, [0, 0.0])
+        stats[0] += 1
+        stats[1] += time.perf_counter() - start
+        return widget
+
+    def __setup_compiled(self, ui_class, parent):
+        widget = QWidget(parent)
+        ui = ui_class()
+        ui.setupUi(widget)
+        # Children as attributes of the form widget, as QUiLoader does
+        for name, child in vars(ui).items():
+            setattr(widget, name, child)
+        return widget
+
+    def __load_xml(self, ui_file, parent):
+        form = self.__forms.get(ui_file)
+        if form is None:
+            with open(os.path.join(self.ui_folder, ui_file), "rb") as f:
+                form = QByteArray(f.read())
+            self.__forms[ui_file] = form
+        if self.__loader is None:
+            self.__loader = QUiLoader()
+            self.__loader.setWorkingDirectory(QDir(self.ui_folder))
+        buffer = QBuffer()
+        buffer.setData(form)
+        buffer.open(QIODevice.ReadOnly)
+        widget = self.__loader.load(buffer, parent)
+        buffer.close()
+        return widget
+
+    def get_stats(self):
+        """Return the per-form build statistics.
+
+        Returns
+        -------
+        dict
+            `{ui_file: {"instances", "total_time_s"}}`.
+        """
+        return {
+            ui_file: {"instances": s[0], "total_time_s": s[1]}
+            for ui_file, s in self.__stats.items()
+        }
+
+ui_form_cache = UiFormCache()
+
+def load_form(ui_file, parent=None):
+    """Create a new instance of a form of the `stdatalog_gui` UI folder.
+
+    Parameters
+    ----------
+    ui_file : str
+        Form file name (e.g., "component_config_widget.ui").
+    parent : QWidget | None, optional
+        Parent of the new widget.
+
+    Returns
+    -------
+    QWidget
+        The form top-level widget.
+    """
+    return ui_form_cache.load(ui_file, parent)
@@ -29,7 +29,7 @@ components. It supports two main scenarios:
     upload completes.
 
 The widget uses the project UI template `send_command_widget.ui` loaded at runtime via
-`QUiLoader` to keep presentation separated from logic. It coordinates with a
+`UiFormCache` to keep presentation separated from logic. It coordinates with a
 controller providing device-level operations such as `send_command`, `upload_file`,
 `upload_mlc_ucf_file`, and `upload_ispu_ucf_file`.
 
@@ -51,7 +51,6 @@ sections using the style already used in the project.
 from dataclasses import dataclass
 from functools import partial
 import json
-import os
 
 from PySide6.QtWidgets import (
     QLabel,
@@ -68,12 +67,12 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QDoubleValidator, QIntValidator
 from PySide6.QtCore import QTimer
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtDesigner import QPyDesignerCustomWidgetCollection
 from stdatalog_pnpl.PnPLCmd import PnPLCMDManager
 import stdatalog_gui
 from stdatalog_gui.UI.styles import STDTDL_PushButton
 from stdatalog_gui.Widgets.LoadingWindow import LoadingWindow
+from stdatalog_gui.Utils.UiFormCache import load_form
 from stdatalog_core.HSD_utils.DataClass import TypeEnum
 
 UCF_AND_JSON_FILE_FILTER = (
@@ -207,13 +206,7 @@ class CommandWidget(QWidget):
         QPyDesignerCustomWidgetCollection.registerCustomWidget(
             CommandWidget, module="CommandWidget"
         )
-        loader = QUiLoader()
-        command_widget = loader.load(
-            os.path.join(
-                os.path.dirname(stdatalog_gui.__file__), "UI", "send_command_widget.ui"
-            ),
-            parent,
-        )
+        command_widget = load_form("send_command_widget.ui", parent)
         command_title_frame = command_widget.frame_component_config.findChild(
             QFrame, "frame_title"
         )
@@ -29,13 +29,12 @@ Responsibilities:
 - Provide controls for packing/unpacking content and popping out/in the widget.
 
 Design Notes:
-- Built with PySide6 and dynamically loads its UI via `QUiLoader`.
+- Built with PySide6; its UI form is instantiated through the shared `UiFormCache`.
 - Avoids behavioral changes; only documentation and minor formatting when needed.
 - Follows the project's 100-character line width where practical.
 """
 
 from abc import abstractmethod
-import os
 from functools import partial
 
 from PySide6.QtCore import Qt, Slot
@@ -53,12 +52,12 @@ from PySide6.QtWidgets import (
     QGridLayout,
 )
 from PySide6.QtGui import QDoubleValidator, QIntValidator
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtDesigner import QPyDesignerCustomWidgetCollection
 
 import stdatalog_gui
 from stdatalog_gui.UI.styles import STDTDL_PushButton
 from stdatalog_gui.Utils import UIUtils
+from stdatalog_gui.Utils.UiFormCache import load_form
 from stdatalog_gui.Widgets.ToggleButton import ToggleButton
 from stdatalog_pnpl.DTDL.device_template_model import ContentSchema, ContentType, RequestSchema, ResponseSchema
 from stdatalog_pnpl.PnPLCmd import PnPLCMDManager
@@ -95,6 +94,8 @@ class ComponentWidget(QWidget):
         Sequential component ID for layout/indexing (default 0).
     parent : QWidget | None, optional
         Optional parent widget.
+    lazy_contents : bool, optional
+        Build the contents widgets on first expansion or enabling (default False).
 
     Attributes
     ----------
@@ -110,6 +111,8 @@ class ComponentWidget(QWidget):
         Mapping from command name to command widget instances.
     contents_widget : QFrame
         Container for dynamic component controls.
+    contents_built : bool
+        Whether the contents widgets have been built (see `build_contents`).
     """
 
     def __init__(
@@ -121,6 +124,7 @@ class ComponentWidget(QWidget):
         comp_contents,
         c_id=0,
         parent=None,
+        lazy_contents=False,
     ):
         """Initialize component widget UI and connect controller signals.
 
@@ -140,6 +144,9 @@ class ComponentWidget(QWidget):
             Component ID (default 0).
         parent : QWidget | None, optional
             Optional parent widget.
+        lazy_contents : bool, optional
+            If True, the contents widgets are built on first expansion or enabling
+            instead of now (default False).
         """
         super().__init__(parent)
         self.parent = parent
@@ -165,15 +172,7 @@ class ComponentWidget(QWidget):
         QPyDesignerCustomWidgetCollection.registerCustomWidget(
             ComponentWidget, module="ComponentWidget"
         )
-        loader = QUiLoader()
-        comp_config_widget = loader.load(
-            os.path.join(
-                os.path.dirname(stdatalog_gui.__file__),
-                "UI",
-                "component_config_widget.ui",
-            ),
-            parent,
-        )
+        comp_config_widget = load_form("component_config_widget.ui", parent)
         self.frame_component_config = comp_config_widget.frame_component_config
         self.title_frame = comp_config_widget.frame_component_config.findChild(
             QFrame, "frame_title"
@@ -220,6 +219,33 @@ class ComponentWidget(QWidget):
         self.property_widgets = dict()
         self.command_widgets = dict()
 
+        self.lazy_contents = lazy_contents
+        self.contents_built = False
+        self.__pending_status = dict()
+        if lazy_contents:
+            # Only the title bar is built now: the contents are built when the
+            # component is expanded or enabled for the first time
+            if comp_sem_type in (
+                ComponentType.SENSOR, ComponentType.ALGORITHM, ComponentType.ACTUATOR
+            ) and any(self.__is_property(p) and p.name == "enable" for p in comp_contents):
+                self.radioButton_enable.setVisible(True)
+                self.radioButton_enable.toggled.connect(self.__lazy_enable_toggled)
+        else:
+            self.build_contents()
+
+    def build_contents(self):
+        """Build the property, command and telemetry widgets of the component.
+
+        Called by the constructor, or on first expansion/enabling when the widget was
+        created with `lazy_contents=True`. The status received in the meantime is
+        applied to the new widgets.
+        """
+        if self.contents_built:
+            return
+        self.contents_built = True
+        controller = self.controller
+        comp_name = self.comp_name
+        comp_sem_type = self.comp_sem_type
         # Frame Properties
         component_props_frame = QFrame()
         component_props_layout = QGridLayout()
@@ -260,9 +286,10 @@ class ComponentWidget(QWidget):
                         or comp_sem_type == ComponentType.ACTUATOR
                     ) and p.name == "enable":
                         self.radioButton_enable.setVisible(True)
-                        self.radioButton_enable.toggled.connect(
-                            partial(self.sensor_component_enabled, widget)
-                        )
+                        if not self.lazy_contents:
+                            self.radioButton_enable.toggled.connect(
+                                partial(self.sensor_component_enabled, widget)
+                            )
                     component_props_layout.addWidget(widget, i, 0)
                     # add widget to the Property widget dictionary
                     self.property_widgets[p.name] = widget
@@ -686,6 +713,36 @@ class ComponentWidget(QWidget):
         component_props_frame.setLayout(component_props_layout)
         component_props_frame.setFixedHeight(component_props_layout.sizeHint().height())
         self.contents_widget.layout().addWidget(component_props_frame)
+        if len(self.__pending_status) > 0:
+            pending_status = self.__pending_status
+            self.__pending_status = dict()
+            self.s_component_updated(self.comp_name, pending_status)
+
+    @staticmethod
+    def __is_property(content):
+        if isinstance(content.type, ContentType):
+            return content.type.name == "PROPERTY"
+        return any(x.name == "PROPERTY" for x in content.type)
+
+    def __update_packed_status(self, comp_status):
+        # Contents not built yet: keep the status for build_contents and update the
+        # title bar only
+        self.__pending_status.update(comp_status)
+        enable = comp_status.get("enable")
+        if isinstance(enable, bool) and not self.radioButton_enable.isHidden():
+            self.radioButton_enable.blockSignals(True)
+            self.radioButton_enable.setChecked(enable)
+            self.radioButton_enable.blockSignals(False)
+        note = comp_status.get("sensor_annotation")
+        if self.comp_sem_type == ComponentType.SENSOR and note is not None:
+            self.__set_component_annotation(note)
+
+    @Slot(bool)
+    def __lazy_enable_toggled(self, status):
+        self.build_contents()
+        enable_widget = self.property_widgets.get("enable")
+        if enable_widget is not None:
+            self.sensor_component_enabled(enable_widget, status)
 
     def assign_callbacks(
         self, controller, widget, schema_type, schema_value=None, enum_values=None
@@ -885,6 +942,10 @@ class ComponentWidget(QWidget):
                             else:
                                 self.controller.enable_start_log_button()
 
+                if not self.contents_built:
+                    self.__update_packed_status(comp_status)
+                    return
+
                 for cont_name, cont_value in comp_status.items():
                     cont_dtdl = next(
                         (c for c in self.comp_contents if c.name == cont_name), None
@@ -1094,58 +1155,55 @@ class ComponentWidget(QWidget):
         else:
             log.warning("Unrecognized Property Type")
 
-    def send_string_command(self, widget: PropertyWidget):
-        """Send a PnPL string property command and trigger status refresh."""
-        json_string = PnPLCMDManager.create_set_property_cmd(
-            widget.comp_name,
-            widget.prop_name,
-            widget.value.text()
-            if widget.field_name is None
-            else {widget.field_name: widget.value.text()},
-        )
-        self.controller.send_command(json_string)
+    def send_property(self, widget: PropertyWidget, value, use_field_name=True):
+        """Send a PnPL set-property command and trigger status refresh.
+
+        The command goes through the controller property-set pipeline when available
+        (debounced, merged per component and sent off the GUI thread), otherwise it is
+        sent synchronously.
+
+        Parameters
+        ----------
+        widget : PropertyWidget
+            Edited property widget.
+        value : Any
+            New property (or property field) value.
+        use_field_name : bool, optional
+            Wrap the value in `{field_name: value}` for object property fields.
+            Default is True.
+        """
+        if use_field_name and widget.field_name is not None:
+            value = {widget.field_name: value}
         if widget.comp_sem_type == ComponentType.SENSOR:
             comp_sensor_name = widget.comp_name.split('_')[0]
-            for cn in list(self.controller.components_dtdl.keys()):
-                if comp_sensor_name in cn:
-                    self.controller.update_component_status(cn, ComponentType.SENSOR)
+            refresh_list = [
+                (cn, ComponentType.SENSOR)
+                for cn in list(self.controller.components_dtdl.keys())
+                if comp_sensor_name in cn
+            ]
         else:
-            self.controller.update_component_status(widget.comp_name, widget.comp_sem_type)
+            refresh_list = [(widget.comp_name, widget.comp_sem_type)]
+        pipeline = getattr(self.controller, "property_set_pipeline", None)
+        if pipeline is not None:
+            pipeline.set_property(widget.comp_name, widget.prop_name, value, refresh_list)
+            return
+        json_string = PnPLCMDManager.create_set_property_cmd(widget.comp_name, widget.prop_name, value)
+        self.controller.send_command(json_string)
+        for cn, comp_type in refresh_list:
+            self.controller.update_component_status(cn, comp_type)
+
+    def send_string_command(self, widget: PropertyWidget):
+        """Send a PnPL string property command and trigger status refresh."""
+        self.send_property(widget, widget.value.text())
 
     def send_int_command(self, widget: PropertyWidget, value=None):
         """Send a PnPL integer property command and trigger status refresh."""
         int_value = int(value) if value is not None else int(widget.value.text())
-        json_string = PnPLCMDManager.create_set_property_cmd(
-            widget.comp_name,
-            widget.prop_name,
-            int_value if widget.field_name is None else {widget.field_name: int_value},
-        )
-        self.controller.send_command(json_string)
-        if widget.comp_sem_type == ComponentType.SENSOR:
-            comp_sensor_name = widget.comp_name.split('_')[0]
-            for cn in list(self.controller.components_dtdl.keys()):
-                if comp_sensor_name in cn:
-                    self.controller.update_component_status(cn, ComponentType.SENSOR)
-        else:
-            self.controller.update_component_status(widget.comp_name, widget.comp_sem_type)
+        self.send_property(widget, int_value)
 
     def send_double_command(self, widget: PropertyWidget):
         """Send a PnPL double/float property command and trigger status refresh."""
-        json_string = PnPLCMDManager.create_set_property_cmd(
-            widget.comp_name,
-            widget.prop_name,
-            float(widget.value.text())
-            if widget.field_name is None
-            else {widget.field_name: float(widget.value.text())},
-        )
-        self.controller.send_command(json_string)
-        if widget.comp_sem_type == ComponentType.SENSOR:
-            comp_sensor_name = widget.comp_name.split('_')[0]
-            for cn in list(self.controller.components_dtdl.keys()):
-                if comp_sensor_name in cn:
-                    self.controller.update_component_status(cn, ComponentType.SENSOR)
-        else:
-            self.controller.update_component_status(widget.comp_name, widget.comp_sem_type)
+        self.send_property(widget, float(widget.value.text()))
 
     def sensor_component_enabled(self, widget: PropertyWidget, status):
         """Reflect enable state changes while respecting current logging state."""
@@ -1167,49 +1225,15 @@ class ComponentWidget(QWidget):
 
     def send_bool_command(self, widget: PropertyWidget, status):
         """Send a PnPL boolean property command and trigger status refresh."""
-        json_string = PnPLCMDManager.create_set_property_cmd(
-            widget.comp_name,
-            widget.prop_name,
-            status if widget.field_name is None else {widget.field_name: status},
-        )
-        self.controller.send_command(json_string)
-        if widget.comp_sem_type == ComponentType.SENSOR:
-            comp_sensor_name = widget.comp_name.split('_')[0]
-            for cn in list(self.controller.components_dtdl.keys()):
-                if comp_sensor_name in cn:
-                    self.controller.update_component_status(cn, ComponentType.SENSOR)
-        else:
-            self.controller.update_component_status(widget.comp_name, widget.comp_sem_type)
+        self.send_property(widget, status)
 
     def send_enum_number_command(self, widget: PropertyWidget, enum_values, index):
         """Send a PnPL enum (numeric) property command and trigger status refresh."""
-        int_value = enum_values[index].enum_value
-        json_string = PnPLCMDManager.create_set_property_cmd(
-            widget.comp_name, widget.prop_name, int_value
-        )
-        self.controller.send_command(json_string)
-        if widget.comp_sem_type == ComponentType.SENSOR:
-            comp_sensor_name = widget.comp_name.split('_')[0]
-            for cn in list(self.controller.components_dtdl.keys()):
-                if comp_sensor_name in cn:
-                    self.controller.update_component_status(cn, ComponentType.SENSOR)
-        else:
-            self.controller.update_component_status(widget.comp_name, widget.comp_sem_type)
+        self.send_property(widget, enum_values[index].enum_value, use_field_name=False)
 
     def send_enum_string_command(self, widget: PropertyWidget, enum_values, index):
         """Send a PnPL enum (string) property command and trigger status refresh."""
-        str_value = enum_values[index].enum_value
-        json_string = PnPLCMDManager.create_set_property_cmd(
-            widget.comp_name, widget.prop_name, str_value
-        )
-        self.controller.send_command(json_string)
-        if widget.comp_sem_type == ComponentType.SENSOR:
-            comp_sensor_name = widget.comp_name.split('_')[0]
-            for cn in list(self.controller.components_dtdl.keys()):
-                if comp_sensor_name in cn:
-                    self.controller.update_component_status(cn, ComponentType.SENSOR)
-        else:
-            self.controller.update_component_status(widget.comp_name, widget.comp_sem_type)
+        self.send_property(widget, enum_values[index].enum_value, use_field_name=False)
 
     def closeEvent(self, event):
         """Ensure the widget is re-docked when the window is closed.
@@ -1249,6 +1273,7 @@ class ComponentWidget(QWidget):
 
     def unpack_contents_widget(self):
         """Expand the contents area to reveal component controls."""
+        self.build_contents()
         self.contents_widget.setVisible(True)
 
     def pack_contents_widget(self):
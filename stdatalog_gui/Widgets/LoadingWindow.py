@@ -19,7 +19,7 @@
 
 This module provides small, themed dialogs used to inform users about ongoing operations:
 - ``StaticLoadingWindow``: modal dialog displaying static text while work proceeds.
-- ``LoadingWindow``: indeterminate progress dialog for longer operations.
+- ``LoadingWindow``: progress dialog for longer operations, optionally cancelable.
 - ``WaitingDialog``: dialog with an animated loading icon and message.
 
 Design Notes
@@ -93,7 +93,9 @@ class StaticLoadingWindow:
         self.dialog.close()
 
 class LoadingWindow:
-    """Indeterminate progress dialog with consistent styling.
+    """Progress dialog with consistent styling.
+
+    The progress is indeterminate until `set_progress` is called.
 
     Parameters
     ----------
@@ -103,16 +105,25 @@ class LoadingWindow:
         Message shown above the progress indicator.
     parent : QWidget
         Parent widget.
+    cancel_callback : callable | None, optional
+        Function called when the user presses the Cancel button. If None (default),
+        no Cancel button is shown.
     """
 
-    def __init__(self, title, text, parent) -> None:
+    def __init__(self, title, text, parent, cancel_callback=None) -> None:
         self.dialog = QProgressDialog(parent)
         self.dialog.setContentsMargins(24,24,24,24)
         self.dialog.setMinimum(0)
         self.dialog.setMaximum(0)
         self.dialog.setLabelText(text)
         self.dialog.setWindowTitle(title)
-        self.dialog.setCancelButton(None)
+        self.dialog.setAutoClose(False)
+        self.dialog.setAutoReset(False)
+        self.cancel_callback = cancel_callback
+        if cancel_callback is None:
+            self.dialog.setCancelButton(None)
+        else:
+            self.dialog.canceled.connect(cancel_callback)
         self.dialog.setModal(True)
         style = '''
             QProgressDialog
@@ -124,6 +135,23 @@ class LoadingWindow:
         self.dialog.setStyleSheet(style)
         self.dialog.show()
 
+    def set_progress(self, value, maximum, text=None):
+        """Show a determinate progress.
+
+        Parameters
+        ----------
+        value : int
+            Completed steps.
+        maximum : int
+            Total number of steps.
+        text : str | None, optional
+            New message, if any.
+        """
+        self.dialog.setMaximum(maximum)
+        self.dialog.setValue(value)
+        if text is not None:
+            self.dialog.setLabelText(text)
+
     def loadingDone(self):
         """Close the dialog when the loading operation completes.
 
@@ -131,6 +159,9 @@ class LoadingWindow:
         -------
         None
         """
+        if self.cancel_callback is not None:
+            # Closing the dialog emits canceled: the operation is already over
+            self.dialog.canceled.disconnect(self.cancel_callback)
         self.dialog.close()
 
 class WaitingDialog(QDialog):
@@ -29,6 +29,11 @@ Responsibilities:
 - Display a gauge that maps a numeric range `[min_value, max_value]` to angles.
 - Render scale markers, numeric labels, current value text, and a center cap.
 - Update the needle position on new data and when the widget resizes.
+
+The markers and scale labels do not depend on the value: they are rendered once into
+a cached `QPixmap`, invalidated on resize or range change. Each repaint draws the
+colored band, the cached layer, the value text, the needle and the center cap with a
+single `QPainter`.
 """
 
 import math
@@ -43,6 +48,7 @@ from PySide6.QtGui import (
     QPainter,
     QFontMetrics,
     QConicalGradient,
+    QPixmap,
 )
 from PySide6.QtCore import Qt, QPoint, QPointF, Signal, Slot
 
@@ -82,6 +88,8 @@ class AnalogGaugeInnerWidget(PlotWidget):
     - Scale layout and pie gradient use simple trigonometry via `math`.
     """
 
+    render_continuously = False  # redrawn only when new data are added
+
     valueChanged = Signal(int)
 
     def __init__(
@@ -139,6 +147,10 @@ class AnalogGaugeInnerWidget(PlotWidget):
 
         self.text_radius_factor = 0.7
 
+        # Markers and scale labels, rendered once per size/range (see paintEvent)
+        self.static_layer = None
+        self.band_points = None
+
     @Slot(bool, int)
     def s_is_logging(self, status: bool, interface: int):
         """Start/stop the internal timer based on logging status.
@@ -172,21 +184,47 @@ class AnalogGaugeInnerWidget(PlotWidget):
         if data > self.max_value:
             data = self.max_value
         self.l_data = data
+        self.dirty = True
+
+    def set_range(self, min_value, max_value):
+        """Change the scale range and redraw the dial.
+
+        Parameters
+        ----------
+        min_value : int | float
+            Minimum value shown on the scale.
+        max_value : int | float
+            Maximum value shown on the scale.
+        """
+        self.min_value = min_value
+        self.max_value = max_value
+        self.value = min(max(self.value, min_value), max_value)
+        self.invalidate_static_layer()
+        self.update()
+
+    def invalidate_static_layer(self):
+        """Discard the cached dial, rendered again at the next paint."""
+        self.static_layer = None
+        self.band_points = None
 
     def set_scale_method(self):
         """Compute geometry-dependent parameters and build the needle polygon."""
         self.wdgt_width = self.width() if self.width() <= self.height() else self.height()
-        self.needle.append(QPolygon([
+        self.needle = [QPolygon([
             QPoint(3, 27),
             QPoint(-3, 27),
             QPoint(-2, - self.wdgt_width / 2 * 0.8),
             QPoint(0, - self.wdgt_width / 2 * 0.8 - 6),
             QPoint(2, - self.wdgt_width / 2 * 0.8),
-        ]))
+        ])]
+        self.invalidate_static_layer()
 
     def create_pie(self, start, lenght, out_rad, in_rad):
         """Create a pie-shaped polygon representing the colored scale band.
 
+        The outer and inner arc points (one per degree) are computed once per
+        geometry and sliced according to the current value.
+
         Parameters
         ----------
         start : float
@@ -203,40 +241,32 @@ class AnalogGaugeInnerWidget(PlotWidget):
         QPolygonF
             Polygon that describes the pie slice geometry for the current value.
         """
-        polygon_pie = QPolygonF()
-        x = y = 0
+        key = (start, lenght, out_rad, in_rad)
+        if self.band_points is None or self.band_points[0] != key:
+            angles = [math.radians(t + start) for t in range(int(lenght) + 1)]
+            outer = [QPointF(out_rad * math.cos(a), out_rad * math.sin(a)) for a in angles]
+            inner = [QPointF(in_rad * math.cos(a), in_rad * math.sin(a)) for a in angles]
+            self.band_points = (key, outer, inner)
+        _, outer, inner = self.band_points
         lenght = int(
             round(
                 (lenght / (self.max_value - self.min_value))
                 * (self.value - self.min_value)
             )
         )
-        # Outer circle line
-        for i in range(lenght + 1):
-            t = i + start
-            x = out_rad * math.cos(math.radians(t))
-            y = out_rad * math.sin(math.radians(t))
-            polygon_pie.append(QPointF(x, y))
-        # Inner circle line
-        for i in range(lenght + 1):
-            t = (lenght - i) + start
-            x = in_rad * math.cos(math.radians(t))
-            y = in_rad * math.sin(math.radians(t))
-            polygon_pie.append(QPointF(x, y))
-        # Outer line closure
-        polygon_pie.append(QPointF(x, y))
-        return polygon_pie
-
-    def draw_polygon(self, outline_pen_with=0):
+        lenght = min(max(lenght, 0), len(outer) - 1)
+        # Outer circle line, inner circle line (backwards) and outer line closure
+        return QPolygonF(outer[:lenght + 1] + inner[lenght::-1] + [inner[0]])
+
+    def draw_polygon(self, painter, outline_pen_with=0):
         """Draw the colored scale band with optional outline."""
-        painter_filled_polygon = QPainter(self)
-        painter_filled_polygon.setRenderHint(QPainter.Antialiasing)
+        painter.save()
         # Center the coords origin with the widget
-        painter_filled_polygon.translate(self.width() / 2, self.height() / 2)
-        painter_filled_polygon.setPen(Qt.NoPen)
+        painter.translate(self.width() / 2, self.height() / 2)
+        painter.setPen(Qt.NoPen)
         self.markers_pen.setWidth(outline_pen_with)
         if outline_pen_with > 0:
-            painter_filled_polygon.setPen(self.markers_pen)
+            painter.setPen(self.markers_pen)
         colored_scale_polygon = self.create_pie(
             self.scale_angle_start_value,
             self.scale_angle_size,
@@ -256,30 +286,30 @@ class AnalogGaugeInnerWidget(PlotWidget):
 
         for eachcolor in self.scale_polygon_colors:
             grad.setColorAt(eachcolor[0], eachcolor[1])
-        painter_filled_polygon.setBrush(grad)
-        painter_filled_polygon.drawPolygon(colored_scale_polygon)
+        painter.setBrush(grad)
+        painter.drawPolygon(colored_scale_polygon)
+        painter.restore()
 
-    def draw_large_markers(self):
+    def draw_large_markers(self, painter):
         """Draw primary scale markers around the dial."""
-        my_painter = QPainter(self)
-        my_painter.setRenderHint(QPainter.Antialiasing)
-        my_painter.translate(self.width() / 2, self.height() / 2)
+        painter.save()
+        painter.translate(self.width() / 2, self.height() / 2)
 
         self.markers_pen.setWidth(2)
-        my_painter.setPen(self.markers_pen)
+        painter.setPen(self.markers_pen)
 
-        my_painter.rotate(self.scale_angle_start_value)
+        painter.rotate(self.scale_angle_start_value)
         steps_size = (float(self.scale_angle_size) / float(self.scale_values_count))
         scale_line_outer_start = self.wdgt_width / 2
         scale_line_lenght = (self.wdgt_width / 2) - (self.wdgt_width / 20)
         for _ in range(self.scale_values_count + 1):
-            my_painter.drawLine(scale_line_lenght, 0, scale_line_outer_start, 0)
-            my_painter.rotate(steps_size)
+            painter.drawLine(scale_line_lenght, 0, scale_line_outer_start, 0)
+            painter.rotate(steps_size)
+        painter.restore()
 
-    def draw_markers_values_text(self):
+    def draw_markers_values_text(self, painter):
         """Draw numeric labels for the main scale divisions."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.save()
         painter.translate(self.width() / 2, self.height() / 2)
 
         font = QFont(self.scale_values_font, self.scale_values_fontsize)
@@ -289,6 +319,7 @@ class AnalogGaugeInnerWidget(PlotWidget):
 
         pen_shadow.setBrush(self.scale_values_color)
         painter.setPen(pen_shadow)
+        painter.setFont(font)
 
         text_radius_factor = 0.8
         text_radius = self.wdgt_width / 2 * text_radius_factor
@@ -302,7 +333,6 @@ class AnalogGaugeInnerWidget(PlotWidget):
             text = str(int(self.min_value + scale_per_div * i))
             w = fm.boundingRect(text).width() + 1
             h = fm.height()
-            painter.setFont(QFont(self.scale_values_font, self.scale_values_fontsize))
             angle = angle_distance * i + float(self.scale_angle_start_value)
             x = text_radius * math.cos(math.radians(angle))
             y = text_radius * math.sin(math.radians(angle))
@@ -315,15 +345,15 @@ class AnalogGaugeInnerWidget(PlotWidget):
                 text,
             ]
             painter.drawText(text[0], text[1], text[2], text[3], text[4], text[5])
+        painter.restore()
 
-    def draw_small_markers(self):
+    def draw_small_markers(self, painter):
         """Draw secondary (minor) scale markers between the main divisions."""
-        my_painter = QPainter(self)
-        my_painter.setRenderHint(QPainter.Antialiasing)
-        my_painter.translate(self.width() / 2, self.height() / 2)
+        painter.save()
+        painter.translate(self.width() / 2, self.height() / 2)
 
-        my_painter.setPen(QColor(0, 0, 0, 255))
-        my_painter.rotate(self.scale_angle_start_value)
+        painter.setPen(QColor(0, 0, 0, 255))
+        painter.rotate(self.scale_angle_start_value)
         steps_size = (
             float(self.scale_angle_size)
             / float(self.scale_values_count * self.scale_sub_values_count)
@@ -331,14 +361,13 @@ class AnalogGaugeInnerWidget(PlotWidget):
         scale_line_outer_start = self.wdgt_width / 2
         scale_line_lenght = (self.wdgt_width / 2) - (self.wdgt_width / 40)
         for _ in range((self.scale_values_count * self.scale_sub_values_count) + 1):
-            my_painter.drawLine(scale_line_lenght, 0, scale_line_outer_start, 0)
-            my_painter.rotate(steps_size)
+            painter.drawLine(scale_line_lenght, 0, scale_line_outer_start, 0)
+            painter.rotate(steps_size)
+        painter.restore()
 
-    def draw_values_text(self):
+    def draw_values_text(self, painter):
         """Draw the current value text near the lower center of the dial."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
+        painter.save()
         painter.translate(self.width() / 2, self.height() / 2)
         font = QFont(self.value_font, self.value_fontsize)
         fm = QFontMetrics(font)
@@ -352,7 +381,7 @@ class AnalogGaugeInnerWidget(PlotWidget):
         text = str(int(self.value))
         w = fm.boundingRect(text).width() + 1
         h = fm.height()
-        painter.setFont(QFont(self.value_font, self.value_fontsize))
+        painter.setFont(font)
 
         angle_end = float(self.scale_angle_start_value + self.scale_angle_size - 360)
         angle = (angle_end - self.scale_angle_start_value) / 2 + self.scale_angle_start_value
@@ -368,27 +397,28 @@ class AnalogGaugeInnerWidget(PlotWidget):
             text,
         ]
         painter.drawText(text[0], text[1], text[2], text[3], text[4], text[5])
+        painter.restore()
 
-    def draw_center_point(self, diameter=30):
+    def draw_center_point(self, painter, diameter=30):
         """Draw the center circle cap.
 
         Parameters
         ----------
+        painter : QPainter
+            Active painter on the widget.
         diameter : int, optional
             The diameter of the center circle in pixels. Default is 30.
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
+        painter.save()
         painter.translate(self.width() / 2, self.height() / 2)
         painter.setPen(Qt.NoPen)
         painter.setBrush(self.center_color)
         painter.drawEllipse(int(-diameter / 2), int(-diameter / 2), int(diameter), int(diameter))
+        painter.restore()
 
-    def draw_needle(self):
+    def draw_needle(self, painter):
         """Draw the needle polygon rotated to the current value angle."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.save()
         painter.translate(self.width() / 2, self.height() / 2)
         painter.setPen(Qt.NoPen)
         painter.setBrush(self.needle_color)
@@ -403,6 +433,31 @@ class AnalogGaugeInnerWidget(PlotWidget):
         )
 
         painter.drawConvexPolygon(self.needle[0])
+        painter.restore()
+
+    def render_static_layer(self):
+        """Render the value-independent part of the dial (markers and scale labels).
+
+        Returns
+        -------
+        QPixmap
+            Transparent pixmap of the widget size, at the screen pixel ratio.
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(
+            max(1, int(self.width() * ratio)), max(1, int(self.height() * ratio))
+        )
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        # draw scale marker lines
+        self.draw_small_markers(painter)
+        self.draw_large_markers(painter)
+        # draw scale marker value text
+        self.draw_markers_values_text(painter)
+        painter.end()
+        return pixmap
 
     def resizeEvent(self, event):
         """
@@ -418,7 +473,7 @@ class AnalogGaugeInnerWidget(PlotWidget):
 
     def paintEvent(self, event):
         """
-        Paint the complete dial: pie band, markers, labels, needle, and center.
+        Paint the dial: pie band, cached markers and labels, value, needle and center.
         Parameters
         ----------
         event : QPaintEvent
@@ -426,25 +481,25 @@ class AnalogGaugeInnerWidget(PlotWidget):
             (Unused but required by the Qt signature.)
         """
         _ = event  # Unused parameter
-        # Center the coords origin with the widget
+        if self.static_layer is None:
+            self.static_layer = self.render_static_layer()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
         # colored pie area
-        self.draw_polygon()
+        self.draw_polygon(painter)
 
-        # draw scale marker lines
-        self.draw_small_markers()
-        self.draw_large_markers()
-
-        # draw scale marker value text
-        self.draw_markers_values_text()
+        # scale marker lines and values text (cached)
+        painter.drawPixmap(0, 0, self.static_layer)
 
         # Display Value
-        self.draw_values_text()
+        self.draw_values_text(painter)
 
         # draw needle
-        self.draw_needle()
+        self.draw_needle(painter)
 
         # Draw Center Point
-        self.draw_center_point(diameter = self.wdgt_width / 6)
+        self.draw_center_point(painter, diameter = self.wdgt_width / 6)
+        painter.end()
 
 class AnalogGaugeWidget(PlotWidget):
     """Container widget that hosts the inner analog gauge and a title label.
@@ -29,8 +29,6 @@ Responsibilities:
 - Consume the newest sample from the queue on each update and repaint.
 """
 
-from PySide6.QtWidgets import QLabel
-
 from stdatalog_gui.Widgets.Plots.ClassifierOutputWidget import ClassifierOutputWidget
 
 class AnomalyDetectorWidget(ClassifierOutputWidget):
@@ -97,39 +95,16 @@ class AnomalyDetectorWidget(ClassifierOutputWidget):
         -----
         - Expects the internal queue to provide items shaped like `(class_id, conf)`
             when `with_confidence` is True, otherwise `(class_id, _)`.
-        - Highlights the predicted class, dims others, and updates confidence text.
+        - Highlights the latest predicted class, dims the previous one, and updates the
+            confidence text.
         """
         if len(self._data[0]) > 0:
-            # Extract all data from the queue (pop)
-            one_reduced_t_interval = [self._data[0].popleft() for _i in range(len(self._data[0]))]
-            ort = one_reduced_t_interval[0][0]
+            # Only the latest prediction of the interval is displayed
+            ort = self._data[0][-1]
+            self._data[0].clear()
             if self.with_confidence:
-                confidence = one_reduced_t_interval[0][1]
+                confidence = ort[1]
                 self.class_confidence_value.setText(
                     str(round((confidence * 100.0), 2)) + " %"
                 )
-            class_id = int(ort)
-            class_names = list(self.output_class_widget.keys())
-            class_name = class_names[class_id]
-            for cn in class_names:
-                if cn == class_name:
-                    self.output_class_widget[cn].out_class_image.setPixmap(
-                        self.output_class_pixmaps[cn][0]
-                    )
-                    self.output_class_widget[cn].setEnabled(True)
-                    self.output_class_widget[cn].findChild(
-                        QLabel, "out_class_name"
-                    ).setStyleSheet(
-                        "color: #a4c238; font-size: 30px;"
-                    )
-                else:
-                    self.output_class_widget[cn].out_class_image.setPixmap(
-                        self.output_class_pixmaps[cn][1]
-                    )
-                    self.output_class_widget[cn].setEnabled(False)
-                    self.output_class_widget[cn].findChild(
-                        QLabel, "out_class_name"
-                    ).setStyleSheet(
-                        "color: #383D48; font-size: 20px;"
-                    )
-        self.app_qt.processEvents()
+            self.show_class(int(ort[0]))
@@ -59,6 +59,8 @@ class CheckBoxListWidget(PlotWidget):
         Emitted when value changes (not used directly by this implementation).
     """
 
+    render_continuously = False  # redrawn only when new data are added
+
     valueChanged = Signal(int)
 
     def __init__(
@@ -147,3 +149,4 @@ class CheckBoxListWidget(PlotWidget):
             Expected to contain a primary index/value at position 0.
         """
         self.l_data = data[0]
+        self.dirty = True
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    ClassHighlight.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""
+Incremental highlighting of the output class cards of the classifier widgets.
+
+`ClassHighlightMixin` remembers the class currently highlighted, so a new prediction
+restyles only the previous and the new winner card (nothing when it is unchanged).
+"""
+
+_UNKNOWN = object()
+
+class ClassHighlightMixin:
+    """Class card highlighting shared by the classifier output widgets.
+
+    The widget fills `output_class_widget` (card widget), `output_class_pixmaps`
+    ((enabled, disabled) pixmaps) and `output_class_labels` ((image label, name label))
+    for each class name, after calling `init_class_highlight`.
+    """
+
+    def init_class_highlight(self, out_classes):
+        """Reset the highlight state.
+
+        Parameters
+        ----------
+        out_classes : dict
+            Output classes (class name: image path); their order defines the class ids.
+        """
+        self.output_class_labels = {} # {class name: (image label, name label)}
+        self.class_names = list(out_classes)
+        # Class currently highlighted (None: all dimmed, _UNKNOWN: initial layout)
+        self.__shown_class = _UNKNOWN
+
+    def show_class(self, class_id):
+        """Highlight an output class, restyling only the cards that change.
+
+        Parameters
+        ----------
+        class_id : int | None
+            Index of the class to highlight, in `out_classes` order. None dims all classes.
+        """
+        if class_id == self.__shown_class:
+            return
+        if self.__shown_class is _UNKNOWN:
+            for cn in self.class_names:
+                self.__set_class_highlight(cn, False)
+        elif self.__shown_class is not None:
+            self.__set_class_highlight(self.class_names[self.__shown_class], False)
+        if class_id is not None:
+            self.__set_class_highlight(self.class_names[class_id], True)
+        self.__shown_class = class_id
+
+    def __set_class_highlight(self, class_name, highlighted):
+        class_image, class_name_label = self.output_class_labels[class_name]
+        if highlighted:
+            class_image.setPixmap(self.output_class_pixmaps[class_name][0])
+            class_name_label.setStyleSheet("color: #a4c238; font-size: 30px;")
+        else:
+            class_image.setPixmap(self.output_class_pixmaps[class_name][1])
+            class_name_label.setStyleSheet("color: #383D48; font-size: 20px;")
+        self.output_class_widget[class_name].setEnabled(highlighted)
@@ -20,19 +20,18 @@
 """
 
 from collections import deque
-import os
 
 from PySide6.QtCore import Qt, QPoint, Slot
 from PySide6.QtGui import QPainter, QPixmap
 from PySide6.QtWidgets import QFrame, QLabel, QPushButton, QSizePolicy
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtDesigner import QPyDesignerCustomWidgetCollection
 
-import stdatalog_gui
+from stdatalog_gui.Utils.UiFormCache import load_form
+from stdatalog_gui.Widgets.Plots.ClassHighlight import ClassHighlightMixin
 from stdatalog_gui.Widgets.Plots.PlotWidget import PlotWidget
 from stdatalog_gui.Widgets.Plots.PlotWidget import PlotLabel
 
-class ClassifierOutputWidget(PlotWidget):
+class ClassifierOutputWidget(ClassHighlightMixin, PlotWidget):
     def __init__(self, controller, comp_name, comp_display_name, out_classes, ai_tool = None, with_signal=False, with_confidence=True, p_id=0, parent=None, left_label=None):
         """AI is creating summary for __init__
         Args:
@@ -58,6 +57,7 @@ class ClassifierOutputWidget(PlotWidget):
         self.ai_tool = ai_tool
         self.output_class_widget = {}
         self.output_class_pixmaps = {}
+        self.init_class_highlight(out_classes)
         
         self.with_signal = with_signal
         self.with_confidence = with_confidence
@@ -68,8 +68,7 @@ class ClassifierOutputWidget(PlotWidget):
         
         # New Customized Graphic layout
         QPyDesignerCustomWidgetCollection.registerCustomWidget(ClassifierOutputWidget, module="ClassifierOutputWidget")
-        loader = QUiLoader()
-        self.plot_widget = loader.load(os.path.join(os.path.dirname(stdatalog_gui.__file__),"UI","classifier_output_widget.ui"), parent)
+        self.plot_widget = load_form("classifier_output_widget.ui", parent)
         title_frame = self.plot_widget.findChild(QFrame,"frame_title")
         self.frame_powered_by_ai =  self.plot_widget.findChild(QFrame,"frame_powered_by_ai")
         self.contents_frame = self.plot_widget.findChild(QFrame,"frame_contents")
@@ -122,15 +121,16 @@ class ClassifierOutputWidget(PlotWidget):
         title_frame.layout().addWidget(title_label)
         
         for output_class in self.out_classes:
-            self.output_class_widget[output_class] = loader.load(os.path.join(os.path.dirname(stdatalog_gui.__file__),"UI","output_class_widget.ui"), parent)
+            self.output_class_widget[output_class] = load_form("output_class_widget.ui", parent)
             class_name = self.output_class_widget[output_class].findChild(QLabel,"out_class_name")
             class_name.setText(output_class)
             if output_class != "ISPU": #NOTE Done for ISPU CES2023 Demo purposes
-                self.output_class_widget[output_class].out_class_name.setStyleSheet("color: #383D48; font-size: 20px;")
+                class_name.setStyleSheet("color: #383D48; font-size: 20px;")
             else:
-                self.output_class_widget[output_class].out_class_name.setStyleSheet("color: #3cb4e6; font-size: 20px;")
+                class_name.setStyleSheet("color: #3cb4e6; font-size: 20px;")
             class_pixmap = QPixmap(self.out_classes[output_class])
             class_image:QLabel = self.output_class_widget[output_class].findChild(QLabel,"out_class_image")
+            self.output_class_labels[output_class] = (class_image, class_name)
             enabled_pixmap = class_pixmap
             disabled_pixmap = self.setOpacity(class_pixmap, 0.1)
             self.output_class_pixmaps[output_class] = (enabled_pixmap, disabled_pixmap)
@@ -178,34 +178,19 @@ class ClassifierOutputWidget(PlotWidget):
         if len(self._data[0]) > 0: 
             if not self.is_plotting_out:
                 self.is_plotting_out = True
-            # Extract all data from the queue (pop)    
-            one_reduced_t_interval = [self._data[0].popleft() for _i in range(len(self._data[0]))]
-            ort = one_reduced_t_interval[0][0]
+            # Only the latest prediction of the interval is displayed
+            ort = self._data[0][-1]
+            self._data[0].clear()
             if self.with_confidence:
-                confidence = one_reduced_t_interval[0][1]
+                confidence = ort[1]
                 self.class_confidence_value.setText(str(round((confidence * 100.0), 2)) + " %")
-            class_id = int(ort)
-            class_names = list(self.output_class_widget.keys())
-            class_name = class_names[class_id]
-            for cn in class_names:
-                if cn == class_name:
-                    self.output_class_widget[cn].out_class_image.setPixmap(self.output_class_pixmaps[cn][0])
-                    self.output_class_widget[cn].setEnabled(True)
-                    self.output_class_widget[cn].findChild(QLabel,"out_class_name").setStyleSheet("color: #a4c238; font-size: 30px;")
-                else:
-                    self.output_class_widget[cn].out_class_image.setPixmap(self.output_class_pixmaps[cn][1])
-                    self.output_class_widget[cn].setEnabled(False)
-                    self.output_class_widget[cn].findChild(QLabel,"out_class_name").setStyleSheet("color: #383D48; font-size: 20px;")
+            self.show_class(int(ort[0]))
         else:
             if self.is_plotting_out:
-                for cn in list(self.output_class_widget.keys()):
-                    self.output_class_widget[cn].out_class_image.setPixmap(self.output_class_pixmaps[cn][1])
-                    self.output_class_widget[cn].setEnabled(False)
-                    self.output_class_widget[cn].findChild(QLabel,"out_class_name").setStyleSheet("color: #383D48; font-size: 20px;")
+                self.show_class(None)
                 self.is_plotting_out = False
                 if self.with_confidence:
                     self.class_confidence_value.setText("--- %")
-        self.app_qt.processEvents()
 
     def add_data(self, data):
         self._data[0].append(data[0])
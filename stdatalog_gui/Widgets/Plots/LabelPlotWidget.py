@@ -58,6 +58,8 @@ class LabelPlotWidget(PlotWidget):
         Optional parent widget.
     """
 
+    render_continuously = False  # redrawn only when new data are added
+
     def __init__(
         self,
         controller,
@@ -141,3 +143,4 @@ class LabelPlotWidget(PlotWidget):
             Expected to contain the numeric value at index 0.
         """
         self.value = data[0]
+        self.dirty = True
@@ -306,13 +306,10 @@ class PlotBarFFTWidget(PlotBarWidget):
     def update_plot(self):
         """Consume buffered data, compute PSD, update bars and peak visualization."""
         if self.buffering_timer_counter == 0:
-            if len(self._data[0]) > 0:
-                # Extract all data from the queue (pop)
-                one_reduced_t_interval = [
-                    self._data[0].popleft() for _i in range(len(self._data[0]))
-                ]
-                y_raw_values = np.array(one_reduced_t_interval)
-                y_array_mean = np.mean(y_raw_values, axis=0)
+            # Extract all data from the buffer (n_bars, n)
+            one_reduced_t_interval = self._data.read()
+            if one_reduced_t_interval.shape[1] > 0:
+                y_array_mean = np.mean(one_reduced_t_interval, axis=1)
                 # Power spectral density
                 y_raw_values = np.square(y_array_mean)
                 y_raw_values = y_raw_values / (self.fft_len * self.fft_input_freq_hz)
@@ -337,7 +334,6 @@ class PlotBarFFTWidget(PlotBarWidget):
                     if self.fft_peak_label_shown:
                         self.__show_hide_peak_reveal(False)
                         self.fft_peak_label_shown = False
-            self.app_qt.processEvents()
         else:
             # Increment the buffering counter
             #   (skip a plot timer interval to bufferize data from sensors)
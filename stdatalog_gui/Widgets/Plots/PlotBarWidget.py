@@ -26,7 +26,7 @@ relying on the common buffering and rendering logic implemented here.
 
 Responsibilities
 ----------------
-- Maintain a fixed-size queue of incoming samples and compute display values.
+- Maintain a preallocated ring buffer of incoming samples and compute display values.
 - Render a bar graph and update it periodically when logging is active.
 - Expose base slot methods for logging/detection that start or stop the timer.
 
@@ -39,12 +39,11 @@ Notes
     multiplier (``timer_interval_ms``), allowing sensors to buffer data between updates.
 """
 
-from collections import deque
-
 import numpy as np
 from PySide6.QtCore import Slot, QSize
 import pyqtgraph as pg
 
+from stdatalog_gui.Utils.RingBuffer import RingBuffer
 from stdatalog_gui.Widgets.Plots.PlotWidget import PlotWidget
 
 class PlotBarWidget(PlotWidget):
@@ -83,9 +82,9 @@ class PlotBarWidget(PlotWidget):
         Number of bars displayed in the graph.
     bar_width : float
         Width of each bar.
-    _data : dict[int, collections.deque]
-        Mapping from channel index to a deque that buffers incoming samples. Only the
-        ``0`` channel is used by this widget.
+    _data : RingBuffer
+        ``(n_bars, capacity)`` buffer of incoming sample vectors, one column per
+        sample. The capacity is bounded to about 200000 values in total.
     x : numpy.ndarray
         The x positions for the bars.
     bargraph : pyqtgraph.BarGraphItem
@@ -94,6 +93,8 @@ class PlotBarWidget(PlotWidget):
         Effective update interval in milliseconds (derived from the base timer).
     """
 
+    render_continuously = False  # redrawn only when new data are added
+
     def __init__(
         self,
         controller,
@@ -115,8 +116,7 @@ class PlotBarWidget(PlotWidget):
         self.n_bars = n_bars
         self.bar_width = bar_width
 
-        self._data = dict()  # dict of queues
-        self._data[0] = deque(maxlen=200000)
+        self._data = RingBuffer(n_bars, max(1, 200000 // n_bars))
 
         # create list for y-axis
         y1 = np.zeros(n_bars)
@@ -220,29 +220,25 @@ class PlotBarWidget(PlotWidget):
         Notes
         -----
         - Uses a skip interval via ``buffering_timer_counter`` to allow sensor buffering.
-        - Computes the mean across queued samples for each bar and updates the graph.
+        - Computes the mean across buffered samples for each bar and updates the graph.
 
         Returns
         -------
         None
         """
         if self.buffering_timer_counter == 0:
-            if len(self._data[0]) > 0:
-                # Extract all data from the queue (pop)
-                one_reduced_t_interval = [
-                    self._data[0].popleft() for _i in range(len(self._data[0]))
-                ]
-                y_value = np.array(one_reduced_t_interval)
-                y_array_mean = np.mean(y_value, axis=0)
+            # Extract all data from the buffer (n_bars, n)
+            one_reduced_t_interval = self._data.read()
+            if one_reduced_t_interval.shape[1] > 0:
+                y_array_mean = np.mean(one_reduced_t_interval, axis=1)
                 self.bargraph.setOpts(x=self.x, height=y_array_mean)
-            self.app_qt.processEvents()
         else:
             # Increment the buffering counter
             # (skip a plot timer interval to bufferize data from sensors)
             self.buffering_timer_counter += 1
 
     def add_data(self, data):
-        """Append a new sample to the primary queue.
+        """Append a new sample to the ring buffer.
 
         Parameters
         ----------
@@ -254,4 +250,5 @@ class PlotBarWidget(PlotWidget):
         -------
         None
         """
-        self._data[0].append(data[0])
+        self._data.write(np.reshape(data[0], (-1, self.n_bars)).T)
+        self.dirty = True
@@ -436,6 +436,9 @@ class PlotHeatmapWidget(PlotWidget):
         Emitted when an ROI threshold is exceeded (not used in current flow).
     """
 
+    # The queue is drained and presence detection runs in update_plot
+    update_offscreen = True
+
     sig_threshold_exceded = Signal(int, int, int)  # roi_id, current_value, threshold_value
 
     def __init__(
@@ -479,8 +482,14 @@ class PlotHeatmapWidget(PlotWidget):
         self.validity_mask = np.zeros(shape=(self.heatmap_shape), dtype='i')
         self.zones = PlotHeatmapWidget.create_matrix(self.heatmap_shape[0])
         self.rois = {i: {} for i in range(ROI_NUMBER)}
+        self.roi_indexes = dict()  # {roi_id: (rows, cols)} index arrays of the ROI pixels
+        for roi_id in range(ROI_NUMBER):
+            self.__update_roi_indexes(roi_id)
         self.underthresh = {i: [] for i in range(ROI_NUMBER)}
         self.global_underthresh = np.zeros(shape=(self.heatmap_shape), dtype='i')
+        # Last values/validity shown by the text overlays (None: overlays must be redrawn)
+        self.__shown_data = None
+        self.__shown_invalid = None
         self.is_roi_flashing = {i:False for i in range(ROI_NUMBER)}
 
         self.selected_roi_id = 0
@@ -559,6 +568,44 @@ class PlotHeatmapWidget(PlotWidget):
                 self.graph_widget.addItem(text_item)
                 row.append(text_item)
             self.text_items.append(row)
+        self.__shown_data = None
+        self.__shown_invalid = None
+
+    def __update_text_items(self, l_data, out_of_range, invalid):
+        # Only cells whose value or validity changed since the last frame are touched
+        if self.__shown_data is None or self.__shown_data.shape != l_data.shape:
+            text_changed = np.ones(l_data.shape, dtype=bool)
+            color_changed = text_changed
+        else:
+            text_changed = l_data != self.__shown_data
+            color_changed = invalid != self.__shown_invalid
+        rows, cols = np.nonzero(text_changed)
+        for i, j, value, oor in zip(
+            rows.tolist(), cols.tolist(),
+            l_data[rows, cols].tolist(), out_of_range[rows, cols].tolist(),
+        ):
+            self.text_items[j][i].setText("X" if oor else str(value))
+        rows, cols = np.nonzero(color_changed)
+        for i, j, inv in zip(rows.tolist(), cols.tolist(), invalid[rows, cols].tolist()):
+            # red: invalid, green: valid
+            self.text_items[j][i].setColor(self.red_color if inv else self.green_color)
+        self.__shown_data = np.array(l_data, copy=True)
+        self.__shown_invalid = invalid
+
+    @staticmethod
+    def __roi_index_arrays(roi):
+        """Return the `(rows, cols)` index arrays of the pixels of an ROI."""
+        rows = np.fromiter((p[0] for p in roi), dtype=np.intp, count=len(roi))
+        cols = np.fromiter((p[1] for p in roi), dtype=np.intp, count=len(roi))
+        return rows, cols
+
+    def __update_roi_indexes(self, roi_id):
+        rows, cols = PlotHeatmapWidget.__roi_index_arrays(self.rois[roi_id])
+        in_range = (
+            (rows >= 0) & (rows < self.heatmap_shape[0])
+            & (cols >= 0) & (cols < self.heatmap_shape[1])
+        )
+        self.roi_indexes[roi_id] = (rows[in_range], cols[in_range])
 
     def update_plot_characteristics(self, heatmap_shape):
         """Reset internal arrays and overlays for a new heatmap shape."""
@@ -568,6 +615,8 @@ class PlotHeatmapWidget(PlotWidget):
         self._data.clear()
         self.global_underthresh = np.zeros(shape=(self.heatmap_shape), dtype='i')
         self.validity_mask = np.zeros(shape=(self.heatmap_shape), dtype='i')
+        for roi_id in range(ROI_NUMBER):
+            self.__update_roi_indexes(roi_id)
         self.heatmap_img.setImage(self.data, levels=[MIN_DIST, MAX_DIST])
         self.graph_widget.getPlotItem()._updateView()
         # Add text items for each pixel
@@ -596,41 +645,21 @@ class PlotHeatmapWidget(PlotWidget):
             l_data = self._data.popleft()
             if l_data.shape == self.heatmap_shape:
                 self.heatmap_img.setImage(l_data, levels=[MIN_DIST, MAX_DIST])
-                for i in range(self.heatmap_shape[0]):
-                    for j in range(self.heatmap_shape[1]):
-                        curr_data = l_data[i][j]
-                        curr_valid_mask = self.validity_mask[i][j]
-                        if curr_data > MAX_DIST:
-                            self.text_items[j][i].setText("X")
-                            curr_valid_mask = VALIDITY_MASK_INVALID_VALUE
-                            self.global_underthresh[i][j] = 0
-                        else:
-                            self.text_items[j][i].setText(str(curr_data))
-
-                        if curr_valid_mask == VALIDITY_MASK_INVALID_VALUE:
-                            self.text_items[j][i].setColor(self.red_color) #red, invalid
-                            self.global_underthresh[i][j] = 0
-                        else:
-                            self.text_items[j][i].setColor(self.green_color) #green, valid
-                            if curr_data != 0 and curr_data < self.presence_threshold:
-                                self.global_underthresh[i][j] = 1
-                            else:
-                                self.global_underthresh[i][j] = 0
-                        for k in range(ROI_NUMBER):
-                            if len(self.rois[k].keys()) == 0:
-                                self.underthresh[k] = []
-                            elif (i,j) in self.rois[k].keys():
-
-                                if curr_valid_mask == VALIDITY_MASK_INVALID_VALUE:
-                                    if (i,j) in self.underthresh[k]:
-                                        self.underthresh[k].remove((i,j))
-                                else:
-                                    if curr_data < self.roi_thresolds[k]:
-                                        if (i,j) not in self.underthresh[k]:
-                                            self.underthresh[k].append((i,j))
-                                    else:
-                                        if (i,j) in self.underthresh[k]:
-                                            self.underthresh[k].remove((i,j))
+                out_of_range = l_data > MAX_DIST
+                invalid = out_of_range | (self.validity_mask == VALIDITY_MASK_INVALID_VALUE)
+                self.__update_text_items(l_data, out_of_range, invalid)
+
+                valid = ~invalid
+                self.global_underthresh = (
+                    valid & (l_data != 0) & (l_data < self.presence_threshold)
+                ).astype('i')
+                for k in range(ROI_NUMBER):
+                    rows, cols = self.roi_indexes[k]
+                    if len(rows) == 0:
+                        self.underthresh[k] = []
+                        continue
+                    hits = valid[rows, cols] & (l_data[rows, cols] < self.roi_thresolds[k])
+                    self.underthresh[k] = list(zip(rows[hits].tolist(), cols[hits].tolist()))
                 if (
                     bool(np.any(self.global_underthresh)) == True
                     and not np.all(0)
@@ -791,3 +820,4 @@ class PlotHeatmapWidget(PlotWidget):
             self.graph_widget.removeItem(self.rois[self.selected_roi_id][(x,y)])
             del self.rois[self.selected_roi_id][(x,y)]
             self.zones[(x,y)] = False
+        self.__update_roi_indexes(self.selected_roi_id)
@@ -18,6 +18,8 @@ import numpy as np
 from functools import partial
 
 from stdatalog_gui.Utils.PlotParams import SensorCameraPlotParams
+from stdatalog_gui.Utils.FrameFileWriter import FrameFileWriter
+from stdatalog_gui.Utils.JpegFrameAssembler import JPEG_EOI, JpegFrameAssembler, to_bytes
 
 from PySide6.QtCore import Slot, Qt, QTimer, QPoint
 from PySide6.QtGui import QColor, QIcon, QIntValidator, QPainter, QPen, QBrush, QPixmap
@@ -156,6 +158,9 @@ class CustomImagePlotWidget(CustomPGPlotWidget):
 
 class PlotImageWidget(PlotWidget):
 
+    # Frames are cut, saved and removed from the buffer by update_plot
+    update_offscreen = True
+
     def __init__(self, controller, comp_name, comp_display_name, width, height, plot_label= "", p_id = 0, parent=None):
         super().__init__(controller, comp_name, comp_display_name, p_id, parent, plot_label)
 
@@ -247,6 +252,11 @@ class PlotImageWidget(PlotWidget):
         self.cmx_matrix = np.array(self.cmx_coeffs_with_signs, dtype=np.float32).reshape((3, 3))
         self.called_update = 0
         self.called_update_and_visualize = 0
+        # JPEG (pixel_format 8) frames are cut from the stream as they arrive
+        self.jpeg_assembler = JpegFrameAssembler()
+        self.skipped_frames = 0 # complete JPEG frames saved but not displayed
+        # JPEG frame files are written by a worker thread, not by the plot update
+        self.frame_writer = FrameFileWriter()
 
 
 
@@ -263,40 +273,53 @@ class PlotImageWidget(PlotWidget):
                 self.data_end = 0
                 self.first_data = 0
                 self.timer.stop()
+                if self.pixel_format == 8:
+                    writer_stats = self.frame_writer.get_stats()
+                    print("Sensor {0}: {1} JPEG frames, {2} dropped, {3} not displayed, {4} not saved".format(
+                        self.comp_name, self.jpeg_assembler.frames,
+                        self.jpeg_assembler.dropped_frames, self.skipped_frames,
+                        writer_stats["dropped"] + writer_stats["errors"]))
+                self.jpeg_assembler.clear()
+                self.skipped_frames = 0
         else: # interface == 0
             print("Component {} is logging on SD Card: {}".format(self.comp_name,status))
 
     
     def find_jpeg_end_marker(self, buffer):
-        #marker = b'\xff\xd9'
-        marker = ['0xff', '0xd9']
-
-        hex_array = [hex(x) for x in np.array(buffer).astype(np.uint8)]
+        index = to_bytes(buffer).find(JPEG_EOI)
+        return index + len(JPEG_EOI) if index >= 0 else -1 # first index after the marker, -1 if not found
+
+    def update_jpeg_plot(self):
+        # All the frames completed since the previous update are saved, the newest is displayed
+        frames = self.jpeg_assembler.pop_frames()
+        if len(frames) == 0:
+            return
+        self.called_update_and_visualize +=1
+        folder = self.controller.get_acquisition_folder()
+        for frame in frames:
+            self.count_show +=1
+            self.frame_writer.save("{0}/img_jpg_{1}.jpg".format(folder, self.count_show), frame)
+        self.skipped_frames += len(frames) - 1
+        try:
+            image = Image.open(io.BytesIO(frames[-1])).rotate(-90, expand = True)
+        except Exception:
+            image = Image.open(start_image).rotate(-90, expand = True)
+            print("An exception occurred")
+        self.img.setImage(np.array(image))
 
-        # Iterate through the byte array to find the marker
-        for i in range(len(hex_array) - 1):
-            if hex_array[i:i+2] == marker:
-                return i+2  # Return the first index after the marker
-    
-        return -1  # Return -1 if the marker is not found
-    
     def update_plot(self):
 
         self.called_update +=1;
         if self.pixel_format == 8:
-            self.total_bytes_to_show = len(self.data)
-            self.data_end = self.find_jpeg_end_marker(self.data)
-            if (self.data_end < 0):
-                return
-            self.total_bytes = self.data_end
-
-        else:  
-            self.total_bytes_to_show = len(self.data)
-            self.data_end = self.total_bytes
-            
-            if (self.total_bytes_to_show < self.total_bytes):
-                # print("not enough data to plot {0} < {1}".format(self.total_bytes_to_show, self.total_bytes))
-                return
+            self.update_jpeg_plot()
+            return
+
+        self.total_bytes_to_show = len(self.data)
+        self.data_end = self.total_bytes
+
+        if (self.total_bytes_to_show < self.total_bytes):
+            # print("not enough data to plot {0} < {1}".format(self.total_bytes_to_show, self.total_bytes))
+            return
         
         self.called_update_and_visualize +=1;
 
@@ -495,20 +518,6 @@ class PlotImageWidget(PlotWidget):
                     self.img.setImage(np.array(image))
                     # Save the image
                     image.save("{0}/img_y8_{1}.bmp".format(folder, self.count_show))
-                case 8:
-                    self.bytes_per_pixel = 1 #JPG
-                    uint_buffer = np.array(image_data, dtype=np.float32).astype(np.uint8)
-                    byte_array = bytearray(uint_buffer.tobytes())
-                    
-                    try:
-                        image = Image.open(io.BytesIO(byte_array)).rotate(-90, expand = True)
-                    except:
-                        image = Image.open(start_image).rotate(-90, expand = True)
-                        print("An exception occurred")
-                    
-                    self.img.setImage(np.array(image))
-                    # Save the image
-                    image.save("{0}}/img_jpg_{1}.bmp".format(folder, self.count_show))
                 case _:
                     self.bytes_per_pixel = 0
             #print("remain data len = {0} after plot".format(len(self.data)))
@@ -618,12 +627,7 @@ class PlotImageWidget(PlotWidget):
             #     #self.data.clear()          
         else:
             # its necessary update the jpeg with the same protocol shown before, this part is the older one
-            lenght=len(data[0])
-            print("numero di dati {0}".format(lenght))
-            if lenght > 0:
-                self.data_end_marker = self.find_jpeg_end_marker(data[0])
-                lenght = self.data_end_marker if self.data_end_marker > 0 else lenght
-                self.data.extend(data[0][0:lenght])
+            if len(data[0]) > 0:
+                self.jpeg_assembler.feed(data[0])
             else:
                 print("dati non arrivati")
-                #self.data.clear()
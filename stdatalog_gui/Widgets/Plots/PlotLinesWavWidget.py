@@ -230,6 +230,17 @@ class PlotLinesWavWidget(PlotLinesWidget):
         else:
             self.frame_wav_control.setVisible(False)
 
+    def on_wav_conversion_progress(self, percentage):
+        """Show the WAV conversion progress.
+
+        Parameters
+        ----------
+        percentage : int
+            Completed percentage of the conversion.
+        """
+        self.wav_progress_bar.setValue(percentage)
+        self.waiting_dialog.set_progress(percentage, 100)
+
     def on_wav_conversion_finished(self, comp_name, converted_wav_fpath):
         """Callback invoked when the WAV conversion thread has finished.
 
@@ -241,6 +252,7 @@ class PlotLinesWavWidget(PlotLinesWidget):
             Path of the converted WAV file, or None/empty on failure.
         """
         self.waiting_dialog.loadingDone()
+        self.wav_progress_bar.setValue(0)
         if converted_wav_fpath is None or converted_wav_fpath == "":
             self.playing_wav_frame.setEnabled(False)
             self.pushButton_convert_wav.setStyleSheet(STDTDL_PushButton.invalid)
@@ -264,12 +276,16 @@ class PlotLinesWavWidget(PlotLinesWidget):
                     "Please wait..."
                 ),
                 self,
+                cancel_callback=getattr(self.controller, "cancel_wav_conversion", None),
             )
+            self.wav_progress_bar.setMaximum(100)
+            self.wav_progress_bar.setValue(0)
             self.controller.start_wav_conversion_thread(
                 self.comp_name,
                 self.start_time_spinbox.value(),
                 self.end_time_spinbox.value(),
                 self.on_wav_conversion_finished,
+                self.on_wav_conversion_progress,
             )
 
     @Slot()
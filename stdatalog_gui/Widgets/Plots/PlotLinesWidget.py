@@ -19,18 +19,19 @@
 Multi-line time series plot widget with resampling and rolling window display.
 
 This module implements a general-purpose line plot that can render multiple dimensions
-over a fixed time window. Incoming data are buffered in per-axis queues, resampled to a
-uniform number of points per timer interval, and appended to rolling y-queues that match
-the x-axis sampling. The widget integrates with the common `PlotWidget` base to share
+over a fixed time window. Incoming data blocks are buffered in a preallocated NumPy ring
+buffer, reduced to a uniform number of points per timer interval (linear resampling or
+peak-preserving min/max decimation), and appended to a rolling window that matches the
+x-axis sampling. The widget integrates with the common `PlotWidget` base to share
 timing, axis labels, and logging/detecting signals.
 """
-from collections import deque
-
 import numpy as np
 from PySide6.QtCore import Slot
 import pyqtgraph as pg
 
+from stdatalog_gui.Utils.Decimation import DecimationMode, decimate, resample_linear
 from stdatalog_gui.Utils.PlotParams import LinesPlotParams
+from stdatalog_gui.Utils.RingBuffer import RingBuffer, RollingBuffer
 from stdatalog_gui.Widgets.Plots.PlotWidget import PlotWidget
 
 class PlotLinesWidget(PlotWidget):
@@ -59,12 +60,15 @@ class PlotLinesWidget(PlotWidget):
         Color palette used to style each axis curve (cycled if needed).
     graph_curves : dict[int, pg.PlotDataItem]
         Mapping from axis index to the pyqtgraph curve item.
-    _data : dict[int, deque]
-        Per-axis queue collecting raw incoming samples.
-    y_queue : dict[int, deque]
-        Per-axis rolling window buffer shown on screen.
+    _data : RingBuffer
+        `(dimension, capacity)` buffer collecting raw incoming samples.
+    y_queue : RollingBuffer
+        `(dimension, plot_len)` rolling window shown on screen.
     current_x : float
         Current x-axis head position (seconds).
+    decimation_mode : DecimationMode
+        How each timer interval of raw samples is reduced to `plot_t_interval_size`
+        points. Defaults to `DecimationMode.LINEAR`.
     """
 
     def __init__(
@@ -93,9 +97,10 @@ class PlotLinesWidget(PlotWidget):
         self.graph_curves = dict()
 
         self.one_t_interval_resampled = dict()
-        self._data = dict()  # dict of queues
-        self.y_queue = dict()  # dict of queues
+        self._data = None  # RingBuffer (dimension, capacity)
+        self.y_queue = None  # RollingBuffer (dimension, plot_len)
         self.current_x = 0
+        self.decimation_mode = DecimationMode.LINEAR
 
         self.update_plot_characteristics(plot_params)
 
@@ -117,10 +122,9 @@ class PlotLinesWidget(PlotWidget):
             self.current_x,
             self.plot_len,
         )
+        self._data = RingBuffer(self.plot_params.dimension, 200000)
+        self.y_queue = RollingBuffer(self.plot_params.dimension, self.plot_len)
         for i in range(self.plot_params.dimension):
-            self._data[i] = deque(maxlen=200000)
-            self.y_queue[i] = deque(maxlen=self.plot_len)
-            self.y_queue[i].extend(np.zeros(self.plot_len))
             if len(self.graph_curves) < self.plot_params.dimension:
                 self.graph_curves[i] = self.graph_widget.plot()
                 self.graph_curves[i] = pg.PlotDataItem(
@@ -201,47 +205,46 @@ class PlotLinesWidget(PlotWidget):
         np.ndarray
             Interpolated array of length `targetLen`.
         """
-        original = np.array(original, dtype=float)
-        index_arr = np.linspace(0, len(original) - 1, num=targetLen, dtype=float)
-        index_floor = np.array(index_arr, dtype=int)  # Round down
-        index_ceil = index_floor + 1
-        index_rem = index_arr - index_floor  # Remainder
-
-        val1 = original[index_floor]
-        val2 = original[index_ceil % len(original)]
-        interp = val1 * (1.0 - index_rem) + val2 * index_rem
-        assert(len(interp) == targetLen)
-        return interp
+        original = np.asarray(original, dtype=float)
+        return resample_linear(original[np.newaxis, :], targetLen)[0]
+
+    def set_decimation_mode(self, mode: DecimationMode):
+        """Select how raw samples are reduced to the plot point budget.
+
+        Parameters
+        ----------
+        mode : DecimationMode
+            `LINEAR` interpolation or `MINMAX` (peak-preserving) envelope.
+        """
+        self.decimation_mode = mode
 
     def update_plot(self):
-        """Advance time, resample queued data, and refresh curve visuals."""
+        """Advance time, decimate queued data, and refresh curve visuals."""
         self.x_data = self.x_data + self.timer_interval
-        # for i in range(self.n_curves):
+        # Extract all data received since the last tick (dimension, n)
+        one_reduced_t_interval = self._data.read()
+        if one_reduced_t_interval.shape[1] > 0:  # If data buffer is not empty
+            # Decimate extracted raw data to have the same plot_timer_interval size
+            # (plot len / (time window / times interval(sec)))
+            resampled = decimate(
+                one_reduced_t_interval, self.plot_t_interval_size, self.decimation_mode
+            )
+            for i in range(self.plot_params.dimension):
+                self.one_t_interval_resampled[i] = resampled[i]
+        # Put resampled data (or the last interval, if no new data) into the y window
+        self.y_queue.extend(
+            [self.one_t_interval_resampled[i] for i in range(self.plot_params.dimension)]
+        )
         for i in range(self.plot_params.dimension):
-            if len(self._data[i]) > 0:  # If data queue is not empty
-                # Extract all data from the queue (pop)
-                one_reduced_t_interval = [self._data[i].popleft() for _i in range(len(self._data[i]))]
-                # Resample extracted raw data to have the same plot_timer_interval size
-                # (plot len / (time window / times interval(sec)))
-                self.one_t_interval_resampled[i] = self.resample_linear1D(
-                    one_reduced_t_interval, self.plot_t_interval_size
-                )
-                # Put resampled data into the y data queue
-                self.y_queue[i].extend(self.one_t_interval_resampled[i])
-            else:  # data queue is empty
-                self.y_queue[i].extend(self.one_t_interval_resampled[i])
-            # set extracted resampled data into the plot curve (for each axis)
-            # [x and y will have the same len = (plot len / (time window / times interval(sec)))]
-            self.graph_curves[i].setData(x=self.x_data, y=np.array(self.y_queue[i]))
-        self.app_qt.processEvents()
+            # set the rolling window into the plot curve (for each axis)
+            self.graph_curves[i].setData(x=self.x_data, y=self.y_queue.row(i))
 
     def add_data(self, data):
-        """Append new raw samples for each axis to the per-axis queues.
+        """Append a block of new raw samples to the ring buffer.
 
         Parameters
         ----------
         data : Sequence[Sequence[float]]
             Iterable with one iterable per dimension, each containing new samples.
         """
-        for i in range(self.plot_params.dimension):
-            self._data[i].extend(data[i])
+        self._data.write(data)
@@ -24,22 +24,23 @@ This module defines reusable plot components used by all specific plot widgets:
 - `CustomPGPlotWidget`: wraps `pyqtgraph.PlotWidget` to adjust mouse wheel behavior
     depending on docking state.
 - `PlotWidget`: base QWidget that loads a common UI, sets up a pyqtgraph plot with
-    crosshair and legend, manages timers, and supports pop in/out docking behavior.
+    crosshair and legend, schedules its updates on the controller shared render clock,
+    and supports pop in/out docking behavior.
 """
 
 from abc import abstractmethod
-import os
 
-from PySide6.QtCore import Qt, Slot, QTimer
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QPainter, QFont, QScreen, QPixmap, QIcon
 from PySide6.QtWidgets import QWidget, QFrame, QVBoxLayout, QPushButton, QSizePolicy
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import QApplication
 from PySide6.QtDesigner import QPyDesignerCustomWidgetCollection
 
 import pyqtgraph as pg
 
 import stdatalog_gui
+from stdatalog_gui.Utils.RenderScheduler import RenderTimer
+from stdatalog_gui.Utils.UiFormCache import load_form
 
 import stdatalog_gui.UI.icons
 from pkg_resources import resource_filename
@@ -125,12 +126,21 @@ class PlotWidget(QWidget):
         The pyqtgraph plot widget hosting curves and overlays.
     legend : pg.LegendItem
         Legend used for showing crosshair coordinates.
-    timer : QTimer
-        Timer that triggers `update_plot` at a fixed precision interval.
+    timer : RenderTimer
+        Handle on the controller `RenderScheduler` that triggers `update_plot` every
+        `timer_interval_ms` while the widget is on screen.
+    dirty : bool
+        Set by `add_data` in widgets that only need a redraw when new data arrive.
     is_docked : bool
         Whether the widget is embedded in the parent layout.
     """
 
+    # False for widgets whose update_plot is a no-op until new data are added
+    render_continuously = True
+    # True for widgets whose update_plot also consumes their data (e.g., saves frames
+    # or detects events): they are updated even when not on screen
+    update_offscreen = False
+
     def __init__(
         self,
         controller,
@@ -160,15 +170,7 @@ class PlotWidget(QWidget):
         self.stop_stream = False
 
         QPyDesignerCustomWidgetCollection.registerCustomWidget(PlotWidget, module="PlotWidget")
-        loader = QUiLoader()
-        self.plot_widget = loader.load(
-            os.path.join(
-                os.path.dirname(stdatalog_gui.__file__),
-                "UI",
-                "plot_widget.ui",
-            ),
-            parent,
-        )
+        self.plot_widget = load_form("plot_widget.ui", parent)
         self.frame_plot = self.plot_widget.findChild(QFrame, "frame_plot")
         self.title_frame = self.plot_widget.frame_plot.findChild(QFrame, "frame_title")
         self.contents_frame = self.plot_widget.frame_plot.findChild(QFrame, "frame_contents")
@@ -287,10 +289,9 @@ class PlotWidget(QWidget):
         self.contents_frame.layout().addWidget(self.graph_widget)
 
         self.timer_interval_ms = self.timer_interval * 1000
-        self.timer = QTimer()  # to create a thread that calls a function at intervals
-        self.timer.setTimerType(Qt.PreciseTimer)
-        # the update function keeps getting called at intervals
-        self.timer.timeout.connect(self.update_plot)
+        # update_plot is called at intervals by the controller shared render clock
+        self.dirty = False
+        self.timer = RenderTimer(self.controller.render_scheduler, self)
 
     @Slot()
     def clicked_pop_out_button(self):
@@ -93,6 +93,8 @@ class PlotsArrayWidget(PlotWidget):
         Timer period in milliseconds derived from the base timer interval.
     """
 
+    render_continuously = False  # sub-plots are refreshed on their own
+
     def __init__(
         self,
         controller,
@@ -36,7 +36,6 @@ Design Notes:
     line wrapping where needed without changing behavior.
 """
 
-import os
 
 from PySide6.QtWidgets import (
     QLabel,
@@ -51,9 +50,9 @@ from PySide6.QtWidgets import (
     QGridLayout,
 )
 from PySide6.QtGui import QValidator, QPixmap, QDoubleValidator, QIntValidator
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtDesigner import QPyDesignerCustomWidgetCollection
 from stdatalog_gui.UI.styles import STDTDL_RadioButton
+from stdatalog_gui.Utils.UiFormCache import load_form
 from stdatalog_core.HSD_utils.DataClass import TypeEnum
 
 from stdatalog_pnpl.DTDL.dtdl_utils import UnitMap
@@ -151,18 +150,10 @@ class SubPropertyWidget(QWidget):
         QPyDesignerCustomWidgetCollection.registerCustomWidget(
             SubPropertyWidget, module="SubPropertyWidget"
         )
-        loader = QUiLoader()
         self.comp_name = comp_name
         self.prop_name = prop_name
         self.label = label
-        comp_config_widget = loader.load(
-            os.path.join(
-                os.path.dirname(stdatalog_gui.__file__),
-                "UI",
-                "component_config_widget.ui",
-            ),
-            parent,
-        )
+        comp_config_widget = load_form("component_config_widget.ui", parent)
         frame_component_config = comp_config_widget.findChild(
             QFrame, "frame_component_config"
         )
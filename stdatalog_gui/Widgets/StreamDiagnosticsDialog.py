@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# coding: utf-8
+# *****************************************************************************
+#  * @file    StreamDiagnosticsDialog.py
+#  * @author  SRA
+# ******************************************************************************
+# * @attention
+# *
+# * Copyright (c) 2022 STMicroelectronics.
+# * All rights reserved.
+# *
+# * This software is licensed under terms that can be found in the LICENSE file
+# * in the root directory of this software component.
+# * If no LICENSE file comes with this software, it is provided AS-IS.
+# *
+# *
+# ******************************************************************************
+"""Acquisition diagnostics panel.
+
+This module defines a non-modal dialog showing the samples of the controller
+`StreamTelemetry`: a row per stream with throughput, packet losses and queue depths,
+plus the GUI frame time and the raw data file write latency. The collected samples can
+be exported to CSV/JSON files.
+"""
+
+from PySide6.QtCore import Qt, Slot
+from PySide6.QtWidgets import (
+    QDialog,
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from stdatalog_gui.UI.styles import STDTDL_PushButton
+
+COLUMNS = [
+    ("Component", None),
+    ("kB/s", lambda s: f"{s['bytes_per_s'] / 1000:.1f}"),
+    ("Packets/s", lambda s: f"{s['packets_per_s']:.1f}"),
+    ("Lost packets", lambda s: str(s["lost_packets"])),
+    ("Counter gaps", lambda s: str(s["gap_events"])),
+    ("Stage depth", lambda s: str(s["stage_depth"])),
+    ("Stage dropped", lambda s: str(s["stage_dropped"])),
+    ("Plot backlog", lambda s: str(s["plot_backlog"])),
+    ("Plot dropped", lambda s: str(s["plot_dropped"])),
+]
+
+class StreamDiagnosticsDialog(QDialog):
+    """Live view of the acquisition telemetry.
+
+    Parameters
+    ----------
+    controller : HSD_Controller
+        Controller owning the `stream_telemetry` sampler.
+    parent : QWidget | None, optional
+        Parent widget.
+    """
+
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.telemetry = controller.stream_telemetry
+
+        self.setWindowTitle("Acquisition Diagnostics")
+        self.setStyleSheet("background-color: #292d38; color: #FFFFFF;")
+        self.resize(820, 360)
+
+        self.table = QTableWidget(0, len(COLUMNS), self)
+        self.table.setHorizontalHeaderLabels([c[0] for c in COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        self.summary_label = QLabel("No acquisition running", self)
+
+        self.export_button = QPushButton("Export...", self)
+        self.export_button.setStyleSheet(STDTDL_PushButton.valid)
+        self.export_button.clicked.connect(self.clicked_export_button)
+
+        bottom_layout = QHBoxLayout()
+        bottom_layout.addWidget(self.summary_label, 1)
+        bottom_layout.addWidget(self.export_button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addLayout(bottom_layout)
+
+        self.telemetry.sig_sample.connect(self.s_telemetry_sample)
+        if len(self.telemetry.samples) > 0:
+            self.s_telemetry_sample(self.telemetry.samples[-1])
+
+    @Slot(dict)
+    def s_telemetry_sample(self, sample):
+        """Refresh the table and the summary with a new telemetry sample."""
+        streams = sample["streams"]
+        self.table.setRowCount(len(streams))
+        for row, (comp_name, stream) in enumerate(streams.items()):
+            for col, (_, fmt) in enumerate(COLUMNS):
+                text = comp_name if fmt is None else fmt(stream)
+                item = self.table.item(row, col)
+                if item is None:
+                    item = QTableWidgetItem(text)
+                    if fmt is not None:
+                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    self.table.setItem(row, col, item)
+                else:
+                    item.setText(text)
+
+        summary = (
+            f"t = {sample['t_s']:.0f} s  |  "
+            f"Frame time: {sample['frame_time_s'] * 1000:.1f} ms "
+            f"(max {sample['max_frame_time_s'] * 1000:.1f} ms)"
+        )
+        writer = sample["writer"]
+        if writer is not None:
+            summary += (
+                f"  |  File write: avg {writer['avg_latency_s'] * 1000:.2f} ms, "
+                f"max {writer['max_latency_s'] * 1000:.2f} ms, "
+                f"{writer['pending_buffers']} pending"
+            )
+        self.summary_label.setText(summary)
+
+    @Slot()
+    def clicked_export_button(self):
+        """Export the collected samples to a user-selected folder."""
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder")
+        if folder:
+            files = self.telemetry.export(folder)
+            if len(files) > 0:
+                self.summary_label.setText(f"Saved {', '.join(files)}")
+            else:
+                self.summary_label.setText("No telemetry samples to export")
@@ -30,7 +30,6 @@ Responsibilities:
 - Update UI in response to `sig_telemetry_received` from the controller.
 """
 
-import os
 import json
 from json import JSONDecodeError
 from PySide6.QtWidgets import (
@@ -46,10 +45,10 @@ from PySide6.QtWidgets import (
     QGridLayout,
 )
 from PySide6.QtGui import QDoubleValidator, QIntValidator
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtDesigner import QPyDesignerCustomWidgetCollection
 
 import stdatalog_gui
+from stdatalog_gui.Utils.UiFormCache import load_form
 from stdatalog_core.HSD_utils.DataClass import TypeEnum
 
 class SubTelemetryWidget(QWidget):
@@ -88,17 +87,9 @@ class SubTelemetryWidget(QWidget):
         QPyDesignerCustomWidgetCollection.registerCustomWidget(
             SubTelemetryWidget, module="SubTelemetryWidget"
         )
-        loader = QUiLoader()
         self.comp_name = comp_name
         self.object_name = object_name
-        comp_config_widget = loader.load(
-            os.path.join(
-                os.path.dirname(stdatalog_gui.__file__),
-                "UI",
-                "component_config_widget.ui",
-            ),
-            parent,
-        )
+        comp_config_widget = load_form("component_config_widget.ui", parent)
         title_frame = comp_config_widget.frame_component_config.findChild(
             QFrame, "frame_title"
         )